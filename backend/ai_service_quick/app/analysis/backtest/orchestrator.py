@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Tuple
 
 from itapia_common.dblib.services import BacktestReportService
 from itapia_common.schemas.entities.analysis import QuickCheckAnalysisReport
@@ -10,3 +11,6 @@ class BacktestOrchestrator:
 
     def save_report(self, report: QuickCheckAnalysisReport, backtest_date: datetime):
         self.backtest_report_service.save_quick_check_report(report, backtest_date)
+
+    def save_reports(self, reports: List[Tuple[QuickCheckAnalysisReport, datetime]]):
+        self.backtest_report_service.save_quick_check_reports(reports)
@@ -0,0 +1,176 @@
+"""In-process ring buffers that mirror the intraday Redis streams."""
+
+import threading
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from itapia_common.dblib.crud.prices import INTRADAY_CANDLE_DTYPE
+from itapia_common.dblib.services import APIPricesService
+from itapia_common.logger import ITAPIALogger
+
+logger = ITAPIALogger("Intraday Stream Buffer")
+
+_STREAM_START_ID = "0-0"
+
+
+class _TickerRingBuffer:
+    """Fixed-capacity ring of intraday candles for a single ticker."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.last_id = _STREAM_START_ID
+        self._records = np.empty(capacity, dtype=INTRADAY_CANDLE_DTYPE)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        self.last_id = _STREAM_START_ID
+        self._start = 0
+        self._size = 0
+
+    def extend(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Append decoded candles, overwriting the oldest ones when full."""
+        n = len(arrays["timestamp_us"])
+        if n == 0:
+            return
+        # Only the newest `capacity` candles can survive anyway
+        skip = max(0, n - self.capacity)
+        kept = n - skip
+
+        end = (self._start + self._size) % self.capacity
+        positions = (end + np.arange(kept)) % self.capacity
+        for name in INTRADAY_CANDLE_DTYPE.names:
+            self._records[name][positions] = arrays[name][skip:]
+
+        overflow = max(0, self._size + kept - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._size = min(self.capacity, self._size + kept)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the buffered candles as an OHLCV frame sorted by time."""
+        if self._size == 0:
+            return pd.DataFrame()
+        positions = (self._start + np.arange(self._size)) % self.capacity
+        records = self._records[positions]
+        index = pd.DatetimeIndex(
+            pd.to_datetime(records["timestamp_us"], unit="us", utc=True),
+            name="datetime_utc",
+        )
+        frame = pd.DataFrame(
+            {col: records[col] for col in ["open", "high", "low", "close", "volume"]},
+            index=index,
+        )
+        return frame.sort_index()
+
+
+class IntradayStreamBuffer:
+    """Keep a bounded in-memory copy of each ticker's intraday stream.
+
+    Each refresh only pulls entries newer than the last seen stream ID, so serving
+    a ticker costs one small round trip instead of re-reading the whole stream.
+    """
+
+    def __init__(self, prices_service: APIPricesService, capacity: int):
+        """Initialize the buffer.
+
+        Args:
+            prices_service (APIPricesService): Service used to read the Redis streams.
+            capacity (int): Maximum number of candles kept per ticker.
+        """
+        self.prices_service = prices_service
+        self.capacity = capacity
+        self._buffers: Dict[str, _TickerRingBuffer] = {}
+        # Never held across a Redis round trip, only while buffers are read or
+        # updated, so it is safe to take from the event loop.
+        self._lock = threading.Lock()
+
+    async def refresh(self, tickers: List[str]) -> None:
+        """Catch up the buffers of the given tickers with their streams.
+
+        Redis is read with the asyncio client, so the event loop is never blocked.
+
+        Args:
+            tickers (List[str]): Tickers to refresh.
+        """
+        tickers = [ticker.upper() for ticker in tickers]
+        with self._lock:
+            for ticker in tickers:
+                if ticker not in self._buffers:
+                    self._buffers[ticker] = _TickerRingBuffer(self.capacity)
+
+        stale = await self._apply_updates(tickers)
+        if stale:
+            # The last seen entry is gone: the stream was deleted, recreated or
+            # trimmed past it, so the buffered candles no longer match, reload them
+            logger.warn(f"Intraday streams out of sync, reloading: {stale}")
+            with self._lock:
+                for ticker in stale:
+                    self._buffers[ticker].clear()
+            await self._apply_updates(stale)
+
+    async def get_ohlcv(self, ticker: str) -> pd.DataFrame:
+        """Refresh a ticker and return its buffered intraday OHLCV data.
+
+        Args:
+            ticker (str): Ticker symbol.
+
+        Returns:
+            pd.DataFrame: OHLCV DataFrame with a UTC DatetimeIndex named `datetime_utc`.
+                Empty if the stream has no data.
+        """
+        ticker = ticker.upper()
+        await self.refresh([ticker])
+        with self._lock:
+            buffer = self._buffers.get(ticker)
+            return buffer.to_frame() if buffer else pd.DataFrame()
+
+    async def get_last_id(self, ticker: str) -> str:
+        """Refresh a ticker and return the newest stream ID seen for it.
+
+        Args:
+            ticker (str): Ticker symbol.
+
+        Returns:
+            str: The last stream ID, "0-0" if the stream has no data.
+        """
+        ticker = ticker.upper()
+        await self.refresh([ticker])
+        with self._lock:
+            buffer = self._buffers.get(ticker)
+            return buffer.last_id if buffer else _STREAM_START_ID
+
+    def invalidate(self, ticker: str | None = None) -> None:
+        """Drop the buffer of a ticker, or of all tickers if none is given."""
+        with self._lock:
+            if ticker is None:
+                self._buffers.clear()
+            else:
+                self._buffers.pop(ticker.upper(), None)
+
+    async def _apply_updates(self, tickers: List[str]) -> List[str]:
+        with self._lock:
+            last_ids = {
+                ticker: self._buffers[ticker].last_id
+                for ticker in tickers
+                if ticker in self._buffers
+            }
+        updates = await self.prices_service.get_intraday_updates_async(last_ids)
+
+        stale = []
+        with self._lock:
+            for ticker, (last_id, arrays, in_sync) in updates.items():
+                buffer = self._buffers.get(ticker)
+                # Skip buffers another refresh advanced (or dropped) while we were
+                # waiting on Redis, otherwise its entries would be appended twice
+                if buffer is None or buffer.last_id != last_ids[ticker]:
+                    continue
+                buffer.extend(arrays)
+                buffer.last_id = last_id
+                if not in_sync:
+                    stale.append(ticker)
+        return stale
@@ -1,14 +1,19 @@
+import asyncio
 from datetime import datetime
+from typing import Dict, List
 
 import app.core.config as cfg
+import itapia_common.dblib.db_config as dbcfg
+import pandas as pd
 from itapia_common.dblib.services import (
     APIMetadataService,
     APINewsService,
     APIPricesService,
 )
+from itapia_common.dblib.services.news import HistoryNewsWindow
 from itapia_common.logger import ITAPIALogger
 
-from .data_transform import *
+from .intraday_buffer import IntradayStreamBuffer
 
 logger = ITAPIALogger("Data Prepare Orchestrator")
 
@@ -28,6 +33,9 @@ class DataPrepareOrchestrator:
         self.metadata_service = metadata_service
         self.prices_service = prices_service
         self.news_service = news_service
+        self.intraday_buffer = IntradayStreamBuffer(
+            prices_service, capacity=dbcfg.INTRADAY_STREAM_BUFFER_CAPACITY
+        )
 
     def get_all_tickers(self) -> List[str]:
         """
@@ -46,18 +54,10 @@ class DataPrepareOrchestrator:
         If any error occured, return empty DataFrame.
         """
         logger.info(f"Preparing daily OHLCV for ticker '{ticker}'...")
-        res = self.prices_service.get_daily_prices(ticker, limit=limit, skip=0)
-        json_res = res.model_dump()
-        if not json_res:
+        df = self.prices_service.get_daily_ohlcv(ticker, limit=limit, skip=0)
+        if df.empty:
             logger.warn("Null response. Return empty DF.")
-            return pd.DataFrame()
-
-        try:
-            df = transform_single_ticker_response(json_res)
-            return df
-        except KeyError as e:
-            logger.err(f"Could not process a response. Error: {e}. Skipping.")
-            return pd.DataFrame()
+        return df
 
     def get_daily_ohlcv_for_sector(
         self, sector_code: str, limit_per_ticker: int = 2000
@@ -68,35 +68,59 @@ class DataPrepareOrchestrator:
         If any error occured, return empty DataFrame.
         """
         logger.info(f"Preparing daily OHLCV for sector '{sector_code}'...")
-        res_lst = self.prices_service.get_daily_prices_by_sector(
+        df = self.prices_service.get_daily_ohlcv_by_sector(
             sector_code, limit=limit_per_ticker, skip=0
         )
-        json_list = [x.model_dump() for x in res_lst]
-        if not json_list:
+        if df.empty:
             logger.warn("Null response. Return empty DF.")
-            return pd.DataFrame()
-
-        df = transform_multi_ticker_responses(json_list)
         return df
 
-    def get_intraday_ohlcv_for_ticker(self, ticker: str) -> pd.DataFrame:
+    async def get_intraday_ohlcv_for_ticker(self, ticker: str) -> pd.DataFrame:
         """
-        Get and transform intraday OHLCV data of a single ticker into validated DataFrame.
+        Get intraday OHLCV data of a single ticker as a DataFrame.
 
-        If any error occured, return empty DataFrame.
+        Served from the in-process stream buffer, which only pulls candles
+        appended since the previous call. If any error occured, return empty DataFrame.
         """
         logger.info(f"Preparing intraday OHLCV for ticker '{ticker}'...")
-        json_res = self.prices_service.get_intraday_prices(ticker).model_dump()
-        if not json_res:
+        self.metadata_service.get_validate_ticker_info(ticker, "intraday")
+        df = await self.intraday_buffer.get_ohlcv(ticker)
+        if df.empty:
             logger.warn("Null response. Return empty DF.")
-            return pd.DataFrame()
+        return df
 
-        try:
-            df = transform_single_ticker_response(json_res)
-            return df
-        except ValueError as e:
-            logger.err(f"Could not process a response. Error: {e}. Skipping.")
-            return pd.DataFrame()
+    async def get_data_versions(
+        self, ticker: str, include_intraday: bool = True
+    ) -> Dict[str, str]:
+        """
+        Get version markers that change whenever daily bars, news or intraday candles of a ticker are added or updated.
+
+        Results derived from the ticker's data can be cached under these markers.
+        Returns a dict with `daily`, `news` and, if requested, `intraday` entries.
+        The database lookup runs in the default executor so it does not block the event loop.
+        The universal news version is read from Redis, where the news ingestion publishes it.
+        """
+        loop = asyncio.get_running_loop()
+        versions = await loop.run_in_executor(
+            None, self.metadata_service.get_data_versions, ticker
+        )
+        universal_news_version = (
+            await self.news_service.get_universal_news_version_async()
+        )
+        last_daily_bar = versions["last_daily_bar"]
+        last_daily_update = versions["last_daily_update"]
+        last_news_time = versions["last_news_time"]
+        result = {
+            # The update time catches bars corrected in place, which keep their date
+            "daily": f"d{int(last_daily_bar.timestamp()) if last_daily_bar else 0}"
+            f"u{int(last_daily_update.timestamp() * 1_000_000) if last_daily_update else 0}",
+            "news": f"n{int(last_news_time.timestamp()) if last_news_time else 0}"
+            f"v{universal_news_version}",
+        }
+        if include_intraday:
+            last_id = await self.intraday_buffer.get_last_id(ticker)
+            result["intraday"] = f"i{last_id}"
+        return result
 
     def get_all_sectors_as_df(self) -> pd.DataFrame:
         logger.info(f"Preparing sector list...")
@@ -128,15 +152,29 @@ class DataPrepareOrchestrator:
         except ValueError as e:
             return False
 
-    def _get_full_text_from_news(self, news):
-        text: str = news.title
-        if news.summary is not None:
-            text += "." + news.summary
-        return text
+    def _get_universal_news_scopes(self, ticker: str) -> List[tuple]:
+        sector = self.metadata_service.get_sector_name_of(ticker)
+        # L2 (contextual) first, then L3 (macro), in priority order for deduplication
+        return [(f"{sector}", cfg.NEWS_COUNT_CONTEXTUAL)] + [
+            (search_terms, cfg.NEWS_COUNT_MACRO)
+            for search_terms in cfg.NEWS_MACRO_SEARCH_TERMS
+        ]
+
+    def get_universal_news_search_terms(self) -> List[str]:
+        """
+        List every universal news search the news feeds of all tickers run.
+
+        Returns:
+            List[str]: The sector names, then the macro search terms.
+        """
+        sectors = self.metadata_service.get_all_sectors()
+        return [sector.sector_name for sector in sectors] + list(
+            cfg.NEWS_MACRO_SEARCH_TERMS
+        )
 
     def get_all_news_text_for_ticker(self, ticker: str) -> List[str]:
         """
-        Fetch and combine all news for a ticker, contains:
+        Fetch and combine all news for a ticker in one round trip, contains:
 
         L1: Relevant news
 
@@ -150,66 +188,19 @@ class DataPrepareOrchestrator:
         Returns:
             List[str]: List of all news, each news element is made up of its `title` and `summary`
         """
-
         logger.info(f"Preparing combined news feed for ticker: {ticker}")
-        sector_list = self.metadata_service.get_all_sectors()
-        sector_code = self.get_sector_code_of(ticker)
-        for x in sector_list:
-            if x.sector_code == sector_code:
-                sector = x.sector_name
-                break
-
-        all_news_text_with_time = []
-
-        logger.info(f"Fetching L1 (Relevant) news...")
-        relevant_news = self.news_service.get_relevant_news(
-            ticker, skip=0, limit=cfg.NEWS_COUNT_RELEVANT
+        return self.news_service.get_news_texts_by_scopes(
+            ticker,
+            relevant_limit=cfg.NEWS_COUNT_RELEVANT,
+            universal_scopes=self._get_universal_news_scopes(ticker),
+            total_limit=cfg.NEWS_TOTAL_LIMIT,
         )
-        for news in relevant_news.datas:
-            all_news_text_with_time.append(
-                (self._get_full_text_from_news(news), news.publish_ts)
-            )
-
-        universal_news_hash = set()
-
-        logger.info(f"Fetching L2 (Contextual) universal news...")
-        contextual_search_terms = f"{sector}"
-        contextual_news = self.news_service.get_universal_news(
-            contextual_search_terms, skip=0, limit=cfg.NEWS_COUNT_CONTEXTUAL
-        )
-        for news in contextual_news.datas:
-            if news.title_hash not in universal_news_hash:
-                universal_news_hash.add(news.title_hash)
-                all_news_text_with_time.append(
-                    (self._get_full_text_from_news(news), news.publish_ts)
-                )
-
-        logger.info(f"Fetching L3 (Macro) universal news...")
-        macro_search_terms_lst = [
-            "Federal Reserve policy",
-            "US inflation report CPI",
-            "S&P 500",
-        ]
-        for macro_search_terms in macro_search_terms_lst:
-            macro_news = self.news_service.get_universal_news(
-                macro_search_terms, skip=0, limit=cfg.NEWS_COUNT_MACRO
-            )
-            for news in macro_news.datas:
-                if news.title_hash not in universal_news_hash:
-                    universal_news_hash.add(news.title_hash)
-                    all_news_text_with_time.append(
-                        (self._get_full_text_from_news(news), news.publish_ts)
-                    )
-
-        all_news_text_with_time.sort(key=lambda x: x[1], reverse=True)
-
-        return [x[0] for x in all_news_text_with_time[: cfg.NEWS_TOTAL_LIMIT]]
 
     def get_history_news_for_ticker(
         self, ticker: str, before_date: datetime
     ) -> List[str]:
         """
-        Fetch and combine all history news for a ticker, serve for backtesting, contains:
+        Fetch and combine all history news for a ticker in one round trip, serve for backtesting, contains:
 
         L2: Contextual universal news
 
@@ -223,51 +214,33 @@ class DataPrepareOrchestrator:
             List[str]: List of all news, each news element is made up of its `title` and `summary`
         """
         logger.info(f"Preparing combined news feed for ticker: {ticker}")
-        sector_list = self.metadata_service.get_all_sectors()
-        sector_code = self.get_sector_code_of(ticker)
-        for x in sector_list:
-            if x.sector_code == sector_code:
-                sector = x.sector_name
-                break
-
-        all_news_text_with_time = []
-        universal_news_hash = set()
-
-        logger.info(f"Fetching L2 (Contextual) universal news...")
-        contextual_search_terms = f"{sector}"
-        contextual_news = self.news_service.get_universal_news(
-            contextual_search_terms,
-            skip=0,
-            limit=cfg.NEWS_COUNT_CONTEXTUAL,
+        return self.news_service.get_news_texts_by_scopes(
+            None,
+            relevant_limit=0,
+            universal_scopes=self._get_universal_news_scopes(ticker),
+            total_limit=cfg.NEWS_TOTAL_LIMIT,
+            before_date=before_date,
+        )
+
+    def get_history_news_window_for_ticker(
+        self, ticker: str, before_date: datetime
+    ) -> HistoryNewsWindow:
+        """
+        Load the history news of a ticker once for a whole backtest range.
+
+        The window gives, for any date up to `before_date`, the same feed as
+        `get_history_news_for_ticker` without querying the database again.
+
+        Args:
+            ticker (str): Ticker to fetch data.
+            before_date (datetime): Latest backtest date.
+
+        Returns:
+            HistoryNewsWindow: News window, see `HistoryNewsWindow.get_news_texts`.
+        """
+        logger.info(f"Loading history news window for ticker: {ticker}")
+        return self.news_service.get_history_news_window(
+            self._get_universal_news_scopes(ticker),
+            total_limit=cfg.NEWS_TOTAL_LIMIT,
             before_date=before_date,
         )
-        for news in contextual_news.datas:
-            if news.title_hash not in universal_news_hash:
-                universal_news_hash.add(news.title_hash)
-                all_news_text_with_time.append(
-                    (self._get_full_text_from_news(news), news.publish_ts)
-                )
-
-        logger.info(f"Fetching L3 (Macro) universal news...")
-        macro_search_terms_lst = [
-            "Federal Reserve policy",
-            "US inflation report CPI",
-            "S&P 500",
-        ]
-        for macro_search_terms in macro_search_terms_lst:
-            macro_news = self.news_service.get_universal_news(
-                macro_search_terms,
-                skip=0,
-                limit=cfg.NEWS_COUNT_MACRO,
-                before_date=before_date,
-            )
-            for news in macro_news.datas:
-                if news.title_hash not in universal_news_hash:
-                    universal_news_hash.add(news.title_hash)
-                    all_news_text_with_time.append(
-                        (self._get_full_text_from_news(news), news.publish_ts)
-                    )
-
-        all_news_text_with_time.sort(key=lambda x: x[1], reverse=True)
-
-        return [x[0] for x in all_news_text_with_time[: cfg.NEWS_TOTAL_LIMIT]]
@@ -29,8 +29,14 @@ class ForecastingOrchestrator:
 
     def __init__(self):
         """Initialize the forecasting orchestrator with model and explainer caches."""
-        self.model_cache = AsyncInMemoryCache()
-        self.explainer_cache = AsyncInMemoryCache()
+        self.model_cache = AsyncInMemoryCache(
+            max_entries=cfg.FORECASTING_CACHE_MAX_ENTRIES,
+            ttl_seconds=cfg.FORECASTING_CACHE_TTL_SECONDS,
+        )
+        self.explainer_cache = AsyncInMemoryCache(
+            max_entries=cfg.FORECASTING_CACHE_MAX_ENTRIES,
+            ttl_seconds=cfg.FORECASTING_CACHE_TTL_SECONDS,
+        )
 
     async def _get_or_load_model(
         self,
@@ -173,6 +179,30 @@ class ForecastingOrchestrator:
         logger.info(f"  - Completed task: {task_id}")
         return task_report
 
+    async def get_required_features(self, sector: str) -> List[str]:
+        """Get the features read by the models of all tasks of a sector.
+
+        Models are loaded (or taken from the cache) to read their task metadata.
+
+        Args:
+            sector (str): Sector code
+
+        Returns:
+            List[str]: Union of the selected features of all tasks, in task order
+        """
+        required_features: Dict[str, None] = {}
+        for model_template, task_template, problem_id in self._get_tasks_config():
+            task_id = cfg.TASK_ID_SECTOR_TEMPLATE.format(
+                problem=problem_id, sector=sector
+            )
+            model_wrapper = await self._get_or_load_model(
+                model_template, task_template, task_id
+            )
+            required_features.update(
+                dict.fromkeys(model_wrapper.task.selected_features)
+            )
+        return list(required_features)
+
     async def generate_report(
         self, latest_enriched_data: pd.DataFrame, ticker: str, sector: str
     ) -> ForecastingReport:
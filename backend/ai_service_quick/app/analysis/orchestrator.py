@@ -3,7 +3,7 @@
 import asyncio
 import time
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Callable, Coroutine, Dict, List, Literal, Optional, Type
 
 import numpy as np
 import pandas as pd
@@ -19,6 +19,7 @@ from .data_prepare.orchestrator import DataPrepareOrchestrator
 from .explainer.orchestrator import AnalysisExplainerOrchestrator, ExplainReportType
 from .forecasting.orchestrator import ForecastingOrchestrator
 from .news.orchestrator import NewsOrchestrator
+from .report_cache import AnalysisReportCache, ReportT
 from .technical.orchestrator import TechnicalOrchestrator
 
 logger = ITAPIALogger("Analysis Orchestrator")
@@ -60,6 +61,7 @@ class AnalysisOrchestrator:
         news_analyzer: NewsOrchestrator,
         explainer: AnalysisExplainerOrchestrator,
         backtest_orchestrator: BacktestOrchestrator,
+        report_cache: AnalysisReportCache | None = None,
     ):
         """Initialize the AnalysisOrchestrator with all required sub-orchestrators.
 
@@ -70,6 +72,8 @@ class AnalysisOrchestrator:
             news_analyzer (NewsOrchestrator): News analysis orchestrator
             explainer (AnalysisExplainerOrchestrator): Analysis explainer orchestrator
             backtest_orchestrator (BacktestOrchestrator): Backtest orchestrator
+            report_cache (AnalysisReportCache | None, optional): Cache for finished reports.
+                Defaults to None (always compute).
         """
         # Initialize department heads
         self.data_preparer = data_preparer
@@ -78,6 +82,7 @@ class AnalysisOrchestrator:
         self.news_analyzer = news_analyzer
         self.explainer = explainer
         self.backtest_generator = backtest_orchestrator
+        self.report_cache = report_cache
         self.is_active = False
 
     def get_all_tickers(self) -> list:
@@ -138,6 +143,84 @@ class AnalysisOrchestrator:
         # 2. Call generate_report function (heavy, asynchronous)
         return await self.forecaster.generate_report(latest_features, ticker, sector)
 
+    async def _get_required_daily_features(
+        self, ticker: str, technical: bool, forecasting: bool
+    ) -> Optional[List[str]]:
+        """Collect the daily feature columns read by the requested modules.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            technical (bool): Whether the daily technical analysis runs
+            forecasting (bool): Whether the forecasting models run
+
+        Returns:
+            Optional[List[str]]: Required columns, None to compute all features
+        """
+        required_features: List[str] = []
+        if technical:
+            required_features.extend(TechnicalOrchestrator.DAILY_ANALYSIS_FEATURES)
+        if forecasting:
+            try:
+                sector = self.data_preparer.get_sector_code_of(ticker)
+                required_features.extend(
+                    await self.forecaster.get_required_features(sector)
+                )
+            except Exception as e:
+                # Forecasting reports the failure itself, keep all features for it
+                logger.warn(f"Cannot get forecasting features of {ticker}: {e}")
+                return None
+        return required_features
+
+    async def _get_daily_features(
+        self,
+        daily_df: pd.DataFrame,
+        ticker: str,
+        required_features: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Generate daily features in the default executor.
+
+        The feature store reads and writes local files under a per-ticker lock, so
+        neither the computation nor the store work may run on the event loop.
+
+        Args:
+            daily_df (pd.DataFrame): Daily OHLCV data
+            ticker (str): Stock ticker symbol
+            required_features (Optional[List[str]], optional): Feature columns the
+                caller reads, see `TechnicalOrchestrator.get_daily_features`.
+                Defaults to None (all features).
+
+        Returns:
+            pd.DataFrame: DataFrame enriched with technical features
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self.tech_analyzer.get_daily_features,
+            daily_df,
+            ticker,
+            required_features,
+        )
+
+    async def _get_intraday_features(
+        self, intraday_df: pd.DataFrame, ticker: str
+    ) -> pd.DataFrame:
+        """Generate intraday features in the default executor.
+
+        Streaming engines are updated under a per-ticker lock, which must not be
+        taken on the event loop.
+
+        Args:
+            intraday_df (pd.DataFrame): Intraday OHLCV data
+            ticker (str): Stock ticker symbol
+
+        Returns:
+            pd.DataFrame: DataFrame enriched with technical features
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.tech_analyzer.get_intraday_features, intraday_df, ticker
+        )
+
     async def _prepare_and_run_news_analysis(self, ticker: str) -> NewsAnalysisReport:
         """News Analysis Phase (asynchronous).
 
@@ -177,6 +260,40 @@ class AnalysisOrchestrator:
 
     # === MAIN COORDINATION FUNCTIONS (PROCESS 1) ===
 
+    def _report_key(
+        self,
+        kind: str,
+        ticker: str,
+        params: List[str],
+        versions: Dict[str, str],
+        sources: List[str],
+    ) -> str:
+        """Build a report cache key from the request and the versions of its inputs."""
+        version_tag = ",".join(versions[source] for source in sources)
+        return ":".join([kind, ticker.upper(), *params, version_tag])
+
+    async def _get_or_compute_report(
+        self,
+        key_builder: Callable[[Dict[str, str]], str],
+        include_intraday: bool,
+        ticker: str,
+        report_type: Type[ReportT],
+        report_factory: Callable[[Dict[str, str] | None], Coroutine],
+    ) -> ReportT:
+        """Serve a report from the report cache, computing it with `report_factory` on a miss.
+
+        `report_factory` receives the input versions the key was built from, or None
+        when no cache is configured.
+        """
+        if self.report_cache is None:
+            return await report_factory(None)
+        # Versions are read before computing, so a report is never stored under
+        # a newer version than the data it was computed from
+        versions = await self.data_preparer.get_data_versions(ticker, include_intraday)
+        return await self.report_cache.get_or_compute(
+            key_builder(versions), report_type, lambda: report_factory(versions)
+        )
+
     async def get_technical_report(
         self,
         ticker: str,
@@ -185,6 +302,165 @@ class AnalysisOrchestrator:
     ) -> TechnicalReport:
         """Get technical analysis report for a specific ticker.
 
+        Served from the report cache while no new daily bar or intraday candle arrived.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            daily_analysis_type (Literal['short', 'medium', 'long'], optional): Type of daily analysis.
+                Defaults to 'medium'.
+            required_type (Literal['daily', 'intraday', 'all'], optional): Type of analysis required.
+                Defaults to 'all'.
+
+        Returns:
+            TechnicalReport: Technical analysis report
+
+        Raises:
+            NotReadyServiceError: If service is not ready
+            NoDataError: If no data is available for the ticker
+        """
+        self.check_service_health()
+        self.check_data_avaiable(ticker)
+        return await self._get_or_compute_report(
+            lambda versions: self._technical_key(
+                ticker, daily_analysis_type, required_type, versions
+            ),
+            required_type != "daily",
+            ticker,
+            TechnicalReport,
+            lambda versions: self._compute_technical_report(
+                ticker, daily_analysis_type, required_type
+            ),
+        )
+
+    async def get_forecasting_report(self, ticker: str) -> ForecastingReport:
+        """Get forecasting report for a specific ticker.
+
+        Served from the report cache while no new daily bar arrived.
+
+        Args:
+            ticker (str): Stock ticker symbol
+
+        Returns:
+            ForecastingReport: Forecasting analysis report
+
+        Raises:
+            NotReadyServiceError: If service is not ready
+            NoDataError: If no data is available for the ticker
+        """
+        self.check_service_health()
+        self.check_data_avaiable(ticker)
+        return await self._get_or_compute_report(
+            lambda versions: self._forecasting_key(ticker, versions),
+            False,
+            ticker,
+            ForecastingReport,
+            lambda versions: self._compute_forecasting_report(ticker),
+        )
+
+    async def get_news_report(self, ticker: str) -> NewsAnalysisReport:
+        """Get news analysis report for a specific ticker.
+
+        Served from the report cache while no new news arrived.
+
+        Args:
+            ticker (str): Stock ticker symbol
+
+        Returns:
+            NewsAnalysisReport: News analysis report
+
+        Raises:
+            NotReadyServiceError: If service is not ready
+            NoDataError: If no data is available for the ticker
+        """
+        self.check_service_health()
+        self.check_data_avaiable(ticker)
+        return await self._get_or_compute_report(
+            lambda versions: self._news_key(ticker, versions),
+            False,
+            ticker,
+            NewsAnalysisReport,
+            lambda versions: self._compute_news_report(ticker),
+        )
+
+    async def get_full_analysis_report(
+        self,
+        ticker: str,
+        daily_analysis_type: Literal["short", "medium", "long"] = "medium",
+        required_type: Literal["daily", "intraday", "all"] = "all",
+    ) -> QuickCheckAnalysisReport:
+        """Get a complete A-Z analysis report for a ticker.
+
+        Served from the report cache, shared by all workers, while no new daily bar,
+        news or intraday candle arrived.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            daily_analysis_type (Literal['short', 'medium', 'long'], optional): Type of daily analysis.
+                Defaults to 'medium'.
+            required_type (Literal['daily', 'intraday', 'all'], optional): Type of analysis required.
+                Defaults to 'all'.
+
+        Returns:
+            QuickCheckAnalysisReport: Complete analysis report
+
+        Raises:
+            NotReadyServiceError: If service is not ready
+            NoDataError: If no data is available for the ticker
+            MissingReportError: If any analysis module fails
+        """
+        self.check_service_health()
+        self.check_data_avaiable(ticker)
+        return await self._get_or_compute_report(
+            lambda versions: self._report_key(
+                "full",
+                ticker,
+                [daily_analysis_type, required_type],
+                versions,
+                self._sources_of(required_type, ["daily", "news"]),
+            ),
+            required_type != "daily",
+            ticker,
+            QuickCheckAnalysisReport,
+            lambda versions: self._compute_full_analysis_report(
+                ticker, daily_analysis_type, required_type, versions
+            ),
+        )
+
+    @staticmethod
+    def _sources_of(required_type: str, sources: List[str]) -> List[str]:
+        return sources + ["intraday"] if required_type != "daily" else sources
+
+    def _technical_key(
+        self,
+        ticker: str,
+        daily_analysis_type: str,
+        required_type: str,
+        versions: Dict[str, str],
+    ) -> str:
+        return self._report_key(
+            "technical",
+            ticker,
+            [daily_analysis_type, required_type],
+            versions,
+            self._sources_of(required_type, ["daily"]),
+        )
+
+    def _forecasting_key(self, ticker: str, versions: Dict[str, str]) -> str:
+        return self._report_key("forecasting", ticker, [], versions, ["daily"])
+
+    def _news_key(self, ticker: str, versions: Dict[str, str]) -> str:
+        return self._report_key("news", ticker, [], versions, ["news"])
+
+    # === UNCACHED COMPUTATION ===
+
+    async def _compute_technical_report(
+        self,
+        ticker: str,
+        daily_analysis_type: Literal["short", "medium", "long"] = "medium",
+        required_type: Literal["daily", "intraday", "all"] = "all",
+    ) -> TechnicalReport:
+        """Compute technical analysis report for a specific ticker, bypassing the report cache.
+
         Args:
             ticker (str): Stock ticker symbol
             daily_analysis_type (Literal['short', 'medium', 'long'], optional): Type of daily analysis.
@@ -208,8 +484,19 @@ class AnalysisOrchestrator:
 
         # --- STEP 1: FETCH RAW DATA (SYNCHRONOUS) ---
         logger.info("CEO -> DataPreparer: Fetching price data...")
-        daily_df = self.data_preparer.get_daily_ohlcv_for_ticker(ticker)
-        intraday_df = self.data_preparer.get_intraday_ohlcv_for_ticker(ticker)
+        if self.tech_analyzer.tail_mode:
+            # Only the latest bars the daily analysis reads, with their warm-up
+            daily_df = self.data_preparer.get_daily_ohlcv_for_ticker(
+                ticker,
+                limit=self.tech_analyzer.get_daily_analysis_lookback(
+                    daily_analysis_type
+                ),
+            )
+        else:
+            daily_df = self.data_preparer.get_daily_ohlcv_for_ticker(ticker)
+        intraday_df = await self.data_preparer.get_intraday_ohlcv_for_ticker(ticker)
+        if self.tech_analyzer.tail_mode:
+            intraday_df = self.tech_analyzer.get_intraday_analysis_tail(intraday_df)
 
         if (
             daily_df.empty
@@ -217,8 +504,13 @@ class AnalysisOrchestrator:
             logger.err(f"No daily data available for ticker {ticker}.")
             raise NoDataError(f"No daily data available for ticker {ticker}.")
 
-        enriched_daily_df = self.tech_analyzer.get_daily_features(daily_df)
-        enriched_intraday_df = self.tech_analyzer.get_intraday_features(intraday_df)
+        required_features = await self._get_required_daily_features(
+            ticker, technical=True, forecasting=False
+        )
+        enriched_daily_df = await self._get_daily_features(
+            daily_df, ticker, required_features
+        )
+        enriched_intraday_df = await self._get_intraday_features(intraday_df, ticker)
 
         loop = asyncio.get_running_loop()
         report = await loop.run_in_executor(
@@ -231,8 +523,8 @@ class AnalysisOrchestrator:
         )
         return report
 
-    async def get_forecasting_report(self, ticker: str) -> ForecastingReport:
-        """Get forecasting report for a specific ticker.
+    async def _compute_forecasting_report(self, ticker: str) -> ForecastingReport:
+        """Compute forecasting report for a specific ticker, bypassing the report cache.
 
         Args:
             ticker (str): Stock ticker symbol
@@ -261,11 +553,16 @@ class AnalysisOrchestrator:
             logger.err(f"No daily data available for ticker {ticker}.")
             raise NoDataError(f"No daily data available for ticker {ticker}.")
 
-        enriched_daily_df = self.tech_analyzer.get_daily_features(daily_df)
+        required_features = await self._get_required_daily_features(
+            ticker, technical=False, forecasting=True
+        )
+        enriched_daily_df = await self._get_daily_features(
+            daily_df, ticker, required_features
+        )
         return await self._prepare_and_run_forecasting(ticker, enriched_daily_df)
 
-    async def get_news_report(self, ticker: str) -> NewsAnalysisReport:
-        """Get news analysis report for a specific ticker.
+    async def _compute_news_report(self, ticker: str) -> NewsAnalysisReport:
+        """Compute news analysis report for a specific ticker, bypassing the report cache.
 
         Args:
             ticker (str): Stock ticker symbol
@@ -284,14 +581,18 @@ class AnalysisOrchestrator:
 
         return await self._prepare_and_run_news_analysis(ticker)
 
-    async def get_full_analysis_report(
+    async def _compute_full_analysis_report(
         self,
         ticker: str,
         daily_analysis_type: Literal["short", "medium", "long"] = "medium",
         required_type: Literal["daily", "intraday", "all"] = "all",
+        versions: Dict[str, str] | None = None,
     ) -> QuickCheckAnalysisReport:
         """Create a complete A-Z analysis report for a ticker, running heavy modules in parallel.
 
+        Bypasses the report cache, but stores the finished sub-reports in it when
+        the input `versions` are given.
+
         Args:
             ticker (str): Stock ticker symbol
             daily_analysis_type (Literal['short', 'medium', 'long'], optional): Type of daily analysis.
@@ -317,7 +618,10 @@ class AnalysisOrchestrator:
         # --- STEP 1: FETCH RAW DATA (SYNCHRONOUS) ---
         logger.info("CEO -> DataPreparer: Fetching price data...")
         daily_df = self.data_preparer.get_daily_ohlcv_for_ticker(ticker)
-        intraday_df = self.data_preparer.get_intraday_ohlcv_for_ticker(ticker)
+        intraday_df = await self.data_preparer.get_intraday_ohlcv_for_ticker(ticker)
+        if self.tech_analyzer.tail_mode:
+            # Daily bars are shared with forecasting, only intraday is cut to its tail
+            intraday_df = self.tech_analyzer.get_intraday_analysis_tail(intraday_df)
 
         if (
             daily_df.empty
@@ -325,8 +629,13 @@ class AnalysisOrchestrator:
             logger.err(f"No daily data available for ticker {ticker}.")
             raise NoDataError(f"No daily data available for ticker {ticker}.")
 
-        enriched_daily_df = self.tech_analyzer.get_daily_features(daily_df)
-        enriched_intraday_df = self.tech_analyzer.get_intraday_features(intraday_df)
+        required_features = await self._get_required_daily_features(
+            ticker, technical=True, forecasting=True
+        )
+        enriched_daily_df = await self._get_daily_features(
+            daily_df, ticker, required_features
+        )
+        enriched_intraday_df = await self._get_intraday_features(intraday_df, ticker)
 
         # --- STEP 2: RUN ALL MODULES IN PARALLEL ---
         logger.info("CEO: Dispatching all analysis modules to run in parallel...")
@@ -386,7 +695,26 @@ class AnalysisOrchestrator:
 
         # Clean up NaN/inf values before returning
         cleaned_report_dict = clean_json_outliers(final_report.model_dump())
-        return QuickCheckAnalysisReport.model_validate(cleaned_report_dict)
+        cleaned_report = QuickCheckAnalysisReport.model_validate(cleaned_report_dict)
+
+        if self.report_cache is not None and versions is not None:
+            # Sub-reports are already computed, make them available to the
+            # single-module endpoints as well
+            await self.report_cache.put(
+                self._technical_key(
+                    ticker, daily_analysis_type, required_type, versions
+                ),
+                cleaned_report.technical_report,
+            )
+            await self.report_cache.put(
+                self._forecasting_key(ticker, versions),
+                cleaned_report.forecasting_report,
+            )
+            await self.report_cache.put(
+                self._news_key(ticker, versions), cleaned_report.news_report
+            )
+
+        return cleaned_report
 
     async def get_full_explaination_report(
         self,
@@ -490,15 +818,11 @@ class AnalysisOrchestrator:
             return pd.DataFrame()
 
         # STEP 2: CREATE FEATURES FOR AGGREGATED DATA
-        # Note: Need to iterate through each ticker to create correct features
+        # Features are computed per ticker, for all tickers at once
         logger.info("CEO -> TechAnalyzer: Generating features for sector data...")
-        all_enriched_dfs = []
-        for ticker, group_df in sector_ohlcv_df.groupby("ticker"):
-            logger.info(f"  - Generating features for {ticker}...")
-            enriched_ticker_df = self.tech_analyzer.get_daily_features(group_df)
-            all_enriched_dfs.append(enriched_ticker_df)
-
-        enriched_sector_df = pd.concat(all_enriched_dfs)
+        enriched_sector_df = self.tech_analyzer.get_sector_daily_features(
+            sector_ohlcv_df
+        )
 
         # STEP 3 (FUTURE): CREATE TARGETS
         # training_ready_df = self.forecasting_pipeline.create_targets(enriched_sector_df)
@@ -542,7 +866,9 @@ class AnalysisOrchestrator:
             logger.warn(f"  No daily data for '{ticker}'. Skipping ticker.")
             return
 
-        enriched_daily_df = self.tech_analyzer.get_daily_features(full_daily_df).copy()
+        enriched_daily_df = (
+            await self._get_daily_features(full_daily_df, ticker)
+        ).copy()
 
         target_dates_ts = pd.to_datetime(backtest_dates, utc=True)
         target_dates_iloc = enriched_daily_df.index.get_indexer(
@@ -579,7 +905,13 @@ class AnalysisOrchestrator:
             )
             return
 
-        # 3. Prepare Technical and News tasks to run in parallel
+        # 3. Load news of the whole range once, each date only slices it
+        last_backtest_date = enriched_daily_df.index[valid_target_ilocs.max()]
+        news_window = self.data_preparer.get_history_news_window_for_ticker(
+            ticker, last_backtest_date.to_pydatetime()
+        )
+
+        # 4. Prepare Technical and News tasks to run in parallel
         tasks_to_gather = []
         for iloc_pos in valid_target_ilocs:
             # Prepare data slice for technical
@@ -597,22 +929,21 @@ class AnalysisOrchestrator:
 
             # Create task for News Analysis (it's async itself)
             backtest_date = current_date_ohlcv.name.to_pydatetime()
-            news_texts = self.data_preparer.get_history_news_for_ticker(
-                ticker, backtest_date
-            )
+            news_texts = news_window.get_news_texts(backtest_date)
             news_task = self.news_analyzer.generate_report(ticker, news_texts)
             tasks_to_gather.append(news_task)
 
-        # 4. Run all Technical and News tasks in parallel
+        # 5. Run all Technical and News tasks in parallel
         logger.info(
             f"  Running {len(tasks_to_gather)} Technical/News tasks in parallel for '{ticker}'..."
         )
         other_reports = await asyncio.gather(*tasks_to_gather, return_exceptions=True)
 
-        # 5. Assemble and save each report
+        # 6. Assemble and save each report
         logger.info(
             f"  Assembling and saving {len(selected_datas)} reports for '{ticker}'..."
         )
+        reports_to_save = []
         for i, iloc_pos in enumerate(valid_target_ilocs):
             backtest_date: datetime = enriched_daily_df.iloc[
                 iloc_pos
@@ -649,7 +980,10 @@ class AnalysisOrchestrator:
             report_to_save = QuickCheckAnalysisReport.model_validate(
                 cleaned_report_dict
             )
-            self.backtest_generator.save_report(report_to_save, backtest_date)
+            reports_to_save.append((report_to_save, backtest_date))
+
+        # All reports of the ticker go to the database in one transaction
+        self.backtest_generator.save_reports(reports_to_save)
 
         logger.info(f"  -> SUCCESS: Finished processing reports for '{ticker}'.")
 
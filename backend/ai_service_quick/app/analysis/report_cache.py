@@ -0,0 +1,97 @@
+"""Two-level cache for analysis reports shared across workers."""
+
+from typing import Callable, Coroutine, Type, TypeVar
+
+from itapia_common.dblib.cache.memory import AsyncInMemoryCache
+from itapia_common.dblib.cache.remote import AsyncRedisCache
+from itapia_common.logger import ITAPIALogger
+from pydantic import BaseModel, ValidationError
+
+logger = ITAPIALogger("Analysis Report Cache")
+
+ReportT = TypeVar("ReportT", bound=BaseModel)
+
+
+class AnalysisReportCache:
+    """Cache analysis reports in a short-lived in-process L1 backed by a shared Redis L2.
+
+    Keys are expected to embed the version of the input data, so entries never
+    need explicit invalidation; they are simply no longer requested.
+    """
+
+    def __init__(
+        self,
+        redis_cache: AsyncRedisCache | None,
+        l1_ttl_seconds: float,
+        l1_max_entries: int,
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis_cache (AsyncRedisCache | None): Shared L2 cache. If None, only L1 is used.
+            l1_ttl_seconds (float): Lifetime of reports in the in-process cache.
+            l1_max_entries (int): Maximum number of reports kept in the in-process cache.
+        """
+        self.l1 = AsyncInMemoryCache(
+            max_entries=l1_max_entries, ttl_seconds=l1_ttl_seconds
+        )
+        self.l2 = redis_cache
+
+    async def get_or_compute(
+        self,
+        key: str,
+        report_type: Type[ReportT],
+        report_factory: Callable[[], Coroutine],
+    ) -> ReportT:
+        """Get a report from L1, then L2, and compute it with `report_factory` on a miss.
+
+        Concurrent misses for the same key in this process share one computation.
+
+        Args:
+            key (str): Cache key, including the data version.
+            report_type (Type[ReportT]): Pydantic model used to decode L2 entries.
+            report_factory (Callable[[], Coroutine]): Async function computing the report.
+
+        Returns:
+            ReportT: A copy of the cached or newly computed report.
+        """
+
+        async def load() -> ReportT:
+            cached = await self._get_l2(key, report_type)
+            if cached is not None:
+                logger.info(f"L2 HIT for report '{key}'")
+                return cached
+            report = await report_factory()
+            await self._set_l2(key, report)
+            return report
+
+        report = await self.l1.get_or_set_with_lock(key, load)
+        # Cached reports are shared, hand out copies so callers cannot alter them
+        return report.model_copy(deep=True)
+
+    async def put(self, key: str, report: BaseModel) -> None:
+        """Store an already computed report in both levels.
+
+        Args:
+            key (str): Cache key, including the data version.
+            report (BaseModel): Report to store.
+        """
+        self.l1.set(key, report.model_copy(deep=True))
+        await self._set_l2(key, report)
+
+    async def _get_l2(self, key: str, report_type: Type[ReportT]) -> ReportT | None:
+        if self.l2 is None:
+            return None
+        raw = await self.l2.get(key)
+        if raw is None:
+            return None
+        try:
+            return report_type.model_validate_json(raw)
+        except ValidationError as e:
+            # Entry written by an older schema, recompute it
+            logger.warn(f"Discarding undecodable cached report '{key}': {e}")
+            return None
+
+    async def _set_l2(self, key: str, report: BaseModel) -> None:
+        if self.l2 is not None:
+            await self.l2.set(key, report.model_dump_json())
@@ -47,6 +47,24 @@ class DailyAnalysisEngine:
         },
     }
 
+    # Feature columns read by the engine and its analyzers, so callers can compute
+    # only these. Any CDL_ column stands for all candlestick patterns.
+    REQUIRED_FEATURES = [
+        "SMA_20",
+        "SMA_50",
+        "SMA_200",
+        "RSI_14",
+        "ADX_14",
+        "DMP_14",
+        "DMN_14",
+        "BBU_20_2.0",
+        "BBM_20_2.0",
+        "BBL_20_2.0",
+        "ATRr_14",
+        "PSARs_0.02_0.2",
+        "CDL_HAMMER",
+    ]
+
     def __init__(
         self,
         feature_df: pd.DataFrame,
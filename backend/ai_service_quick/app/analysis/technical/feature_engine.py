@@ -1,7 +1,10 @@
 """Feature engineering engines for technical analysis of financial time series data."""
 
 import inspect
-from typing import Any, Dict, List, Optional
+import json
+import math
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -10,6 +13,64 @@ from itapia_common.logger import ITAPIALogger
 
 logger = ITAPIALogger("Feature Engine")
 
+# pandas-ta input arguments and the OHLCV columns they are fed from
+_OHLCV_INPUTS = {
+    "open_": "open",
+    "high": "high",
+    "low": "low",
+    "close": "close",
+    "volume": "volume",
+}
+
+
+class _IndicatorStep:
+    """One indicator config compiled for repeated execution.
+
+    Holds the pandas-ta function, the validated parameters, the OHLCV inputs it is
+    called with and the columns it produces, so none of them is looked up again
+    when the step runs.
+    """
+
+    def __init__(
+        self,
+        indicator_name: str,
+        function: Callable[..., Any],
+        params: Dict[str, Any],
+        inputs: List[Tuple[str, str]],
+    ):
+        self.indicator_name = indicator_name
+        self.function = function
+        self.params = params
+        self.inputs = inputs
+        self.key = (indicator_name, json.dumps(params, sort_keys=True, default=str))
+        self.output_columns: List[str] = []
+
+    def run(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Compute the indicator over a frame with lowercase OHLCV columns."""
+        kwargs = {arg: df[column] for arg, column in self.inputs}
+        result = self.function(**kwargs, **self.params)
+        if result is None:
+            return None
+        return result.to_frame() if isinstance(result, pd.Series) else result
+
+
+def _get_compile_frame(min_length: int) -> pd.DataFrame:
+    """Deterministic OHLCV frame long enough for every configured window."""
+    t = np.arange(max(min_length, 100), dtype=np.float64)
+    close = 100 + 10 * np.sin(t / 7) + 0.05 * t
+    open_ = np.roll(close, 1)
+    open_[0] = close[0]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + 1 + np.cos(t / 3) ** 2,
+            "low": np.minimum(open_, close) - 1 - np.sin(t / 5) ** 2,
+            "close": close,
+            "volume": 1e6 + 1e5 * np.cos(t / 5),
+        },
+        index=pd.date_range("2000-01-03", periods=len(t), freq="D"),
+    )
+
 
 class _FeatureEngine:
     """Abstract base class for Feature Engines.
@@ -23,6 +84,21 @@ class _FeatureEngine:
         DEFAULT_CONFIG (Dict): A dictionary of default configurations for indicators.
     """
 
+    # Compiled indicator steps, shared by all engines of the process and keyed by
+    # indicator name and configs. Configs are the same for (almost) every request.
+    _PLAN_CACHE: Dict[Tuple[str, str], List[_IndicatorStep]] = {}
+    _PLAN_CACHE_LOCK = threading.Lock()
+
+    # Weight left to the bars before the warm-up window in recursive (EMA, Wilder)
+    # indicators, small enough not to show in the rounded values of the reports.
+    WARMUP_TOLERANCE = 1e-4
+    # PSAR has no bounded memory, it forgets its start after a couple of reversals
+    PATH_DEPENDENT_WARMUP = 100
+    # Shortest warm-up of any feature set (e.g. candlestick pattern lookbacks)
+    MIN_WARMUP = 1
+    # pandas-ta window lengths used when a config does not set one
+    _DEFAULT_LENGTHS = {"sma": 10, "ema": 10, "bbands": 5, "donchian": 20}
+
     def __init__(self, ohlcv_df: pd.DataFrame):
         """Initialize Feature Engine with an OHLCV DataFrame.
 
@@ -45,6 +121,8 @@ class _FeatureEngine:
             raise ValueError(f"DataFrame must have cols: {required_cols}")
         if "ta" in self.df.columns:
             self.df.drop(columns=["ta"], inplace=True)
+        # Steps already run on this frame, an identical config is computed once
+        self._executed_steps = set()
 
     def get_features(
         self,
@@ -75,9 +153,8 @@ class _FeatureEngine:
 
         return df
 
-    def _handle_nans(
-        self, df: pd.DataFrame, method: str = "forward_fill"
-    ) -> pd.DataFrame:
+    @staticmethod
+    def _handle_nans(df: pd.DataFrame, method: str = "forward_fill") -> pd.DataFrame:
         """Handle NaN values in DataFrame after computing indicators.
 
         Args:
@@ -106,43 +183,119 @@ class _FeatureEngine:
 
         return df
 
-    # --- CORE HELPER FUNCTION (FINAL ENHANCED VERSION) ---
-    def _add_generic_indicator(
-        self, indicator_name: str, configs: Optional[List[Dict[str, Any]]] = None
-    ):
-        """Generic function to add any indicator from pandas-ta.
+    # --- WARM-UP ---
+    @classmethod
+    def get_warmup(
+        cls, all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> int:
+        """Return how many bars the features need before their values can be used.
 
-        Actively validates parameters using inspect.signature.
+        Unlike `DailyFeatureEngine.get_lookback`, recursive indicators are given the bars needed for
+        the weight of their initialization to fall below `WARMUP_TOLERANCE`, so the
+        last bars of a tail of this length match the values over the full history.
+        Running totals (e.g. OBV) never converge in level and are not covered.
 
         Args:
-            indicator_name (str): Name of the indicator to add
-            configs (Optional[List[Dict[str, Any]]], optional): Configuration parameters.
-                If None, uses DEFAULT_CONFIG.
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional): Configurations
+                for all indicators. Defaults to `DEFAULT_CONFIG`.
 
         Returns:
-            Self: Returns self for method chaining
+            int: Number of bars.
         """
-        logger.debug(f"Adding indicator {indicator_name} to Frame ...")
-        if configs is None:
-            configs = self.DEFAULT_CONFIG.get(indicator_name)
-            if configs is None:
-                logger.warn(
-                    f"Warning: No default config for '{indicator_name}'. Skipping."
+        all_configs = all_configs or cls.DEFAULT_CONFIG
+        max_warmup, max_lag = cls.MIN_WARMUP, 0
+        for indicator_name, configs in all_configs.items():
+            for config in configs:
+                if indicator_name == "lag":
+                    max_lag = max([max_lag, *config.get("periods", [])])
+                    continue
+                max_warmup = max(
+                    max_warmup, cls._get_config_warmup(indicator_name, config)
                 )
-                return self
-        try:
-            indicator_function = getattr(self.df.ta, indicator_name)
-        except AttributeError:
+        return max_warmup + max_lag
+
+    @classmethod
+    def _get_config_warmup(cls, indicator_name: str, config: Dict[str, Any]) -> int:
+        """Warm-up of a single indicator config, see `get_warmup`."""
+
+        def decay(alpha: float) -> int:
+            # Bars for (1 - alpha)^n to drop below the tolerance
+            return math.ceil(math.log(cls.WARMUP_TOLERANCE) / math.log(1 - alpha))
+
+        windows = [
+            value
+            for value in config.values()
+            if isinstance(value, int) and not isinstance(value, bool)
+        ]
+        length = (
+            max(windows) if windows else cls._DEFAULT_LENGTHS.get(indicator_name, 14)
+        )
+
+        if indicator_name == "ema":
+            return length + decay(2 / (length + 1))
+        if indicator_name in ("rsi", "atr"):
+            return length + decay(1 / length)
+        if indicator_name == "adx":
+            # Wilder smoothing of the directional movement, then of DX
+            return length + 2 * decay(1 / length)
+        if indicator_name == "macd":
+            slow, signal = config.get("slow", 26), config.get("signal", 9)
+            return slow + decay(2 / (slow + 1)) + signal + decay(2 / (signal + 1))
+        if indicator_name == "stoch":
+            return config.get("k", 14) + config.get("d", 3) + config.get("smooth_k", 3)
+        if indicator_name == "psar":
+            return cls.PATH_DEPENDENT_WARMUP
+        if indicator_name in ("obv", "vwap"):
+            return 1
+        return length + 1
+
+    # --- EXECUTION PLAN ---
+    @classmethod
+    def get_plan(
+        cls, indicator_name: str, configs: List[Dict[str, Any]]
+    ) -> List[_IndicatorStep]:
+        """Get the compiled steps of an indicator's configs, compiling them once.
+
+        Args:
+            indicator_name (str): Name of the pandas-ta indicator.
+            configs (List[Dict[str, Any]]): Configuration parameters.
+
+        Returns:
+            List[_IndicatorStep]: One step per valid, distinct config.
+        """
+        key = (indicator_name, json.dumps(configs, sort_keys=True, default=str))
+        plan = cls._PLAN_CACHE.get(key)
+        if plan is None:
+            with cls._PLAN_CACHE_LOCK:
+                plan = cls._PLAN_CACHE.get(key)
+                if plan is None:
+                    plan = cls._compile_plan(indicator_name, configs)
+                    cls._PLAN_CACHE[key] = plan
+        return plan
+
+    @staticmethod
+    def _compile_plan(
+        indicator_name: str, configs: List[Dict[str, Any]]
+    ) -> List[_IndicatorStep]:
+        """Resolve the pandas-ta function, validate params and name the outputs.
+
+        Output columns are taken from one run over a small synthetic frame.
+        """
+        logger.debug(f"Compiling indicator plan for {indicator_name} ...")
+        indicator_function = getattr(ta, indicator_name, None)
+        if not callable(indicator_function):
             logger.err(
                 f"Warning: Indicator '{indicator_name}' not found in pandas-ta. Skipping."
             )
-            return self
+            return []
 
-        # Get list of valid parameter names from function signature
-        valid_params = list(inspect.signature(indicator_function).parameters.keys())
-        # Add common parameters that pandas-ta uses
+        parameters = inspect.signature(indicator_function).parameters
+        inputs = [(arg, col) for arg, col in _OHLCV_INPUTS.items() if arg in parameters]
+        # Accepted for compatibility with the pandas-ta DataFrame accessor
+        valid_params = [name for name in parameters if name not in _OHLCV_INPUTS]
         valid_params.extend(["append", "col_names"])
 
+        plan, seen_keys = [], set()
         for config in configs:
             # Find invalid keys in config
             invalid_keys = [key for key in config.keys() if key not in valid_params]
@@ -155,8 +308,66 @@ class _FeatureEngine:
                 )
                 continue
 
-            # If no invalid keys, call function safely
-            indicator_function(**config, append=True)
+            params = {
+                name: value
+                for name, value in config.items()
+                if name not in ("append", "col_names")
+            }
+            step = _IndicatorStep(indicator_name, indicator_function, params, inputs)
+            if step.key in seen_keys:
+                continue
+            seen_keys.add(step.key)
+
+            windows = [
+                value
+                for value in params.values()
+                if isinstance(value, int) and not isinstance(value, bool)
+            ]
+            result = step.run(_get_compile_frame(3 * max([0, *windows])))
+            step.output_columns = list(result.columns) if result is not None else []
+            plan.append(step)
+        return plan
+
+    def _run_step(self, step: _IndicatorStep):
+        """Run a compiled step on the frame and append its output columns."""
+        if step.key in self._executed_steps:
+            return
+        result = step.run(self.df)
+        self._executed_steps.add(step.key)
+        if result is None:
+            return
+        for i, column in enumerate(result.columns):
+            self.df[column] = result.iloc[:, i]
+
+    # --- CORE HELPER FUNCTION (FINAL ENHANCED VERSION) ---
+    def _add_generic_indicator(
+        self, indicator_name: str, configs: Optional[List[Dict[str, Any]]] = None
+    ):
+        """Generic function to add any indicator from pandas-ta.
+
+        Configs are compiled once per process into an execution plan (see
+        `get_plan`); parameters are validated against the pandas-ta function
+        signature at that point, not on every call.
+
+        Args:
+            indicator_name (str): Name of the indicator to add
+            configs (Optional[List[Dict[str, Any]]], optional): Configuration parameters.
+                If None, uses DEFAULT_CONFIG.
+
+        Returns:
+            Self: Returns self for method chaining
+        """
+        logger.debug(f"Adding indicator {indicator_name} to Frame ...")
+        if configs is None:
+            configs = self.DEFAULT_CONFIG.get(indicator_name)
+            if configs is None:
+                logger.warn(
+                    f"Warning: No default config for '{indicator_name}'. Skipping."
+                )
+                return self
+
+        for step in self.get_plan(indicator_name, configs):
+            self._run_step(step)
 
         return self
 
@@ -200,6 +411,23 @@ class DailyFeatureEngine(_FeatureEngine):
         ],
     }
 
+    # Running totals whose level depends on where the input starts, not only on
+    # the preceding bars.
+    CUMULATIVE_FEATURES: List[str] = ["OBV"]
+
+    # Candlestick patterns look back at most this many bars (body/shadow averages)
+    MIN_WARMUP = 32
+
+    # Columns each interaction feature is computed from (see `add_interaction_features`)
+    INTERACTION_DEPENDENCIES: Dict[str, List[str]] = {
+        "RSI_x_trend": ["diff_from_sma_200", "RSI_14"],
+        "CCI_norm_by_ATR": ["CCI_14_0.015", "ATRr_14"],
+        "hammer_in_oversold": ["CDL_HAMMER", "RSI_14"],
+    }
+
+    # Configs that are not pandas-ta indicators
+    _CUSTOM_FEATURES = ("diff_from_sma", "return_d", "lag")
+
     def __init__(self, ohlcv_df: pd.DataFrame):
         """Initialize DailyFeatureEngine with OHLCV DataFrame.
 
@@ -208,6 +436,121 @@ class DailyFeatureEngine(_FeatureEngine):
         """
         super().__init__(ohlcv_df)
 
+    @classmethod
+    def resolve_required_configs(
+        cls,
+        required_columns: Iterable[str],
+        all_configs: Optional[Dict[str, List[Dict[str, any]]]] = None,
+    ) -> Tuple[Dict[str, List[Dict[str, any]]], bool, bool]:
+        """Reduce the configs to the ones producing the required columns.
+
+        Dependencies are followed backwards: lag features need their source column,
+        `diff_from_sma_*` needs its SMA and interaction features need their inputs.
+        Any `CDL_*` column requires all candlestick patterns, which pandas-ta
+        computes in a single call.
+
+        Args:
+            required_columns (Iterable[str]): Feature columns the caller reads.
+            all_configs (Optional[Dict[str, List[Dict[str, any]]]], optional): Configurations
+                for all indicators, missing ones fall back to `DEFAULT_CONFIG`.
+
+        Returns:
+            Tuple[Dict[str, List[Dict[str, any]]], bool, bool]: The reduced configs
+                (only non-empty entries), whether candlestick patterns and whether
+                interaction features are needed.
+        """
+        all_configs = {**cls.DEFAULT_CONFIG, **(all_configs or {})}
+        required = set(required_columns) - set(_OHLCV_INPUTS.values())
+        resolved: Dict[str, List[Dict[str, any]]] = {}
+
+        # Interaction features
+        add_interactions = False
+        for column, dependencies in cls.INTERACTION_DEPENDENCIES.items():
+            if column in required:
+                add_interactions = True
+                required.update(dependencies)
+        required.difference_update(cls.INTERACTION_DEPENDENCIES)
+
+        # Lag features, before the columns they shift are resolved
+        for config in all_configs.get("lag") or []:
+            column = config.get("column")
+            periods = [
+                period
+                for period in config.get("periods") or []
+                if f"{column}_lag_{period}" in required
+            ]
+            if column and periods:
+                resolved.setdefault("lag", []).append({**config, "periods": periods})
+                required.difference_update(f"{column}_lag_{p}" for p in periods)
+                required.add(column)
+        required.difference_update(_OHLCV_INPUTS.values())
+
+        # Custom features
+        for config in all_configs.get("diff_from_sma") or []:
+            column = f"diff_from_sma_{config.get('sma_length')}"
+            if column in required:
+                resolved.setdefault("diff_from_sma", []).append(config)
+                required.discard(column)
+                required.add(f"SMA_{config.get('sma_length')}")
+        for config in all_configs.get("return_d") or []:
+            column = f"return_{config.get('d')}d"
+            if column in required:
+                resolved.setdefault("return_d", []).append(config)
+                required.discard(column)
+
+        # Candlestick patterns
+        add_candles = any(column.startswith("CDL_") for column in required)
+        required = {column for column in required if not column.startswith("CDL_")}
+
+        # pandas-ta indicators, matched on the output columns of their compiled plan
+        for indicator_name, configs in all_configs.items():
+            if indicator_name in cls._CUSTOM_FEATURES or not hasattr(
+                cls, f"add_{indicator_name}"
+            ):
+                continue
+            for config in configs or []:
+                for step in cls.get_plan(indicator_name, [config]):
+                    if required.intersection(step.output_columns):
+                        resolved.setdefault(indicator_name, []).append(config)
+                        required.difference_update(step.output_columns)
+
+        if required:
+            logger.warn(
+                f"Warning: No configured feature produces columns {sorted(required)}."
+            )
+        return resolved, add_candles, add_interactions
+
+    @classmethod
+    def get_lookback(
+        cls, all_configs: Optional[Dict[str, List[Dict[str, any]]]] = None
+    ) -> int:
+        """Return how many preceding bars the features of a bar depend on.
+
+        Lag features shift other features (e.g. `diff_from_sma_50`), so the longest
+        indicator window plus the longest lag is used as an upper bound.
+
+        Args:
+            all_configs (Optional[Dict[str, List[Dict[str, any]]]], optional): Configurations
+                for all indicators. Defaults to `DEFAULT_CONFIG`.
+
+        Returns:
+            int: Number of bars.
+        """
+        all_configs = all_configs or cls.DEFAULT_CONFIG
+        max_window, max_lag = 1, 0
+        for indicator_name, configs in all_configs.items():
+            for config in configs:
+                if indicator_name == "lag":
+                    max_lag = max([max_lag, *config.get("periods", [])])
+                    continue
+                windows = [
+                    value
+                    for value in config.values()
+                    if isinstance(value, int) and not isinstance(value, bool)
+                ]
+                max_window = max([max_window, *windows])
+        return max_window + max_lag
+
     # --- INDICATOR WRAPPER METHODS ---
     def add_sma(self, configs: Optional[List[Dict[str, any]]] = None):
         return self._add_generic_indicator("sma", configs)
@@ -520,6 +863,44 @@ class DailyFeatureEngine(_FeatureEngine):
         )
         return self
 
+    def add_required_features(
+        self,
+        required_columns: Iterable[str],
+        all_configs: Optional[Dict[str, List[Dict[str, any]]]] = None,
+    ):
+        """Add only the features needed to produce the required columns.
+
+        Values of the required columns are the same as with `add_all_features`;
+        other columns of the indicators involved (e.g. the MACD signal line) may be
+        added as well.
+
+        Args:
+            required_columns (Iterable[str]): Feature columns the caller reads.
+            all_configs (Optional[Dict[str, List[Dict[str, any]]]], optional): Configurations for all indicators
+
+        Returns:
+            Self: Returns self for method chaining
+        """
+        logger.info("Daily Feature Engine: === Adding Required Features ===")
+        configs, add_candles, add_interactions = self.resolve_required_configs(
+            required_columns, all_configs
+        )
+
+        for indicator_name, indicator_configs in configs.items():
+            if indicator_name not in self._CUSTOM_FEATURES:
+                getattr(self, f"add_{indicator_name}")(indicator_configs)
+        if "diff_from_sma" in configs:
+            self.add_diff_from_sma(configs["diff_from_sma"])
+        if "return_d" in configs:
+            self.add_return_d(configs["return_d"])
+        if "lag" in configs:
+            self.add_lag_features(configs["lag"])
+        if add_candles:
+            self.add_all_candlestick_patterns()
+        if add_interactions:
+            self.add_interaction_features()
+        return self
+
 
 class IntradayFeatureEngine(_FeatureEngine):
     """Feature generator expert for intraday time series data.
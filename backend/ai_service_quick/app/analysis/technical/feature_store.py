@@ -0,0 +1,252 @@
+"""Local Parquet store of daily technical features, extended bar by bar."""
+
+import os
+import pickle
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from itapia_common.logger import ITAPIALogger
+
+logger = ITAPIALogger("Daily Feature Store")
+
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+class DailyFeatureStore:
+    """Persist the daily feature frame of each ticker as one Parquet file.
+
+    The file keeps the raw features (before NaN handling) of every stored bar. When
+    new bars arrive, features are only computed over the new bars plus `lookback`
+    preceding ones and appended to the stored frame. Any change in already stored
+    OHLCV values (e.g. split adjustments) or in the feature set triggers a full rebuild.
+
+    With `create_stream`, a streaming feature engine is also persisted next to each
+    file, so new bars are appended in O(1) per bar instead of recomputing the tail.
+    The tail recompute stays the fallback whenever the stream does not line up. A
+    stream persisted with another fingerprint (engine version or indicator configs)
+    is never reused, the features of the ticker are rebuilt instead.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        compute_features: Callable[[pd.DataFrame], pd.DataFrame],
+        lookback: int,
+        cumulative_features: Optional[list] = None,
+        create_stream: Optional[Callable[[pd.DataFrame], Any]] = None,
+        stream_fingerprint: Optional[str] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            base_path (str): Directory holding one `<TICKER>.parquet` file per ticker.
+            compute_features (Callable[[pd.DataFrame], pd.DataFrame]): Computes raw
+                features (no NaN handling) from an OHLCV frame.
+            lookback (int): Number of bars preceding the new ones that are recomputed
+                so that windowed and recursive indicators are warmed up.
+            cumulative_features (Optional[list], optional): Running-total columns that
+                are re-based onto the stored values when appending. Defaults to None.
+            create_stream (Optional[Callable[[pd.DataFrame], Any]], optional): Seeds
+                a streaming engine (e.g. `StreamingFeatureEngine.from_history`) from the
+                OHLCV frame of a rebuild. The engine must expose `last_timestamp` and
+                `extend(ohlcv_df)` returning raw feature rows. Defaults to None.
+            stream_fingerprint (Optional[str], optional): Identifies the engines
+                `create_stream` returns (e.g. `StreamingFeatureEngine.
+                get_state_fingerprint`), stored with each persisted engine.
+                Defaults to None.
+        """
+        self.base_path = base_path
+        self.compute_features = compute_features
+        self.lookback = lookback
+        self.cumulative_features = cumulative_features or []
+        self.create_stream = create_stream
+        self.stream_fingerprint = stream_fingerprint
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get_features(self, ticker: str, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        """Return forward-filled features for the bars of an OHLCV frame.
+
+        Same output as `get_features(handle_na_method="forward_fill")` of the feature
+        engine, except that warm-up rows are kept when older bars are stored.
+
+        Args:
+            ticker (str): Ticker symbol.
+            ohlcv_df (pd.DataFrame): OHLCV data sorted by a DatetimeIndex.
+
+        Returns:
+            pd.DataFrame: Feature frame limited to the time range of `ohlcv_df`.
+        """
+        ticker = ticker.upper()
+        with self._get_lock(ticker):
+            raw_features = self._sync(ticker, ohlcv_df)
+
+        window = raw_features.loc[ohlcv_df.index[0] : ohlcv_df.index[-1]].copy()
+        window.ffill(inplace=True)
+        window.dropna(inplace=True)
+        return window
+
+    def _get_lock(self, ticker: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _get_path(self, ticker: str) -> str:
+        return os.path.join(self.base_path, f"{ticker}.parquet")
+
+    def _get_stream_path(self, ticker: str) -> str:
+        return os.path.join(self.base_path, f"{ticker}.stream.pkl")
+
+    def _sync(self, ticker: str, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        """Bring the stored features of a ticker up to date with `ohlcv_df`."""
+        stored = self._load(ticker)
+        if stored is None or not self._is_consistent(stored, ohlcv_df):
+            return self._rebuild(ticker, ohlcv_df)
+
+        new_bars = ohlcv_df.index > stored.index[-1]
+        n_new = int(new_bars.sum())
+        if n_new == 0:
+            return stored
+
+        if self.create_stream is not None:
+            stream, is_stale = self._load_stream(ticker)
+            if is_stale:
+                logger.warn(
+                    f"Stored stream of {ticker} comes from another engine version "
+                    "or indicator config, rebuilding stored features."
+                )
+                return self._rebuild(ticker, ohlcv_df)
+            streamed = self._append_streamed(
+                ticker, stored, stream, ohlcv_df.loc[new_bars]
+            )
+            if streamed is not None:
+                return streamed
+
+        start = max(0, len(ohlcv_df) - n_new - self.lookback)
+        tail = self.compute_features(ohlcv_df.iloc[start:])
+        if list(tail.columns) != list(stored.columns):
+            logger.warn(f"Feature set of {ticker} changed, rebuilding stored features.")
+            return self._rebuild(ticker, ohlcv_df)
+
+        # Running totals restart at the beginning of the tail, shift them so they
+        # continue from the last stored bar.
+        anchor = stored.index[-1]
+        appended = tail.loc[tail.index > anchor].copy()
+        for column in self.cumulative_features:
+            if column in appended.columns and anchor in tail.index:
+                appended[column] += stored.at[anchor, column] - tail.at[anchor, column]
+
+        logger.info(f"Appending {n_new} bars to stored features of {ticker}.")
+        return self._save(ticker, pd.concat([stored, appended]))
+
+    def _rebuild(self, ticker: str, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        logger.info(f"Rebuilding stored features of {ticker}...")
+        raw_features = self._save(ticker, self.compute_features(ohlcv_df))
+        if self.create_stream is not None:
+            self._remove_stream(ticker)
+            try:
+                self._save_stream(ticker, self.create_stream(ohlcv_df))
+            except ValueError as e:
+                logger.warn(f"Cannot stream features of {ticker}: {e}")
+        return raw_features
+
+    def _append_streamed(
+        self,
+        ticker: str,
+        stored: pd.DataFrame,
+        stream: Optional[Any],
+        new_ohlcv_df: pd.DataFrame,
+    ) -> Optional[pd.DataFrame]:
+        """Append new bars with the persisted stream, None if it cannot be used."""
+        if stream is None or stream.last_timestamp != stored.index[-1]:
+            return None
+
+        appended = stream.extend(new_ohlcv_df)
+        if list(appended.columns) != list(stored.columns):
+            logger.warn(f"Streamed features of {ticker} differ from stored ones.")
+            self._remove_stream(ticker)
+            return None
+
+        logger.info(f"Streaming {len(appended)} bars into stored features of {ticker}.")
+        raw_features = self._save(ticker, pd.concat([stored, appended]))
+        self._save_stream(ticker, stream)
+        return raw_features
+
+    def _is_consistent(self, stored: pd.DataFrame, ohlcv_df: pd.DataFrame) -> bool:
+        """Check that `ohlcv_df` only extends the stored bars without rewriting them."""
+        if ohlcv_df.index[0] < stored.index[0]:
+            # Older history than what was stored, rebuild over the longer range
+            return False
+
+        overlap = ohlcv_df.loc[ohlcv_df.index <= stored.index[-1], _OHLCV_COLUMNS]
+        if overlap.empty:
+            # A gap between the stored and the new bars
+            return False
+        stored_overlap = stored.loc[overlap.index[0] :, _OHLCV_COLUMNS]
+        if not overlap.index.equals(stored_overlap.index):
+            return False
+        return np.allclose(
+            overlap.to_numpy(dtype=np.float64),
+            stored_overlap.to_numpy(dtype=np.float64),
+            equal_nan=True,
+        )
+
+    def _load(self, ticker: str) -> Optional[pd.DataFrame]:
+        path = self._get_path(ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            stored = pd.read_parquet(path)
+        except Exception as e:
+            logger.warn(f"Cannot read stored features of {ticker}: {e}")
+            return None
+        return stored if not stored.empty else None
+
+    def _save(self, ticker: str, raw_features: pd.DataFrame) -> pd.DataFrame:
+        os.makedirs(self.base_path, exist_ok=True)
+        path = self._get_path(ticker)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        raw_features.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        return raw_features
+
+    def _load_stream(self, ticker: str) -> Tuple[Optional[Any], bool]:
+        """Load the persisted stream of a ticker.
+
+        Returns:
+            Tuple[Optional[Any], bool]: The stream, None if there is none, and whether
+                a stream was persisted by another engine version or configuration.
+                A file that cannot be unpickled counts as such, since it was most
+                likely written by other code.
+        """
+        path = self._get_stream_path(ticker)
+        if not os.path.exists(path):
+            return None, False
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warn(f"Cannot read stored stream of {ticker}: {e}")
+            return None, True
+        if (
+            not isinstance(payload, dict)
+            or payload.get("fingerprint") != self.stream_fingerprint
+        ):
+            return None, True
+        return payload["stream"], False
+
+    def _save_stream(self, ticker: str, stream: Any):
+        path = self._get_stream_path(ticker)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        payload = {"fingerprint": self.stream_fingerprint, "stream": stream}
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _remove_stream(self, ticker: str):
+        try:
+            os.remove(self._get_stream_path(ticker))
+        except FileNotFoundError:
+            pass
@@ -1,7 +1,10 @@
 """Technical analysis orchestrator for coordinating feature engineering and analysis engines."""
 
-from typing import Literal
+import math
+import threading
+from typing import Dict, Iterable, Literal, Optional
 
+import numpy as np
 import pandas as pd
 from itapia_common.logger import ITAPIALogger
 from itapia_common.schemas.entities.analysis.technical import TechnicalReport
@@ -9,6 +12,9 @@ from itapia_common.schemas.entities.analysis.technical import TechnicalReport
 from .analysis_engine.daily import DailyAnalysisEngine
 from .analysis_engine.intraday import IntradayAnalysisEngine
 from .feature_engine import DailyFeatureEngine, IntradayFeatureEngine
+from .feature_store import DailyFeatureStore
+from .panel_feature_engine import DailyPanelFeatureEngine
+from .streaming_feature_engine import StreamingFeatureEngine
 
 logger = ITAPIALogger("Technical Orchestrator")
 
@@ -19,36 +25,178 @@ class TechnicalOrchestrator:
     Coordinates feature engineering and analysis engines for both daily and intraday data.
     """
 
-    def get_daily_features(self, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+    # Daily feature columns read by `get_daily_analysis`
+    DAILY_ANALYSIS_FEATURES = DailyAnalysisEngine.REQUIRED_FEATURES
+
+    def __init__(
+        self,
+        feature_store_path: Optional[str] = None,
+        warmup_factor: int = 1,
+        streaming: bool = False,
+        tail_mode: bool = False,
+        tail_margin: float = 0.25,
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            feature_store_path (Optional[str], optional): Directory of the local daily
+                feature store. Features are recomputed on every call if None.
+                Defaults to None.
+            warmup_factor (int, optional): Multiple of the indicator lookback recomputed
+                when appending new bars to the store. Defaults to 1.
+            streaming (bool, optional): Update intraday features, and daily features
+                appended to the store, bar by bar with `StreamingFeatureEngine`.
+                Defaults to False.
+            tail_mode (bool, optional): Fetch and compute only the latest bars needed
+                by the daily and intraday analyses, see `get_daily_analysis_lookback`.
+                Defaults to False.
+            tail_margin (float, optional): Share of the indicator warm-up added to the
+                tail as a safety margin. Defaults to 0.25.
+        """
+        self.streaming = streaming
+        self.tail_mode = tail_mode
+        self.tail_margin = tail_margin
+        self.feature_store = None
+        if feature_store_path:
+            self.feature_store = DailyFeatureStore(
+                feature_store_path,
+                compute_features=self._compute_raw_daily_features,
+                lookback=DailyFeatureEngine.get_lookback() * warmup_factor,
+                cumulative_features=DailyFeatureEngine.CUMULATIVE_FEATURES,
+                create_stream=self._create_daily_stream if streaming else None,
+                stream_fingerprint=StreamingFeatureEngine.get_state_fingerprint(
+                    "daily"
+                ),
+            )
+
+        self._intraday_streams: Dict[str, StreamingFeatureEngine] = {}
+        self._intraday_locks: Dict[str, threading.Lock] = {}
+        self._intraday_locks_guard = threading.Lock()
+
+    def get_daily_features(
+        self,
+        ohlcv_df: pd.DataFrame,
+        ticker: Optional[str] = None,
+        required_columns: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
         """Generate features for daily technical analysis.
 
+        When a ticker is given and the feature store is enabled, features of already
+        stored bars are read from the store and only new bars are computed.
+
         Args:
             ohlcv_df (pd.DataFrame): OHLCV data for feature generation
+            ticker (Optional[str], optional): Ticker of the data, used as the feature
+                store key. Defaults to None.
+            required_columns (Optional[Iterable[str]], optional): Feature columns the
+                caller reads. Only the indicators they depend on are computed, unless
+                the features are read from the store, which holds all of them.
+                Defaults to None (all features).
 
         Returns:
             pd.DataFrame: DataFrame enriched with technical features
         """
         logger.info("GENERATE DAILY FEATURES")
         try:
+            if ticker is not None and self.feature_store is not None:
+                return self._get_stored_daily_features(ohlcv_df, ticker)
             engine = DailyFeatureEngine(ohlcv_df)
-            return engine.add_all_features().get_features(
+            if required_columns is not None:
+                engine.add_required_features(required_columns)
+            else:
+                engine.add_all_features()
+            return engine.get_features(
                 handle_na_method="forward_fill", reset_index=False
             )
         except (ValueError, TypeError) as e:
             logger.err(f"Daily Feature Engine: {e}. Returning empty DataFrame.")
             return pd.DataFrame()
 
-    def get_intraday_features(self, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+    def _get_stored_daily_features(
+        self, ohlcv_df: pd.DataFrame, ticker: str
+    ) -> pd.DataFrame:
+        """Read daily features through the feature store, computing only new bars.
+
+        Columns other than OHLCV (e.g. `ticker` of sector data) are not stored and
+        are joined back onto the features. The store holds every feature, so
+        `required_columns` of `get_daily_features` does not apply here and all
+        feature columns are returned. This reads and writes local files, callers on
+        an event loop run it in an executor.
+        """
+        ohlcv_cols = ["open", "high", "low", "close", "volume"]
+        extra_cols = [col for col in ohlcv_df.columns if col not in ohlcv_cols]
+        try:
+            features = self.feature_store.get_features(ticker, ohlcv_df[ohlcv_cols])
+        except (ImportError, OSError) as e:
+            # Parquet engine missing or store directory not writable
+            logger.warn(f"Daily Feature Store: {e}. Computing features directly.")
+            engine = DailyFeatureEngine(ohlcv_df)
+            return engine.add_all_features().get_features(
+                handle_na_method="forward_fill", reset_index=False
+            )
+
+        if extra_cols:
+            features = features.join(ohlcv_df[extra_cols])
+        return features
+
+    def get_sector_daily_features(self, sector_ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        """Generate daily features for all tickers of a sector at once.
+
+        Args:
+            sector_ohlcv_df (pd.DataFrame): OHLCV data of several tickers, with a
+                `ticker` column.
+
+        Returns:
+            pd.DataFrame: Features of all tickers, ordered by ticker then time.
+        """
+        logger.info("GENERATE SECTOR DAILY FEATURES")
+        try:
+            engine = DailyPanelFeatureEngine(sector_ohlcv_df)
+            return engine.add_all_features().get_features(
+                handle_na_method="forward_fill"
+            )
+        except (ValueError, TypeError) as e:
+            logger.warn(f"Daily Panel Feature Engine: {e}. Computing per ticker.")
+            return pd.concat(
+                [
+                    self.get_daily_features(group_df, ticker)
+                    for ticker, group_df in sector_ohlcv_df.groupby("ticker")
+                ]
+            )
+
+    @staticmethod
+    def _compute_raw_daily_features(ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        engine = DailyFeatureEngine(ohlcv_df)
+        return engine.add_all_features().get_features(
+            handle_na_method=None, reset_index=False
+        )
+
+    @staticmethod
+    def _create_daily_stream(ohlcv_df: pd.DataFrame) -> StreamingFeatureEngine:
+        # Stored rows come from the batch engine, the stream only needs its states
+        return StreamingFeatureEngine.from_history(ohlcv_df, "daily", keep_rows=False)
+
+    def get_intraday_features(
+        self, ohlcv_df: pd.DataFrame, ticker: Optional[str] = None
+    ) -> pd.DataFrame:
         """Generate features for intraday technical analysis.
 
+        When a ticker is given and streaming is enabled, the features of each ticker
+        are kept in a streaming engine and only candles newer than the last call are
+        computed.
+
         Args:
             ohlcv_df (pd.DataFrame): OHLCV data for feature generation
+            ticker (Optional[str], optional): Ticker of the data, used as the key of
+                its streaming engine. Defaults to None.
 
         Returns:
             pd.DataFrame: DataFrame enriched with technical features
         """
         logger.info("GENERATE INTRADAY FEATURES")
         try:
+            if ticker is not None and self.streaming and not ohlcv_df.empty:
+                return self._get_streamed_intraday_features(ohlcv_df, ticker)
             engine = IntradayFeatureEngine(ohlcv_df)
             return engine.add_all_intraday_features().get_features(
                 handle_na_method="forward_fill", reset_index=False
@@ -57,6 +205,78 @@ class TechnicalOrchestrator:
             logger.err(f"Intraday Feature Engine: {e}. Returning empty DataFrame.")
             return pd.DataFrame()
 
+    def _get_streamed_intraday_features(
+        self, ohlcv_df: pd.DataFrame, ticker: str
+    ) -> pd.DataFrame:
+        """Extend the streaming engine of a ticker with its new candles.
+
+        The engine is rebuilt from `ohlcv_df` if its last candle is missing or changed,
+        e.g. after a gap in the stream or on a new process.
+        """
+        ticker = ticker.upper()
+        with self._get_intraday_lock(ticker):
+            engine = self._intraday_streams.get(ticker)
+            if engine is not None and engine.can_extend(ohlcv_df):
+                engine.extend(ohlcv_df.loc[ohlcv_df.index > engine.last_timestamp])
+            else:
+                engine = StreamingFeatureEngine.from_history(ohlcv_df, "intraday")
+                self._intraday_streams[ticker] = engine
+            engine.drop_rows_before(ohlcv_df.index[0])
+            return engine.get_features(handle_na_method="forward_fill")
+
+    def _get_intraday_lock(self, ticker: str) -> threading.Lock:
+        with self._intraday_locks_guard:
+            return self._intraday_locks.setdefault(ticker, threading.Lock())
+
+    def get_daily_analysis_lookback(
+        self, analysis_type: Literal["short", "medium", "long"] = "medium"
+    ) -> int:
+        """Number of latest daily bars `get_daily_analysis` needs.
+
+        The warm-up of the indicators the analysis reads, plus the safety margin,
+        comes before the history window the analyzers scan, so every bar of that
+        window has the same feature values as over the full history.
+
+        Args:
+            analysis_type (Literal['short', 'medium', 'long'], optional): Analysis timeframe.
+                Defaults to 'medium'.
+
+        Returns:
+            int: Number of bars.
+        """
+        configs, _, _ = DailyFeatureEngine.resolve_required_configs(
+            self.DAILY_ANALYSIS_FEATURES
+        )
+        warmup = DailyFeatureEngine.get_warmup(configs)
+        history_window = DailyAnalysisEngine.PARAMS_BY_PERIOD[analysis_type][
+            "history_window"
+        ]
+        return math.ceil(warmup * (1 + self.tail_margin)) + history_window
+
+    def get_intraday_analysis_tail(self, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        """Cut intraday candles to the tail `get_intraday_analysis` needs.
+
+        The tail covers the indicator warm-up plus the safety margin and is
+        extended to whole sessions, so session-anchored features (VWAP, opening
+        range) are the same as over all candles.
+
+        Args:
+            ohlcv_df (pd.DataFrame): Intraday OHLCV data sorted by time
+
+        Returns:
+            pd.DataFrame: Latest candles of `ohlcv_df`
+        """
+        if ohlcv_df.empty:
+            return ohlcv_df
+        n_candles = math.ceil(
+            IntradayFeatureEngine.get_warmup() * (1 + self.tail_margin)
+        )
+        start = max(0, len(ohlcv_df) - n_candles)
+        # Move back to the first candle of the session the tail starts in
+        dates = ohlcv_df.index.date
+        start = int(np.argmax(dates == dates[start]))
+        return ohlcv_df.iloc[start:]
+
     def get_daily_analysis(
         self,
         enriched_df: pd.DataFrame,
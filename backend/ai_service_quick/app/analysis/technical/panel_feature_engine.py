@@ -0,0 +1,505 @@
+"""Daily features of many tickers computed at once over a (bar x ticker) panel."""
+
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from itapia_common.logger import ITAPIALogger
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .feature_engine import DailyFeatureEngine
+
+logger = ITAPIALogger("Panel Feature Engine")
+
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+Panel = pd.DataFrame
+
+
+# --- PANEL HELPERS (pandas-ta formulas, applied column by column) ---
+def _ema(values: Panel, length: int) -> Panel:
+    """pandas-ta EMA: seeded with the SMA of the first `length` valid values."""
+    seeded = values.copy()
+    first_valid = values.notna().to_numpy().argmax(axis=0)
+    for start in np.unique(first_valid):
+        columns = values.columns[first_valid == start]
+        seed = values[columns].iloc[start : start + length].mean()
+        seeded.loc[seeded.index[: start + length - 1], columns] = np.nan
+        if start + length - 1 < len(seeded):
+            seeded.loc[seeded.index[start + length - 1], columns] = seed
+    return seeded.ewm(span=length, adjust=False).mean()
+
+
+def _rma(values: Panel, length: int) -> Panel:
+    """pandas-ta Wilder moving average."""
+    return values.ewm(alpha=1.0 / length, min_periods=length).mean()
+
+
+def _non_zero_range(high: Panel, low: Panel) -> Panel:
+    diff = high - low
+    if diff.eq(0).any().any():
+        diff += np.finfo(float).eps
+    return diff
+
+
+def _true_range(high: Panel, low: Panel, close: Panel) -> Panel:
+    prev_close = close.shift(1)
+    true_range = np.fmax(
+        np.fmax(high - low, (high - prev_close).abs()), (prev_close - low).abs()
+    )
+    true_range.iloc[:1] = np.nan
+    return true_range
+
+
+class DailyPanelFeatureEngine:
+    """Daily feature generator for all tickers of a sector at once.
+
+    The long (ticker, date) frame is laid out as one column per ticker, aligned by
+    bar position rather than by date, so every ticker keeps its own bar sequence
+    (no gaps from other tickers' trading days). Rolling, EWM and shift operations
+    then run once over all columns instead of once per ticker.
+
+    Features match `DailyFeatureEngine.add_all_features()` run per ticker, with the
+    same columns in the same order. Indicators follow the pandas-ta formulas; when
+    TA-Lib is installed, pandas-ta computes a few of them (e.g. RSI, ATR, MACD) with
+    TA-Lib, whose warm-up differs slightly and converges within a few hundred bars.
+    Candlestick patterns are still computed per ticker by TA-Lib.
+    """
+
+    def __init__(self, ohlcv_df: pd.DataFrame, ticker_column: str = "ticker"):
+        """Initialize the engine with a long OHLCV frame of several tickers.
+
+        Args:
+            ohlcv_df (pd.DataFrame): OHLCV data with a DatetimeIndex and a ticker column.
+            ticker_column (str, optional): Name of the ticker column. Defaults to "ticker".
+
+        Raises:
+            TypeError: If DataFrame index is not a DatetimeIndex
+            ValueError: If required columns are missing from the DataFrame
+        """
+        if not isinstance(ohlcv_df.index, pd.DatetimeIndex):
+            raise TypeError("DataFrame index must be a DatetimeIndex.")
+
+        df = ohlcv_df.copy()
+        df.columns = [col.lower() for col in df.columns]
+        required_cols = _OHLCV_COLUMNS + [ticker_column]
+        if not all(col in df.columns for col in required_cols):
+            raise ValueError(f"DataFrame must have cols: {required_cols}")
+
+        codes, self.tickers = pd.factorize(df[ticker_column], sort=True)
+        # Same row order as concatenating the per-ticker frames of a groupby
+        order = np.lexsort((df.index.asi8, codes))
+        self.df = df.iloc[order]
+        self.ticker_column = ticker_column
+        self._codes = codes[order]
+        self._positions = (
+            pd.Series(self._codes).groupby(self._codes).cumcount().to_numpy()
+        )
+        self._lengths = np.bincount(self._codes, minlength=len(self.tickers))
+        self._n_rows = int(self._lengths.max()) if len(self.tickers) else 0
+
+        self.ohlcv = {col: self._to_panel(self.df[col]) for col in _OHLCV_COLUMNS}
+        self.features: Dict[str, Panel] = {}
+
+    # --- LAYOUT ---
+    def _to_panel(self, series: pd.Series) -> Panel:
+        values = np.full((self._n_rows, len(self.tickers)), np.nan)
+        values[self._positions, self._codes] = series.to_numpy(dtype=np.float64)
+        return pd.DataFrame(values, columns=self.tickers)
+
+    def _from_panel(self, panel: Panel) -> np.ndarray:
+        return panel.to_numpy()[self._positions, self._codes]
+
+    def _get_column(self, name: str) -> Optional[Panel]:
+        if name in self.features:
+            return self.features[name]
+        return self.ohlcv.get(name)
+
+    # --- INDICATORS ---
+    def _sma(self, length: int = 10):
+        close = self.ohlcv["close"]
+        return {f"SMA_{length}": close.rolling(length).mean()}
+
+    def _ema_indicator(self, length: int = 10):
+        return {f"EMA_{length}": _ema(self.ohlcv["close"], length)}
+
+    def _macd(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        close = self.ohlcv["close"]
+        macd = _ema(close, fast) - _ema(close, slow)
+        signal_line = _ema(macd, signal)
+        suffix = f"_{fast}_{slow}_{signal}"
+        return {
+            f"MACD{suffix}": macd,
+            f"MACDh{suffix}": macd - signal_line,
+            f"MACDs{suffix}": signal_line,
+        }
+
+    def _adx(self, length: int = 14, lensig: Optional[int] = None, scalar=100):
+        lensig = lensig or length
+        high, low, close = self.ohlcv["high"], self.ohlcv["low"], self.ohlcv["close"]
+        atr = _rma(_true_range(high, low, close), length)
+        up = high - high.shift(1)
+        dn = low.shift(1) - low
+        pos = ((up > dn) & (up > 0)) * up
+        neg = ((dn > up) & (dn > 0)) * dn
+        pos.iloc[:1] = np.nan
+        neg.iloc[:1] = np.nan
+
+        k = scalar / atr
+        dmp = k * _rma(pos, length)
+        dmn = k * _rma(neg, length)
+        dx = scalar * (dmp - dmn).abs() / (dmp + dmn)
+        return {
+            f"ADX_{lensig}": _rma(dx, lensig),
+            f"DMP_{length}": dmp,
+            f"DMN_{length}": dmn,
+        }
+
+    def _psar(self, af0: float = 0.02, af: Optional[float] = None, max_af=0.2):
+        af0, max_af = float(af0), float(max_af)
+        af_init = float(af) if af and af > 0 else af0
+        high = self.ohlcv["high"].to_numpy()
+        low = self.ohlcv["low"].to_numpy()
+        close = self.ohlcv["close"].to_numpy()
+        n_rows, n_tickers = high.shape
+
+        long = np.full_like(high, np.nan)
+        short = np.full_like(high, np.nan)
+        acceleration = np.full_like(high, np.nan)
+        acceleration[:2] = af0
+        reversal = np.zeros(high.shape, dtype=np.int64)
+        if n_rows < 2:
+            return self._psar_columns(af0, max_af, long, short, acceleration, reversal)
+
+        falling = (low[0] - low[1] > high[1] - high[0]) & (low[0] - low[1] > 0)
+        sar = close[0].copy()
+        ep = np.where(falling, low[0], high[0])
+        af_values = np.full(n_tickers, af_init)
+        # pandas-ta looks two bars back; on the second bar that wraps around to the
+        # last bar of the ticker's series
+        last = np.maximum(self._lengths - 1, 0)
+        tickers = np.arange(n_tickers)
+
+        for row in range(1, n_rows):
+            row_high, row_low = high[row], low[row]
+            prev_high = high[row - 2] if row >= 2 else high[last, tickers]
+            prev_low = low[row - 2] if row >= 2 else low[last, tickers]
+
+            candidate = sar + af_values * (ep - sar)
+            reverse = np.where(falling, row_high > candidate, row_low < candidate)
+            new_low = falling & (row_low < ep)
+            new_high = ~falling & (row_high > ep)
+            ep = np.where(new_low, row_low, np.where(new_high, row_high, ep))
+            af_values = np.where(
+                new_low | new_high, np.minimum(af_values + af0, max_af), af_values
+            )
+            candidate = np.where(
+                falling,
+                np.maximum(np.maximum(high[row - 1], prev_high), candidate),
+                np.minimum(np.minimum(low[row - 1], prev_low), candidate),
+            )
+
+            sar = np.where(reverse, ep, candidate)
+            af_values = np.where(reverse, af0, af_values)
+            falling = np.where(reverse, ~falling, falling)
+            ep = np.where(reverse, np.where(falling, row_low, row_high), ep)
+
+            long[row] = np.where(falling, np.nan, sar)
+            short[row] = np.where(falling, sar, np.nan)
+            acceleration[row] = af_values
+            reversal[row] = reverse
+        return self._psar_columns(af0, max_af, long, short, acceleration, reversal)
+
+    def _psar_columns(self, af0, max_af, long, short, acceleration, reversal):
+        suffix = f"_{af0}_{max_af}"
+        return {
+            f"PSARl{suffix}": pd.DataFrame(long, columns=self.tickers),
+            f"PSARs{suffix}": pd.DataFrame(short, columns=self.tickers),
+            f"PSARaf{suffix}": pd.DataFrame(acceleration, columns=self.tickers),
+            f"PSARr{suffix}": pd.DataFrame(reversal, columns=self.tickers),
+        }
+
+    def _rsi(self, length: int = 14, scalar=100):
+        diff = self.ohlcv["close"].diff(1)
+        gain = _rma(diff.clip(lower=0), length)
+        loss = _rma(diff.clip(upper=0), length)
+        return {f"RSI_{length}": scalar * gain / (gain + loss.abs())}
+
+    def _stoch(self, k: int = 14, d: int = 3, smooth_k: int = 3):
+        high, low, close = self.ohlcv["high"], self.ohlcv["low"], self.ohlcv["close"]
+        lowest = low.rolling(k).min()
+        highest = high.rolling(k).max()
+        stoch = 100 * (close - lowest) / _non_zero_range(highest, lowest)
+        stoch_k = stoch.rolling(smooth_k).mean()
+        suffix = f"_{k}_{d}_{smooth_k}"
+        return {
+            f"STOCHk{suffix}": stoch_k,
+            f"STOCHd{suffix}": stoch_k.rolling(d).mean(),
+        }
+
+    def _cci(self, length: int = 14, c: float = 0.015):
+        typical = (self.ohlcv["high"] + self.ohlcv["low"] + self.ohlcv["close"]) / 3.0
+        mad = np.full(typical.shape, np.nan)
+        if len(typical) >= length:
+            windows = sliding_window_view(typical.to_numpy(), length, axis=0)
+            deviation = np.abs(windows - windows.mean(axis=2, keepdims=True))
+            mad[length - 1 :] = deviation.mean(axis=2)
+        mad = pd.DataFrame(mad, columns=self.tickers)
+        cci = (typical - typical.rolling(length).mean()) / (float(c) * mad)
+        return {f"CCI_{length}_{float(c)}": cci}
+
+    def _willr(self, length: int = 14):
+        highest = self.ohlcv["high"].rolling(length).max()
+        lowest = self.ohlcv["low"].rolling(length).min()
+        willr = 100 * (self.ohlcv["close"] - highest) / (highest - lowest)
+        return {f"WILLR_{length}": willr}
+
+    def _bbands(self, length: int = 5, std: float = 2.0):
+        close = self.ohlcv["close"]
+        mid = close.rolling(length).mean()
+        deviation = float(std) * close.rolling(length).std(ddof=0)
+        lower, upper = mid - deviation, mid + deviation
+        band_range = _non_zero_range(upper, lower)
+        suffix = f"_{length}_{float(std)}"
+        return {
+            f"BBL{suffix}": lower,
+            f"BBM{suffix}": mid,
+            f"BBU{suffix}": upper,
+            f"BBB{suffix}": 100 * band_range / mid,
+            f"BBP{suffix}": _non_zero_range(close, lower) / band_range,
+        }
+
+    def _atr(self, length: int = 14):
+        high, low, close = self.ohlcv["high"], self.ohlcv["low"], self.ohlcv["close"]
+        return {f"ATRr_{length}": _rma(_true_range(high, low, close), length)}
+
+    def _donchian(self, lower_length: int = 20, upper_length: int = 20):
+        lower = self.ohlcv["low"].rolling(lower_length).min()
+        upper = self.ohlcv["high"].rolling(upper_length).max()
+        suffix = f"_{lower_length}_{upper_length}"
+        return {
+            f"DCL{suffix}": lower,
+            f"DCM{suffix}": 0.5 * (lower + upper),
+            f"DCU{suffix}": upper,
+        }
+
+    def _mfi(self, length: int = 14):
+        typical = (self.ohlcv["high"] + self.ohlcv["low"] + self.ohlcv["close"]) / 3.0
+        money_flow = typical * self.ohlcv["volume"]
+        direction = typical.diff(1)
+        positive = money_flow.where(direction > 0, 0.0).rolling(length).sum()
+        negative = money_flow.where(direction < 0, 0.0).rolling(length).sum()
+        ratio = positive / negative
+        return {f"MFI_{length}": 100 * ratio / (1 + ratio)}
+
+    def _obv(self):
+        close = self.ohlcv["close"]
+        sign = np.sign(close.diff(1))
+        sign.iloc[:1] = 1
+        return {"OBV": (sign * self.ohlcv["volume"]).cumsum()}
+
+    def _vwap(self, anchor: str = "D"):
+        if anchor.upper() != "D":
+            raise ValueError(f"VWAP anchor '{anchor}' is not supported in panel mode")
+        typical = (self.ohlcv["high"] + self.ohlcv["low"] + self.ohlcv["close"]) / 3.0
+        volume = self.ohlcv["volume"]
+        # Daily bars: every anchor period holds a single bar
+        return {f"VWAP_{anchor}": typical * volume / volume}
+
+    _INDICATORS: Dict[str, Callable[..., Dict[str, Panel]]] = {
+        "sma": _sma,
+        "ema": _ema_indicator,
+        "macd": _macd,
+        "adx": _adx,
+        "psar": _psar,
+        "rsi": _rsi,
+        "stoch": _stoch,
+        "cci": _cci,
+        "willr": _willr,
+        "bbands": _bbands,
+        "atr": _atr,
+        "donchian": _donchian,
+        "mfi": _mfi,
+        "obv": _obv,
+        "vwap": _vwap,
+    }
+
+    def _get_configs(self, all_configs, name) -> List[Dict[str, Any]]:
+        configs = all_configs.get(name) if all_configs else None
+        if configs is None:
+            return DailyFeatureEngine.DEFAULT_CONFIG.get(name, [])
+        return configs
+
+    def add_indicators(
+        self, all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ):
+        """Add the pandas-ta indicators, in the order of `DailyFeatureEngine`.
+
+        Args:
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional):
+                Configurations for all indicators. Defaults to `DEFAULT_CONFIG`.
+
+        Returns:
+            Self: Returns self for method chaining
+
+        Raises:
+            ValueError: If a configuration has no panel implementation.
+        """
+        unsupported = set(all_configs or {}) - set(self._INDICATORS)
+        unsupported -= {"diff_from_sma", "return_d", "lag"}
+        if unsupported:
+            raise ValueError(
+                f"Indicators {unsupported} are not supported in panel mode"
+            )
+
+        for name, indicator_function in self._INDICATORS.items():
+            for config in self._get_configs(all_configs, name):
+                try:
+                    self.features.update(indicator_function(self, **config))
+                except TypeError as e:
+                    raise ValueError(
+                        f"Config {config} of '{name}' is not supported in panel mode: {e}"
+                    ) from e
+        return self
+
+    def add_custom_features(
+        self, all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ):
+        """Add difference from SMA, N-day returns and lag features.
+
+        Args:
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional):
+                Configurations for all indicators. Defaults to `DEFAULT_CONFIG`.
+
+        Returns:
+            Self: Returns self for method chaining
+        """
+        close = self.ohlcv["close"]
+        for config in self._get_configs(all_configs, "diff_from_sma"):
+            sma = self.features.get(f"SMA_{config.get('sma_length')}")
+            if sma is not None:
+                self.features[f"diff_from_sma_{config['sma_length']}"] = (
+                    (close - sma) / (sma + 1e-9) * 100
+                )
+
+        for config in self._get_configs(all_configs, "return_d"):
+            d_period = config.get("d")
+            if d_period:
+                # pct_change without its padding of the NaN rows after short tickers
+                self.features[f"return_{d_period}d"] = (
+                    close / close.shift(d_period) - 1
+                ) * 100
+
+        for config in self._get_configs(all_configs, "lag"):
+            column = config.get("column")
+            values = self._get_column(column) if column else None
+            if values is None or not config.get("periods"):
+                logger.warn(f"Warning: Cannot lag with config {config}. Skipping.")
+                continue
+            for period in config["periods"]:
+                self.features[f"{column}_lag_{period}"] = values.shift(period)
+        return self
+
+    def add_all_candlestick_patterns(self):
+        """Add all candlestick patterns, computed per ticker by pandas-ta.
+
+        Returns:
+            Self: Returns self for method chaining
+        """
+        patterns = {}
+        for code, ticker in enumerate(self.tickers):
+            rows = self._codes == code
+            ticker_patterns = self.df.loc[rows, _OHLCV_COLUMNS].ta.cdl_pattern(
+                name="all"
+            )
+            if ticker_patterns is None:
+                continue
+            for column in ticker_patterns.columns:
+                if column not in patterns:
+                    patterns[column] = np.full(
+                        (self._n_rows, len(self.tickers)), np.nan
+                    )
+                patterns[column][self._positions[rows], code] = ticker_patterns[
+                    column
+                ].to_numpy(dtype=np.float64)
+
+        for column, values in patterns.items():
+            self.features[column] = pd.DataFrame(values, columns=self.tickers)
+        return self
+
+    def add_interaction_features(self):
+        """Same interaction features as `DailyFeatureEngine.add_interaction_features`.
+
+        Returns:
+            Self: Returns self for method chaining
+        """
+        features = self.features
+        if "diff_from_sma_200" in features and "RSI_14" in features:
+            features["RSI_x_trend"] = features["RSI_14"] * np.sign(
+                features["diff_from_sma_200"]
+            )
+        if "CCI_14_0.015" in features and "ATRr_14" in features:
+            features["CCI_norm_by_ATR"] = features["CCI_14_0.015"] / (
+                features["ATRr_14"] + 1e-9
+            )
+        if "CDL_HAMMER" in features and "RSI_14" in features:
+            is_oversold = (features["RSI_14"] < 30).astype(int)
+            features["hammer_in_oversold"] = features["CDL_HAMMER"] / 100 * is_oversold
+        return self
+
+    def add_all_features(
+        self, all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ):
+        """Add all standard features, as `DailyFeatureEngine.add_all_features`.
+
+        Args:
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional):
+                Configurations for all indicators. Defaults to `DEFAULT_CONFIG`.
+
+        Returns:
+            Self: Returns self for method chaining
+        """
+        logger.info(
+            f"Daily Panel Feature Engine: === Adding All Features for "
+            f"{len(self.tickers)} tickers ==="
+        )
+        return (
+            self.add_indicators(all_configs)
+            .add_custom_features(all_configs)
+            .add_all_candlestick_patterns()
+            .add_interaction_features()
+        )
+
+    def get_features(
+        self, handle_na_method: Optional[str] = "forward_fill"
+    ) -> pd.DataFrame:
+        """Return the long feature frame, ordered by ticker then time.
+
+        NaN handling is applied per ticker, as with the per-ticker engine.
+
+        Args:
+            handle_na_method (Optional[str], optional): Method to handle NaN values,
+                as in `DailyFeatureEngine.get_features`. Defaults to 'forward_fill'.
+
+        Returns:
+            pd.DataFrame: Input columns followed by the features.
+        """
+        features = self.features
+        if handle_na_method == "forward_fill":
+            # Columns are tickers, so filling never crosses from one ticker to another
+            features = {name: panel.ffill() for name, panel in features.items()}
+        elif handle_na_method == "mean":
+            features = {
+                name: panel.fillna(panel.mean()) for name, panel in features.items()
+            }
+
+        columns = {name: self._from_panel(panel) for name, panel in features.items()}
+        df = pd.concat(
+            [self.df, pd.DataFrame(columns, index=self.df.index)], axis=1, copy=False
+        )
+        if handle_na_method:
+            # Remaining NaN are the warm-up rows of each ticker
+            df.dropna(inplace=True)
+        return df
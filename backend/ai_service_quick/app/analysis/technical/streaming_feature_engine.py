@@ -0,0 +1,953 @@
+"""Incremental counterpart of the feature engines, updating features bar by bar.
+
+Each configured indicator keeps its own state (rolling windows, EMA and Wilder
+accumulators, PSAR trend), so appending a candle costs O(1) per indicator instead of
+recomputing the indicators over the whole frame. Formulas follow the pandas-ta
+implementations used by `DailyFeatureEngine` and `IntradayFeatureEngine`.
+"""
+
+import json
+import math
+import sys
+from collections import deque, namedtuple
+from hashlib import sha1
+from typing import Any, Deque, Dict, List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+from itapia_common.logger import ITAPIALogger
+
+from .feature_engine import DailyFeatureEngine, IntradayFeatureEngine, _FeatureEngine
+
+logger = ITAPIALogger("Streaming Feature Engine")
+
+_NAN = float("nan")
+_EPSILON = sys.float_info.epsilon
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+_Bar = namedtuple("_Bar", ["timestamp", "open", "high", "low", "close", "volume"])
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """Divide like pandas does: x/0 is +-inf and 0/0 is NaN."""
+    if denominator == 0:
+        if numerator == 0 or numerator != numerator:
+            return _NAN
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+
+def _non_zero(value: float) -> float:
+    """Same guard as pandas-ta `non_zero_range`, applied per value."""
+    return value if value != 0 else _EPSILON
+
+
+# --- STATE PRIMITIVES ---
+class _RollingWindow:
+    """Last `length` values with running sums.
+
+    Sums are recomputed once per window around the current values, which keeps the
+    rounding drift of adding and removing values bounded.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.values: Deque[float] = deque()
+        self._anchor = 0.0
+        self._total = 0.0
+        self._total_sq = 0.0
+        self._pushes = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.length
+
+    def push(self, value: float):
+        self.values.append(value)
+        shifted = value - self._anchor
+        self._total += shifted
+        self._total_sq += shifted * shifted
+        if len(self.values) > self.length:
+            dropped = self.values.popleft() - self._anchor
+            self._total -= dropped
+            self._total_sq -= dropped * dropped
+
+        self._pushes += 1
+        if self._pushes >= self.length:
+            self._resum()
+
+    def _resum(self):
+        self._pushes = 0
+        self._anchor = self.values[-1]
+        shifted = [value - self._anchor for value in self.values]
+        self._total = sum(shifted)
+        self._total_sq = sum(value * value for value in shifted)
+
+    def sum(self) -> float:
+        return self._anchor * len(self.values) + self._total
+
+    def mean(self) -> float:
+        return self._anchor + self._total / len(self.values)
+
+    def variance(self) -> float:
+        """Population variance (ddof=0) of the window."""
+        n = len(self.values)
+        mean_shifted = self._total / n
+        return max(self._total_sq / n - mean_shifted * mean_shifted, 0.0)
+
+
+class _RollingExtremum:
+    """Maximum or minimum of the last `length` values, using a monotonic deque."""
+
+    def __init__(self, length: int, is_max: bool):
+        self.length = length
+        self.is_max = is_max
+        self._count = 0
+        self._candidates: Deque[tuple] = deque()
+
+    def push(self, value: float) -> float:
+        position = self._count
+        self._count += 1
+        candidates = self._candidates
+        if self.is_max:
+            while candidates and candidates[-1][1] <= value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= value:
+                candidates.pop()
+        candidates.append((position, value))
+        if candidates[0][0] <= position - self.length:
+            candidates.popleft()
+        return candidates[0][1] if self._count >= self.length else _NAN
+
+
+class _EMA:
+    """EMA seeded with the SMA of its first `length` values, as pandas-ta does."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2.0 / (length + 1)
+        self.value = _NAN
+        self._seed: Optional[List[float]] = []
+
+    def push(self, value: float) -> float:
+        if self._seed is not None:
+            self._seed.append(value)
+            if len(self._seed) == self.length:
+                self.value = sum(self._seed) / self.length
+                self._seed = None
+            return self.value
+        self.value = self.alpha * value + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class _RMA:
+    """Wilder smoothing as pandas-ta computes it: `ewm(alpha=1/length, min_periods=length)`.
+
+    pandas uses the adjusted (weight-normalized) EWM here, so the sum of weights is
+    carried along with the value. NaN inputs are skipped but still decay the weights.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.decay = 1.0 - 1.0 / length
+        self.value = _NAN
+        self._old_weight = 0.0
+        self._count = 0
+
+    def push(self, value: float) -> float:
+        is_observation = value == value
+        self._count += is_observation
+        if self.value == self.value:
+            self._old_weight *= self.decay
+            if is_observation:
+                self.value = (self._old_weight * self.value + value) / (
+                    self._old_weight + 1.0
+                )
+                self._old_weight += 1.0
+        elif is_observation:
+            self.value = value
+            self._old_weight = 1.0
+        return self.value if self._count >= self.length else _NAN
+
+
+# --- INDICATOR STATES ---
+class _StreamingState:
+    """State of one configured feature, writing its columns into each new row."""
+
+    # Features that only produce row values (no state needed to continue) can be
+    # skipped while replaying history whose rows are not kept.
+    row_only = False
+
+    def update(self, bar: _Bar, row: Dict[str, float]):
+        raise NotImplementedError
+
+    def skip(self, bar: _Bar):
+        self.update(bar, {})
+
+
+class _SMA(_StreamingState):
+    def __init__(self, length: int = 10):
+        self.column = f"SMA_{length}"
+        self.window = _RollingWindow(length)
+
+    def update(self, bar, row):
+        self.window.push(bar.close)
+        row[self.column] = self.window.mean() if self.window.full else _NAN
+
+
+class _EMAIndicator(_StreamingState):
+    def __init__(self, length: int = 10):
+        self.column = f"EMA_{length}"
+        self.ema = _EMA(length)
+
+    def update(self, bar, row):
+        row[self.column] = self.ema.push(bar.close)
+
+
+class _MACD(_StreamingState):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        suffix = f"_{fast}_{slow}_{signal}"
+        self.columns = [f"MACD{suffix}", f"MACDh{suffix}", f"MACDs{suffix}"]
+        self.fast = _EMA(fast)
+        self.slow = _EMA(slow)
+        # Runs on the MACD line from its first valid value
+        self.signal = _EMA(signal)
+
+    def update(self, bar, row):
+        macd = self.fast.push(bar.close) - self.slow.push(bar.close)
+        signal = self.signal.push(macd) if macd == macd else _NAN
+        macd_col, hist_col, signal_col = self.columns
+        row[macd_col] = macd
+        row[hist_col] = macd - signal
+        row[signal_col] = signal
+
+
+class _TrueRange:
+    def __init__(self):
+        self.prev_close = None
+
+    def push(self, bar: _Bar) -> float:
+        prev_close, self.prev_close = self.prev_close, bar.close
+        if prev_close is None:
+            return _NAN
+        return max(
+            abs(bar.high - bar.low),
+            abs(bar.high - prev_close),
+            abs(prev_close - bar.low),
+        )
+
+
+class _ATR(_StreamingState):
+    def __init__(self, length: int = 14):
+        self.column = f"ATRr_{length}"
+        self.true_range = _TrueRange()
+        self.rma = _RMA(length)
+
+    def update(self, bar, row):
+        row[self.column] = self.rma.push(self.true_range.push(bar))
+
+
+class _ADX(_StreamingState):
+    def __init__(self, length: int = 14, lensig: Optional[int] = None, scalar=100):
+        lensig = lensig or length
+        self.columns = [f"ADX_{lensig}", f"DMP_{length}", f"DMN_{length}"]
+        self.scalar = scalar
+        self.true_range = _TrueRange()
+        self.atr = _RMA(length)
+        self.pos = _RMA(length)
+        self.neg = _RMA(length)
+        self.adx = _RMA(lensig)
+        self.prev_bar: Optional[_Bar] = None
+
+    def update(self, bar, row):
+        pos = neg = _NAN
+        if self.prev_bar is not None:
+            up = bar.high - self.prev_bar.high
+            dn = self.prev_bar.low - bar.low
+            pos = up if (up > dn and up > 0) else 0.0
+            neg = dn if (dn > up and dn > 0) else 0.0
+        self.prev_bar = bar
+
+        k = _div(self.scalar, self.atr.push(self.true_range.push(bar)))
+        dmp = k * self.pos.push(pos)
+        dmn = k * self.neg.push(neg)
+        dx = self.scalar * _div(abs(dmp - dmn), dmp + dmn)
+        adx_col, dmp_col, dmn_col = self.columns
+        row[adx_col] = self.adx.push(dx)
+        row[dmp_col] = dmp
+        row[dmn_col] = dmn
+
+
+class _PSAR(_StreamingState):
+    def __init__(self, af0: float = 0.02, af: Optional[float] = None, max_af=0.2):
+        af0, max_af = float(af0), float(max_af)
+        suffix = f"_{af0}_{max_af}"
+        self.columns = [f"PSARl{suffix}", f"PSARs{suffix}", f"PSARaf{suffix}"]
+        self.columns.append(f"PSARr{suffix}")
+        self.af0 = af0
+        self.af_init = float(af) if af and af > 0 else af0
+        self.max_af = max_af
+        self.bars: Deque[_Bar] = deque(maxlen=2)
+        self.falling = False
+        self.sar = self.ep = self.af = _NAN
+
+    def update(self, bar, row):
+        long_col, short_col, af_col, reversal_col = self.columns
+        if not self.bars:
+            self.bars.append(bar)
+            row[long_col], row[short_col] = _NAN, _NAN
+            row[af_col], row[reversal_col] = self.af0, 0
+            return
+
+        prev = self.bars[-1]
+        # Two bars back; on the second bar pandas-ta wraps around to the last bar
+        # of the frame, the first bar is used instead.
+        prev2 = self.bars[0]
+        if len(self.bars) == 1:
+            up = bar.high - prev.high
+            dn = prev.low - bar.low
+            self.falling = dn > up and dn > 0
+            self.sar = prev.close
+            self.ep = prev.low if self.falling else prev.high
+            self.af = self.af_init
+
+        sar = self.sar + self.af * (self.ep - self.sar)
+        if self.falling:
+            reverse = bar.high > sar
+            if bar.low < self.ep:
+                self.ep = bar.low
+                self.af = min(self.af + self.af0, self.max_af)
+            sar = max(prev.high, prev2.high, sar)
+        else:
+            reverse = bar.low < sar
+            if bar.high > self.ep:
+                self.ep = bar.high
+                self.af = min(self.af + self.af0, self.max_af)
+            sar = min(prev.low, prev2.low, sar)
+
+        if reverse:
+            sar = self.ep
+            self.af = self.af0
+            self.falling = not self.falling
+            self.ep = bar.low if self.falling else bar.high
+        self.sar = sar
+        self.bars.append(bar)
+
+        row[long_col] = _NAN if self.falling else sar
+        row[short_col] = sar if self.falling else _NAN
+        row[af_col] = self.af
+        row[reversal_col] = int(reverse)
+
+
+class _RSI(_StreamingState):
+    def __init__(self, length: int = 14, scalar=100):
+        self.column = f"RSI_{length}"
+        self.scalar = scalar
+        self.gain = _RMA(length)
+        self.loss = _RMA(length)
+        self.prev_close = None
+
+    def update(self, bar, row):
+        diff = _NAN if self.prev_close is None else bar.close - self.prev_close
+        self.prev_close = bar.close
+        gain = self.gain.push(max(diff, 0.0) if diff == diff else _NAN)
+        loss = self.loss.push(min(diff, 0.0) if diff == diff else _NAN)
+        row[self.column] = self.scalar * _div(gain, gain + abs(loss))
+
+
+class _Stoch(_StreamingState):
+    def __init__(self, k: int = 14, d: int = 3, smooth_k: int = 3):
+        suffix = f"_{k}_{d}_{smooth_k}"
+        self.columns = [f"STOCHk{suffix}", f"STOCHd{suffix}"]
+        self.highest = _RollingExtremum(k, is_max=True)
+        self.lowest = _RollingExtremum(k, is_max=False)
+        self.smooth_k = _RollingWindow(smooth_k)
+        self.smooth_d = _RollingWindow(d)
+
+    def update(self, bar, row):
+        highest = self.highest.push(bar.high)
+        lowest = self.lowest.push(bar.low)
+        stoch_k = stoch_d = _NAN
+        if lowest == lowest:
+            self.smooth_k.push(100 * (bar.close - lowest) / _non_zero(highest - lowest))
+            if self.smooth_k.full:
+                stoch_k = self.smooth_k.mean()
+                self.smooth_d.push(stoch_k)
+                if self.smooth_d.full:
+                    stoch_d = self.smooth_d.mean()
+        row[self.columns[0]] = stoch_k
+        row[self.columns[1]] = stoch_d
+
+
+class _CCI(_StreamingState):
+    def __init__(self, length: int = 14, c: float = 0.015):
+        self.column = f"CCI_{length}_{float(c)}"
+        self.c = float(c)
+        self.window = _RollingWindow(length)
+
+    def update(self, bar, row):
+        typical = (bar.high + bar.low + bar.close) / 3.0
+        self.window.push(typical)
+        if not self.window.full:
+            row[self.column] = _NAN
+            return
+        # The mean absolute deviation has no running form, it costs O(length)
+        mean = self.window.mean()
+        mad = sum(abs(value - mean) for value in self.window.values) / len(
+            self.window.values
+        )
+        row[self.column] = _div(typical - mean, self.c * mad)
+
+
+class _WillR(_StreamingState):
+    def __init__(self, length: int = 14):
+        self.column = f"WILLR_{length}"
+        self.highest = _RollingExtremum(length, is_max=True)
+        self.lowest = _RollingExtremum(length, is_max=False)
+
+    def update(self, bar, row):
+        highest = self.highest.push(bar.high)
+        lowest = self.lowest.push(bar.low)
+        row[self.column] = 100 * _div(bar.close - highest, highest - lowest)
+
+
+class _BBands(_StreamingState):
+    def __init__(self, length: int = 5, std: float = 2.0):
+        suffix = f"_{length}_{float(std)}"
+        self.columns = [f"BB{part}{suffix}" for part in ["L", "M", "U", "B", "P"]]
+        self.std = float(std)
+        self.window = _RollingWindow(length)
+
+    def update(self, bar, row):
+        self.window.push(bar.close)
+        if not self.window.full:
+            for column in self.columns:
+                row[column] = _NAN
+            return
+        mid = self.window.mean()
+        deviation = self.std * math.sqrt(self.window.variance())
+        lower, upper = mid - deviation, mid + deviation
+        band_range = _non_zero(upper - lower)
+        values = [
+            lower,
+            mid,
+            upper,
+            100 * _div(band_range, mid),
+            _non_zero(bar.close - lower) / band_range,
+        ]
+        row.update(zip(self.columns, values))
+
+
+class _Donchian(_StreamingState):
+    def __init__(self, lower_length: int = 20, upper_length: int = 20):
+        suffix = f"_{lower_length}_{upper_length}"
+        self.columns = [f"DCL{suffix}", f"DCM{suffix}", f"DCU{suffix}"]
+        self.lowest = _RollingExtremum(lower_length, is_max=False)
+        self.highest = _RollingExtremum(upper_length, is_max=True)
+
+    def update(self, bar, row):
+        lower = self.lowest.push(bar.low)
+        upper = self.highest.push(bar.high)
+        row.update(zip(self.columns, [lower, 0.5 * (lower + upper), upper]))
+
+
+class _MFI(_StreamingState):
+    def __init__(self, length: int = 14):
+        self.column = f"MFI_{length}"
+        self.positive = _RollingWindow(length)
+        self.negative = _RollingWindow(length)
+        self.prev_typical = None
+
+    def update(self, bar, row):
+        typical = (bar.high + bar.low + bar.close) / 3.0
+        money_flow = typical * bar.volume
+        prev_typical, self.prev_typical = self.prev_typical, typical
+        is_up = prev_typical is not None and typical > prev_typical
+        is_down = prev_typical is not None and typical < prev_typical
+        self.positive.push(money_flow if is_up else 0.0)
+        self.negative.push(money_flow if is_down else 0.0)
+        if not self.positive.full:
+            row[self.column] = _NAN
+            return
+        ratio = _div(self.positive.sum(), self.negative.sum())
+        row[self.column] = 100 * _div(ratio, 1 + ratio)
+
+
+class _OBV(_StreamingState):
+    def __init__(self):
+        self.value = _NAN
+        self.prev_close = None
+
+    def update(self, bar, row):
+        if self.prev_close is None:
+            self.value = bar.volume
+        else:
+            diff = bar.close - self.prev_close
+            self.value += (diff > 0) * bar.volume - (diff < 0) * bar.volume
+        self.prev_close = bar.close
+        row["OBV"] = self.value
+
+
+class _VWAP(_StreamingState):
+    def __init__(self, anchor: str = "D"):
+        if anchor.upper() != "D":
+            raise ValueError(f"VWAP anchor '{anchor}' is not supported in streaming")
+        self.column = f"VWAP_{anchor}"
+        self.day = None
+        self.price_volume = 0.0
+        self.volume = 0.0
+
+    def update(self, bar, row):
+        day = bar.timestamp.date()
+        if day != self.day:
+            self.day = day
+            self.price_volume = self.volume = 0.0
+        self.price_volume += (bar.high + bar.low + bar.close) / 3.0 * bar.volume
+        self.volume += bar.volume
+        row[self.column] = _div(self.price_volume, self.volume)
+
+
+# --- CUSTOM FEATURE STATES ---
+class _DiffFromSMA(_StreamingState):
+    def __init__(self, sma_length: int):
+        self.sma_column = f"SMA_{sma_length}"
+        self.column = f"diff_from_sma_{sma_length}"
+
+    def update(self, bar, row):
+        sma = row[self.sma_column]
+        row[self.column] = (bar.close - sma) / (sma + 1e-9) * 100
+
+
+class _Return(_StreamingState):
+    def __init__(self, d: int):
+        self.column = f"return_{d}d"
+        self.closes: Deque[float] = deque(maxlen=d + 1)
+
+    def update(self, bar, row):
+        self.closes.append(bar.close)
+        if len(self.closes) < self.closes.maxlen:
+            row[self.column] = _NAN
+            return
+        row[self.column] = (_div(bar.close, self.closes[0]) - 1) * 100
+
+
+class _Lag(_StreamingState):
+    def __init__(self, column: str, periods: List[int]):
+        self.column = column
+        self.periods = periods
+        self.values: Deque[float] = deque(maxlen=max(periods) + 1)
+
+    def update(self, bar, row):
+        self.values.append(row.get(self.column, _NAN))
+        for period in self.periods:
+            lagged = self.values[-period - 1] if period < len(self.values) else _NAN
+            row[f"{self.column}_lag_{period}"] = lagged
+
+
+class _CandlePatterns(_StreamingState):
+    """Candlestick patterns, computed by pandas-ta over the last few bars only.
+
+    Patterns look back a bounded number of candles, so the window gives the same
+    values as computing them over the whole history.
+    """
+
+    row_only = True
+
+    def __init__(self, window: int):
+        self.bars: Deque[_Bar] = deque(maxlen=window)
+
+    def skip(self, bar):
+        self.bars.append(bar)
+
+    def update(self, bar, row):
+        self.bars.append(bar)
+        frame = pd.DataFrame(
+            [bar[1:] for bar in self.bars],
+            columns=_OHLCV_COLUMNS,
+            index=pd.DatetimeIndex([bar.timestamp for bar in self.bars]),
+        )
+        patterns = frame.ta.cdl_pattern(name="all")
+        if patterns is not None and not patterns.empty:
+            row.update(patterns.iloc[-1].to_dict())
+
+
+class _InteractionFeatures(_StreamingState):
+    """Same interaction features as `DailyFeatureEngine.add_interaction_features`."""
+
+    row_only = True
+
+    def update(self, bar, row):
+        if "diff_from_sma_200" in row and "RSI_14" in row:
+            row["RSI_x_trend"] = row["RSI_14"] * np.sign(row["diff_from_sma_200"])
+        if "CCI_14_0.015" in row and "ATRr_14" in row:
+            row["CCI_norm_by_ATR"] = row["CCI_14_0.015"] / (row["ATRr_14"] + 1e-9)
+        if "CDL_HAMMER" in row and "RSI_14" in row:
+            is_oversold = int(row["RSI_14"] < 30)
+            row["hammer_in_oversold"] = row["CDL_HAMMER"] / 100 * is_oversold
+
+    def skip(self, bar):
+        pass
+
+
+class _OpeningRange(_StreamingState):
+    """Same opening range as `IntradayFeatureEngine.add_opening_range`.
+
+    Rows inside the opening window of a day are updated again as the window fills,
+    since the batch path gives them the range of the whole window.
+    """
+
+    def __init__(self, minutes: int = 30):
+        self.columns = [f"OR_{minutes}m_High", f"OR_{minutes}m_Low"]
+        self.minutes = minutes
+        self.day = None
+        self.end_time = None
+        self.high = self.low = _NAN
+        self.window_rows: List[Dict[str, float]] = []
+
+    def update(self, bar, row):
+        timestamp = bar.timestamp
+        if timestamp.date() != self.day:
+            self.day = timestamp.date()
+            start_time = timestamp.time()
+            self.start_time = start_time
+            self.end_time = (
+                pd.to_datetime(f"1970-01-01 {start_time}")
+                + pd.Timedelta(minutes=self.minutes - 1)
+            ).time()
+            self.high = self.low = _NAN
+            self.window_rows = []
+
+        if self.start_time <= timestamp.time() <= self.end_time:
+            self.high = bar.high if self.high != self.high else max(self.high, bar.high)
+            self.low = bar.low if self.low != self.low else min(self.low, bar.low)
+            self.window_rows.append(row)
+            for window_row in self.window_rows:
+                window_row[self.columns[0]] = self.high
+                window_row[self.columns[1]] = self.low
+            return
+
+        row[self.columns[0]] = self.high
+        row[self.columns[1]] = self.low
+
+    def skip(self, bar):
+        self.update(bar, {})
+        # Rows that are not kept must not be updated later
+        self.window_rows = []
+
+
+_INDICATOR_STATES = {
+    "sma": _SMA,
+    "ema": _EMAIndicator,
+    "macd": _MACD,
+    "adx": _ADX,
+    "psar": _PSAR,
+    "rsi": _RSI,
+    "stoch": _Stoch,
+    "cci": _CCI,
+    "willr": _WillR,
+    "bbands": _BBands,
+    "atr": _ATR,
+    "donchian": _Donchian,
+    "mfi": _MFI,
+    "obv": _OBV,
+    "vwap": _VWAP,
+}
+
+# Indicators in the order the batch engines add them, so columns come out the same
+_DAILY_INDICATORS = list(_INDICATOR_STATES)
+_INTRADAY_INDICATORS = ["ema", "rsi", "macd", "bbands", "atr", "vwap"]
+
+
+class StreamingFeatureEngine:
+    """Incremental feature engine, updating the features of each appended bar in O(1).
+
+    The engine is seeded by replaying a history once (`from_history`), then each new
+    candle only updates the indicator states. Features of `kind="daily"` match
+    `DailyFeatureEngine.add_all_features()` and those of `kind="intraday"` match
+    `IntradayFeatureEngine.add_all_intraday_features()`, column for column.
+
+    Tolerance: values match the batch engines computed over the same bars to a
+    relative error of `TOLERANCE`, with these exceptions:
+        - On the second bar, pandas-ta's PSAR reads the last bar of the whole frame,
+          which a stream cannot know. Values are identical once both have reversed,
+          usually within a few dozen bars.
+        - When TA-Lib is installed, pandas-ta computes some indicators (e.g. RSI, ATR,
+          MACD) with TA-Lib, whose warm-up differs. The difference decays
+          geometrically, e.g. below `TOLERANCE` after a few hundred bars for RSI_14.
+        - CCI recomputes its mean deviation over the window, O(length) per bar.
+    """
+
+    TOLERANCE = 1e-6
+    # Bars kept for candlestick patterns, longer than any pattern's lookback
+    CANDLE_WINDOW = 32
+    # Bump whenever the attributes of the engine or of its states change, so that
+    # persisted engines written by another version are not reused
+    STATE_VERSION = 1
+
+    def __init__(
+        self,
+        kind: Literal["daily", "intraday"] = "daily",
+        all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ):
+        """Initialize an engine with empty states.
+
+        Args:
+            kind (Literal['daily', 'intraday'], optional): Feature set to compute.
+                Defaults to 'daily'.
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional):
+                Configurations for all indicators. Defaults to the `DEFAULT_CONFIG` of
+                the matching batch engine.
+
+        Raises:
+            ValueError: If the configuration uses an indicator or parameter that has
+                no streaming implementation.
+        """
+        self.kind = kind
+        if kind == "daily":
+            self._states = self._build_daily_states(all_configs)
+        else:
+            self._states = self._build_intraday_states(all_configs)
+        self.last_bar: Optional[_Bar] = None
+        self._rows: Deque[tuple] = deque()
+
+    @classmethod
+    def from_history(
+        cls,
+        ohlcv_df: pd.DataFrame,
+        kind: Literal["daily", "intraday"] = "daily",
+        all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        keep_rows: bool = True,
+    ) -> "StreamingFeatureEngine":
+        """Create an engine and replay a history through it.
+
+        Args:
+            ohlcv_df (pd.DataFrame): OHLCV data sorted by a DatetimeIndex.
+            kind (Literal['daily', 'intraday'], optional): Feature set to compute.
+                Defaults to 'daily'.
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional):
+                Configurations for all indicators. Defaults to None.
+            keep_rows (bool, optional): Keep the feature rows of the history for
+                `get_features`. Without them, features that only produce values
+                (candlestick patterns) are not computed for the history, which makes
+                seeding much faster. Defaults to True.
+
+        Returns:
+            StreamingFeatureEngine: Engine whose states are at the last bar.
+        """
+        engine = cls(kind, all_configs)
+        engine.extend(ohlcv_df, emit=keep_rows)
+        return engine
+
+    @classmethod
+    def get_state_fingerprint(
+        cls,
+        kind: Literal["daily", "intraday"] = "daily",
+        all_configs: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> str:
+        """Identify the state layout and indicator configs of an engine.
+
+        Persisted engines must only be reused by an engine with the same fingerprint.
+
+        Args:
+            kind (Literal['daily', 'intraday'], optional): Feature set to compute.
+                Defaults to 'daily'.
+            all_configs (Optional[Dict[str, List[Dict[str, Any]]]], optional):
+                Configurations for all indicators. Defaults to None.
+
+        Returns:
+            str: Hash of `STATE_VERSION`, `kind` and the indicator configurations.
+        """
+        default_config = (
+            DailyFeatureEngine.DEFAULT_CONFIG
+            if kind == "daily"
+            else IntradayFeatureEngine.DEFAULT_CONFIG
+        )
+        payload = json.dumps(
+            [cls.STATE_VERSION, kind, default_config, all_configs],
+            sort_keys=True,
+            default=str,
+        )
+        return sha1(payload.encode()).hexdigest()
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        return self.last_bar.timestamp if self.last_bar is not None else None
+
+    def can_extend(self, ohlcv_df: pd.DataFrame) -> bool:
+        """Check that `ohlcv_df` contains the last bar seen by the engine, unchanged.
+
+        Args:
+            ohlcv_df (pd.DataFrame): OHLCV data sorted by a DatetimeIndex.
+
+        Returns:
+            bool: True if the bars of `ohlcv_df` after the last seen one can be appended.
+        """
+        if self.last_bar is None or self.last_bar.timestamp not in ohlcv_df.index:
+            return False
+        seen = ohlcv_df.loc[self.last_bar.timestamp, _OHLCV_COLUMNS]
+        return np.allclose(
+            seen.to_numpy(dtype=np.float64),
+            np.asarray(self.last_bar[1:], dtype=np.float64),
+            equal_nan=True,
+        )
+
+    def update(
+        self,
+        timestamp: pd.Timestamp,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        emit: bool = True,
+    ) -> Dict[str, float]:
+        """Append one candle and compute its features.
+
+        Args:
+            timestamp (pd.Timestamp): Time of the candle, after the last appended one.
+            open (float): Open price.
+            high (float): High price.
+            low (float): Low price.
+            close (float): Close price.
+            volume (float): Volume.
+            emit (bool, optional): Keep the row for `get_features`. Defaults to True.
+
+        Returns:
+            Dict[str, float]: Raw features of the candle (no NaN handling), keyed by
+                column name in the batch engine's order.
+
+        Raises:
+            ValueError: If the candle is not newer than the last appended one.
+        """
+        if self.last_bar is not None and timestamp <= self.last_bar.timestamp:
+            raise ValueError(
+                f"Bar at {timestamp} is not after the last bar {self.last_bar.timestamp}"
+            )
+        bar = _Bar(timestamp, open, high, low, close, volume)
+        row = dict(zip(_OHLCV_COLUMNS, bar[1:]))
+        for state in self._states:
+            if emit or not state.row_only:
+                state.update(bar, row)
+            else:
+                state.skip(bar)
+        self.last_bar = bar
+        if emit:
+            self._rows.append((timestamp, row))
+        return row
+
+    def extend(self, ohlcv_df: pd.DataFrame, emit: bool = True) -> pd.DataFrame:
+        """Append the candles of an OHLCV frame.
+
+        Args:
+            ohlcv_df (pd.DataFrame): OHLCV data sorted by a DatetimeIndex, newer than
+                the last appended candle.
+            emit (bool, optional): Keep and return the rows. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Raw features of the appended candles. Empty if `emit` is False.
+
+        Raises:
+            TypeError: If the index is not a DatetimeIndex.
+            ValueError: If OHLCV columns are missing or candles are out of order.
+        """
+        if not isinstance(ohlcv_df.index, pd.DatetimeIndex):
+            raise TypeError("DataFrame index must be a DatetimeIndex.")
+        columns = {col.lower(): col for col in ohlcv_df.columns}
+        if not all(col in columns for col in _OHLCV_COLUMNS):
+            raise ValueError(f"DataFrame must have cols: {_OHLCV_COLUMNS}")
+
+        arrays = [
+            ohlcv_df[columns[col]].to_numpy(dtype=np.float64).tolist()
+            for col in _OHLCV_COLUMNS
+        ]
+        rows = [
+            self.update(timestamp, *values, emit=emit)
+            for timestamp, *values in zip(ohlcv_df.index, *arrays)
+        ]
+        if not emit:
+            return pd.DataFrame()
+        return pd.DataFrame(rows, index=ohlcv_df.index)
+
+    def drop_rows_before(self, timestamp: pd.Timestamp):
+        """Forget kept rows older than a timestamp. States are not affected."""
+        while self._rows and self._rows[0][0] < timestamp:
+            self._rows.popleft()
+
+    def get_features(
+        self, handle_na_method: Optional[str] = "forward_fill"
+    ) -> pd.DataFrame:
+        """Return the kept rows as a feature frame.
+
+        Args:
+            handle_na_method (Optional[str], optional): NaN handling, same as the batch
+                engines' `get_features`. Defaults to 'forward_fill'.
+
+        Returns:
+            pd.DataFrame: Feature frame indexed by candle time.
+        """
+        if not self._rows:
+            return pd.DataFrame()
+        index = pd.DatetimeIndex([timestamp for timestamp, _ in self._rows])
+        df = pd.DataFrame([row for _, row in self._rows], index=index)
+        if handle_na_method:
+            df = _FeatureEngine._handle_nans(df, method=handle_na_method)
+        return df
+
+    # --- STATE BUILDERS ---
+    @staticmethod
+    def _get_configs(all_configs, default_config, name) -> List[Dict[str, Any]]:
+        configs = all_configs.get(name) if all_configs else None
+        return default_config.get(name, []) if configs is None else configs
+
+    @classmethod
+    def _build_indicator_states(
+        cls, names: List[str], all_configs, default_config
+    ) -> List[_StreamingState]:
+        states = []
+        for name in names:
+            for config in cls._get_configs(all_configs, default_config, name):
+                try:
+                    states.append(_INDICATOR_STATES[name](**config))
+                except TypeError as e:
+                    raise ValueError(
+                        f"Config {config} of '{name}' is not supported in streaming: {e}"
+                    ) from e
+        unsupported = set(all_configs or {}) - set(_INDICATOR_STATES)
+        unsupported -= {"diff_from_sma", "return_d", "lag"}
+        if unsupported:
+            raise ValueError(f"Indicators {unsupported} are not supported in streaming")
+        return states
+
+    @classmethod
+    def _build_daily_states(cls, all_configs) -> List[_StreamingState]:
+        default_config = DailyFeatureEngine.DEFAULT_CONFIG
+        states = cls._build_indicator_states(
+            _DAILY_INDICATORS, all_configs, default_config
+        )
+        sma_columns = {state.column for state in states if isinstance(state, _SMA)}
+
+        for config in cls._get_configs(all_configs, default_config, "diff_from_sma"):
+            sma_length = config.get("sma_length")
+            if sma_length and f"SMA_{sma_length}" in sma_columns:
+                states.append(_DiffFromSMA(sma_length))
+        for config in cls._get_configs(all_configs, default_config, "return_d"):
+            if config.get("d"):
+                states.append(_Return(config["d"]))
+        for config in cls._get_configs(all_configs, default_config, "lag"):
+            if config.get("column") and config.get("periods"):
+                states.append(_Lag(config["column"], config["periods"]))
+
+        states.append(_CandlePatterns(cls.CANDLE_WINDOW))
+        states.append(_InteractionFeatures())
+        return states
+
+    @classmethod
+    def _build_intraday_states(cls, all_configs) -> List[_StreamingState]:
+        states = cls._build_indicator_states(
+            _INTRADAY_INDICATORS, all_configs, IntradayFeatureEngine.DEFAULT_CONFIG
+        )
+        states.append(_OpeningRange(minutes=30))
+        return states
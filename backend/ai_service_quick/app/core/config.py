@@ -47,6 +47,13 @@ FORECASTING_TRAINING_BONUS_FEATURES = [
 
 FORECASTING_TRAINING_SCORE_WEIGHTS = {"lgbm": 0.4, "rf": 0.3, "mi": 0.3}
 
+# Bounds of the forecasting model and explainer caches (3 tasks per sector).
+# A TTL of 0 keeps entries until they are evicted.
+FORECASTING_CACHE_MAX_ENTRIES = int(os.getenv("FORECASTING_CACHE_MAX_ENTRIES", 64))
+FORECASTING_CACHE_TTL_SECONDS = (
+    int(os.getenv("FORECASTING_CACHE_TTL_SECONDS", 0)) or None
+)
+
 LGBM_MODEL_BASE_NAME = "LGBM"
 MULTIOUTPUT_LGBM_MODEL_BASE_NAME = "Multi-LGBM"
 
@@ -70,7 +77,39 @@ NEWS_COUNT_RELEVANT = 10
 NEWS_COUNT_CONTEXTUAL = 4
 NEWS_COUNT_MACRO = 2
 NEWS_TOTAL_LIMIT = 17
+NEWS_MACRO_SEARCH_TERMS = [
+    "Federal Reserve policy",
+    "US inflation report CPI",
+    "S&P 500",
+]
 
 BACKTEST_DAY_OF_MONTH = 10
 BACKTEST_START_YEAR = 2020
 BACKTEST_END_YEAR = 2024
+
+# Analysis report cache: short in-process L1 in front of a Redis L2 shared by workers
+ANALYSIS_CACHE_PREFIX = "analysis_report"
+ANALYSIS_CACHE_L1_TTL_SECONDS = int(os.getenv("ANALYSIS_CACHE_L1_TTL_SECONDS", 60))
+ANALYSIS_CACHE_L1_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_L1_MAX_ENTRIES", 256))
+ANALYSIS_CACHE_L2_TTL_SECONDS = int(os.getenv("ANALYSIS_CACHE_L2_TTL_SECONDS", 86400))
+
+# Local Parquet store of daily technical features, extended with new bars only.
+# Each append recomputes the indicator lookback times this factor, so recursive
+# indicators (EMA, PSAR, ...) start from a warmed-up state. Cumulative indicators
+# (OBV, ...) then depend on where the stored history starts, so this is opt-in.
+FEATURE_STORE_ENABLED = os.getenv("FEATURE_STORE_ENABLED", "false").lower() == "true"
+FEATURE_STORE_BASE_PATH = os.getenv("FEATURE_STORE_BASE_PATH", "./feature_store/daily")
+FEATURE_STORE_WARMUP_FACTOR = int(os.getenv("FEATURE_STORE_WARMUP_FACTOR", 4))
+# Incremental indicator states: intraday features and stored daily features are
+# updated bar by bar instead of being recomputed over the whole window. Values
+# during the warm-up are approximations of the batch ones, so this is opt-in.
+FEATURE_STREAMING_ENABLED = (
+    os.getenv("FEATURE_STREAMING_ENABLED", "false").lower() == "true"
+)
+# Live technical reports only fetch and compute the latest bars the analyses need:
+# the indicator warm-up (plus this share of it as margin) and the analysed window.
+# Values then approximate the ones computed over the full history, so this is opt-in.
+FEATURE_TAIL_MODE_ENABLED = (
+    os.getenv("FEATURE_TAIL_MODE_ENABLED", "false").lower() == "true"
+)
+FEATURE_TAIL_SAFETY_MARGIN = float(os.getenv("FEATURE_TAIL_SAFETY_MARGIN", 0.25))
@@ -6,17 +6,27 @@ following a factory pattern to create a singleton orchestrator instance.
 
 from typing import Optional
 
+import app.core.config as cfg
+import itapia_common.dblib.db_config as dbcfg
 from app.personal.preferences import PreferencesManager
 from app.personal.quantitive import QuantitivePreferencesAnalyzer
 from app.personal.scorer import WeightedSumScorer
+from itapia_common.dblib.cache.remote import AsyncRedisCache
 from itapia_common.dblib.services import (
     APIMetadataService,
     APINewsService,
     APIPricesService,
     BacktestReportService,
+    DataNewsService,
     RuleService,
 )
-from itapia_common.dblib.session import get_rdbms_session, get_redis_connection
+from itapia_common.dblib.session import (
+    close_singleton_async_redis_client,
+    get_redis_connection,
+    get_singleton_async_redis_client,
+    get_singleton_rdbms_engine,
+    get_singleton_session_factory,
+)
 from itapia_common.rules.action import MEDIUM_SWING_IDEAL_MAPPER
 
 from .advisor import AdvisorOrchestrator
@@ -28,6 +38,7 @@ from .analysis.data_prepare import DataPrepareOrchestrator
 from .analysis.explainer import AnalysisExplainerOrchestrator
 from .analysis.forecasting import ForecastingOrchestrator
 from .analysis.news import NewsOrchestrator
+from .analysis.report_cache import AnalysisReportCache
 from .analysis.technical import TechnicalOrchestrator
 
 # Import all required classes for initialization
@@ -55,28 +66,58 @@ def create_dependencies() -> None:
     if _ceo_orchestrator is not None:
         return
 
-    db_session_gen = get_rdbms_session()
+    # Services borrow a pooled session per unit of work instead of sharing one,
+    # so concurrent requests and executor threads never touch the same session.
+    session_factory = get_singleton_session_factory()
     redis_gen = get_redis_connection()
-    db = next(db_session_gen)
     redis = next(redis_gen)
+    # Intraday and cache reads happen inside async handlers, they go through
+    # the asyncio client so they neither block the loop nor use executor threads
+    async_redis = get_singleton_async_redis_client()
 
     try:
         # 1. Initialize low-level services
-        metadata_service = APIMetadataService(rdbms_session=db)
+        metadata_service = APIMetadataService(
+            rdbms_session=None, session_factory=session_factory
+        )
         prices_service = APIPricesService(
-            rdbms_session=db, redis_client=redis, metadata_service=metadata_service
+            rdbms_session=None,
+            redis_client=redis,
+            metadata_service=metadata_service,
+            session_factory=session_factory,
+            async_redis_client=async_redis,
         )
         news_service = APINewsService(
-            rdbms_session=db, metadata_service=metadata_service
+            rdbms_session=None,
+            metadata_service=metadata_service,
+            session_factory=session_factory,
+            async_redis_client=async_redis,
+        )
+        rule_service = RuleService(rdbms_session=None, session_factory=session_factory)
+        backtest_report_service = BacktestReportService(
+            rdbms_session=None, session_factory=session_factory
         )
-        rule_service = RuleService(rdbms_session=db)
-        backtest_report_service = BacktestReportService(rdbms_session=db)
 
         # 2. Initialize "department head" level orchestrators
         data_prepare_orc = DataPrepareOrchestrator(
             metadata_service, prices_service, news_service
         )
-        technical_orc = TechnicalOrchestrator()
+        if dbcfg.UNIVERSAL_NEWS_DIGESTS:
+            # News feeds only read digests, register the searches they run up front
+            DataNewsService(
+                get_singleton_rdbms_engine()
+            ).register_universal_news_digests(
+                data_prepare_orc.get_universal_news_search_terms()
+            )
+        technical_orc = TechnicalOrchestrator(
+            feature_store_path=(
+                cfg.FEATURE_STORE_BASE_PATH if cfg.FEATURE_STORE_ENABLED else None
+            ),
+            warmup_factor=cfg.FEATURE_STORE_WARMUP_FACTOR,
+            streaming=cfg.FEATURE_STREAMING_ENABLED,
+            tail_mode=cfg.FEATURE_TAIL_MODE_ENABLED,
+            tail_margin=cfg.FEATURE_TAIL_SAFETY_MARGIN,
+        )
         news_orc = NewsOrchestrator()
         forecasting_orc = ForecastingOrchestrator()
         analysis_explaine_orc = AnalysisExplainerOrchestrator()
@@ -89,6 +130,15 @@ def create_dependencies() -> None:
             scorer=WeightedSumScorer(),
         )
         backtest_orc = BacktestOrchestrator(backtest_report_service)
+        report_cache = AnalysisReportCache(
+            redis_cache=AsyncRedisCache(
+                async_redis,
+                prefix=cfg.ANALYSIS_CACHE_PREFIX,
+                ttl_seconds=cfg.ANALYSIS_CACHE_L2_TTL_SECONDS,
+            ),
+            l1_ttl_seconds=cfg.ANALYSIS_CACHE_L1_TTL_SECONDS,
+            l1_max_entries=cfg.ANALYSIS_CACHE_L1_MAX_ENTRIES,
+        )
 
         # 3. Initialize "deputy CEO" level orchestrators
         analysis_orc = AnalysisOrchestrator(
@@ -98,6 +148,7 @@ def create_dependencies() -> None:
             news_analyzer=news_orc,
             explainer=analysis_explaine_orc,
             backtest_orchestrator=backtest_orc,
+            report_cache=report_cache,
             # backtest_orchestrator is no longer needed for main flow, but can be initialized here if needed
         )
         advisor_orc = AdvisorOrchestrator(
@@ -115,7 +166,6 @@ def create_dependencies() -> None:
             personal_orchestrator=personal_orc,
         )
     finally:
-        db.close()
         redis.close()
 
 
@@ -137,10 +187,11 @@ def get_ceo_orchestrator() -> AIServiceQuickOrchestrator:
     return _ceo_orchestrator
 
 
-def close_dependencies() -> None:
+async def close_dependencies() -> None:
     """Cleanup function called when application shuts down.
 
-    Resets the global orchestrator instance to None.
+    Resets the global orchestrator instance to None and closes the asyncio Redis client.
     """
     global _ceo_orchestrator
     _ceo_orchestrator = None
+    await close_singleton_async_redis_client()
@@ -40,7 +40,7 @@ async def lifespan(app: FastAPI):
 
     # 3. Cleanup on shutdown
     print("AI Service shutting down. Cleaning up dependencies.")
-    dependencies.close_dependencies()
+    await dependencies.close_dependencies()
 
 
 app = FastAPI(
@@ -0,0 +1,235 @@
+from datetime import datetime, timedelta, timezone
+
+import fakeredis
+import numpy as np
+import pandas as pd
+import pytest
+from app.analysis.data_prepare.intraday_buffer import (
+    IntradayStreamBuffer,
+    _TickerRingBuffer,
+)
+import itapia_common.dblib.db_config as dbcfg
+from itapia_common.dblib.crud.prices import (
+    INTRADAY_CANDLE_DTYPE,
+    PACKED_CANDLE_FIELD,
+    _decode_intraday_entries,
+    _pack_intraday_candle,
+    add_intraday_candle,
+    get_intraday_prices_after_async,
+)
+
+STREAM_PREFIX = "intraday_stream"
+
+# 2024-01-02 14:30 UTC, tính bằng micro giây
+START_US = 1704205800 * 1_000_000
+MINUTE_US = 60 * 1_000_000
+
+
+def make_arrays(start: int, count: int) -> dict:
+    """
+    Tạo các mảng nến giống đầu ra của `_decode_intraday_entries`, nến thứ i
+    có giá đóng cửa bằng i và cách nhau một phút.
+    """
+    closes = np.arange(start, start + count, dtype=np.float64)
+    arrays = {
+        name: np.empty(count, dtype=INTRADAY_CANDLE_DTYPE[name])
+        for name in INTRADAY_CANDLE_DTYPE.names
+    }
+    for name in ["open", "high", "low", "close"]:
+        arrays[name][:] = closes
+    arrays["volume"][:] = 100.0
+    arrays["timestamp_us"][:] = START_US + np.arange(start, start + count) * MINUTE_US
+    return arrays
+
+
+def test_extend_below_capacity_keeps_all_candles():
+    """Khi chưa đầy, buffer giữ toàn bộ nến theo đúng thứ tự thời gian."""
+    buffer = _TickerRingBuffer(capacity=5)
+    buffer.extend(make_arrays(0, 2))
+    buffer.extend(make_arrays(2, 2))
+
+    frame = buffer.to_frame()
+
+    assert buffer.size == 4
+    assert frame["close"].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert frame.index.name == "datetime_utc"
+    assert frame.index[0] == pd.Timestamp("2024-01-02 14:30", tz="UTC")
+
+
+def test_extend_wraps_around_and_drops_oldest():
+    """Khi vượt sức chứa, buffer ghi đè vòng và loại bỏ các nến cũ nhất."""
+    buffer = _TickerRingBuffer(capacity=5)
+    buffer.extend(make_arrays(0, 4))
+    buffer.extend(make_arrays(4, 3))
+
+    frame = buffer.to_frame()
+
+    assert buffer.size == 5
+    assert frame["close"].tolist() == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert frame.index.is_monotonic_increasing
+
+
+def test_extend_batch_larger_than_capacity_keeps_newest():
+    """Một lô lớn hơn sức chứa chỉ giữ lại `capacity` nến mới nhất."""
+    buffer = _TickerRingBuffer(capacity=5)
+    buffer.extend(make_arrays(0, 3))
+    buffer.extend(make_arrays(3, 12))
+
+    assert buffer.size == 5
+    assert buffer.to_frame()["close"].tolist() == [10.0, 11.0, 12.0, 13.0, 14.0]
+
+
+def test_extend_many_small_batches_matches_tail():
+    """Nhiều lần thêm nhỏ liên tiếp cho kết quả giống phần đuôi của toàn bộ chuỗi."""
+    buffer = _TickerRingBuffer(capacity=7)
+    start = 0
+    for count in [3, 1, 5, 2, 4, 6]:
+        buffer.extend(make_arrays(start, count))
+        start += count
+
+    expected = np.arange(start - 7, start, dtype=np.float64)
+    assert buffer.to_frame()["close"].tolist() == expected.tolist()
+
+
+def test_extend_empty_batch_and_clear():
+    """Lô rỗng không thay đổi buffer, `clear` đưa buffer về trạng thái ban đầu."""
+    buffer = _TickerRingBuffer(capacity=3)
+    buffer.extend(make_arrays(0, 0))
+    assert buffer.size == 0
+    assert buffer.to_frame().empty
+
+    buffer.extend(make_arrays(0, 2))
+    buffer.last_id = "5-0"
+    buffer.clear()
+
+    assert buffer.size == 0
+    assert buffer.last_id == "0-0"
+    buffer.extend(make_arrays(10, 1))
+    assert buffer.to_frame()["close"].tolist() == [10.0]
+
+
+class FakePricesService:
+    """Đọc stream từ fakeredis giống `APIPricesService.get_intraday_updates_async`."""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+
+    async def get_intraday_updates_async(self, last_ids: dict) -> dict:
+        return await get_intraday_prices_after_async(
+            self.redis_client, last_ids, STREAM_PREFIX
+        )
+
+
+async def add_candles(redis_client, ticker: str, closes: list, first_id: int):
+    """Thêm các nến đã đóng gói với ID stream tường minh, bắt đầu từ `first_id`."""
+    for i, close in enumerate(closes):
+        candle = {
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": 100.0,
+            "last_update_utc": datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+            + timedelta(minutes=first_id + i),
+        }
+        await redis_client.xadd(
+            f"{STREAM_PREFIX}:{ticker}",
+            {PACKED_CANDLE_FIELD: _pack_intraday_candle(candle)},
+            id=f"{first_id + i}-0",
+        )
+
+
+@pytest.mark.asyncio
+async def test_refresh_appends_only_new_entries():
+    """Mỗi lần refresh chỉ thêm các entry mới hơn ID đã đọc."""
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    buffer = IntradayStreamBuffer(FakePricesService(redis_client), capacity=5)
+    await add_candles(redis_client, "AAA", [0.0, 1.0], first_id=100)
+    await buffer.refresh(["AAA"])
+    await add_candles(redis_client, "AAA", [2.0], first_id=102)
+
+    frame = await buffer.get_ohlcv("AAA")
+
+    assert frame["close"].tolist() == [0.0, 1.0, 2.0]
+    assert await buffer.get_last_id("AAA") == "102-0"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("first_id", [1, 200])
+async def test_recreated_longer_stream_is_reloaded(first_id):
+    """
+    Stream bị xóa rồi tạo lại dài hơn buffer (ID cũ hơn hoặc mới hơn ID đã đọc)
+    phải được tải lại, không giữ nến của stream cũ.
+    """
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    buffer = IntradayStreamBuffer(FakePricesService(redis_client), capacity=4)
+    await add_candles(redis_client, "AAA", [0.0, 1.0], first_id=100)
+    await buffer.refresh(["AAA"])
+
+    await redis_client.delete(f"{STREAM_PREFIX}:AAA")
+    await add_candles(redis_client, "AAA", [10.0 + i for i in range(6)], first_id)
+
+    frame = await buffer.get_ohlcv("AAA")
+
+    assert frame["close"].tolist() == [12.0, 13.0, 14.0, 15.0]
+    assert await buffer.get_last_id("AAA") == f"{first_id + 5}-0"
+
+
+@pytest.mark.asyncio
+async def test_deleted_stream_empties_buffer():
+    """Stream bị xóa hẳn thì buffer cũng trở nên rỗng."""
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    buffer = IntradayStreamBuffer(FakePricesService(redis_client), capacity=4)
+    await add_candles(redis_client, "AAA", [0.0, 1.0], first_id=100)
+    await buffer.refresh(["AAA"])
+
+    await redis_client.delete(f"{STREAM_PREFIX}:AAA")
+
+    assert (await buffer.get_ohlcv("AAA")).empty
+    assert await buffer.get_last_id("AAA") == "0-0"
+
+
+@pytest.mark.asyncio
+async def test_cold_read_matches_full_stream():
+    """
+    Lần đọc đầu tiên trả về đúng toàn bộ stream, kể cả khi MAXLEN ~ để lại nhiều
+    hơn INTRADAY_STREAM_MAX_ENTRIES entry.
+    """
+    server = fakeredis.FakeServer()
+    writer = fakeredis.FakeRedis(server=server, decode_responses=True)
+    redis_client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    buffer = IntradayStreamBuffer(
+        FakePricesService(redis_client),
+        capacity=dbcfg.INTRADAY_STREAM_BUFFER_CAPACITY,
+    )
+    for i in range(dbcfg.INTRADAY_STREAM_MAX_ENTRIES + 50):
+        candle = {
+            "open": i,
+            "high": i + 1.0,
+            "low": i - 1.0,
+            "close": i + 0.5,
+            "volume": 100.0,
+            "last_update_utc": datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+            + timedelta(minutes=i),
+        }
+        add_intraday_candle(
+            writer,
+            "AAA",
+            candle,
+            STREAM_PREFIX,
+            max_entries=dbcfg.INTRADAY_STREAM_MAX_ENTRIES,
+            packed=i % 2 == 0,
+        )
+
+    frame = await buffer.get_ohlcv("AAA")
+
+    arrays = _decode_intraday_entries(writer.xrange(f"{STREAM_PREFIX}:AAA"))
+    expected = pd.DataFrame(
+        {col: arrays[col] for col in ["open", "high", "low", "close", "volume"]},
+        index=pd.DatetimeIndex(
+            pd.to_datetime(arrays["timestamp_us"], unit="us", utc=True),
+            name="datetime_utc",
+        ),
+    )
+    assert len(frame) > dbcfg.INTRADAY_STREAM_MAX_ENTRIES
+    pd.testing.assert_frame_equal(frame, expected)
@@ -112,3 +112,101 @@ def test_get_features_dropna_and_reset_index(sample_ohlcv_data):
     # Test dropna=False
     df_not_dropped = engine.get_features(handle_na_method=None)
     assert df_not_dropped.isna().sum().sum() > 0
+
+
+def test_indicator_plan_is_compiled_once(sample_ohlcv_data):
+    """Config chỉ được biên dịch một lần, các lần gọi sau dùng lại cùng plan."""
+    configs = [{"fast": 12, "slow": 26, "signal": 9}]
+    plan = DailyFeatureEngine.get_plan("macd", configs)
+
+    assert DailyFeatureEngine.get_plan("macd", list(configs)) is plan
+    # Tên cột đầu ra đã được xác định lúc biên dịch
+    assert plan[0].output_columns == ["MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"]
+
+    df = (
+        DailyFeatureEngine(sample_ohlcv_data)
+        .add_macd(configs)
+        .get_features(handle_na_method=None)
+    )
+    assert all(col in df.columns for col in plan[0].output_columns)
+
+
+def test_duplicate_configs_are_computed_once(sample_ohlcv_data):
+    """Các config giống hệt nhau chỉ tạo một bước trong plan."""
+    plan = DailyFeatureEngine.get_plan("sma", [{"length": 20}, {"length": 20}])
+    assert len(plan) == 1
+    assert plan[0].output_columns == ["SMA_20"]
+
+
+def test_add_required_features_matches_all_features(sample_ohlcv_data):
+    """Chỉ tính các feature được yêu cầu (kèm phụ thuộc), giá trị giống add_all_features."""
+    required = ["RSI_x_trend", "close_lag_5", "diff_from_sma_50_lag_5", "MACDs_12_26_9"]
+    expected = (
+        DailyFeatureEngine(sample_ohlcv_data)
+        .add_all_features()
+        .get_features(handle_na_method=None)
+    )
+    df = (
+        DailyFeatureEngine(sample_ohlcv_data)
+        .add_required_features(required)
+        .get_features(handle_na_method=None)
+    )
+
+    for col in required:
+        pd.testing.assert_series_equal(df[col], expected[col])
+    # Các phụ thuộc được tính, các feature không cần thì không
+    assert "SMA_200" in df.columns and "diff_from_sma_50" in df.columns
+    assert "EMA_20" not in df.columns
+    assert "close_lag_1" not in df.columns
+    assert not any(col.startswith("CDL_") for col in df.columns)
+
+
+def test_resolve_required_configs_candles_and_unknown_columns():
+    """Cột CDL_ kéo theo toàn bộ mẫu nến; cột không tồn tại chỉ bị bỏ qua."""
+    configs, add_candles, add_interactions = (
+        DailyFeatureEngine.resolve_required_configs(
+            ["hammer_in_oversold", "not_a_feature"]
+        )
+    )
+    assert add_candles and add_interactions
+    assert configs == {"rsi": [{"length": 14}]}
+
+
+def test_warmup_tail_matches_full_history():
+    """Tính trên phần đuôi dài bằng warm-up phải cho giá trị như tính trên toàn bộ lịch sử."""
+    size = 1500
+    # Giá xuất phát cao để random walk không tiến về 0
+    close = 1000 + np.cumsum(np.random.normal(0, 1, size=size))
+    df = pd.DataFrame(
+        {
+            "open": close + np.random.normal(0, 0.5, size=size),
+            "close": close,
+            "volume": np.random.uniform(1e6, 5e6, size=size),
+        },
+        index=pd.date_range(start="2018-01-01", periods=size, freq="D"),
+    )
+    df["high"] = df[["open", "close"]].max(axis=1) + np.random.uniform(0, 2, size=size)
+    df["low"] = df[["open", "close"]].min(axis=1) - np.random.uniform(0, 2, size=size)
+
+    required = ["SMA_200", "RSI_14", "ADX_14", "ATRr_14", "BBU_20_2.0"]
+    configs, _, _ = DailyFeatureEngine.resolve_required_configs(required)
+    warmup = DailyFeatureEngine.get_warmup(configs)
+    # SMA_200 cần 200 nến, các chỉ báo đệ quy (ADX) cần nhiều hơn
+    assert warmup > 200
+    assert warmup < DailyFeatureEngine.get_warmup()
+
+    full = (
+        DailyFeatureEngine(df)
+        .add_required_features(required)
+        .get_features(handle_na_method=None)
+    )
+    tail = (
+        DailyFeatureEngine(df.iloc[-(warmup + 20) :])
+        .add_required_features(required)
+        .get_features(handle_na_method=None)
+    )
+    np.testing.assert_allclose(
+        tail[required].iloc[-20:].to_numpy(dtype=np.float64),
+        full[required].iloc[-20:].to_numpy(dtype=np.float64),
+        rtol=DailyFeatureEngine.WARMUP_TOLERANCE,
+    )
@@ -0,0 +1,105 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.analysis.technical.feature_store import DailyFeatureStore
+
+
+def compute_features(ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+    """Feature giả: chỉ thêm cột close nhân đôi."""
+    features = ohlcv_df.copy()
+    features["double_close"] = features["close"] * 2
+    return features
+
+
+class FakeStream:
+    """Stream giả, tính cùng feature với `compute_features` từng nến một."""
+
+    def __init__(self, ohlcv_df: pd.DataFrame):
+        self.last_timestamp = ohlcv_df.index[-1]
+        self.extended_bars = 0
+
+    def extend(self, ohlcv_df: pd.DataFrame) -> pd.DataFrame:
+        self.last_timestamp = ohlcv_df.index[-1]
+        self.extended_bars += len(ohlcv_df)
+        return compute_features(ohlcv_df)
+
+
+def make_ohlcv(size: int) -> pd.DataFrame:
+    close = np.arange(size, dtype=np.float64) + 100
+    dates = pd.date_range(start="2024-01-01", periods=size, freq="D", tz="UTC")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 1000.0,
+        },
+        index=dates,
+    )
+
+
+def make_store(base_path: str, fingerprint: str) -> DailyFeatureStore:
+    return DailyFeatureStore(
+        base_path,
+        compute_features=compute_features,
+        lookback=3,
+        create_stream=FakeStream,
+        stream_fingerprint=fingerprint,
+    )
+
+
+def read_stream_payload(base_path) -> dict:
+    with open(base_path / "AAA.stream.pkl", "rb") as f:
+        return pickle.load(f)
+
+
+def test_stream_is_saved_with_its_fingerprint(tmp_path):
+    """Stream được lưu kèm fingerprint và được dùng lại để thêm nến mới."""
+    ohlcv = make_ohlcv(10)
+    store = make_store(str(tmp_path), "v1")
+    store.get_features("AAA", ohlcv.iloc[:8])
+
+    features = store.get_features("AAA", ohlcv)
+
+    payload = read_stream_payload(tmp_path)
+    assert payload["fingerprint"] == "v1"
+    assert payload["stream"].extended_bars == 2
+    assert features["double_close"].tolist() == (ohlcv["close"] * 2).tolist()
+
+
+@pytest.mark.parametrize("stored_payload", ["v0", "raw"])
+def test_stale_stream_triggers_rebuild(tmp_path, stored_payload):
+    """Stream có fingerprint khác (hoặc định dạng cũ) không được dùng, dữ liệu được dựng lại."""
+    ohlcv = make_ohlcv(10)
+    make_store(str(tmp_path), "v0").get_features("AAA", ohlcv.iloc[:8])
+    if stored_payload == "raw":
+        # Định dạng cũ: đối tượng stream được pickle trực tiếp
+        stream = read_stream_payload(tmp_path)["stream"]
+        with open(tmp_path / "AAA.stream.pkl", "wb") as f:
+            pickle.dump(stream, f)
+
+    features = make_store(str(tmp_path), "v1").get_features("AAA", ohlcv)
+
+    payload = read_stream_payload(tmp_path)
+    assert payload["fingerprint"] == "v1"
+    # Stream mới được khởi tạo từ toàn bộ lịch sử, không thêm nến nào
+    assert payload["stream"].extended_bars == 0
+    assert payload["stream"].last_timestamp == ohlcv.index[-1]
+    assert features["double_close"].tolist() == (ohlcv["close"] * 2).tolist()
+
+
+def test_unreadable_stream_triggers_rebuild(tmp_path):
+    """File stream không đọc được cũng khiến dữ liệu được dựng lại."""
+    ohlcv = make_ohlcv(10)
+    store = make_store(str(tmp_path), "v1")
+    store.get_features("AAA", ohlcv.iloc[:8])
+    (tmp_path / "AAA.stream.pkl").write_bytes(b"not a pickle")
+
+    store.get_features("AAA", ohlcv)
+
+    payload = read_stream_payload(tmp_path)
+    assert payload["fingerprint"] == "v1"
+    assert payload["stream"].extended_bars == 0
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.analysis.technical.feature_engine import DailyFeatureEngine
+from app.analysis.technical.panel_feature_engine import DailyPanelFeatureEngine
+
+# Bỏ qua giai đoạn khởi động, nơi TA-Lib (nếu có) khởi tạo chỉ báo hơi khác pandas-ta
+WARMUP_BARS = 300
+
+
+def _make_ticker_data(ticker: str, size: int, start: str) -> pd.DataFrame:
+    close = 100 + np.cumsum(np.random.normal(0, 1, size=size))
+    df = pd.DataFrame(
+        {
+            "open": close + np.random.normal(0, 0.5, size=size),
+            "close": close,
+            "volume": np.random.uniform(1e6, 5e6, size=size),
+        },
+        index=pd.date_range(start=start, periods=size, freq="D", tz="UTC"),
+    )
+    df["high"] = df[["open", "close"]].max(axis=1) + np.random.uniform(0, 2, size=size)
+    df["low"] = df[["open", "close"]].min(axis=1) - np.random.uniform(0, 2, size=size)
+    df["ticker"] = ticker
+    return df[["open", "high", "low", "close", "volume", "ticker"]]
+
+
+@pytest.fixture(scope="module")
+def sample_sector_data() -> pd.DataFrame:
+    """
+    Dữ liệu của một sector gồm 3 mã với độ dài và ngày bắt đầu khác nhau,
+    trộn thứ tự các dòng để kiểm tra việc sắp xếp lại.
+    """
+    df = pd.concat(
+        [
+            _make_ticker_data("BBB", 500, "2021-01-01"),
+            _make_ticker_data("AAA", 420, "2021-03-01"),
+            _make_ticker_data("CCC", 460, "2021-02-01"),
+        ]
+    )
+    return df.sample(frac=1, random_state=0)
+
+
+def test_panel_matches_per_ticker_features(sample_sector_data):
+    """Tính theo panel phải cho kết quả giống tính riêng từng mã (sau khởi động)."""
+    panel = (
+        DailyPanelFeatureEngine(sample_sector_data)
+        .add_all_features()
+        .get_features(handle_na_method=None)
+    )
+
+    for ticker, group_df in sample_sector_data.groupby("ticker"):
+        expected = (
+            DailyFeatureEngine(group_df.sort_index())
+            .add_all_features()
+            .get_features(handle_na_method=None)
+        )
+        actual = panel[panel["ticker"] == ticker]
+
+        assert actual.index.equals(expected.index)
+        assert list(actual.columns) == list(expected.columns)
+        numeric_cols = [col for col in expected.columns if col != "ticker"]
+        np.testing.assert_allclose(
+            actual[numeric_cols].iloc[WARMUP_BARS:].to_numpy(dtype=np.float64),
+            expected[numeric_cols].iloc[WARMUP_BARS:].to_numpy(dtype=np.float64),
+            rtol=1e-6,
+            atol=1e-6,
+            equal_nan=True,
+        )
+
+
+def test_panel_rows_ordered_by_ticker_then_time(sample_sector_data):
+    """Kết quả được sắp theo mã rồi theo thời gian, như khi nối các groupby."""
+    df = DailyPanelFeatureEngine(sample_sector_data).add_all_features().get_features()
+
+    assert list(df["ticker"].unique()) == ["AAA", "BBB", "CCC"]
+    for _, group_df in df.groupby("ticker"):
+        assert group_df.index.is_monotonic_increasing
+    # forward_fill không được làm tràn giá trị từ mã này sang mã khác
+    assert not df.isna().any().any()
+    assert (df.groupby("ticker").size() == [420 - 199, 500 - 199, 460 - 199]).all()
+
+
+def test_unsupported_config_raises(sample_sector_data):
+    """Cấu hình không có bản panel phải báo lỗi để caller tính riêng từng mã."""
+    engine = DailyPanelFeatureEngine(sample_sector_data)
+    with pytest.raises(ValueError):
+        engine.add_all_features({"kama": [{"length": 10}]})
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.analysis.technical.feature_engine import DailyFeatureEngine
+from app.analysis.technical.streaming_feature_engine import StreamingFeatureEngine
+
+# Số nến dùng để khởi tạo stream, phần còn lại được thêm từng nến một
+SEED_BARS = 400
+
+
+@pytest.fixture(scope="module")
+def sample_ohlcv_data() -> pd.DataFrame:
+    """
+    Tạo DataFrame OHLCV dạng random walk, đủ dài để mọi chỉ báo (kể cả SMA_200)
+    đã qua giai đoạn khởi động.
+    """
+    size = 500
+    close = 100 + np.cumsum(np.random.normal(0, 1, size=size))
+    data = {
+        "open": close + np.random.normal(0, 0.5, size=size),
+        "close": close,
+        "volume": np.random.uniform(1e6, 5e6, size=size),
+    }
+    dates = pd.date_range(start="2022-01-01", periods=size, freq="D")
+    df = pd.DataFrame(data, index=dates)
+    df["high"] = df[["open", "close"]].max(axis=1) + np.random.uniform(0, 2, size=size)
+    df["low"] = df[["open", "close"]].min(axis=1) - np.random.uniform(0, 2, size=size)
+    return df[["open", "high", "low", "close", "volume"]]
+
+
+@pytest.fixture(scope="module")
+def batch_features(sample_ohlcv_data) -> pd.DataFrame:
+    engine = DailyFeatureEngine(sample_ohlcv_data)
+    return engine.add_all_features().get_features(handle_na_method=None)
+
+
+def test_streaming_matches_batch_features(sample_ohlcv_data, batch_features):
+    """Các nến thêm vào stream phải có feature giống hệt tính lại toàn bộ (trong sai số)."""
+    stream = StreamingFeatureEngine.from_history(
+        sample_ohlcv_data.iloc[:SEED_BARS], "daily", keep_rows=False
+    )
+    appended = stream.extend(sample_ohlcv_data.iloc[SEED_BARS:])
+
+    # Cùng tập cột và cùng thứ tự cột
+    assert list(appended.columns) == list(batch_features.columns)
+    np.testing.assert_allclose(
+        appended.to_numpy(dtype=np.float64),
+        batch_features.iloc[SEED_BARS:].to_numpy(dtype=np.float64),
+        rtol=StreamingFeatureEngine.TOLERANCE,
+        atol=StreamingFeatureEngine.TOLERANCE,
+        equal_nan=True,
+    )
+
+
+def test_update_returns_row_of_new_bar(sample_ohlcv_data, batch_features):
+    """update() trả về feature của đúng nến vừa thêm."""
+    stream = StreamingFeatureEngine.from_history(
+        sample_ohlcv_data.iloc[:-1], "daily", keep_rows=False
+    )
+    last = sample_ohlcv_data.iloc[-1]
+    row = stream.update(sample_ohlcv_data.index[-1], *last.tolist())
+
+    assert stream.last_timestamp == sample_ohlcv_data.index[-1]
+    assert row["RSI_14"] == pytest.approx(
+        batch_features["RSI_14"].iloc[-1], rel=StreamingFeatureEngine.TOLERANCE
+    )
+    assert row["OBV"] == pytest.approx(
+        batch_features["OBV"].iloc[-1], rel=StreamingFeatureEngine.TOLERANCE
+    )
+
+
+def test_update_rejects_older_bar(sample_ohlcv_data):
+    """Không được thêm nến cũ hơn (hoặc trùng) nến cuối cùng."""
+    stream = StreamingFeatureEngine.from_history(
+        sample_ohlcv_data.iloc[:50], "daily", keep_rows=False
+    )
+    first = sample_ohlcv_data.iloc[0]
+    with pytest.raises(ValueError):
+        stream.update(sample_ohlcv_data.index[0], *first.tolist())
+
+
+def test_can_extend(sample_ohlcv_data):
+    """can_extend() chỉ đúng khi dữ liệu mới chứa nến cuối cùng, không bị sửa đổi."""
+    stream = StreamingFeatureEngine.from_history(
+        sample_ohlcv_data.iloc[:50], "daily", keep_rows=False
+    )
+    assert stream.can_extend(sample_ohlcv_data)
+    # Nến cuối cùng bị điều chỉnh (ví dụ chia tách cổ phiếu)
+    adjusted = sample_ohlcv_data.copy()
+    adjusted.iloc[49, adjusted.columns.get_loc("close")] += 1
+    assert not stream.can_extend(adjusted)
+    # Dữ liệu mới không còn chứa nến cuối cùng
+    assert not stream.can_extend(sample_ohlcv_data.iloc[60:])
+
+
+def test_unsupported_config_raises():
+    """Cấu hình không có bản streaming phải báo lỗi để caller quay về cách tính cũ."""
+    with pytest.raises(ValueError):
+        StreamingFeatureEngine("daily", all_configs={"sma": [{"length": 20, "x": 1}]})
+    with pytest.raises(ValueError):
+        StreamingFeatureEngine("daily", all_configs={"kama": [{"length": 10}]})
+
+
+def test_state_fingerprint_tracks_kind_and_configs():
+    """Fingerprint đổi khi loại feature hoặc cấu hình chỉ báo thay đổi."""
+    fingerprint = StreamingFeatureEngine.get_state_fingerprint("daily")
+
+    assert fingerprint == StreamingFeatureEngine.get_state_fingerprint("daily")
+    assert fingerprint != StreamingFeatureEngine.get_state_fingerprint("intraday")
+    assert fingerprint != StreamingFeatureEngine.get_state_fingerprint(
+        "daily", {"sma": [{"length": 5}]}
+    )
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from app.analysis.technical.feature_engine import IntradayFeatureEngine
+from app.analysis.technical.streaming_feature_engine import StreamingFeatureEngine
 
 
 @pytest.fixture(scope="module")
@@ -129,3 +130,53 @@ def test_vwap_resets_daily(sample_intraday_data):
     # VWAP của cây nến thứ hai phải khác
     second_candle_day1 = df.loc["2024-05-20 09:45:00"]
     assert not np.isclose(second_candle_day1["VWAP_D"], expected_vwap_day1)
+
+
+def test_streaming_matches_batch_intraday_features():
+    """
+    Stream intraday (thêm từng nến) phải cho cùng feature với tính lại toàn bộ,
+    kể cả Opening Range của các nến nằm trong 30 phút đầu ngày.
+    """
+    # 12 ngày giao dịch, đủ dài để các chỉ báo đệ quy (RSI, ATR) hội tụ
+    days = pd.date_range(start="2024-05-06", periods=12, freq="B")
+    dates = pd.DatetimeIndex(
+        np.concatenate(
+            [
+                pd.date_range(start=f"{day.date()} 09:30", periods=27, freq="15min")
+                for day in days
+            ]
+        )
+    )
+    size = len(dates)
+    close = 150 + np.cumsum(np.random.normal(0, 0.3, size=size))
+    df = pd.DataFrame(
+        {
+            "open": close + np.random.normal(0, 0.1, size=size),
+            "high": close + np.random.uniform(0.1, 0.5, size=size),
+            "low": close - np.random.uniform(0.1, 0.5, size=size),
+            "close": close,
+            "volume": np.random.randint(10000, 50000, size=size),
+        },
+        index=dates,
+    )
+    batch = (
+        IntradayFeatureEngine(df)
+        .add_all_intraday_features()
+        .get_features(handle_na_method=None)
+    )
+
+    # Khởi tạo stream giữa phiên, ngay trong vùng Opening Range của ngày cuối
+    seed_bars = size - 26
+    stream = StreamingFeatureEngine.from_history(df.iloc[:seed_bars], "intraday")
+    stream.extend(df.iloc[seed_bars:])
+    streamed = stream.get_features(handle_na_method=None)
+
+    assert list(streamed.columns) == list(batch.columns)
+    # Bỏ qua giai đoạn khởi động của các chỉ báo
+    warm = slice(size - 60, size)
+    np.testing.assert_allclose(
+        streamed.iloc[warm].to_numpy(dtype=np.float64),
+        batch.iloc[warm].to_numpy(dtype=np.float64),
+        rtol=StreamingFeatureEngine.TOLERANCE,
+        atol=StreamingFeatureEngine.TOLERANCE,
+    )
@@ -7,6 +7,7 @@ from itapia_common.dblib.dependencies import (
     get_news_service,
     get_prices_service,
 )
+from itapia_common.dblib.pagination import InvalidCursorError
 from itapia_common.dblib.services import (
     APIMetadataService,
     APINewsService,
@@ -29,6 +30,7 @@ def get_daily_prices(
     ticker: str,
     skip: int = 0,
     limit: int = 500,
+    cursor: str | None = None,
     prices_service: APIPricesService = Depends(get_prices_service),
 ):
     """Get daily historical price data for a stock ticker.
@@ -37,14 +39,18 @@ def get_daily_prices(
         ticker (str): Stock ticker symbol
         skip (int): Number of records to skip (for pagination)
         limit (int): Maximum number of records to return
+        cursor (str | None): `next_cursor` of the previous page, preferred over `skip`
+            for deep pages
         prices_service (APIPricesService): Prices service dependency
 
     Returns:
         PriceResponse: Daily historical price data
     """
     try:
-        res = prices_service.get_daily_prices(ticker, skip, limit)
+        res = prices_service.get_daily_prices(ticker, skip, limit, cursor=cursor)
         return PriceResponse.model_validate(res.model_dump())
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Not found metadata for {ticker}")
     except Exception:
@@ -89,7 +95,7 @@ def get_daily_prices_by_sector(
     tags=["Market Prices"],
     summary="Get intraday price history for a stock ticker",
 )
-def get_intraday_prices(
+async def get_intraday_prices(
     ticker: str,
     prices_service: APIPricesService = Depends(get_prices_service),
     latest_only: bool = False,
@@ -105,7 +111,9 @@ def get_intraday_prices(
         PriceResponse: Intraday price history
     """
     try:
-        res = prices_service.get_intraday_prices(ticker, latest_only=latest_only)
+        res = await prices_service.get_intraday_prices_async(
+            ticker, latest_only=latest_only
+        )
         return PriceResponse.model_validate(res.model_dump())
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Not found metadata for {ticker}")
@@ -123,6 +131,7 @@ def get_relevant_news(
     ticker: str,
     skip: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
     news_service: APINewsService = Depends(get_news_service),
 ):
     """Get recent news for a stock ticker.
@@ -131,14 +140,18 @@ def get_relevant_news(
         ticker (str): Stock ticker symbol
         skip (int): Number of records to skip (for pagination)
         limit (int): Maximum number of records to return
+        cursor (str | None): `next_cursor` of the previous page, preferred over `skip`
+            for deep pages
         news_service (APINewsService): News service dependency
 
     Returns:
         RelevantNewsResponse: Recent news for the stock ticker
     """
     try:
-        res = news_service.get_relevant_news(ticker, skip, limit)
+        res = news_service.get_relevant_news(ticker, skip, limit, cursor=cursor)
         return RelevantNewsResponse.model_validate(res.model_dump())
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Not found metadata for {ticker}")
     except Exception:
@@ -155,6 +168,7 @@ def get_universal_news(
     search_terms: str,
     skip: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
     news_service: APINewsService = Depends(get_news_service),
 ):
     """Get recent news based on search terms.
@@ -163,14 +177,18 @@ def get_universal_news(
         search_terms (str): Search terms to filter news
         skip (int): Number of records to skip (for pagination)
         limit (int): Maximum number of records to return
+        cursor (str | None): `next_cursor` of the previous page, preferred over `skip`
+            for deep pages
         news_service (APINewsService): News service dependency
 
     Returns:
         UniversalNewsResponse: Recent news based on search terms
     """
     try:
-        res = news_service.get_universal_news(search_terms, skip, limit)
+        res = news_service.get_universal_news(search_terms, skip, limit, cursor=cursor)
         return UniversalNewsResponse.model_validate(res.model_dump())
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
     except Exception:
         raise HTTPException(status_code=500, detail="Unknown error occured in server")
 
@@ -25,6 +25,7 @@ from app.clients.ai_rules import ai_rules_client
 from app.core.config import GATEWAY_ALLOW_ORIGINS, GATEWAY_V1_BASE_ROUTE
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from itapia_common.dblib.session import close_singleton_async_redis_client
 
 
 @asynccontextmanager
@@ -45,6 +46,8 @@ async def lifespan(app: FastAPI):
             async with ai_rules_client:
                 yield
 
+    await close_singleton_async_redis_client()
+
 
 app = FastAPI(
     title="ITAPIA API Service",
@@ -0,0 +1,43 @@
+"""Tests for the data viewer endpoints."""
+
+from unittest.mock import Mock
+
+import pytest
+from app.core.config import GATEWAY_V1_BASE_ROUTE
+from app.main import app
+from fastapi.testclient import TestClient
+from itapia_common.dblib.dependencies import get_news_service, get_prices_service
+from itapia_common.dblib.pagination import InvalidCursorError
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def failing_services():
+    """Prices and news services raising InvalidCursorError on every read."""
+    prices_service = Mock()
+    news_service = Mock()
+    error = InvalidCursorError("Invalid pagination cursor: bad")
+    prices_service.get_daily_prices.side_effect = error
+    news_service.get_relevant_news.side_effect = error
+    news_service.get_universal_news.side_effect = error
+    app.dependency_overrides[get_prices_service] = lambda: prices_service
+    app.dependency_overrides[get_news_service] = lambda: news_service
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/market/tickers/AAPL/prices/daily?cursor=bad",
+        "/market/tickers/AAPL/news?cursor=bad",
+        "/market/news/universal?search_terms=tech&cursor=bad",
+    ],
+)
+def test_invalid_cursor_returns_400(failing_services, path):
+    """A malformed cursor is a client error, not a missing ticker (404) or a 500."""
+    response = client.get(GATEWAY_V1_BASE_ROUTE + path)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination cursor"}
@@ -194,7 +194,7 @@ def full_pipeline(
         ]
         selected_df = cleaned_df[selected_cols].copy()
         prices_service.add_daily_prices(
-            data=selected_df, unique_cols=["collect_date", "ticker"]
+            data=selected_df, unique_cols=["collect_date", "ticker"], method="copy"
         )
         logger.info(f"Successfully save {len(cleaned_df)} records.")
     except FetchException as e:
@@ -170,6 +170,7 @@ def full_pipeline(
             transformed_data,
             "relevant",
             unique_cols=["news_uuid"],
+            method="copy",
         )
 
         logger.info(f"Successfully load!")
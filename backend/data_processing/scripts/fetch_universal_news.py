@@ -15,7 +15,10 @@ from urllib.parse import urlparse, urlunparse
 
 from gnews import GNews
 from itapia_common.dblib.services import DataNewsService
-from itapia_common.dblib.session import get_singleton_rdbms_engine
+from itapia_common.dblib.session import (
+    get_singleton_rdbms_engine,
+    get_singleton_redis_client,
+)
 from itapia_common.logger import ITAPIALogger
 
 from .utils import UNIVERSAL_KEYWORDS_EN, UNIVERSAL_TOPIC_EN, FetchException
@@ -334,7 +337,10 @@ def full_pipeline(
 
         logger.info(f"Loading {len(transformed_data)} news articles to DB...")
         news_service.add_news(
-            data=transformed_data, type="universal", unique_cols=["title_hash"]
+            data=transformed_data,
+            type="universal",
+            unique_cols=["title_hash"],
+            method="copy",
         )
 
         logger.info(f"Successfully processed universal news!")
@@ -351,7 +357,8 @@ if __name__ == "__main__":
     print(end_date)
 
     engine = get_singleton_rdbms_engine()
-    news_service = DataNewsService(engine)
+    redis_client = get_singleton_redis_client()
+    news_service = DataNewsService(engine, redis_client)
 
     full_pipeline(
         news_service=news_service,
@@ -57,6 +57,7 @@ CREATE TABLE public.rules ( rule_id varchar(255) NOT NULL, "name" varchar(255) N
 
 CREATE TABLE public.universal_news ( news_uuid varchar(256) NOT NULL, keyword varchar(150) NOT NULL, title text NOT NULL, summary text NULL, provider varchar(150) NULL, link text NULL, publish_time timestamptz NULL, collect_time timestamptz NOT NULL, keyword_tsv tsvector NOT NULL, title_hash varchar(100) NOT NULL, news_prior int4 NOT NULL, CONSTRAINT universal_news_pkey PRIMARY KEY (news_uuid), CONSTRAINT universal_news_unique UNIQUE (title_hash));
 CREATE INDEX keyword_tsv_idx ON public.universal_news USING gin (keyword_tsv);
+CREATE INDEX universal_news_collect_time ON public.universal_news USING btree (collect_time DESC);
 
 -- Table Triggers
 
@@ -68,6 +69,28 @@ update
     public.universal_news for each row execute function tsvector_update_trigger('keyword_tsv', 'pg_catalog.english', 'keyword');
 
 
+-- public.universal_news_digest_scopes definition
+
+-- Drop table
+
+-- DROP TABLE public.universal_news_digest_scopes;
+
+-- Existing databases: data_seeds/scripts/migrate_news_digests.py (also creates
+-- universal_news_collect_time and relevant_news_ticker_sort_key)
+
+CREATE TABLE public.universal_news_digest_scopes ( search_terms varchar(150) NOT NULL, refreshed_at timestamptz DEFAULT now() NOT NULL, CONSTRAINT universal_news_digest_scopes_pkey PRIMARY KEY (search_terms));
+
+
+-- public.universal_news_digests definition
+
+-- Drop table
+
+-- DROP TABLE public.universal_news_digests;
+
+CREATE TABLE public.universal_news_digests ( search_terms varchar(150) NOT NULL, news_uuid varchar(256) NOT NULL, "rank" float4 NOT NULL, news_prior int4 NOT NULL, publish_time timestamptz NULL, collect_time timestamptz NOT NULL, CONSTRAINT universal_news_digests_pkey PRIMARY KEY (search_terms, news_uuid), CONSTRAINT universal_news_digests_search_terms_fkey FOREIGN KEY (search_terms) REFERENCES public.universal_news_digest_scopes(search_terms) ON DELETE CASCADE, CONSTRAINT universal_news_digests_news_uuid_fkey FOREIGN KEY (news_uuid) REFERENCES public.universal_news(news_uuid) ON DELETE CASCADE);
+CREATE INDEX universal_news_digests_news_uuid_idx ON public.universal_news_digests USING btree (news_uuid);
+
+
 -- public.users definition
 
 -- Drop table
@@ -100,7 +123,10 @@ insert
 
 -- DROP TABLE public.backtest_reports;
 
-CREATE TABLE public.backtest_reports ( report_id varchar(256) NOT NULL, ticker varchar(10) NOT NULL, backtest_date timestamptz NOT NULL, report jsonb NOT NULL, created_at timestamptz DEFAULT now() NOT NULL, CONSTRAINT backtest_reports_pkey PRIMARY KEY (report_id), CONSTRAINT backtest_reports_ticker_fkey FOREIGN KEY (ticker) REFERENCES public.tickers(ticker_sym));
+-- Partitioned by year of backtest_date: one partition per year (backtest_reports_y<YEAR>),
+-- created by the write path. Existing databases: data_seeds/scripts/migrate_partitions.py
+
+CREATE TABLE public.backtest_reports ( report_id varchar(256) NOT NULL, ticker varchar(10) NOT NULL, backtest_date timestamptz NOT NULL, report jsonb NOT NULL, created_at timestamptz DEFAULT now() NOT NULL, CONSTRAINT backtest_reports_pkey PRIMARY KEY (report_id, backtest_date), CONSTRAINT backtest_reports_ticker_fkey FOREIGN KEY (ticker) REFERENCES public.tickers(ticker_sym)) PARTITION BY RANGE (backtest_date);
 CREATE INDEX idx_analysis_reports_ticker_date ON public.backtest_reports USING btree (ticker, backtest_date DESC);
 
 
@@ -110,8 +136,14 @@ CREATE INDEX idx_analysis_reports_ticker_date ON public.backtest_reports USING b
 
 -- DROP TABLE public.daily_prices;
 
-CREATE TABLE public.daily_prices ( record_id int8 GENERATED BY DEFAULT AS IDENTITY( INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 CACHE 1 NO CYCLE) NOT NULL, "open" float4 NULL, high float4 NULL, low float4 NULL, "close" float4 NULL, volume float4 NULL, ticker varchar(12) NOT NULL, collect_date timestamptz NOT NULL, CONSTRAINT daily_prices_pkey PRIMARY KEY (record_id), CONSTRAINT daily_prices_unique UNIQUE (ticker, collect_date), CONSTRAINT daily_prices_ticker_fkey FOREIGN KEY (ticker) REFERENCES public.tickers(ticker_sym));
-CREATE INDEX daily_prices_ticker ON public.daily_prices USING btree (ticker);
+-- Partitioned by year of collect_date: one partition per year (daily_prices_y<YEAR>),
+-- created by the write path. Existing databases: data_seeds/scripts/migrate_partitions.py
+-- daily_prices_unique also serves lookups by ticker alone.
+-- updated_at is set by the upserts on every write, and versions cached reports of the ticker.
+-- Existing databases: data_seeds/scripts/migrate_updated_at.py
+
+CREATE TABLE public.daily_prices ( record_id int8 GENERATED BY DEFAULT AS IDENTITY( INCREMENT BY 1 MINVALUE 1 MAXVALUE 9223372036854775807 START 1 CACHE 1 NO CYCLE) NOT NULL, "open" float4 NULL, high float4 NULL, low float4 NULL, "close" float4 NULL, volume float4 NULL, ticker varchar(12) NOT NULL, collect_date timestamptz NOT NULL, updated_at timestamptz DEFAULT now() NOT NULL, CONSTRAINT daily_prices_pkey PRIMARY KEY (record_id, collect_date), CONSTRAINT daily_prices_unique UNIQUE (ticker, collect_date), CONSTRAINT daily_prices_ticker_fkey FOREIGN KEY (ticker) REFERENCES public.tickers(ticker_sym)) PARTITION BY RANGE (collect_date);
+CREATE INDEX daily_prices_ticker_updated_at ON public.daily_prices USING btree (ticker, updated_at DESC);
 
 
 -- public.relevant_news definition
@@ -121,4 +153,5 @@ CREATE INDEX daily_prices_ticker ON public.daily_prices USING btree (ticker);
 -- DROP TABLE public.relevant_news;
 
 CREATE TABLE public.relevant_news ( news_uuid varchar(256) NOT NULL, ticker varchar(10) NOT NULL, title text NOT NULL, summary text NULL, provider varchar(150) NULL, link text NULL, publish_time timestamptz NULL, collect_time timestamptz NOT NULL, CONSTRAINT relevant_news_pkey PRIMARY KEY (news_uuid), CONSTRAINT relevant_news_ticker_fkey FOREIGN KEY (ticker) REFERENCES public.tickers(ticker_sym));
-CREATE INDEX relevant_news_ticker ON public.relevant_news USING btree (ticker);
\ No newline at end of file
+CREATE INDEX relevant_news_ticker ON public.relevant_news USING btree (ticker);
+CREATE INDEX relevant_news_ticker_sort_key ON public.relevant_news USING btree (ticker, COALESCE(publish_time, 'infinity'::timestamptz) DESC, collect_time DESC, news_uuid DESC);
\ No newline at end of file
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Script to add the universal news digests and the news read indexes to an existing database.
+The tables and indexes are created from ddl.sql if they are missing, then the sector
+searches are registered, which builds their digests from the stored news.
+Other searches (e.g. the macro search terms of the analysis service) are registered,
+and their digests built, when ai_service_quick starts. Safe to run more than once.
+"""
+
+import argparse
+import os
+import re
+from typing import List
+
+import itapia_common.dblib.db_config as dbcfg
+from itapia_common.dblib.crud.news import register_universal_news_digests
+from itapia_common.dblib.session import get_rdbms_session
+from migrate_partitions import get_table_ddl
+from sqlalchemy import text
+
+# Tables created by the migration, in foreign key order
+DIGEST_TABLES = [
+    dbcfg.UNIVERSAL_NEWS_DIGEST_SCOPE_TABLE_NAME,
+    dbcfg.UNIVERSAL_NEWS_DIGEST_TABLE_NAME,
+]
+
+# Indexes of existing tables that the news reads rely on
+NEWS_INDEXES = {
+    dbcfg.UNIVERSAL_NEWS_TABLE_NAME: ['universal_news_collect_time'],
+    dbcfg.RELEVANT_NEWS_TABLE_NAME: ['relevant_news_ticker_sort_key'],
+}
+
+
+def if_not_exists(statement: str) -> str:
+    """Make a CREATE TABLE/INDEX statement of the DDL file idempotent."""
+    return re.sub(r'^CREATE (TABLE|INDEX) ', r'CREATE \1 IF NOT EXISTS ', statement)
+
+
+def migrate_news_digests(search_terms_lst: List[str]):
+    """Create the digest tables and news indexes, then build the digests of the given searches."""
+    rdbms_session = next(get_rdbms_session())
+
+    try:
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ddl_file = os.path.join(script_dir, 'data', 'ddl.sql')
+
+        for table_name in DIGEST_TABLES:
+            print(f"Creating {table_name}...")
+            for statement in get_table_ddl(ddl_file, table_name):
+                rdbms_session.execute(text(if_not_exists(statement)))
+
+        for table_name, index_names in NEWS_INDEXES.items():
+            for statement in get_table_ddl(ddl_file, table_name):
+                index_name = re.match(r'CREATE INDEX (\w+) ', statement)
+                if index_name and index_name.group(1) in index_names:
+                    print(f"Creating index {index_name.group(1)}...")
+                    rdbms_session.execute(text(if_not_exists(statement)))
+
+        sector_names = rdbms_session.execute(text(
+            'SELECT sector_name FROM public.sectors WHERE sector_name IS NOT NULL'
+        )).scalars().all()
+        registered = register_universal_news_digests(
+            rdbms_session.connection(),
+            dbcfg.UNIVERSAL_NEWS_DIGEST_TABLE_NAME,
+            dbcfg.UNIVERSAL_NEWS_DIGEST_SCOPE_TABLE_NAME,
+            dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+            list(sector_names) + search_terms_lst,
+            dbcfg.UNIVERSAL_NEWS_DIGEST_DEPTH,
+        )
+        rdbms_session.commit()
+        print(f"Built digests of: {registered}")
+    except Exception as e:
+        print(f"Error migrating news digests: {e}")
+        rdbms_session.rollback()
+        raise
+    finally:
+        rdbms_session.close()
+
+    print("News digests migrated successfully! Set UNIVERSAL_NEWS_DIGESTS=true to use them.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Add universal news digests to an existing database.')
+    parser.add_argument('--search-terms', nargs='*', default=[],
+                        help='Searches to build digests of, besides the sector names.')
+    args = parser.parse_args()
+    migrate_news_digests(args.search_terms)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Script to migrate daily_prices and backtest_reports to yearly range partitions.
+Each table is recreated from ddl.sql as a partitioned table and its rows are copied
+into it, in a single transaction per table. Tables that are already partitioned are skipped.
+"""
+
+import argparse
+import os
+import re
+from typing import List
+
+import itapia_common.dblib.db_config as dbcfg
+from itapia_common.dblib.crud.partitions import ensure_yearly_partitions, is_partitioned
+from itapia_common.dblib.session import get_rdbms_session
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Suffix of the original table (and its indexes/sequence) while it is being copied
+OLD_SUFFIX = '_unpartitioned'
+
+# Partitioned tables, with the partition column, the indexes of the original table
+# whose names are reused by the new one, and the identity column if any
+PARTITIONED_TABLES = {
+    dbcfg.DAILY_PRICES_TABLE_NAME: {
+        'partition_column': 'collect_date',
+        'indexes': ['daily_prices_pkey', 'daily_prices_unique', 'daily_prices_ticker',
+                    'daily_prices_ticker_updated_at'],
+        'identity_column': 'record_id',
+    },
+    dbcfg.ANALYSIS_REPORTS_TABLE_NAME: {
+        'partition_column': 'backtest_date',
+        'indexes': ['backtest_reports_pkey', 'idx_analysis_reports_ticker_date'],
+        'identity_column': None,
+    },
+}
+
+
+def get_table_ddl(ddl_file: str, table_name: str) -> List[str]:
+    """Get the CREATE TABLE/INDEX statements of a table from the DDL file."""
+    with open(ddl_file, 'r', encoding='utf-8') as f:
+        sql_content = f.read()
+
+    statements = []
+    for statement in sql_content.split(';'):
+        # Drop comment lines, statements are preceded by section comments
+        lines = [line for line in statement.splitlines() if not line.strip().startswith('--')]
+        statement = '\n'.join(lines).strip()
+        if re.match(rf'CREATE TABLE public\.{table_name} \(', statement) or \
+                re.match(rf'CREATE INDEX \w+ ON public\.{table_name} ', statement):
+            statements.append(statement)
+    return statements
+
+
+def migrate_table(session: Session, ddl_file: str, table_name: str, keep_old: bool):
+    """Recreate a table as a partitioned table and copy its rows into it."""
+    if is_partitioned(session, table_name):
+        print(f"{table_name} is already partitioned, skipping.")
+        return
+
+    spec = PARTITIONED_TABLES[table_name]
+    old_table_name = f'{table_name}{OLD_SUFFIX}'
+    partition_column = spec['partition_column']
+    identity_column = spec['identity_column']
+
+    print(f"Migrating {table_name}...")
+    try:
+        # Free the names of the table, its indexes and its identity sequence
+        session.execute(text(f'ALTER TABLE public.{table_name} RENAME TO {old_table_name}'))
+        for index_name in spec['indexes']:
+            session.execute(text(f'ALTER INDEX IF EXISTS public.{index_name} RENAME TO {index_name}{OLD_SUFFIX}'))
+        if identity_column is not None:
+            sequence_name = session.execute(
+                text('SELECT pg_get_serial_sequence(:table_name, :column_name)'),
+                {'table_name': f'public.{old_table_name}', 'column_name': identity_column},
+            ).scalar()
+            if sequence_name is not None:
+                session.execute(text(f'ALTER SEQUENCE {sequence_name} RENAME TO {old_table_name}_{identity_column}_seq'))
+
+        for statement in get_table_ddl(ddl_file, table_name):
+            session.execute(text(statement))
+
+        years = session.execute(text(
+            f"SELECT DISTINCT EXTRACT(YEAR FROM {partition_column} AT TIME ZONE 'UTC')::int "
+            f"FROM public.{old_table_name}"
+        )).scalars().all()
+        created = ensure_yearly_partitions(session, table_name, years)
+        print(f"Created partitions: {created}")
+
+        columns = session.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = 'public' AND table_name = :table_name ORDER BY ordinal_position"
+            ),
+            {'table_name': old_table_name},
+        ).scalars().all()
+        column_list = ', '.join(f'"{column}"' for column in columns)
+        result = session.execute(text(
+            f'INSERT INTO public.{table_name} ({column_list}) SELECT {column_list} FROM public.{old_table_name}'
+        ))
+        print(f"Copied {result.rowcount} rows.")
+
+        if identity_column is not None:
+            # Continue the identity after the copied values
+            session.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('public.{table_name}', '{identity_column}'), "
+                f"COALESCE(MAX({identity_column}), 0) + 1, false) FROM public.{table_name}"
+            ))
+
+        if not keep_old:
+            session.execute(text(f'DROP TABLE public.{old_table_name}'))
+        session.commit()
+    except Exception as e:
+        print(f"Error migrating {table_name}: {e}")
+        session.rollback()
+        raise
+
+    session.execute(text(f'ANALYZE public.{table_name}'))
+    session.commit()
+    print(f"{table_name} migrated successfully!")
+
+
+def migrate_partitions(keep_old: bool = False):
+    """Main function to migrate the partitioned tables."""
+    rdbms_session = next(get_rdbms_session())
+
+    try:
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ddl_file = os.path.join(script_dir, 'data', 'ddl.sql')
+        for table_name in PARTITIONED_TABLES:
+            migrate_table(rdbms_session, ddl_file, table_name, keep_old)
+    finally:
+        rdbms_session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Migrate time-series tables to yearly range partitions.')
+    parser.add_argument('--keep-old', action='store_true',
+                        help=f'Keep the original tables, renamed with the {OLD_SUFFIX} suffix.')
+    args = parser.parse_args()
+    migrate_partitions(keep_old=args.keep_old)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Script to add the updated_at column of daily_prices to an existing database.
+The upserts set it on every write, and cached reports of a ticker are versioned on it,
+so a corrected bar busts them. Safe to run more than once.
+"""
+
+import itapia_common.dblib.db_config as dbcfg
+from itapia_common.dblib.session import get_rdbms_session
+from sqlalchemy import text
+
+
+def migrate_updated_at():
+    """Add the updated_at column and its index to daily_prices."""
+    rdbms_session = next(get_rdbms_session())
+    table_name = dbcfg.DAILY_PRICES_TABLE_NAME
+
+    try:
+        print(f"Adding updated_at to {table_name}...")
+        # Existing rows take the migration time as their last update
+        rdbms_session.execute(text(
+            f'ALTER TABLE public.{table_name} '
+            f'ADD COLUMN IF NOT EXISTS updated_at timestamptz DEFAULT now() NOT NULL'
+        ))
+        rdbms_session.execute(text(
+            f'CREATE INDEX IF NOT EXISTS {table_name}_ticker_updated_at '
+            f'ON public.{table_name} USING btree (ticker, updated_at DESC)'
+        ))
+        rdbms_session.commit()
+        print(f"{table_name} migrated successfully!")
+    except Exception as e:
+        print(f"Error migrating {table_name}: {e}")
+        rdbms_session.rollback()
+        raise
+    finally:
+        rdbms_session.close()
+
+
+if __name__ == "__main__":
+    migrate_updated_at()
@@ -8,6 +8,7 @@ import app.core.config as cfg
 import pandas as pd
 from app.core.exceptions import BacktestError
 from itapia_common.logger import ITAPIALogger
+from itapia_common.rules.projection import ProjectedReport
 from itapia_common.schemas.entities.analysis import QuickCheckAnalysisReport
 from itapia_common.schemas.entities.backtest import BACKTEST_CONTEXT_STATUS
 
@@ -48,7 +49,7 @@ class BacktestContext:
 
         # Data will be loaded here
         self.ohlcv_df: Optional[pd.DataFrame] = None
-        self.historical_reports: List[QuickCheckAnalysisReport] = []
+        self.historical_reports: List[QuickCheckAnalysisReport | ProjectedReport] = []
 
         # Status management variables
         self.status: BACKTEST_CONTEXT_STATUS = "IDLE"
@@ -150,8 +151,8 @@ class BacktestContext:
                 break
 
     def _choose_reports_from_selector(
-        self, reports: List[QuickCheckAnalysisReport]
-    ) -> List[QuickCheckAnalysisReport]:
+        self, reports: List[QuickCheckAnalysisReport | ProjectedReport]
+    ) -> List[QuickCheckAnalysisReport | ProjectedReport]:
         """Select reports based on selector criteria."""
         if not reports:
             return []
@@ -195,9 +196,7 @@ class BacktestContext:
         ohlcv_task = loop.run_in_executor(
             None, self.data_preparer.get_daily_ohlcv_for_ticker, self.ticker, 5000
         )
-        reports_task = loop.run_in_executor(
-            None, self.data_preparer.get_backtest_reports_for_ticker, self.ticker
-        )
+        reports_task = loop.run_in_executor(None, self._load_reports)
 
         self.ohlcv_df, historical_reports = await asyncio.gather(
             ohlcv_task, reports_task
@@ -216,6 +215,15 @@ class BacktestContext:
         )
         self.status = "READY_SERVE"  # Final state: data resides in RAM
 
+    def _load_reports(self) -> List[QuickCheckAnalysisReport | ProjectedReport]:
+        """Load all reports of the ticker, projected to rule variables if configured."""
+        if cfg.BACKTEST_REPORT_PROJECTION:
+            matrix = self.data_preparer.get_backtest_report_matrix_for_ticker(
+                self.ticker
+            )
+            return matrix.rows()
+        return self.data_preparer.get_backtest_reports_for_ticker(self.ticker)
+
     def clear_data_from_memory(self) -> None:
         """Clear heavy data from memory to free up RAM."""
         logger.info(f"Clearing in-memory data for ticker: {self.ticker}")
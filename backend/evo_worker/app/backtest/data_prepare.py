@@ -1,7 +1,6 @@
 """Data preparation utilities for backtesting."""
 
 from datetime import datetime
-from typing import Any, Dict
 
 import pandas as pd
 from itapia_common.dblib.services import (
@@ -10,59 +9,12 @@ from itapia_common.dblib.services import (
     BacktestReportService,
 )
 from itapia_common.logger import ITAPIALogger
+from itapia_common.rules.nodes.registry import get_variable_paths
+from itapia_common.rules.projection import ReportMatrix
 
 logger = ITAPIALogger("Backtest Data Preparer")
 
 
-def transform_single_ticker_response(json_res: Dict[str, Any]) -> pd.DataFrame:
-    """Convert JSON response for a single ticker into a DataFrame.
-
-    DataFrame will have a DatetimeIndex.
-
-    Args:
-        json_res (Dict[str, Any]): JSON response containing 'metadata' and 'datas'.
-
-    Returns:
-        pd.DataFrame: OHLCV DataFrame with DatetimeIndex.
-
-    Raises:
-        ValueError: If response is missing required keys.
-    """
-    # --- STEP 1: VALIDATE AND EXTRACT DATA ---
-    logger.info("Transforming single ticker response ...")
-    metadata = json_res.get("metadata")
-    if not metadata:
-        raise ValueError("Response is missing 'metadata' key.")
-
-    data_points = json_res.get("datas")
-    if not data_points:
-        logger.warn(
-            f"Empty data points for ticker {metadata.get('ticker')}. Returning empty DataFrame."
-        )
-        return pd.DataFrame()
-
-    # --- STEP 2: CONVERT LIST OF DICTS TO DATAFRAME ---
-    df = pd.DataFrame(data_points)
-
-    # Check for required columns in data_points
-    required_cols = ["timestamp", "open", "high", "low", "close", "volume"]
-    if not all(col in df.columns for col in required_cols):
-        raise ValueError(
-            f"Data points are missing required keys. Expected: {required_cols}"
-        )
-
-    # --- STEP 3: PROCESS TIME INDEX ---
-    # Convert timestamp column (Unix epoch) to DatetimeIndex UTC
-    df["datetime_utc"] = pd.to_datetime(df["timestamp"], unit="s", utc=True)
-    df.set_index("datetime_utc", inplace=True)
-    df.drop(columns=["timestamp"], inplace=True)  # Remove numeric timestamp column
-
-    # Sort by time to ensure sequential order
-    df.sort_index(inplace=True)
-
-    return df
-
-
 class BacktestDataPreparer:
     """Prepare and transform data for backtesting purposes."""
 
@@ -96,18 +48,10 @@ class BacktestDataPreparer:
             pd.DataFrame: DataFrame with OHLCV data
         """
         logger.info(f"Preparing daily OHLCV for ticker '{ticker}'...")
-        res = self.prices_service.get_daily_prices(ticker, limit=limit, skip=0)
-        json_res = res.model_dump()
-        if not json_res:
+        df = self.prices_service.get_daily_ohlcv(ticker, limit=limit, skip=0)
+        if df.empty:
             logger.warn("Null response. Return empty DF.")
-            return pd.DataFrame()
-
-        try:
-            df = transform_single_ticker_response(json_res)
-            return df
-        except ValueError as e:
-            logger.err(f"Could not process a response. Error: {e}. Skipping.")
-            return pd.DataFrame()
+        return df
 
     def get_backtest_report(self, ticker: str, backtest_date: datetime):
         """Get a specific backtest report for a ticker and date.
@@ -142,6 +86,20 @@ class BacktestDataPreparer:
         """
         return self.backtest_report_service.get_all_backtest_reports(ticker)
 
+    def get_backtest_report_matrix_for_ticker(self, ticker: str) -> ReportMatrix:
+        """Get the values read by rule variables from all backtest reports of a ticker.
+
+        Args:
+            ticker (str): Stock ticker symbol
+
+        Returns:
+            ReportMatrix: Projected reports, ordered by backtest date descending
+        """
+        timestamps, columns = self.backtest_report_service.get_backtest_report_columns(
+            ticker, get_variable_paths()
+        )
+        return ReportMatrix(timestamps, columns)
+
     def get_all_tickers(self) -> list[str]:
         """Get a list of all available tickers.
 
@@ -34,6 +34,10 @@ SELECTOR_END_DATE = datetime(2025, 3, 31)
 MONTHLY_DAY = 10
 MAX_SPECIAL_POINTS = 50
 POLLING_INTERVAL_SECONDS = 45
+# Load only the report values read by rule variables instead of full reports
+BACKTEST_REPORT_PROJECTION = os.getenv(
+    "BACKTEST_REPORT_PROJECTION", "true"
+).lower() in ["true", "1", "yes", "y", "t"]
 PARALLEL_CONCURRENCY_LIMIT = 1
 
 PARALLEL_MULTICONTEXT_LIMIT = 5
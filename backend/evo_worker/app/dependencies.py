@@ -7,7 +7,7 @@ from itapia_common.dblib.services import (
     APIPricesService,
     BacktestReportService,
 )
-from itapia_common.dblib.session import get_rdbms_session
+from itapia_common.dblib.session import get_singleton_session_factory
 
 from .backtest.context import BacktestContextManager
 from .backtest.data_prepare import BacktestDataPreparer
@@ -24,30 +24,33 @@ def create_dependencies():
     if _backtest_context_manager is not None:
         return
 
-    # DB and services initialization logic
-    db_session_gen = get_rdbms_session()
-    db = next(db_session_gen)
-    # This initialization logic can cause errors if DB connection fails
-    # Should be wrapped in try...finally to ensure sessions are closed
-    try:
-        metadata_service = APIMetadataService(rdbms_session=db)
-        prices_service = APIPricesService(
-            rdbms_session=db, metadata_service=metadata_service, redis_client=None
-        )
-        backtest_report_service = BacktestReportService(rdbms_session=db)
-
-        backtest_data_preparer = BacktestDataPreparer(
-            prices_service=prices_service,
-            backtest_report_service=backtest_report_service,
-            metadata_service=metadata_service,
-        )
-
-        # Initialize and assign to global variable
-        _backtest_context_manager = BacktestContextManager(
-            data_preparer=backtest_data_preparer
-        )
-    finally:
-        db.close()
+    # Services borrow a pooled session per unit of work, so the executor threads
+    # used by BacktestContext never share a session
+    session_factory = get_singleton_session_factory()
+
+    metadata_service = APIMetadataService(
+        rdbms_session=None, session_factory=session_factory
+    )
+    prices_service = APIPricesService(
+        rdbms_session=None,
+        metadata_service=metadata_service,
+        redis_client=None,
+        session_factory=session_factory,
+    )
+    backtest_report_service = BacktestReportService(
+        rdbms_session=None, session_factory=session_factory
+    )
+
+    backtest_data_preparer = BacktestDataPreparer(
+        prices_service=prices_service,
+        backtest_report_service=backtest_report_service,
+        metadata_service=metadata_service,
+    )
+
+    # Initialize and assign to global variable
+    _backtest_context_manager = BacktestContextManager(
+        data_preparer=backtest_data_preparer
+    )
 
 
 def get_backtest_context_manager() -> BacktestContextManager:
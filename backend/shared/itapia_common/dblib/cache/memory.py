@@ -3,16 +3,138 @@ Provides cache classes for caching data in memory.
 """
 
 import asyncio
+import sys
+import time
+from collections import OrderedDict
 from threading import RLock
-from typing import Any, Callable, Coroutine, Dict
+from typing import Any, Callable, Coroutine, NamedTuple, Tuple
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    """Snapshot of a cache's counters and current size."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+
+
+class _BoundedStore:
+    """LRU-ordered key/value store with optional entry, byte and TTL bounds.
+
+    Not synchronized by itself, callers hold their own lock when needed.
+    Without any bound it behaves like a plain dictionary.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        size_of: Callable[[Any], int] = sys.getsizeof,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.size_of = size_of
+        # key -> (value, expires_at or None, size in bytes)
+        self._data: OrderedDict[str, Tuple[Any, float | None, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str, default: Any = None, record: bool = True) -> Any:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+
+        if entry is None:
+            if record:
+                self.misses += 1
+            return default
+
+        if record:
+            self.hits += 1
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: str, value: Any):
+        self._remove(key)
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else None
+        )
+        # Sizes are only computed when a byte budget is configured
+        size = self.size_of(value) if self.max_bytes is not None else 0
+        self._data[key] = (value, expires_at, size)
+        self._bytes += size
+        self._evict()
+
+    def pop(self, key: str):
+        self._remove(key)
+
+    def clear(self):
+        self._data.clear()
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            entries=len(self._data),
+            bytes=self._bytes,
+        )
+
+    def _remove(self, key: str):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds the byte budget
+        while len(self._data) > 1 and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, _, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
 
 
 class SimpleInMemoryCache:
     """A thread-safe in-memory cache using the Double-Checked Locking pattern."""
 
-    def __init__(self):
-        """Initialize the cache with an empty dictionary and a reentrant lock."""
-        self._cache: Dict[str, Any] = {}
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        size_of: Callable[[Any], int] = sys.getsizeof,
+    ):
+        """Initialize the cache with an optionally bounded store and a reentrant lock.
+
+        Args:
+            max_entries (int | None, optional): Maximum number of entries, least recently
+                used ones are evicted first. Defaults to None (unbounded).
+            max_bytes (int | None, optional): Maximum total size of values as measured
+                by `size_of`. Defaults to None (unbounded).
+            ttl_seconds (float | None, optional): Time after which an entry expires.
+                Defaults to None (never).
+            size_of (Callable[[Any], int], optional): Function measuring a value in bytes.
+                Defaults to `sys.getsizeof`.
+        """
+        self._cache = _BoundedStore(max_entries, max_bytes, ttl_seconds, size_of)
         self._lock = RLock()
 
     def get(self, key: str) -> Any | None:
@@ -24,7 +146,9 @@ class SimpleInMemoryCache:
         Returns:
             Any | None: The cached value if found, otherwise None.
         """
-        return self._cache.get(key)
+        # Lookups reorder the LRU list, so they also need the lock
+        with self._lock:
+            return self._cache.get(key)
 
     def set(self, key: str, value: Any):
         """Set an item in the cache.
@@ -33,10 +157,25 @@ class SimpleInMemoryCache:
             key (str): The key to store the value under.
             value (Any): The value to store in the cache.
         """
-        # Dictionary assignment is atomic in Python, but locks are needed
-        # for consistency in more complex patterns.
         with self._lock:
-            self._cache[key] = value
+            self._cache.set(key, value)
+
+    def invalidate(self, key: str | None = None):
+        """Remove an item from the cache, or every item if no key is given.
+
+        Args:
+            key (str | None, optional): The key to remove. Defaults to None.
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key)
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and the current size of the cache."""
+        with self._lock:
+            return self._cache.stats()
 
     def get_or_set_with_lock(self, key: str, value_factory: Callable[[], Any]):
         """Get an item from the cache. If not found, call `value_factory` to create,
@@ -58,8 +197,8 @@ class SimpleInMemoryCache:
             return cached_value
 
         with self._lock:
-            # Check again inside the lock
-            cached_value = self.get(key)
+            # Check again inside the lock, without counting a second miss
+            cached_value = self._cache.get(key, record=False)
             if cached_value is not None:
                 return cached_value
 
@@ -86,12 +225,38 @@ class SingletonInMemoryCache:
                 if cls._instance is None:
                     cls._instance = super(SingletonInMemoryCache, cls).__new__(cls)
                     # Initialize instance attributes
-                    cls._instance._cache = {}
+                    cls._instance._cache = _BoundedStore()
                     cls._instance._cache_lock = (
                         RLock()
                     )  # A separate lock for cache access
         return cls._instance
 
+    def configure(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        size_of: Callable[[Any], int] = sys.getsizeof,
+    ):
+        """Set the bounds of the shared cache. Existing entries are kept and trimmed.
+
+        Args:
+            max_entries (int | None, optional): Maximum number of entries, least recently
+                used ones are evicted first. Defaults to None (unbounded).
+            max_bytes (int | None, optional): Maximum total size of values as measured
+                by `size_of`. Defaults to None (unbounded).
+            ttl_seconds (float | None, optional): Time after which an entry expires.
+                Defaults to None (never).
+            size_of (Callable[[Any], int], optional): Function measuring a value in bytes.
+                Defaults to `sys.getsizeof`.
+        """
+        with self._cache_lock:
+            self._cache.max_entries = max_entries
+            self._cache.max_bytes = max_bytes
+            self._cache.ttl_seconds = ttl_seconds
+            self._cache.size_of = size_of
+            self._cache._evict()
+
     def get_or_set(self, cache_key: str, loader_func: Callable[[], Any]):
         """Get an item from the cache or load it using the provided function if not found.
 
@@ -105,18 +270,21 @@ class SingletonInMemoryCache:
         Returns:
             Any: The cached or newly loaded data.
         """
-        # Quick check
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Lookups reorder the LRU list, so even the quick check takes the lock
+        with self._cache_lock:
+            cached_data = self._cache.get(cache_key, _MISSING)
+        if cached_data is not _MISSING:
+            return cached_data
 
         # Use instance lock
         with self._cache_lock:
-            # Double-check
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            # Double-check, without counting a second miss
+            cached_data = self._cache.get(cache_key, _MISSING, record=False)
+            if cached_data is not _MISSING:
+                return cached_data
 
             new_data = loader_func()
-            self._cache[cache_key] = new_data
+            self._cache.set(cache_key, new_data)
             return new_data
 
     def clean_cache(self, cache_key: str | None = None):
@@ -128,19 +296,49 @@ class SingletonInMemoryCache:
         """
         with self._cache_lock:
             if cache_key:
-                if cache_key in self._cache:
-                    del self._cache[cache_key]
+                self._cache.pop(cache_key)
             else:
                 self._cache.clear()
 
+    def invalidate(self, cache_key: str | None = None):
+        """Alias of `clean_cache`, matching the other cache classes."""
+        self.clean_cache(cache_key)
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and the current size of the cache."""
+        with self._cache_lock:
+            return self._cache.stats()
+
 
 class AsyncInMemoryCache:
-    """An in-memory cache safe for asyncio environments."""
+    """An in-memory cache safe for asyncio environments.
+
+    Misses are resolved with per-key single-flight: concurrent callers missing the
+    same key share one in-flight load, while loads for different keys run in parallel.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        size_of: Callable[[Any], int] = sys.getsizeof,
+    ):
+        """Initialize the cache with an optionally bounded store and no in-flight loads.
 
-    def __init__(self):
-        """Initialize the cache with an empty dictionary and an asyncio lock."""
-        self._cache: dict[str, Any] = {}
-        self._lock = asyncio.Lock()  # Using asyncio.Lock for async safety
+        Args:
+            max_entries (int | None, optional): Maximum number of entries, least recently
+                used ones are evicted first. Defaults to None (unbounded).
+            max_bytes (int | None, optional): Maximum total size of values as measured
+                by `size_of`. Defaults to None (unbounded).
+            ttl_seconds (float | None, optional): Time after which an entry expires.
+                Defaults to None (never).
+            size_of (Callable[[Any], int], optional): Function measuring a value in bytes.
+                Defaults to `sys.getsizeof`.
+        """
+        self._cache = _BoundedStore(max_entries, max_bytes, ttl_seconds, size_of)
+        # Futures of loads currently running, keyed by cache key
+        self._inflight: dict[str, asyncio.Future] = {}
 
     def get(self, key: str) -> Any | None:
         """Get an item from the cache.
@@ -161,7 +359,24 @@ class AsyncInMemoryCache:
             value (Any): The value to store in the cache.
         """
         # set doesn't need to be async since dict assignment is fast
-        self._cache[key] = value
+        self._cache.set(key, value)
+
+    def invalidate(self, key: str | None = None):
+        """Remove an item from the cache, or every item if no key is given.
+
+        In-flight loads are not cancelled and will store their result when done.
+
+        Args:
+            key (str | None, optional): The key to remove. Defaults to None.
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key)
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and the current size of the cache."""
+        return self._cache.stats()
 
     async def get_or_set_with_lock(
         self, key: str, value_factory: Callable[[], Coroutine]
@@ -169,7 +384,9 @@ class AsyncInMemoryCache:
         """Get an item from the cache. If not found, call `value_factory` (an async function)
         to create, store in cache, and return.
 
-        This method implements the Double-Checked Locking pattern to minimize lock contention.
+        Only the first caller missing a key runs `value_factory`; others await the same
+        in-flight future. If that load fails, every waiter receives the error and the
+        next call retries. If the loading caller is cancelled, a waiter takes over.
 
         Args:
             key (str): Cache key.
@@ -179,19 +396,40 @@ class AsyncInMemoryCache:
         Returns:
             Any: The cached value or the newly created value.
         """
-        # This is the main method and must be async
-        cached_value = self.get(key)
-        if cached_value is not None:
-            return cached_value
-
-        # Use asyncio lock
-        async with self._lock:
-            # Double-check
+        while True:
             cached_value = self.get(key)
             if cached_value is not None:
                 return cached_value
 
-            # Call async factory function
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+
+            try:
+                # Shield so a cancelled waiter does not cancel the shared load
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The loading caller was cancelled, retry and possibly take over
+
+        # No await between the check above and registering the future,
+        # so exactly one coroutine becomes the loader for this key.
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
             new_value = await value_factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
             self.set(key, new_value)
+            future.set_result(new_value)
             return new_value
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,75 @@
+"""
+Provides a Redis-backed cache for sharing serialized values across processes.
+"""
+
+import redis.exceptions
+from itapia_common.logger import ITAPIALogger
+from redis.asyncio import Redis as AsyncRedis
+
+logger = ITAPIALogger("Redis Cache")
+
+
+class AsyncRedisCache:
+    """A string cache stored in Redis under a common key prefix, for use inside async handlers.
+
+    Redis errors are logged and treated as cache misses, so callers can always
+    fall back to computing the value.
+    """
+
+    def __init__(
+        self, redis_client: AsyncRedis, prefix: str, ttl_seconds: int | None = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis_client (AsyncRedis): Asyncio Redis client, expected to decode responses to str.
+            prefix (str): Prefix prepended to every key.
+            ttl_seconds (int | None, optional): Default expiry of stored values.
+                Defaults to None (never).
+        """
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> str | None:
+        """Get a value from the cache.
+
+        Args:
+            key (str): The key to look up, without prefix.
+
+        Returns:
+            str | None: The cached value if found and Redis is reachable, otherwise None.
+        """
+        try:
+            return await self.redis_client.get(self._full_key(key))
+        except redis.exceptions.RedisError as e:
+            logger.warn(f"Could not read '{key}' from Redis cache: {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl_seconds: int | None = None):
+        """Set a value in the cache.
+
+        Args:
+            key (str): The key to store the value under, without prefix.
+            value (str): The serialized value.
+            ttl_seconds (int | None, optional): Expiry overriding the default one.
+        """
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        try:
+            await self.redis_client.set(self._full_key(key), value, ex=ttl_seconds)
+        except redis.exceptions.RedisError as e:
+            logger.warn(f"Could not write '{key}' to Redis cache: {e}")
+
+    async def invalidate(self, key: str):
+        """Remove a value from the cache.
+
+        Args:
+            key (str): The key to remove, without prefix.
+        """
+        try:
+            await self.redis_client.delete(self._full_key(key))
+        except redis.exceptions.RedisError as e:
+            logger.warn(f"Could not delete '{key}' from Redis cache: {e}")
@@ -3,12 +3,16 @@
 It uses SQLAlchemy ORM and text-based SQL queries. The table name is retrieved
 from db_config.ANALYSIS_REPORTS_TABLE_NAME. Key functionalities include saving
 reports with UPSERT logic and retrieving the latest report before a specified date.
+The table is partitioned by year of `backtest_date`, see `crud/partitions.py`.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import itapia_common.dblib.db_config as dbcfg
-from sqlalchemy import RowMapping, Sequence, text
+from itapia_common.dblib.crud.general_update import build_multi_row_values
+from itapia_common.dblib.crud.partitions import ensure_yearly_partitions, get_years
+from itapia_common.dblib.crud.prepared import execute_prepared
+from sqlalchemy import Row, RowMapping, Sequence, text
 from sqlalchemy.orm import Session
 
 
@@ -21,7 +25,8 @@ class BacktestReportCRUD:
     def save_report(self, data: Dict[str, Any]):
         """Save an analysis report to the database using UPSERT logic.
 
-        This method inserts a new report or updates an existing one based on the report_id.
+        This method inserts a new report or updates an existing one based on the report_id,
+        which embeds the backtest date.
         It uses PostgreSQL's ON CONFLICT DO UPDATE feature for efficient upsert operations.
 
         Args:
@@ -33,41 +38,111 @@ class BacktestReportCRUD:
             f"""
             INSERT INTO public.{dbcfg.ANALYSIS_REPORTS_TABLE_NAME} (report_id, ticker, backtest_date, report)
             VALUES (:report_id, :ticker, :backtest_date, :report)
-            ON CONFLICT (report_id) DO UPDATE SET
+            ON CONFLICT (report_id, backtest_date) DO UPDATE SET
                 ticker = EXCLUDED.ticker,
-                backtest_date = EXCLUDED.backtest_date,
                 report = EXCLUDED.report
         """
         )
 
+        ensure_yearly_partitions(
+            self.db, dbcfg.ANALYSIS_REPORTS_TABLE_NAME, get_years([data["backtest_date"]])
+        )
         self.db.execute(stmt, data)
         self.db.commit()
 
+    def save_reports(self, datas: List[Dict[str, Any]], chunk_size: int):
+        """Save many analysis reports with UPSERT logic in a single transaction.
+
+        Each chunk is written by one multi-row INSERT ... ON CONFLICT DO UPDATE statement,
+        and the whole batch is committed once. If a report_id appears several times,
+        the last one wins.
+
+        Args:
+            datas (List[Dict[str, Any]]): Report data, with the keys of `save_report`.
+            chunk_size (int): Maximum number of reports per statement.
+        """
+        # ON CONFLICT cannot update the same row twice in one statement
+        rows = list({data["report_id"]: data for data in datas}.values())
+        columns = ["report_id", "ticker", "backtest_date", "report"]
+
+        try:
+            ensure_yearly_partitions(
+                self.db,
+                dbcfg.ANALYSIS_REPORTS_TABLE_NAME,
+                get_years(data["backtest_date"] for data in rows),
+            )
+            for i in range(0, len(rows), chunk_size):
+                values_clause, params = build_multi_row_values(
+                    columns, rows[i : i + chunk_size]
+                )
+                stmt = text(
+                    f"""
+                    INSERT INTO public.{dbcfg.ANALYSIS_REPORTS_TABLE_NAME} (report_id, ticker, backtest_date, report)
+                    VALUES {values_clause}
+                    ON CONFLICT (report_id, backtest_date) DO UPDATE SET
+                        ticker = EXCLUDED.ticker,
+                        report = EXCLUDED.report
+                """
+                )
+                self.db.execute(stmt, params)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
     def get_latest_report_before_date(
         self, ticker: str, backtest_date: Any
     ) -> Optional[RowMapping]:
-        stmt = text(
-            f"""
+        stmt = f"""
             SELECT report_id, ticker, backtest_date, report FROM public.{dbcfg.ANALYSIS_REPORTS_TABLE_NAME}
             WHERE ticker = :ticker AND backtest_date <= :backtest_date
             ORDER BY backtest_date DESC
             LIMIT 1
         """
-        )
-        result = self.db.execute(
-            stmt, {"ticker": ticker, "backtest_date": backtest_date}
+        result = execute_prepared(
+            self.db, stmt, {"ticker": ticker, "backtest_date": backtest_date}
         )
         if result is not None:
             return result.mappings().one()
         return None
 
     def get_reports_by_ticker(self, ticker: str) -> Sequence[RowMapping]:
-        stmt = text(
-            f"""
+        stmt = f"""
             SELECT report_id, ticker, backtest_date, report FROM public.{dbcfg.ANALYSIS_REPORTS_TABLE_NAME}
             WHERE ticker = :ticker
             ORDER BY backtest_date DESC
         """
-        )
-        result = self.db.execute(stmt, {"ticker": ticker})
+        result = execute_prepared(self.db, stmt, {"ticker": ticker})
         return result.mappings().all()
+
+    def stream_report_projections_by_ticker(
+        self, ticker: str, paths: List[List[str]], batch_size: int
+    ) -> Iterator[Sequence[Row]]:
+        """Stream selected values of all reports of a ticker through a server-side cursor.
+
+        Values are extracted from the JSONB column by PostgreSQL, so only they are
+        transferred and decoded instead of whole reports.
+
+        Args:
+            ticker (str): The ticker symbol.
+            paths (List[List[str]]): Path of each value to extract, as JSON keys and array indices.
+            batch_size (int): Number of rows fetched from the cursor at a time.
+
+        Yields:
+            Sequence[Row]: Batches of rows (generated_timestamp, value of each path),
+                ordered by backtest date descending. Missing values are None.
+        """
+        value_columns = "".join(f", report #> :path_{i}" for i in range(len(paths)))
+        stmt = text(
+            f"""
+            SELECT (report ->> 'generated_timestamp')::bigint AS generated_timestamp{value_columns}
+            FROM public.{dbcfg.ANALYSIS_REPORTS_TABLE_NAME}
+            WHERE ticker = :ticker
+            ORDER BY backtest_date DESC
+        """
+        ).execution_options(stream_results=True, max_row_buffer=batch_size)
+
+        params = {f"path_{i}": path for i, path in enumerate(paths)}
+        params["ticker"] = ticker
+        result = self.db.execute(stmt, params)
+        yield from result.partitions(batch_size)
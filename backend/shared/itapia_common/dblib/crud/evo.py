@@ -1,9 +1,60 @@
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from itapia_common.dblib.crud.general_update import build_multi_row_values
 from sqlalchemy import RowMapping, Sequence, text
 from sqlalchemy.orm import Session
 
+# Columns of evo_rules written by the upserts, in INSERT order
+_EVO_RULE_COLUMNS = [
+    "rule_id",
+    "name",
+    "description",
+    "purpose",
+    "rule_status",
+    "created_at",
+    "root",
+    "evo_run_id",
+    "metrics",
+]
+
+# Conflict action shared by the single and batch upserts
+_EVO_RULE_ON_CONFLICT = """
+    ON CONFLICT (rule_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        purpose = EXCLUDED.purpose,
+        rule_status = EXCLUDED.rule_status,
+        root = EXCLUDED.root,
+        evo_run_id = EXCLUDED.evo_run_id,
+        metrics = EXCLUDED.metrics,
+        updated_at = NOW()
+"""
+
+
+def _to_evo_rule_row(rule_id: str, rule_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the columns of an evo_rules row from rule data.
+
+    Args:
+        rule_id (str): ID of the rule.
+        rule_data (Dict[str, Any]): Rule data, as dumped from EvoRuleEntity.
+
+    Returns:
+        Dict[str, Any]: Values of `_EVO_RULE_COLUMNS`, with `root` and `metrics`
+            as JSON strings for the jsonb columns.
+    """
+    return {
+        "rule_id": rule_id,
+        "name": rule_data.get("name", "Untitled Rule"),
+        "description": rule_data.get("description", ""),
+        "purpose": rule_data.get("purpose"),
+        "rule_status": rule_data.get("rule_status"),
+        "created_at": rule_data.get("created_at"),
+        "root": json.dumps(rule_data.get("root")),
+        "evo_run_id": rule_data.get("evo_run_id"),
+        "metrics": json.dumps(rule_data.get("metrics")),
+    }
+
 
 class EvoRuleCRUD:
     """CRUD operations for evolutionary rules."""
@@ -12,52 +63,60 @@ class EvoRuleCRUD:
         self.db = db_session
 
     def create_or_update_rule(self, rule_id: str, rule_data: Dict[str, Any]) -> str:
-        # Extract fields into separate columns for querying
-        name = rule_data.get("name", "Untitled Rule")
-        description = rule_data.get("description", "")
-        rule_status = rule_data.get("rule_status")
-        purpose = rule_data.get("purpose")
-        created_at = rule_data.get("created_at")
-
-        # Convert the entire dict to a JSON string for storage in the jsonb column
-        root_str = json.dumps(rule_data.get("root"))
-        evo_run_id = rule_data.get("evo_run_id")
-        metrics = json.dumps(rule_data.get("metrics"))
-
         stmt = text(
-            """
-            INSERT INTO public.evo_rules (rule_id, name, description, purpose, rule_status, created_at, root, evo_run_id, metrics)
-            VALUES (:rule_id, :name, :description, :purpose, :rule_status, :created_at, :root, :evo_run_id, :metrics)
-            ON CONFLICT (rule_id) DO UPDATE SET
-                name = EXCLUDED.name,
-                description = EXCLUDED.description,
-                purpose = EXCLUDED.purpose,
-                rule_status = EXCLUDED.rule_status,
-                root = EXCLUDED.root,
-                evo_run_id = EXCLUDED.evo_run_id,
-                metrics = EXCLUDED.metrics,
-                updated_at = NOW()
+            f"""
+            INSERT INTO public.evo_rules ({", ".join(_EVO_RULE_COLUMNS)})
+            VALUES ({", ".join(":" + col for col in _EVO_RULE_COLUMNS)})
+            {_EVO_RULE_ON_CONFLICT}
             RETURNING rule_id;
         """
         )
 
-        self.db.execute(
-            stmt,
-            {
-                "rule_id": rule_id,
-                "name": name,
-                "description": description,
-                "purpose": purpose,
-                "rule_status": rule_status,
-                "created_at": created_at,
-                "root": root_str,
-                "evo_run_id": evo_run_id,
-                "metrics": metrics,
-            },
-        )
+        self.db.execute(stmt, _to_evo_rule_row(rule_id, rule_data))
         self.db.commit()
         return rule_id
 
+    def create_or_update_rules(
+        self, rule_datas: List[Dict[str, Any]], chunk_size: int
+    ) -> List[str]:
+        """Create or update many rules in a single transaction.
+
+        Each chunk is written by one multi-row INSERT ... ON CONFLICT DO UPDATE statement,
+        and the whole batch is committed once. If a rule_id appears several times,
+        the last one wins.
+
+        Args:
+            rule_datas (List[Dict[str, Any]]): Rule data, as dumped from EvoRuleEntity.
+            chunk_size (int): Maximum number of rules per statement.
+
+        Returns:
+            List[str]: IDs of the saved rules.
+        """
+        rows = {
+            rule_data["rule_id"]: _to_evo_rule_row(rule_data["rule_id"], rule_data)
+            for rule_data in rule_datas
+        }
+        rows = list(rows.values())
+
+        try:
+            for i in range(0, len(rows), chunk_size):
+                values_clause, params = build_multi_row_values(
+                    _EVO_RULE_COLUMNS, rows[i : i + chunk_size]
+                )
+                stmt = text(
+                    f"""
+                    INSERT INTO public.evo_rules ({", ".join(_EVO_RULE_COLUMNS)})
+                    VALUES {values_clause}
+                    {_EVO_RULE_ON_CONFLICT}
+                """
+                )
+                self.db.execute(stmt, params)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return [row["rule_id"] for row in rows]
+
     def get_all_rules_by_evo(
         self, rule_status: str, evo_run_id: str
     ) -> Sequence[RowMapping]:
@@ -2,13 +2,60 @@
 
 """Provides bulk insert operations with conflict resolution for PostgreSQL."""
 
+import io
 from typing import Literal
 
 import pandas as pd
-from sqlalchemy import Engine
+from itapia_common.dblib.cache.memory import SimpleInMemoryCache
+from sqlalchemy import Engine, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.schema import MetaData, Table
 
+# Reflected tables, shared across calls so each table is only introspected once
+_TABLE_CACHE = SimpleInMemoryCache()
+
+# NULL marker used by the COPY path, so empty strings stay empty strings
+_COPY_NULL_MARKER = "\\N"
+
+# Row-level update marker, set to now() by the upserts when a conflicting row is
+# updated and the data does not provide it
+_UPDATED_AT_COLUMN = "updated_at"
+
+
+def build_multi_row_values(columns: list[str], rows: list[dict]) -> tuple[str, dict]:
+    """Build the VALUES list and bound parameters of a multi-row text INSERT.
+
+    Args:
+        columns (list[str]): Columns of each row, in the order of the INSERT column list.
+        rows (list[dict]): Rows to insert, keyed by column name.
+
+    Returns:
+        tuple[str, dict]: A clause such as `(:a_0, :b_0), (:a_1, :b_1)` and its parameters.
+    """
+    tuples = []
+    params = {}
+    for i, row in enumerate(rows):
+        tuples.append("(" + ", ".join(f":{col}_{i}" for col in columns) + ")")
+        for col in columns:
+            params[f"{col}_{i}"] = row[col]
+    return ", ".join(tuples), params
+
+
+def _get_table(engine: Engine, table_name: str) -> Table:
+    """Get the reflected `Table` of `table_name`, reflecting it on first use only.
+
+    Args:
+        engine (Engine): SQLAlchemy engine for database connection.
+        table_name (str): Name of the table to reflect.
+
+    Returns:
+        Table: The reflected table.
+    """
+    cache_key = f"{engine.url.render_as_string(hide_password=True)}/{table_name}"
+    return _TABLE_CACHE.get_or_set_with_lock(
+        cache_key, lambda: Table(table_name, MetaData(), autoload_with=engine)
+    )
+
 
 def _bulk_insert_on_conflict_do_nothing(
     engine: Engine,
@@ -29,8 +76,7 @@ def _bulk_insert_on_conflict_do_nothing(
         unique_cols (list[str]): List of column names that make up the unique constraint.
         chunk_size (int, optional): Number of records to process in each batch. Defaults to 1000.
     """
-    metadata = MetaData()
-    table = Table(table_name, metadata, autoload_with=engine)
+    table = _get_table(engine, table_name)
     total_processed = 0
 
     with engine.begin() as connection:
@@ -54,7 +100,8 @@ def _bulk_insert_on_conflict_do_update(
     """Insert data in bulk with conflict resolution set to update on conflict.
 
     This function processes data in chunks and uses PostgreSQL's ON CONFLICT DO UPDATE
-    clause to handle conflicts by updating existing records.
+    clause to handle conflicts by updating existing records. Updated rows of tables with
+    an `updated_at` column get it set to now(), unless the data provides it.
 
     Args:
         engine (Engine): SQLAlchemy engine for database connection.
@@ -63,8 +110,7 @@ def _bulk_insert_on_conflict_do_update(
         unique_cols (list[str]): List of column names that make up the unique constraint.
         chunk_size (int, optional): Number of records to process in each batch. Defaults to 1000.
     """
-    metadata = MetaData()
-    table = Table(table_name, metadata, autoload_with=engine)
+    table = _get_table(engine, table_name)
 
     total_inserted = 0
 
@@ -79,6 +125,8 @@ def _bulk_insert_on_conflict_do_update(
             update_cols = {
                 col.name: col for col in stmt.excluded if col.name not in unique_cols
             }
+            if _UPDATED_AT_COLUMN in table.c and _UPDATED_AT_COLUMN not in chunk[0]:
+                update_cols[_UPDATED_AT_COLUMN] = func.now()
             final_stmt = stmt.on_conflict_do_update(
                 index_elements=unique_cols, set_=update_cols
             )
@@ -87,6 +135,86 @@ def _bulk_insert_on_conflict_do_update(
             total_inserted += len(chunk)
 
 
+def _bulk_copy_upsert(
+    engine: Engine,
+    table_name: str,
+    data: pd.DataFrame,
+    unique_cols: list[str],
+    chunk_size: int = 1000,
+    on_conflict: Literal["nothing", "update"] = "nothing",
+):
+    """Upsert a DataFrame through a COPY into a staging table and one INSERT ... SELECT.
+
+    Rows are streamed as CSV straight from the DataFrame into a temporary staging
+    table (dropped on commit), then merged into the target table with a single
+    `INSERT ... SELECT ... ON CONFLICT` statement, all in one transaction. When
+    updating, rows sharing a key are deduplicated first and the last one wins, and
+    an `updated_at` column missing from the data is set to now().
+
+    Args:
+        engine (Engine): SQLAlchemy engine for database connection.
+        table_name (str): Name of the table to insert data into.
+        data (pd.DataFrame): Data to insert. Column names must match the table columns.
+        unique_cols (list[str]): List of column names that make up the unique constraint.
+        chunk_size (int, optional): Number of rows sent per COPY batch. Defaults to 1000.
+        on_conflict (Literal['nothing', 'update'], optional): Conflict action. Defaults to 'nothing'.
+
+    Raises:
+        ValueError: If `data` has columns that do not exist in the table.
+    """
+    table = _get_table(engine, table_name)
+    unknown_cols = [col for col in data.columns if col not in table.c]
+    if unknown_cols:
+        raise ValueError(f"Columns {unknown_cols} do not exist in table {table_name}")
+
+    update_cols = [col for col in data.columns if col not in unique_cols]
+    if on_conflict == "update" and update_cols:
+        # A key cannot be updated twice by one statement, the last input row wins
+        data = data.drop_duplicates(subset=unique_cols, keep="last")
+
+    with engine.begin() as connection:
+        quote = connection.dialect.identifier_preparer.quote
+        target_table = f"public.{quote(table_name)}"
+        staging_table = quote(f"staging_{table_name}")
+        col_list = ", ".join(quote(col) for col in data.columns)
+        conflict_cols = ", ".join(quote(col) for col in unique_cols)
+
+        connection.exec_driver_sql(
+            f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS "
+            f"SELECT {col_list} FROM {target_table} WITH NO DATA"
+        )
+
+        # COPY runs on the DBAPI cursor of the same connection and transaction
+        cursor = connection.connection.cursor()
+        copy_sql = (
+            f"COPY {staging_table} ({col_list}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{_COPY_NULL_MARKER}')"
+        )
+        for i in range(0, len(data), chunk_size):
+            buffer = io.StringIO()
+            data.iloc[i : i + chunk_size].to_csv(
+                buffer, index=False, header=False, na_rep=_COPY_NULL_MARKER
+            )
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+
+        select_sql = f"SELECT {col_list} FROM {staging_table}"
+        if on_conflict == "update" and update_cols:
+            set_sql = ", ".join(
+                f"{quote(col)} = EXCLUDED.{quote(col)}" for col in update_cols
+            )
+            if _UPDATED_AT_COLUMN in table.c and _UPDATED_AT_COLUMN not in data.columns:
+                set_sql += f", {quote(_UPDATED_AT_COLUMN)} = now()"
+            action_sql = f"DO UPDATE SET {set_sql}"
+        else:
+            action_sql = "DO NOTHING"
+
+        connection.exec_driver_sql(
+            f"INSERT INTO {target_table} ({col_list}) {select_sql} "
+            f"ON CONFLICT ({conflict_cols}) {action_sql}"
+        )
+
+
 def bulk_insert(
     engine: Engine,
     table_name: str,
@@ -94,11 +222,14 @@ def bulk_insert(
     unique_cols: list[str],
     chunk_size: int = 1000,
     on_conflict: Literal["nothing", "update"] = "nothing",
+    method: Literal["insert", "copy"] = "insert",
 ):
     """Bulk insert records into a dynamic table with conflict handling (UPSERT).
 
     This function is optimized for writing data to tables with frequently changing data.
     It performs writes in chunks within a single transaction to ensure data integrity.
+    The 'copy' method streams a DataFrame through COPY into a staging table and is
+    the faster choice for large loads of scalar columns.
 
     Args:
         engine (Engine): SQLAlchemy engine for database connection.
@@ -109,10 +240,23 @@ def bulk_insert(
         on_conflict (Literal['nothing', 'update'], optional): Action to take when conflicts occur.
             'nothing' will ignore the new record, 'update' will update the existing record.
             Defaults to 'nothing'.
+        method (Literal['insert', 'copy'], optional): Write method. 'insert' sends
+            multi-row INSERT statements, 'copy' uses COPY + INSERT ... SELECT.
+            Defaults to 'insert'.
 
     Raises:
         ValueError: If `table_name` is not an allowed dynamic table.
     """
+    if method == "copy":
+        _data = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        if _data.empty:
+            print("Data is empty!")
+            return
+        _bulk_copy_upsert(
+            engine, table_name, _data, unique_cols, chunk_size, on_conflict
+        )
+        return
+
     # Convert to JSON format first
     if isinstance(data, pd.DataFrame):
         if data.empty:
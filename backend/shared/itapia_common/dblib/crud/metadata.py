@@ -3,6 +3,7 @@
 
 import pandas as pd
 from itapia_common.dblib.cache.memory import SingletonInMemoryCache
+from itapia_common.dblib.crud.prepared import execute_prepared
 from sqlalchemy import Connection, Engine, RowMapping, Sequence, text
 from sqlalchemy.orm import Session
 
@@ -48,7 +49,9 @@ def _load_ticker_metadata_from_db(db_connectable: Session | Connection) -> dict:
 
 
 def get_ticker_metadata(
-    rdbms_connection: Session | Connection = None, rdbms_engine: Engine = None
+    rdbms_connection: Session | Connection = None,
+    rdbms_engine: Engine = None,
+    refresh: bool = False,
 ) -> dict[str, any]:
     """Get ticker metadata with caching support.
 
@@ -58,6 +61,7 @@ def get_ticker_metadata(
     Args:
         rdbms_connection (Session | Connection, optional): Database session or connection.
         rdbms_engine (Engine, optional): Database engine.
+        refresh (bool, optional): If True, drop the cached metadata and reload it. Defaults to False.
 
     Returns:
         dict[str, any]: A dictionary containing ticker metadata.
@@ -77,6 +81,8 @@ def get_ticker_metadata(
                 return _load_ticker_metadata_from_db(connection)
 
     _metadata_cache = SingletonInMemoryCache()
+    if refresh:
+        _metadata_cache.clean_cache("ticker_metadata")
 
     return _metadata_cache.get_or_set(cache_key="ticker_metadata", loader_func=loader)
 
@@ -110,3 +116,33 @@ def get_all_sectors(
             result = conn.execute(query)
     # .mappings().all() returns a list of dict-like objects
     return result.mappings().all()
+
+
+def get_ticker_data_versions(
+    rdbms_session: Session,
+    ticker: str,
+    daily_prices_table: str,
+    relevant_news_table: str,
+) -> RowMapping:
+    """Retrieve the freshness markers of a ticker's stored data in one round trip.
+
+    Args:
+        rdbms_session (Session): Database session.
+        ticker (str): Ticker symbol.
+        daily_prices_table (str): Name of the daily prices table.
+        relevant_news_table (str): Name of the relevant news table.
+
+    Returns:
+        RowMapping: `last_daily_bar` (latest collect_date of the ticker), `last_daily_update`
+            (latest updated_at of its bars, so a corrected bar changes it too) and `last_news_time`
+            (latest collect_time of its relevant news). All may be None.
+    """
+    query = f"""
+        SELECT
+            (SELECT MAX(collect_date) FROM public.{daily_prices_table} WHERE ticker = :ticker) AS last_daily_bar,
+            (SELECT MAX(updated_at) FROM public.{daily_prices_table} WHERE ticker = :ticker) AS last_daily_update,
+            (SELECT MAX(collect_time) FROM public.{relevant_news_table} WHERE ticker = :ticker) AS last_news_time
+    """
+    # Runs before every cached report lookup, so it is prepared server-side
+    result = execute_prepared(rdbms_session, query, {"ticker": ticker})
+    return result.mappings().one()
@@ -3,25 +3,69 @@
 
 from datetime import datetime
 
-from sqlalchemy import RowMapping, Sequence, text
+from redis.asyncio import Redis as AsyncRedis
+from redis.client import Redis
+from sqlalchemy import Connection, RowMapping, Sequence, text
 from sqlalchemy.orm import Session
 
+_RELEVANT_NEWS_SORT_KEY = (
+    "COALESCE(publish_time, 'infinity'), collect_time, news_uuid"
+)
+_UNIVERSAL_NEWS_SORT_KEY = (
+    "ts_rank(keyword_tsv, plainto_tsquery('english', :search_query)), news_prior, "
+    "COALESCE(publish_time, 'infinity'), collect_time, news_uuid"
+)
+
 
 def get_relevant_news(
-    rdbms_session: Session, table_name: str, ticker: str, skip: int = 0, limit: int = 10
+    rdbms_session: Session,
+    table_name: str,
+    ticker: str,
+    skip: int = 0,
+    limit: int = 10,
+    after_key: tuple[datetime | None, datetime, str] | None = None,
 ) -> Sequence[RowMapping]:
+    """Retrieve relevant news of a ticker, newest first.
+
+    Pages can be fetched with OFFSET (`skip`) or, at constant cost, with a keyset
+    (`after_key`) taken from the last row of the previous page.
+
+    Args:
+        rdbms_session (Session): Database session.
+        table_name (str): Name of the relevant news table.
+        ticker (str): Ticker of the news.
+        skip (int, optional): Number of rows to skip. Defaults to 0.
+        limit (int, optional): Maximum number of rows. Defaults to 10.
+        after_key (tuple[datetime | None, datetime, str] | None, optional): (publish_time,
+            collect_time, news_uuid) of the last row already read. Defaults to None.
+
+    Returns:
+        Sequence[RowMapping]: News rows ordered by publish_time (unknown first),
+            collect_time and news_uuid, all descending.
+    """
+    params = {"ticker": ticker, "skip": skip, "limit": limit}
+    keyset_filter = ""
+    if after_key is not None:
+        keyset_filter = f"AND ({_RELEVANT_NEWS_SORT_KEY}) < (COALESCE(CAST(:after_publish_time AS timestamptz), 'infinity'), :after_collect_time, :after_news_uuid)"
+        params.update(
+            {
+                "after_publish_time": after_key[0],
+                "after_collect_time": after_key[1],
+                "after_news_uuid": after_key[2],
+            }
+        )
+
+    # Unknown publish times are sorted first, as NULLs are in a DESC order
     query = text(
         f"""
         SELECT news_uuid, ticker, title, summary, provider, link, publish_time, collect_time
         FROM public.{table_name} 
-        WHERE ticker = :ticker 
-        ORDER BY publish_time DESC, collect_time DESC 
+        WHERE ticker = :ticker {keyset_filter}
+        ORDER BY COALESCE(publish_time, 'infinity') DESC, collect_time DESC, news_uuid DESC
         OFFSET :skip LIMIT :limit
     """
     )
-    result = rdbms_session.execute(
-        query, {"ticker": ticker, "skip": skip, "limit": limit}
-    )
+    result = rdbms_session.execute(query, params)
     return result.mappings().all()
 
 
@@ -31,27 +75,60 @@ def get_universal_news(
     search_terms: str,
     skip: int = 0,
     limit: int = 10,
+    after_key: tuple[float, int, datetime | None, datetime, str] | None = None,
 ) -> Sequence[RowMapping]:
+    """Retrieve universal news matching search terms, most relevant first.
+
+    Pages can be fetched with OFFSET (`skip`) or with a keyset (`after_key`) taken
+    from the last row of the previous page.
+
+    Args:
+        rdbms_session (Session): Database session.
+        table_name (str): Name of the universal news table.
+        search_terms (str): Full-text search terms.
+        skip (int, optional): Number of rows to skip. Defaults to 0.
+        limit (int, optional): Maximum number of rows. Defaults to 10.
+        after_key (tuple[float, int, datetime | None, datetime, str] | None, optional):
+            (rank, news_prior, publish_time, collect_time, news_uuid) of the last row
+            already read. Defaults to None.
+
+    Returns:
+        Sequence[RowMapping]: News rows with their `rank` and `news_prior`, ordered by
+            rank, news_prior, publish_time (unknown first), collect_time and news_uuid,
+            all descending.
+    """
+    params = {"search_query": search_terms, "skip": skip, "limit": limit}
+    keyset_filter = ""
+    if after_key is not None:
+        # ts_rank returns real, compare with the cursor rank as real to stay exact
+        keyset_filter = f"AND ({_UNIVERSAL_NEWS_SORT_KEY}) < (CAST(:after_rank AS real), :after_news_prior, COALESCE(CAST(:after_publish_time AS timestamptz), 'infinity'), :after_collect_time, :after_news_uuid)"
+        params.update(
+            {
+                "after_rank": after_key[0],
+                "after_news_prior": after_key[1],
+                "after_publish_time": after_key[2],
+                "after_collect_time": after_key[3],
+                "after_news_uuid": after_key[4],
+            }
+        )
 
     query = text(
         f"""
         SELECT 
             news_uuid, keyword, title, summary, provider, link, 
-            publish_time, collect_time, title_hash,
+            publish_time, collect_time, title_hash, news_prior,
             ts_rank(keyword_tsv, plainto_tsquery('english', :search_query)) AS rank
         FROM 
             public.{table_name}
         WHERE 
-            keyword_tsv @@ plainto_tsquery('english', :search_query)
+            keyword_tsv @@ plainto_tsquery('english', :search_query) {keyset_filter}
         ORDER BY 
-            rank DESC, news_prior DESC, publish_time DESC, collect_time DESC
+            rank DESC, news_prior DESC, COALESCE(publish_time, 'infinity') DESC, collect_time DESC, news_uuid DESC
         OFFSET :skip 
         LIMIT :limit
     """
     )
-    result = rdbms_session.execute(
-        query, {"search_query": search_terms, "skip": skip, "limit": limit}
-    )
+    result = rdbms_session.execute(query, params)
     return result.mappings().all()
 
 
@@ -89,3 +166,353 @@ def get_universal_news_with_date(
         },
     )
     return result.mappings().all()
+
+
+def get_news_by_scopes(
+    rdbms_session: Session,
+    relevant_table_name: str,
+    universal_table_name: str,
+    ticker: str | None,
+    relevant_limit: int,
+    universal_scopes: list[tuple[str, int]],
+    before_date: datetime | None = None,
+    digest_table_name: str | None = None,
+    scope_table_name: str | None = None,
+) -> Sequence[RowMapping]:
+    """Retrieve relevant news of a ticker and several universal news searches in one statement.
+
+    Each scope is a sub-query with its own ordering and limit, combined with UNION ALL
+    and tagged so the caller can tell the scopes apart.
+
+    With `digest_table_name` and `scope_table_name`, universal scopes registered as
+    digests (see `register_universal_news_digests`) are read from them by primary key
+    instead of being searched. Scopes that are not registered are still searched, so
+    the statement only reads.
+
+    Args:
+        rdbms_session (Session): Database session.
+        relevant_table_name (str): Name of the relevant news table.
+        universal_table_name (str): Name of the universal news table.
+        ticker (str | None): Ticker of the relevant news scope. None skips that scope.
+        relevant_limit (int): Maximum number of relevant news.
+        universal_scopes (list[tuple[str, int]]): (search terms, limit) of each universal scope.
+        before_date (datetime | None, optional): If given, only universal news published
+            up to this date are returned. Defaults to None.
+        digest_table_name (str | None, optional): Name of the digest table. Requires
+            `scope_table_name` and no `before_date`. Defaults to None.
+        scope_table_name (str | None, optional): Name of the table of registered
+            searches. Defaults to None.
+
+    Returns:
+        Sequence[RowMapping]: Rows with `scope` ('relevant' or 'universal'), `scope_idx`
+            (position of the scope, relevant first), `title`, `summary`, `publish_time`
+            and `title_hash` (None for relevant news), ordered by scope then rank.
+    """
+    sub_queries = []
+    params = {"before_date": before_date}
+
+    # Each scope keeps its top-N with ORDER BY ... LIMIT, then numbers only those rows
+    if ticker is not None and relevant_limit > 0:
+        sub_queries.append(
+            f"""
+            SELECT 'relevant' AS scope, 0 AS scope_idx, title, summary, publish_time,
+                NULL::varchar AS title_hash,
+                ROW_NUMBER() OVER (ORDER BY publish_time DESC, collect_time DESC) AS rn
+            FROM (
+                SELECT title, summary, publish_time, collect_time
+                FROM public.{relevant_table_name}
+                WHERE ticker = :ticker
+                ORDER BY publish_time DESC, collect_time DESC
+                LIMIT :relevant_limit
+            ) relevant_scope
+        """
+        )
+        params.update({"ticker": ticker, "relevant_limit": relevant_limit})
+
+    date_filter = "AND publish_time <= :before_date" if before_date is not None else ""
+    use_digests = digest_table_name is not None and scope_table_name is not None
+    for idx, (search_terms, limit) in enumerate(universal_scopes, start=1):
+        params.update({f"search_query_{idx}": search_terms, f"limit_{idx}": limit})
+        search_filter = ""
+        if use_digests:
+            # Uncorrelated, so only one of the digest read and the search runs
+            registered = (
+                f"EXISTS (SELECT 1 FROM public.{scope_table_name} "
+                f"WHERE search_terms = :search_query_{idx})"
+            )
+            search_filter = f"AND NOT {registered}"
+            sub_queries.append(
+                f"""
+            SELECT 'universal' AS scope, {idx} AS scope_idx, n.title, n.summary, n.publish_time,
+                n.title_hash,
+                ROW_NUMBER() OVER (
+                    ORDER BY d.rank DESC, d.news_prior DESC, d.publish_time DESC, d.collect_time DESC
+                ) AS rn
+            FROM (
+                SELECT news_uuid, rank, news_prior, publish_time, collect_time
+                FROM public.{digest_table_name}
+                WHERE search_terms = :search_query_{idx} AND {registered}
+                ORDER BY rank DESC, news_prior DESC, publish_time DESC, collect_time DESC
+                LIMIT :limit_{idx}
+            ) d
+            JOIN public.{universal_table_name} n ON n.news_uuid = d.news_uuid
+        """
+            )
+
+        sub_queries.append(
+            f"""
+            SELECT 'universal' AS scope, {idx} AS scope_idx, title, summary, publish_time,
+                title_hash,
+                ROW_NUMBER() OVER (
+                    ORDER BY rank DESC, news_prior DESC, publish_time DESC, collect_time DESC
+                ) AS rn
+            FROM (
+                SELECT title, summary, publish_time, collect_time, title_hash, news_prior,
+                    ts_rank(keyword_tsv, plainto_tsquery('english', :search_query_{idx})) AS rank
+                FROM public.{universal_table_name}
+                WHERE keyword_tsv @@ plainto_tsquery('english', :search_query_{idx}) {date_filter} {search_filter}
+                ORDER BY rank DESC, news_prior DESC, publish_time DESC, collect_time DESC
+                LIMIT :limit_{idx}
+            ) universal_scope_{idx}
+        """
+        )
+
+    if not sub_queries:
+        return []
+
+    query = text(
+        " UNION ALL ".join(f"({sub_query})" for sub_query in sub_queries)
+        + " ORDER BY scope_idx, rn"
+    )
+    result = rdbms_session.execute(query, params)
+    return result.mappings().all()
+
+
+def get_universal_news_history(
+    rdbms_session: Session,
+    table_name: str,
+    search_terms_lst: list[str],
+    before_date: datetime,
+) -> Sequence[RowMapping]:
+    """Retrieve every universal news article of several searches published up to a date.
+
+    All searches run as one statement. Rows of each search keep the ranking order of
+    `get_universal_news_with_date`, so the top-N of the search at any earlier date is the
+    first N rows published up to that date.
+
+    Args:
+        rdbms_session (Session): Database session.
+        table_name (str): Name of the universal news table.
+        search_terms_lst (list[str]): Search terms of each search.
+        before_date (datetime): Only news published up to this date are returned.
+
+    Returns:
+        Sequence[RowMapping]: Rows with `scope_idx` (position of the search), `title`,
+            `summary`, `publish_time` and `title_hash`, ordered by search then rank.
+    """
+    if not search_terms_lst:
+        return []
+
+    sub_queries = []
+    params = {"before_date": before_date}
+    for idx, search_terms in enumerate(search_terms_lst):
+        sub_queries.append(
+            f"""
+            SELECT {idx} AS scope_idx, title, summary, publish_time, title_hash,
+                ROW_NUMBER() OVER (
+                    ORDER BY ts_rank(keyword_tsv, plainto_tsquery('english', :search_query_{idx})) DESC,
+                        news_prior DESC, publish_time DESC, collect_time DESC
+                ) AS rn
+            FROM public.{table_name}
+            WHERE keyword_tsv @@ plainto_tsquery('english', :search_query_{idx})
+                AND publish_time <= :before_date
+        """
+        )
+        params[f"search_query_{idx}"] = search_terms
+
+    query = text(
+        " UNION ALL ".join(f"({sub_query})" for sub_query in sub_queries)
+        + " ORDER BY scope_idx, rn"
+    )
+    result = rdbms_session.execute(query, params)
+    return result.mappings().all()
+
+
+# Ranking of universal news searches, shared by searches and their digests
+_DIGEST_ORDER = "rank DESC, news_prior DESC, publish_time DESC, collect_time DESC"
+
+
+def _lock_universal_news_digests(rdbms_connection: Connection, scope_table_name: str):
+    """Serialize digest registrations and refreshes until the transaction ends.
+
+    Each statement then sees the scopes and news committed by the other, so an
+    article inserted while a search is being registered always reaches its digest.
+    """
+    rdbms_connection.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext(:lock_name))"),
+        {"lock_name": f"public.{scope_table_name}"},
+    )
+
+
+def register_universal_news_digests(
+    rdbms_connection: Connection,
+    digest_table_name: str,
+    scope_table_name: str,
+    universal_table_name: str,
+    search_terms_lst: list[str],
+    depth: int,
+) -> list[str]:
+    """Register universal news searches as digests and build the new ones.
+
+    Searches that are already registered are left untouched. The caller commits.
+    Digests are rebuilt by truncating the scope table together with the digest table
+    (TRUNCATE ... CASCADE) and registering the searches again.
+
+    Args:
+        rdbms_connection (Connection): Database connection.
+        digest_table_name (str): Name of the digest table.
+        scope_table_name (str): Name of the table of registered searches.
+        universal_table_name (str): Name of the universal news table.
+        search_terms_lst (list[str]): Search terms to register.
+        depth (int): Number of top-ranked news kept in each digest.
+
+    Returns:
+        list[str]: Search terms that were newly registered.
+    """
+    query = text(
+        f"""
+        WITH new_scopes AS (
+            INSERT INTO public.{scope_table_name} (search_terms, refreshed_at)
+            SELECT DISTINCT unnest(CAST(:search_terms_lst AS varchar[])), NOW()
+            ON CONFLICT (search_terms) DO NOTHING
+            RETURNING search_terms
+        ), built AS (
+            INSERT INTO public.{digest_table_name}
+                (search_terms, news_uuid, rank, news_prior, publish_time, collect_time)
+            SELECT s.search_terms, top.news_uuid, top.rank, top.news_prior, top.publish_time, top.collect_time
+            FROM new_scopes s
+            CROSS JOIN LATERAL (
+                SELECT news_uuid, news_prior, publish_time, collect_time,
+                    ts_rank(keyword_tsv, plainto_tsquery('english', s.search_terms)) AS rank
+                FROM public.{universal_table_name}
+                WHERE keyword_tsv @@ plainto_tsquery('english', s.search_terms)
+                ORDER BY {_DIGEST_ORDER}
+                LIMIT :depth
+            ) top
+        )
+        SELECT search_terms FROM new_scopes
+    """
+    )
+    _lock_universal_news_digests(rdbms_connection, scope_table_name)
+    result = rdbms_connection.execute(
+        query, {"search_terms_lst": search_terms_lst, "depth": depth}
+    )
+    return result.scalars().all()
+
+
+def refresh_universal_news_digests(
+    rdbms_connection: Connection,
+    digest_table_name: str,
+    scope_table_name: str,
+    universal_table_name: str,
+    news_uuids: list[str],
+    depth: int,
+) -> list[str]:
+    """Merge newly inserted universal news into the digests of every registered search.
+
+    The rank of a stored article never changes, so the top-N of a search is the top-N
+    of its current digest plus the new matching articles. Only the new articles are
+    matched against the searches, then touched digests are trimmed back to `depth`.
+    The caller commits.
+
+    Args:
+        rdbms_connection (Connection): Database connection.
+        digest_table_name (str): Name of the digest table.
+        scope_table_name (str): Name of the table of registered searches.
+        universal_table_name (str): Name of the universal news table.
+        news_uuids (list[str]): UUIDs of the inserted news. UUIDs that were not stored
+            (e.g. duplicates) are ignored.
+        depth (int): Number of top-ranked news kept in each digest.
+
+    Returns:
+        list[str]: Search terms whose digest received new articles.
+    """
+    if not news_uuids:
+        return []
+
+    _lock_universal_news_digests(rdbms_connection, scope_table_name)
+    merge_query = text(
+        f"""
+        WITH merged AS (
+            INSERT INTO public.{digest_table_name}
+                (search_terms, news_uuid, rank, news_prior, publish_time, collect_time)
+            SELECT s.search_terms, n.news_uuid,
+                ts_rank(n.keyword_tsv, plainto_tsquery('english', s.search_terms)),
+                n.news_prior, n.publish_time, n.collect_time
+            FROM public.{universal_table_name} n
+            JOIN public.{scope_table_name} s
+                ON n.keyword_tsv @@ plainto_tsquery('english', s.search_terms)
+            WHERE n.news_uuid = ANY(CAST(:news_uuids AS varchar[]))
+            ON CONFLICT (search_terms, news_uuid) DO NOTHING
+            RETURNING search_terms
+        )
+        SELECT DISTINCT search_terms FROM merged
+    """
+    )
+    touched = (
+        rdbms_connection.execute(merge_query, {"news_uuids": news_uuids})
+        .scalars()
+        .all()
+    )
+    if not touched:
+        return []
+
+    trim_query = text(
+        f"""
+        DELETE FROM public.{digest_table_name} d
+        USING (
+            SELECT search_terms, news_uuid,
+                ROW_NUMBER() OVER (PARTITION BY search_terms ORDER BY {_DIGEST_ORDER}) AS rn
+            FROM public.{digest_table_name}
+            WHERE search_terms = ANY(CAST(:touched AS varchar[]))
+        ) ranked
+        WHERE d.search_terms = ranked.search_terms
+            AND d.news_uuid = ranked.news_uuid
+            AND ranked.rn > :depth
+    """
+    )
+    rdbms_connection.execute(trim_query, {"touched": touched, "depth": depth})
+
+    rdbms_connection.execute(
+        text(
+            f"UPDATE public.{scope_table_name} SET refreshed_at = NOW() "
+            "WHERE search_terms = ANY(CAST(:touched AS varchar[]))"
+        ),
+        {"touched": touched},
+    )
+    return touched
+
+
+def set_universal_news_version(redis_client: Redis, key: str, version: int) -> None:
+    """Publish a new version of the universal news, e.g. after an ingestion.
+
+    Args:
+        redis_client (Redis): Redis client instance.
+        key (str): Redis key holding the version.
+        version (int): New version, e.g. the ingestion time in microseconds.
+    """
+    redis_client.set(key, version)
+
+
+async def get_universal_news_version_async(redis_client: AsyncRedis, key: str) -> int:
+    """Read the version published by `set_universal_news_version`.
+
+    Args:
+        redis_client (AsyncRedis): Async Redis client instance.
+        key (str): Redis key holding the version.
+
+    Returns:
+        int: The version, 0 if none was published yet.
+    """
+    version = await redis_client.get(key)
+    return int(version) if version is not None else 0
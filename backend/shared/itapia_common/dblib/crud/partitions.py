@@ -0,0 +1,116 @@
+# common/dblib/crud/partitions.py
+"""Yearly range partitions of time-series tables.
+
+`daily_prices` and `backtest_reports` are partitioned by the year of their date
+column, so per-ticker range reads and upserts only touch the partitions of the years
+involved. There is no default partition: write paths create the partitions of the
+years they are about to write with `ensure_yearly_partitions`.
+"""
+
+from datetime import datetime, timezone
+from typing import Iterable, List
+
+import pandas as pd
+from sqlalchemy import Connection, text
+from sqlalchemy.orm import Session
+
+# Partitions and partitioned tables known to exist, so writes skip the catalog lookups
+_KNOWN_PARTITIONS: set[str] = set()
+_PARTITIONED_TABLES: set[str] = set()
+
+
+def get_yearly_partition_name(table_name: str, year: int) -> str:
+    """Get the name of the partition of a table holding one year.
+
+    Args:
+        table_name (str): Name of the partitioned table.
+        year (int): The year.
+
+    Returns:
+        str: Name of the partition, e.g. `daily_prices_y2024`.
+    """
+    return f"{table_name}_y{year}"
+
+
+def get_years(values: Iterable) -> List[int]:
+    """Get the distinct UTC years of dates, as used to route rows to partitions.
+
+    Args:
+        values (Iterable): Dates as datetimes, timestamps or ISO strings.
+
+    Returns:
+        List[int]: Sorted distinct years.
+    """
+    years = pd.to_datetime(pd.Series(list(values)), utc=True).dt.year
+    return sorted(int(year) for year in years.dropna().unique())
+
+
+def is_partitioned(db_connectable: Session | Connection, table_name: str) -> bool:
+    """Check whether a table is a partitioned table.
+
+    Args:
+        db_connectable (Session | Connection): Database session or connection.
+        table_name (str): Name of the table in the public schema.
+
+    Returns:
+        bool: True if the table exists and is partitioned.
+    """
+    if table_name in _PARTITIONED_TABLES:
+        return True
+    relkind = db_connectable.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:qualified_name)"),
+        {"qualified_name": f"public.{table_name}"},
+    ).scalar()
+    if relkind == "p":
+        _PARTITIONED_TABLES.add(table_name)
+        return True
+    return False
+
+
+def ensure_yearly_partitions(
+    db_connectable: Session | Connection, table_name: str, years: Iterable[int]
+) -> List[str]:
+    """Create the missing yearly partitions of a table.
+
+    Does nothing if the table is not partitioned (i.e. not migrated yet). Creating a
+    partition locks the parent table, so existing partitions are looked up first.
+    The caller commits.
+
+    Args:
+        db_connectable (Session | Connection): Database session or connection.
+        table_name (str): Name of the partitioned table.
+        years (Iterable[int]): Years that rows are about to be written for.
+
+    Returns:
+        List[str]: Names of the created partitions.
+    """
+    years = sorted(set(years))
+    if not years or not is_partitioned(db_connectable, table_name):
+        return []
+
+    created = []
+    for year in years:
+        partition_name = get_yearly_partition_name(table_name, year)
+        if partition_name in _KNOWN_PARTITIONS:
+            continue
+
+        exists = db_connectable.execute(
+            text("SELECT to_regclass(:qualified_name) IS NOT NULL"),
+            {"qualified_name": f"public.{partition_name}"},
+        ).scalar()
+        if exists:
+            _KNOWN_PARTITIONS.add(partition_name)
+            continue
+
+        lower = datetime(year, 1, 1, tzinfo=timezone.utc).isoformat()
+        upper = datetime(year + 1, 1, 1, tzinfo=timezone.utc).isoformat()
+        db_connectable.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS public.{partition_name} "
+                f"PARTITION OF public.{table_name} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        # Not remembered yet, the caller may still roll the creation back
+        created.append(partition_name)
+    return created
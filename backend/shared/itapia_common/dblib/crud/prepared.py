@@ -0,0 +1,118 @@
+# common/dblib/crud/prepared.py
+"""Server-side prepared statements for hot read queries.
+
+psycopg2 sends every statement as plain text, so PostgreSQL parses and plans it on
+each call. Statements run through `execute_prepared` are instead prepared once per
+pooled connection (`PREPARE`) and then only executed by name (`EXECUTE`), which
+lets PostgreSQL reuse the parse tree and, after a few calls, a generic plan.
+"""
+
+import hashlib
+import re
+from typing import Any
+
+import itapia_common.dblib.db_config as dbcfg
+from itapia_common.dblib.cache.memory import SimpleInMemoryCache
+from sqlalchemy import Connection, CursorResult, TextClause, text
+from sqlalchemy.orm import Session
+
+# Compiled statements, shared across calls so each SQL string is only parsed once
+_STATEMENT_CACHE = SimpleInMemoryCache()
+
+# Key of the set of statement names already prepared on a pooled DBAPI connection
+_PREPARED_NAMES_INFO_KEY = "itapia_prepared_statements"
+
+# `:name` bind parameters, but not `::type` casts. String literals and quoted
+# identifiers are matched first so the names inside them are left as they are.
+_BIND_PARAM_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"|(?<![:\w]):(\w+)")
+
+
+class PreparedStatement:
+    """A SQL statement with `:name` bind parameters, compiled for PREPARE/EXECUTE."""
+
+    def __init__(self, sql: str):
+        """Compile the statement.
+
+        Args:
+            sql (str): SQL text using `:name` bind parameters. A parameter may be used
+                several times.
+        """
+        self.sql = sql
+        self.name = "itapia_" + hashlib.sha1(sql.encode()).hexdigest()[:16]
+        self.param_names: list[str] = []
+
+        def to_positional(match: re.Match) -> str:
+            param_name = match.group(1)
+            if param_name is None:
+                return match.group(0)
+            if param_name not in self.param_names:
+                self.param_names.append(param_name)
+            return f"${self.param_names.index(param_name) + 1}"
+
+        positional_sql = _BIND_PARAM_PATTERN.sub(to_positional, sql).rstrip("; \n")
+        self.prepare_sql = f"PREPARE {self.name} AS {positional_sql}"
+
+        execute_sql = f"EXECUTE {self.name}"
+        if self.param_names:
+            execute_sql += f"({', '.join(':' + p for p in self.param_names)})"
+        self.execute_clause: TextClause = text(execute_sql)
+        self.text_clause: TextClause = text(sql)
+
+    def execute(
+        self, db_connectable: Session | Connection, params: dict[str, Any]
+    ) -> CursorResult:
+        """Execute the statement, preparing it first if this connection has not yet.
+
+        Args:
+            db_connectable (Session | Connection): Database session or connection.
+            params (dict[str, Any]): Values of the bind parameters.
+
+        Returns:
+            CursorResult: The result, as returned by executing the plain statement.
+        """
+        connection = (
+            db_connectable.connection()
+            if isinstance(db_connectable, Session)
+            else db_connectable
+        )
+        # `info` lives as long as the DBAPI connection, across pool checkouts,
+        # exactly like the prepared statements of its server session
+        prepared_names = connection.info.setdefault(_PREPARED_NAMES_INFO_KEY, set())
+        if self.name not in prepared_names:
+            connection.exec_driver_sql(self.prepare_sql)
+            prepared_names.add(self.name)
+        return connection.execute(self.execute_clause, params)
+
+
+def get_prepared_statement(sql: str) -> PreparedStatement:
+    """Get the compiled statement of a SQL string, compiling it on first use only.
+
+    Args:
+        sql (str): SQL text using `:name` bind parameters.
+
+    Returns:
+        PreparedStatement: The compiled statement.
+    """
+    return _STATEMENT_CACHE.get_or_set_with_lock(sql, lambda: PreparedStatement(sql))
+
+
+def execute_prepared(
+    db_connectable: Session | Connection, sql: str, params: dict[str, Any]
+) -> CursorResult:
+    """Execute a read query as a server-side prepared statement.
+
+    Falls back to a plain text statement when `POSTGRES_PREPARED_STATEMENTS` is off,
+    e.g. behind a transaction-pooling PgBouncer where server sessions are shared.
+
+    Args:
+        db_connectable (Session | Connection): Database session or connection.
+        sql (str): SQL text using `:name` bind parameters.
+        params (dict[str, Any]): Values of the bind parameters.
+
+    Returns:
+        CursorResult: The query result.
+    """
+    statement = get_prepared_statement(sql)
+    if not dbcfg.POSTGRES_PREPARED_STATEMENTS:
+        return db_connectable.execute(statement.text_clause, params)
+    return statement.execute(db_connectable, params)
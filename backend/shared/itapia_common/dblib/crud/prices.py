@@ -1,8 +1,13 @@
 # common/dblib/crud/prices.py
 """Provides CRUD operations for price-related data entities."""
 
-from datetime import datetime, timezone
+import base64
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
+import pandas as pd
+from itapia_common.dblib.crud.prepared import execute_prepared
+from redis.asyncio import Redis as AsyncRedis
 from redis.client import Redis
 from sqlalchemy import Engine, RowMapping, Sequence, text
 from sqlalchemy.orm import Session
@@ -14,85 +19,345 @@ def get_daily_prices(
     ticker: str,
     skip: int = 0,
     limit: int = 500,
+    before_date: datetime | None = None,
 ) -> Sequence[RowMapping]:
+    """Retrieve daily bars of a ticker, newest first.
 
-    query = text(
-        f"""
-        SELECT * FROM public.{table_name} 
-        WHERE ticker = :ticker 
+    Pages can be fetched with OFFSET (`skip`) or, at constant cost, with the date of
+    the last bar of the previous page (`before_date`).
+
+    Args:
+        rdbms_session (Session): Database session.
+        table_name (str): Name of the daily prices table.
+        ticker (str): Ticker symbol.
+        skip (int, optional): Number of rows to skip. Defaults to 0.
+        limit (int, optional): Maximum number of rows. Defaults to 500.
+        before_date (datetime | None, optional): Only bars strictly older than this date
+            are returned. Defaults to None.
+
+    Returns:
+        Sequence[RowMapping]: Daily price rows ordered by collect_date descending.
+    """
+    params = {"ticker": ticker, "skip": skip, "limit": limit}
+    keyset_filter = ""
+    if before_date is not None:
+        keyset_filter = "AND collect_date < :before_date"
+        params["before_date"] = before_date
+
+    query = f"""
+        SELECT record_id, open, high, low, close, volume, ticker, collect_date
+        FROM public.{table_name} 
+        WHERE ticker = :ticker {keyset_filter}
         ORDER BY collect_date DESC 
         OFFSET :skip LIMIT :limit
     """
-    )
 
-    result = rdbms_session.execute(
-        query, {"ticker": ticker, "skip": skip, "limit": limit}
-    )
+    result = execute_prepared(rdbms_session, query, params)
     return result.mappings().all()
 
 
-def get_tickers_by_sector(
-    rdbms_session: Session, table_name: str, sector_code: str
-) -> Sequence[str]:
+def get_daily_ohlcv(
+    rdbms_session: Session,
+    table_name: str,
+    ticker: str,
+    skip: int = 0,
+    limit: int = 500,
+) -> pd.DataFrame:
+    """Fetch the latest daily OHLCV bars of a ticker as a columnar DataFrame.
 
+    Only the OHLCV columns are selected and the cursor is loaded straight into
+    a DataFrame, skipping the per-row mapping objects of `get_daily_prices`.
+
+    Args:
+        rdbms_session (Session): Database session.
+        table_name (str): Name of the daily prices table.
+        ticker (str): Ticker symbol.
+        skip (int, optional): Number of latest rows to skip. Defaults to 0.
+        limit (int, optional): Maximum number of rows. Defaults to 500.
+
+    Returns:
+        pd.DataFrame: Columns `collect_date, open, high, low, close, volume`,
+            ordered by ascending collect_date.
+    """
+    query = f"""
+        SELECT collect_date, open, high, low, close, volume
+        FROM (
+            SELECT collect_date, open, high, low, close, volume
+            FROM public.{table_name}
+            WHERE ticker = :ticker
+            ORDER BY collect_date DESC
+            OFFSET :skip LIMIT :limit
+        ) latest
+        ORDER BY collect_date
+    """
+
+    result = execute_prepared(
+        rdbms_session, query, {"ticker": ticker, "skip": skip, "limit": limit}
+    )
+    return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+
+def get_daily_prices_by_sector(
+    rdbms_session: Session,
+    table_name: str,
+    tickers: Sequence[str],
+    skip: int = 0,
+    limit: int = 500,
+) -> pd.DataFrame:
+    """Fetch the latest daily bars of every ticker of a sector with one query.
+
+    Each ticker reads its own newest-first `skip`/`limit` window through a LATERAL
+    sub-query (same semantics as `get_daily_prices`), which walks the yearly partitions
+    from the newest one and stops at the limit instead of ranking the whole history.
+    The cursor is loaded straight into a columnar DataFrame without building
+    per-row objects.
+
+    Args:
+        rdbms_session (Session): Database session.
+        table_name (str): Name of the daily prices table.
+        tickers (Sequence[str]): Tickers of the sector, e.g. from the metadata index.
+        skip (int, optional): Number of latest rows to skip per ticker. Defaults to 0.
+        limit (int, optional): Maximum number of rows per ticker. Defaults to 500.
+
+    Returns:
+        pd.DataFrame: Columns `ticker, collect_date, open, high, low, close, volume`,
+            ordered by ticker then ascending collect_date.
+    """
     query = text(
         f"""
-        SELECT ticker_sym FROM public.{table_name}
-        WHERE sector_code = :sector_code AND is_active = TRUE
-        ORDER BY ticker_sym;
+        SELECT p.ticker, p.collect_date, p.open, p.high, p.low, p.close, p.volume
+        FROM unnest(CAST(:tickers AS text[])) AS t(ticker_sym)
+        CROSS JOIN LATERAL (
+            SELECT ticker, collect_date, open, high, low, close, volume
+            FROM public.{table_name}
+            WHERE ticker = t.ticker_sym
+            ORDER BY collect_date DESC
+            OFFSET :skip LIMIT :limit
+        ) p
+        ORDER BY p.ticker, p.collect_date
     """
     )
-    result = rdbms_session.execute(query, {"sector_code": sector_code})
-    # .scalars().all() returns a list of values from the first column
-    return result.scalars().all()
 
+    result = rdbms_session.execute(
+        query, {"tickers": list(tickers), "skip": skip, "limit": limit}
+    )
+    return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
 
-def get_intraday_prices(
-    redis_client: Redis, ticker: str, stream_prefix: str
-) -> list[dict] | None:
 
+# Binary layout of a packed intraday candle. 48 bytes encode to exactly 64 base64
+# characters without padding, so many packed candles can be decoded in one call.
+# `timestamp_us` is the last update time in microseconds since epoch (UTC).
+INTRADAY_CANDLE_DTYPE = np.dtype(
+    [
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+        ("timestamp_us", "<i8"),
+    ]
+)
+PACKED_CANDLE_FIELD = "candle"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Stored in `timestamp_us` when an entry has no last update time, read as NaT by pandas
+MISSING_TIMESTAMP_US = np.iinfo(np.int64).min
+_PRICE_FIELDS = ["open", "high", "low", "close", "volume"]
+# Stream ID to read a stream from its beginning
+_STREAM_START_ID = "0-0"
+
+
+def _pack_intraday_candle(candle_data: dict) -> str:
+    """Pack a candle into one base64 string following `INTRADAY_CANDLE_DTYPE`.
+
+    Base64 keeps the field readable by clients created with `decode_responses=True`.
+    """
+    last_update = candle_data["last_update_utc"]
+    if isinstance(last_update, str):
+        last_update = datetime.fromisoformat(last_update)
+    if last_update.tzinfo is None:
+        last_update = last_update.replace(tzinfo=timezone.utc)
+    # Integer arithmetic on the timedelta keeps microseconds exact
+    timestamp_us = (last_update - _EPOCH) // timedelta(microseconds=1)
+    record = np.array(
+        [
+            (
+                candle_data["open"],
+                candle_data["high"],
+                candle_data["low"],
+                candle_data["close"],
+                candle_data["volume"],
+                timestamp_us,
+            )
+        ],
+        dtype=INTRADAY_CANDLE_DTYPE,
+    )
+    return base64.b64encode(record.tobytes()).decode("ascii")
+
+
+def _decode_intraday_entries(entries: list) -> dict[str, np.ndarray]:
+    """Decode raw stream entries into one NumPy array per candle field.
+
+    Packed and per-field string entries can be mixed in one stream, for example
+    while writers are being switched to the packed format. Fields missing from a
+    per-field entry are decoded as NaN, or `MISSING_TIMESTAMP_US` for the time.
+
+    Args:
+        entries (list): Entries returned by XRANGE, as (entry_id, fields) pairs.
+
+    Returns:
+        dict[str, np.ndarray]: Arrays for open, high, low, close, volume (float64)
+            and timestamp_us (int64, microseconds since epoch in UTC), in stream order.
+    """
+    fields = [data for _, data in entries]
+    n = len(fields)
+    arrays = {
+        name: np.empty(n, dtype=INTRADAY_CANDLE_DTYPE[name])
+        for name in INTRADAY_CANDLE_DTYPE.names
+    }
+    if n == 0:
+        return arrays
+
+    packed_mask = np.fromiter(
+        (PACKED_CANDLE_FIELD in data for data in fields), dtype=bool, count=n
+    )
+    packed_idx = np.flatnonzero(packed_mask)
+    if packed_idx.size:
+        raw = base64.b64decode(
+            "".join(fields[i][PACKED_CANDLE_FIELD] for i in packed_idx)
+        )
+        records = np.frombuffer(raw, dtype=INTRADAY_CANDLE_DTYPE)
+        for name in INTRADAY_CANDLE_DTYPE.names:
+            arrays[name][packed_idx] = records[name]
+
+    text_idx = np.flatnonzero(~packed_mask)
+    if text_idx.size:
+        text_fields = [fields[i] for i in text_idx]
+        for name in _PRICE_FIELDS:
+            arrays[name][text_idx] = np.array(
+                [data.get(name, np.nan) for data in text_fields], dtype=np.float64
+            )
+        last_updates = pd.to_datetime(
+            [data.get("last_update_utc") for data in text_fields],
+            utc=True,
+            format="ISO8601",
+        )
+        # NaT is stored as the int64 minimum, i.e. MISSING_TIMESTAMP_US
+        arrays["timestamp_us"][text_idx] = last_updates.as_unit("us").asi8
+
+    return arrays
+
+
+def _arrays_to_rows(arrays: dict[str, np.ndarray], ticker: str) -> list[dict]:
+    """Turn decoded stream arrays back into row dictionaries.
+
+    Missing values become None. `last_update_utc` is an aware UTC datetime with
+    microsecond precision.
+    """
+    columns = {
+        name: [None if value != value else value for value in arrays[name].tolist()]
+        for name in _PRICE_FIELDS
+    }
+    rows = []
+    for i, timestamp_us in enumerate(arrays["timestamp_us"].tolist()):
+        volume = columns["volume"][i]
+        rows.append(
+            {
+                "open": columns["open"][i],
+                "high": columns["high"][i],
+                "low": columns["low"][i],
+                "close": columns["close"][i],
+                "volume": int(volume) if volume is not None else None,
+                "last_update_utc": (
+                    _EPOCH + timedelta(microseconds=timestamp_us)
+                    if timestamp_us != MISSING_TIMESTAMP_US
+                    else None
+                ),
+                "ticker": ticker,
+            }
+        )
+    return rows
+
+
+def _parse_stream_updates(
+    key_to_ticker: dict[str, str],
+    last_ids: dict[str, str],
+    read_result: list | None,
+    last_entries: list[list],
+) -> dict[str, tuple[str, dict[str, np.ndarray], bool]]:
+    """Decode the XREAD and XRANGE replies of `get_intraday_prices_after_async`."""
+    new_entries = {}
+    for key, entries in read_result or []:
+        if isinstance(key, bytes):
+            key = key.decode()
+        new_entries[key_to_ticker[key]] = entries
+
+    updates = {}
+    for (key, ticker), last_entry in zip(key_to_ticker.items(), last_entries):
+        entries = new_entries.get(ticker, [])
+        last_id = entries[-1][0] if entries else last_ids[ticker]
+        in_sync = last_ids[ticker] == _STREAM_START_ID or bool(last_entry)
+        updates[ticker] = (last_id, _decode_intraday_entries(entries), in_sync)
+    return updates
+
+
+async def get_intraday_prices_async(
+    redis_client: AsyncRedis, ticker: str, stream_prefix: str
+) -> list[dict] | None:
+    """Read all intraday candles of a ticker from its Redis stream, oldest first."""
     if not redis_client:
         return None
     redis_key = f"{stream_prefix}:{ticker}"
-    entries = redis_client.xrange(redis_key)
-    data_lst = []
-    if entries:
-        for entry_id, data in entries:
-            for key, value in data.items():
-                if key in ["open", "high", "low", "close"]:
-                    data[key] = float(value)
-                elif key == "volume":
-                    data[key] = int(value)
-                elif key == "last_update_utc":
-                    data[key] = datetime.fromisoformat(data[key])
-            data["ticker"] = ticker
-            data_lst.append(data)
-        return data_lst
-    else:
+    entries = await redis_client.xrange(redis_key)
+    if not entries:
         return []
+    return _arrays_to_rows(_decode_intraday_entries(entries), ticker)
 
 
-def get_latest_intraday_price(
-    redis_client: Redis, ticker: str, stream_prefix: str
+async def get_latest_intraday_price_async(
+    redis_client: AsyncRedis, ticker: str, stream_prefix: str
 ) -> dict | None:
-
+    """Read the newest intraday candle of a ticker from its Redis stream."""
     if not redis_client:
         return None
     redis_key = f"{stream_prefix}:{ticker}"
-    entries = redis_client.xrevrange(redis_key, count=1)
+    entries = await redis_client.xrevrange(redis_key, count=1)
     if not entries:
         return None
-    entry_id, data = entries[0]
-    for key, value in data.items():
-        if key in ["open", "high", "low", "close"]:
-            data[key] = float(value)
-        elif key == "volume":
-            data[key] = int(value)
-        elif key == "last_update_utc":
-            data[key] = datetime.fromisoformat(data[key])
-    data["ticker"] = ticker
+    return _arrays_to_rows(_decode_intraday_entries(entries), ticker)[0]
+
+
+async def get_intraday_prices_after_async(
+    redis_client: AsyncRedis, last_ids: dict[str, str], stream_prefix: str
+) -> dict[str, tuple[str, dict[str, np.ndarray], bool]]:
+    """Read only the intraday entries newer than the last seen stream ID of each ticker.
+
+    One pipeline issues a single XREAD over all streams plus one XRANGE per stream
+    looking up the last seen entry, so callers can detect streams that were deleted,
+    recreated or trimmed past that entry behind them.
+
+    Args:
+        redis_client (AsyncRedis): Async Redis client instance.
+        last_ids (dict[str, str]): Last seen stream ID per ticker. Use "0-0" to read a
+            stream from the beginning.
+        stream_prefix (str): Prefix for the Redis stream keys.
+
+    Returns:
+        dict[str, tuple[str, dict[str, np.ndarray], bool]]: For each requested ticker,
+            the newest stream ID seen, the decoded new entries (see
+            `_decode_intraday_entries`) and whether the last seen entry is still in
+            the stream (always True for "0-0"). When it is not, the new entries do not
+            continue what the caller has read.
+    """
+    if not redis_client or not last_ids:
+        return {}
 
-    return data
+    key_to_ticker = {f"{stream_prefix}:{ticker}": ticker for ticker in last_ids}
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.xread({key: last_ids[ticker] for key, ticker in key_to_ticker.items()})
+    for key, ticker in key_to_ticker.items():
+        pipe.xrange(key, min=last_ids[ticker], max=last_ids[ticker], count=1)
+    read_result, *last_entries = await pipe.execute()
+    return _parse_stream_updates(key_to_ticker, last_ids, read_result, last_entries)
 
 
 def get_last_history_date(
@@ -124,6 +389,7 @@ def add_intraday_candle(
     candle_data: dict,
     stream_prefix: str,
     max_entries: int = 300,
+    packed: bool = False,
 ):
     """Add an intraday candle to a Redis Stream associated with a ticker.
 
@@ -137,14 +403,20 @@ def add_intraday_candle(
         stream_prefix (str): Prefix for the Redis stream key.
         max_entries (int, optional): Maximum number of entries to keep in the stream.
                                    Defaults to 300.
+        packed (bool, optional): If True, store the candle as one base64 field laid out
+                                 as `INTRADAY_CANDLE_DTYPE` instead of one string per
+                                 field. Defaults to False.
     """
     if not candle_data:
         return
     stream_key = f"{stream_prefix}:{ticker}"
 
     try:
-        # Convert all values to strings for compatibility with Redis Stream
-        mapping_to_save = {k: str(v) for k, v in candle_data.items()}
+        if packed:
+            mapping_to_save = {PACKED_CANDLE_FIELD: _pack_intraday_candle(candle_data)}
+        else:
+            # Convert all values to strings for compatibility with Redis Stream
+            mapping_to_save = {k: str(v) for k, v in candle_data.items()}
 
         # XADD command to add a new entry. '*' lets Redis create an ID based on timestamp.
         # MAXLEN ~ max_entries limits the size of the stream.
@@ -3,6 +3,7 @@
 import json
 from typing import Any, Dict, Optional
 
+from itapia_common.dblib.crud.prepared import execute_prepared
 from sqlalchemy import RowMapping, Sequence, text
 from sqlalchemy.orm import Session
 
@@ -75,13 +76,11 @@ class RuleCRUD:
         self, purpose_name: str, rule_status: str
     ) -> Sequence[RowMapping]:
         # Postgres JSONB query: `->>` extracts field as text
-        stmt = text(
-            """SELECT rule_id, name, description, purpose, rule_status, created_at, updated_at, root, metrics
+        stmt = """SELECT rule_id, name, description, purpose, rule_status, created_at, updated_at, root, metrics
                     FROM public.rules WHERE rule_status = :rule_status AND purpose = :purpose;"""
-        )
 
-        results = self.db.execute(
-            stmt, {"purpose": purpose_name, "rule_status": rule_status}
+        results = execute_prepared(
+            self.db, stmt, {"purpose": purpose_name, "rule_status": rule_status}
         )
 
         # Return a list of dictionaries
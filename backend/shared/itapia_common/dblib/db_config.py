@@ -25,14 +25,53 @@ POSTGRES_PASSWORD = quote_plus(POSTGRES_PASSWORD)
 
 DATABASE_URL = f"postgresql+psycopg2://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# PostgreSQL Connection Pool Configuration
+POSTGRES_POOL_SIZE = int(os.getenv("POSTGRES_POOL_SIZE", 10))
+POSTGRES_MAX_OVERFLOW = int(os.getenv("POSTGRES_MAX_OVERFLOW", 20))
+POSTGRES_POOL_TIMEOUT = int(os.getenv("POSTGRES_POOL_TIMEOUT", 30))
+POSTGRES_POOL_RECYCLE = int(os.getenv("POSTGRES_POOL_RECYCLE", 1800))
+# Run hot read queries as server-side prepared statements. Opt-in; never turn on
+# behind a transaction-pooling proxy (e.g. PgBouncer), where server sessions are shared.
+POSTGRES_PREPARED_STATEMENTS = (
+    os.getenv("POSTGRES_PREPARED_STATEMENTS", "false").lower() == "true"
+)
+
+# Interval after which the in-process ticker/sector index is rebuilt in the background
+METADATA_REFRESH_INTERVAL_SECONDS = int(
+    os.getenv("METADATA_REFRESH_INTERVAL_SECONDS", 3600)
+)
+
 # Redis Configuration
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+# Connection pool size of the asyncio Redis client of each service process
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+# Store intraday candles as one packed binary field instead of per-field strings
+REDIS_PACKED_CANDLES = os.getenv("REDIS_PACKED_CANDLES", "false").lower() == "true"
 
 # Table Names
 DAILY_PRICES_TABLE_NAME = "daily_prices"
 RELEVANT_NEWS_TABLE_NAME = "relevant_news"
 UNIVERSAL_NEWS_TABLE_NAME = "universal_news"
+UNIVERSAL_NEWS_DIGEST_TABLE_NAME = "universal_news_digests"
+UNIVERSAL_NEWS_DIGEST_SCOPE_TABLE_NAME = "universal_news_digest_scopes"
 INTRADAY_STREAM_PREFIX = "intraday_stream"
+INTRADAY_STREAM_MAX_ENTRIES = 300
+# Candles kept per ticker by in-process copies of the intraday streams. Streams are
+# trimmed with MAXLEN ~, which only drops whole stream nodes (100 entries by default),
+# so a stream can hold more than INTRADAY_STREAM_MAX_ENTRIES entries
+INTRADAY_STREAM_BUFFER_CAPACITY = 2 * INTRADAY_STREAM_MAX_ENTRIES
+# Redis key holding the version of the universal news, bumped on each ingestion
+UNIVERSAL_NEWS_VERSION_KEY = "universal_news_version"
 TICKER_METADATA_TABLE_NAME = "tickers"
 ANALYSIS_REPORTS_TABLE_NAME = "backtest_reports"
+# Rows fetched at a time when streaming backtest reports through a server-side cursor
+BACKTEST_REPORT_STREAM_BATCH_SIZE = 500
+# Rows per statement of batched upserts (backtest reports, evolved rules)
+BULK_UPSERT_CHUNK_SIZE = int(os.getenv("BULK_UPSERT_CHUNK_SIZE", 500))
+# Serve live universal news searches of the analysis from digests (top-ranked news of
+# each search) that are kept up to date on ingestion, instead of full-text searching.
+# Opt-in: existing databases need data_seeds/scripts/migrate_news_digests.py first
+UNIVERSAL_NEWS_DIGESTS = os.getenv("UNIVERSAL_NEWS_DIGESTS", "false").lower() == "true"
+# Number of top-ranked news kept per digest, i.e. the largest limit they can serve
+UNIVERSAL_NEWS_DIGEST_DEPTH = int(os.getenv("UNIVERSAL_NEWS_DIGEST_DEPTH", 20))
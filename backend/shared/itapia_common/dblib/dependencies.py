@@ -5,6 +5,7 @@ database connections and service instances in a clean and reusable way.
 """
 
 from fastapi import Depends
+from redis.asyncio import Redis as AsyncRedis
 from redis.client import Redis
 from sqlalchemy.orm import Session
 
@@ -14,7 +15,11 @@ from .services import (
     APIPricesService,
     BacktestReportService,
 )
-from .session import get_rdbms_session, get_redis_connection
+from .session import (
+    get_async_redis_connection,
+    get_rdbms_session,
+    get_redis_connection,
+)
 
 
 def get_metadata_service(
@@ -35,6 +40,7 @@ def get_prices_service(
     rdbms_session: Session = Depends(get_rdbms_session),
     redis_client: Redis = Depends(get_redis_connection),
     metadata_service: APIMetadataService = Depends(get_metadata_service),
+    async_redis_client: AsyncRedis = Depends(get_async_redis_connection),
 ) -> APIPricesService:
     """Create and return an APIPricesService instance.
 
@@ -42,11 +48,17 @@ def get_prices_service(
         rdbms_session (Session): Database session dependency.
         redis_client (Redis): Redis client dependency.
         metadata_service (APIMetadataService): Metadata service dependency.
+        async_redis_client (AsyncRedis): Asyncio Redis client dependency.
 
     Returns:
         APIPricesService: An instance of the prices service.
     """
-    return APIPricesService(rdbms_session, redis_client, metadata_service)
+    return APIPricesService(
+        rdbms_session,
+        redis_client,
+        metadata_service,
+        async_redis_client=async_redis_client,
+    )
 
 
 def get_news_service(
@@ -0,0 +1,68 @@
+# common/dblib/pagination.py
+"""Opaque cursors for keyset pagination.
+
+A cursor wraps the sort key of the last row of a page, so the next page can be
+read with a `WHERE key < cursor` filter instead of an OFFSET.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+_DATETIME_TAG = "$dt"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value[_DATETIME_TAG])
+    return value
+
+
+def encode_cursor(key: Tuple[Any, ...]) -> str:
+    """Encode a sort key into an opaque, URL-safe cursor.
+
+    Args:
+        key (Tuple[Any, ...]): Sort key values. Supported types are JSON scalars and datetimes.
+
+    Returns:
+        str: The cursor.
+    """
+    payload = json.dumps([_encode_value(value) for value in key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_size: int) -> Tuple[Any, ...]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor.
+        key_size (int): Expected number of values in the sort key.
+
+    Returns:
+        Tuple[Any, ...]: The sort key values.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not hold `key_size` values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = tuple(_decode_value(value) for value in values)
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}") from e
+
+    if len(values) != key_size:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}")
+    return values
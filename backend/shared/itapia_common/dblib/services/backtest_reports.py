@@ -6,29 +6,51 @@ handling the conversion between Pydantic models and database representations.
 """
 
 import json
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import itapia_common.dblib.db_config as dbcfg
+import numpy as np
 from itapia_common.dblib.crud.backtest_reports import BacktestReportCRUD
+from itapia_common.dblib.session import rdbms_session_scope
 from itapia_common.schemas.entities.analysis import QuickCheckAnalysisReport
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 
 class BacktestReportService:
     """Service for managing backtest reports in the database."""
 
-    def __init__(self, rdbms_session: Optional[Session]):
+    def __init__(
+        self,
+        rdbms_session: Optional[Session],
+        session_factory: Optional[sessionmaker] = None,
+    ):
         self.crud: BacktestReportCRUD = (
             BacktestReportCRUD(rdbms_session) if rdbms_session else None
         )
+        self.session_factory: sessionmaker = session_factory
 
     def set_rdbms_session(self, rdbms_session: Session) -> None:
         self.crud = BacktestReportCRUD(rdbms_session)
 
+    def set_session_factory(self, session_factory: sessionmaker) -> None:
+        self.session_factory = session_factory
+
     def check_health(self):
-        if self.crud is None:
+        if self.crud is None and self.session_factory is None:
             raise ValueError("Connection is empty!")
 
+    @contextmanager
+    def _crud_scope(self) -> Iterator[BacktestReportCRUD]:
+        """Yield a CRUD bound to a pooled session, or to the shared session as fallback."""
+        self.check_health()
+        if self.session_factory is not None:
+            with rdbms_session_scope(session_factory=self.session_factory) as session:
+                yield BacktestReportCRUD(session)
+        else:
+            yield self.crud
+
     def save_quick_check_report(
         self, report: QuickCheckAnalysisReport, backtest_date: datetime
     ) -> str:
@@ -44,18 +66,36 @@ class BacktestReportService:
         Returns:
             str: The ID of the saved report.
         """
-        self.check_health()
-        report_id = f'{report.ticker.upper()}_{backtest_date.strftime("%Y-%m-%d")}'
+        data_to_save = _to_report_row(report, backtest_date)
 
-        data_to_save = {
-            "report_id": report_id,
-            "backtest_date": backtest_date,
-            "ticker": report.ticker,
-            "report": json.dumps(report.model_dump(mode="json")),
-        }
+        with self._crud_scope() as crud:
+            crud.save_report(data_to_save)
+        return data_to_save["report_id"]
+
+    def save_quick_check_reports(
+        self,
+        reports: List[Tuple[QuickCheckAnalysisReport, datetime]],
+        chunk_size: int = dbcfg.BULK_UPSERT_CHUNK_SIZE,
+    ) -> List[str]:
+        """Save many QuickCheckAnalysisReports in a single transaction.
 
-        self.crud.save_report(data_to_save)
-        return report_id
+        Args:
+            reports (List[Tuple[QuickCheckAnalysisReport, datetime]]): Reports with their backtest dates.
+            chunk_size (int, optional): Maximum number of reports per statement.
+                Defaults to dbcfg.BULK_UPSERT_CHUNK_SIZE.
+
+        Returns:
+            List[str]: The IDs of the saved reports, in input order.
+        """
+        datas_to_save = [
+            _to_report_row(report, backtest_date) for report, backtest_date in reports
+        ]
+        if not datas_to_save:
+            return []
+
+        with self._crud_scope() as crud:
+            crud.save_reports(datas_to_save, chunk_size)
+        return [data["report_id"] for data in datas_to_save]
 
     def get_backtest_report(
         self, ticker: str, backtest_date: datetime
@@ -71,8 +111,8 @@ class BacktestReportService:
         Returns:
             Optional[QuickCheckAnalysisReport]: The report object, or None if not found.
         """
-        self.check_health()
-        report_data = self.crud.get_latest_report_before_date(ticker, backtest_date)
+        with self._crud_scope() as crud:
+            report_data = crud.get_latest_report_before_date(ticker, backtest_date)
 
         if not report_data:
             return None
@@ -91,8 +131,8 @@ class BacktestReportService:
         Returns:
             List[QuickCheckAnalysisReport]: A list of report objects.
         """
-        self.check_health()
-        report_datas = self.crud.get_reports_by_ticker(ticker)
+        with self._crud_scope() as crud:
+            report_datas = crud.get_reports_by_ticker(ticker)
         reports = []
         for report_data in report_datas:
             # The 'report' column is a JSONB string, which needs to be parsed.
@@ -102,3 +142,69 @@ class BacktestReportService:
             reports.append(report)
 
         return reports
+
+    def get_backtest_report_columns(
+        self, ticker: str, paths: List[str]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Retrieve selected values of all backtest reports of a ticker, column by column.
+
+        Only the requested values are extracted by the database and streamed in batches,
+        so no full report is transferred or validated.
+
+        Args:
+            ticker (str): The ticker symbol.
+            paths (List[str]): Dot-separated report paths, with list indices as numbers
+                (e.g. 'forecasting_report.forecasts.0.prediction.0').
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: The `generated_timestamp` of each
+                report, ordered by backtest date descending, and the values of each path.
+                Numerical paths are float64 arrays with NaN for missing values, other
+                paths are object arrays with None for missing values.
+        """
+        timestamps = []
+        values = [[] for _ in paths]
+        with self._crud_scope() as crud:
+            for batch in crud.stream_report_projections_by_ticker(
+                ticker,
+                [path.split(".") for path in paths],
+                dbcfg.BACKTEST_REPORT_STREAM_BATCH_SIZE,
+            ):
+                for row in batch:
+                    timestamps.append(row[0])
+                    for column, value in zip(values, row[1:]):
+                        column.append(value)
+
+        columns = {
+            path: _to_column_array(column) for path, column in zip(paths, values)
+        }
+        return np.array(timestamps, dtype=np.int64), columns
+
+
+def _to_report_row(
+    report: QuickCheckAnalysisReport, backtest_date: datetime
+) -> Dict[str, Any]:
+    """Convert a report to the row stored in the backtest reports table."""
+    return {
+        "report_id": f'{report.ticker.upper()}_{backtest_date.strftime("%Y-%m-%d")}',
+        "backtest_date": backtest_date,
+        "ticker": report.ticker,
+        "report": json.dumps(report.model_dump(mode="json")),
+    }
+
+
+def _to_column_array(values: list) -> np.ndarray:
+    """Store numbers as float64 with NaN for None, anything else as objects."""
+    is_numerical = all(
+        value is None
+        or (isinstance(value, (int, float)) and not isinstance(value, bool))
+        for value in values
+    )
+    if is_numerical:
+        return np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        )
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
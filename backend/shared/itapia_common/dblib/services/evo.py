@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+import itapia_common.dblib.db_config as dbcfg
 from itapia_common.dblib.crud.evo import EvoRuleCRUD, EvoRunCRUD
 from itapia_common.schemas.entities.evo import EvoRuleEntity, EvoRunEntity
 from itapia_common.schemas.entities.rules import RuleStatus
@@ -20,17 +21,25 @@ class EvoService:
         self.run_crud = EvoRunCRUD(rdbms_session)
         self.rule_crud = EvoRuleCRUD(rdbms_session)
 
-    def save_evo_rules(self, evo_rules: List[EvoRuleEntity]) -> None:
-        """Save a list of evolutionary rules to the database.
+    def save_evo_rules(
+        self,
+        evo_rules: List[EvoRuleEntity],
+        chunk_size: int = dbcfg.BULK_UPSERT_CHUNK_SIZE,
+    ) -> None:
+        """Save a list of evolutionary rules to the database in a single transaction.
 
         Args:
             evo_rules (List[EvoRuleEntity]): List of EvoRuleEntity objects to save.
+            chunk_size (int, optional): Maximum number of rules per statement.
+                Defaults to dbcfg.BULK_UPSERT_CHUNK_SIZE.
         """
         if self.rule_crud is None:
             raise ValueError("Connection to Rule DB is empty!")
-        for rule_entity in evo_rules:
-            rule_dict = rule_entity.model_dump()
-            self.rule_crud.create_or_update_rule(rule_entity.rule_id, rule_dict)
+        if not evo_rules:
+            return
+        self.rule_crud.create_or_update_rules(
+            [rule_entity.model_dump() for rule_entity in evo_rules], chunk_size
+        )
 
     def change_status_of_last_rules(self, evo_run_id: str) -> None:
         """Change the status of the last evolutionary rules to DEPRECATED.
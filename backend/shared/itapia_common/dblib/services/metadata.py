@@ -4,30 +4,214 @@ This module provides high-level interfaces for accessing ticker and sector metad
 handling caching and conversion between raw data and Pydantic models.
 """
 
-from typing import Any, Dict, List, Literal, Optional
+import threading
+import time
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
-from itapia_common.dblib.crud.metadata import get_all_sectors, get_ticker_metadata
+import itapia_common.dblib.db_config as dbcfg
+from itapia_common.dblib.crud.metadata import (
+    get_all_sectors,
+    get_ticker_data_versions,
+    get_ticker_metadata,
+)
+from itapia_common.dblib.session import (
+    get_singleton_session_factory,
+    rdbms_session_scope,
+)
 from itapia_common.logger import ITAPIALogger
 from itapia_common.schemas.entities.metadata import SectorMetadata, TickerMetadata
 from sqlalchemy import Engine
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 logger = ITAPIALogger("Metadata Service of DB")
 
 
+class MetadataIndex(NamedTuple):
+    """Immutable lookup tables built from one snapshot of ticker and sector metadata."""
+
+    tickers: Mapping[str, Mapping[str, Any]]
+    sectors: Tuple[SectorMetadata, ...]
+    sector_name_by_ticker: Mapping[str, str]
+    tickers_by_sector: Mapping[str, Tuple[str, ...]]
+    built_at: float
+
+
+def _build_metadata_index(rdbms_session: Session, refresh: bool) -> MetadataIndex:
+    ticker_metadata = get_ticker_metadata(
+        rdbms_connection=rdbms_session, refresh=refresh
+    )
+    sectors = tuple(SectorMetadata(**row) for row in get_all_sectors(rdbms_session))
+
+    tickers_by_sector: Dict[str, List[str]] = {
+        sector.sector_code: [] for sector in sectors
+    }
+    for ticker, info in ticker_metadata.items():
+        tickers_by_sector.setdefault(info["sector_code"], []).append(ticker)
+
+    return MetadataIndex(
+        tickers=MappingProxyType(
+            {
+                ticker: MappingProxyType(dict(info))
+                for ticker, info in ticker_metadata.items()
+            }
+        ),
+        sectors=sectors,
+        sector_name_by_ticker=MappingProxyType(
+            {ticker: info["sector_name"] for ticker, info in ticker_metadata.items()}
+        ),
+        tickers_by_sector=MappingProxyType(
+            {
+                code: tuple(sorted(tickers))
+                for code, tickers in tickers_by_sector.items()
+            }
+        ),
+        built_at=time.monotonic(),
+    )
+
+
+class _SharedMetadataIndex:
+    """Process-wide holder of the current `MetadataIndex`.
+
+    Service instances are often created per request, so the index lives here and is
+    shared by all of them. A stale index keeps being served while a background thread
+    builds its replacement, which is then swapped in atomically.
+    """
+
+    def __init__(self):
+        self._index: MetadataIndex | None = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._last_attempt = 0.0
+
+    def get(
+        self,
+        session_scope: Callable[[], ContextManager[Session]],
+        refresh_interval_seconds: float | None,
+    ) -> MetadataIndex:
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    with session_scope() as session:
+                        self._index = _build_metadata_index(session, refresh=False)
+                index = self._index
+        elif refresh_interval_seconds is not None:
+            now = time.monotonic()
+            if (
+                now - index.built_at > refresh_interval_seconds
+                and now - self._last_attempt > refresh_interval_seconds
+            ):
+                self._start_background_refresh()
+        return index
+
+    def refresh(self, session_scope: Callable[[], ContextManager[Session]]):
+        with session_scope() as session:
+            index = _build_metadata_index(session, refresh=True)
+        self._index = index
+        return index
+
+    def _start_background_refresh(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+            self._last_attempt = time.monotonic()
+
+        def run():
+            try:
+                # Request sessions may be closed by then, borrow a pooled one instead
+                self.refresh(
+                    lambda: rdbms_session_scope(
+                        session_factory=get_singleton_session_factory()
+                    )
+                )
+                logger.info("Metadata index refreshed in background.")
+            except Exception as e:
+                logger.err(f"Could not refresh metadata index, keeping old one: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="metadata-index-refresh", daemon=True).start()
+
+
+_SHARED_METADATA_INDEX = _SharedMetadataIndex()
+
+
 class APIMetadataService:
-    """Centralized service class for metadata-related API queries."""
+    """Centralized service class for metadata-related API queries.
 
-    def __init__(self, rdbms_session: Optional[Session]):
+    Lookups are served from a shared, immutable in-process index that is rebuilt in
+    the background every `refresh_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        rdbms_session: Optional[Session],
+        session_factory: Optional[sessionmaker] = None,
+        refresh_interval_seconds: (
+            float | None
+        ) = dbcfg.METADATA_REFRESH_INTERVAL_SECONDS,
+    ):
         self.rdbms_session: Session = None
-        self.metadata_cache: Dict[str, Any] = None
+        self.session_factory: sessionmaker = None
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._loaded = False
 
         if rdbms_session is not None:
             self.set_rdbms_session(rdbms_session)
 
+        if session_factory is not None:
+            self.set_session_factory(session_factory)
+
     def set_rdbms_session(self, rdbms_session: Session):
         self.rdbms_session = rdbms_session
-        self.metadata_cache = get_ticker_metadata(rdbms_connection=rdbms_session)
+        self._load_index()
+
+    def set_session_factory(self, session_factory: sessionmaker):
+        """Borrow a pooled session per unit of work instead of sharing one session.
+
+        Args:
+            session_factory (sessionmaker): Factory used to open pooled sessions.
+        """
+        self.session_factory = session_factory
+        self._load_index()
+
+    def _session_scope(self) -> ContextManager[Session]:
+        return rdbms_session_scope(self.rdbms_session, self.session_factory)
+
+    def _load_index(self):
+        _SHARED_METADATA_INDEX.get(self._session_scope, self.refresh_interval_seconds)
+        self._loaded = True
+
+    @property
+    def index(self) -> MetadataIndex:
+        """The current metadata index.
+
+        Raises:
+            ValueError: If no connection was ever set.
+        """
+        if not self._loaded:
+            raise ValueError("Metadata cache is missing, check the connection!")
+        return _SHARED_METADATA_INDEX.get(
+            self._session_scope, self.refresh_interval_seconds
+        )
+
+    @property
+    def metadata_cache(self) -> Mapping[str, Mapping[str, Any]] | None:
+        """Read-only ticker metadata keyed by upper-cased ticker."""
+        return self.index.tickers if self._loaded else None
 
     def get_validate_ticker_info(
         self, ticker: str, data_type: Literal["daily", "intraday", "news"]
@@ -46,16 +230,11 @@ class APIMetadataService:
         Raises:
             ValueError: If the ticker is not found in the metadata cache.
         """
-        if self.metadata_cache is None:
-            raise ValueError("Metadata cache is missing, check the connection!")
-
         logger.info(f"SERVICE: Preparing ticker info metadata of ticker {ticker}...")
-        ticker_info = self.metadata_cache.get(ticker.upper())
+        ticker_info = self.index.tickers.get(ticker.upper())
         if not ticker_info:
             raise ValueError(f"Ticker '{ticker}' not found.")
-        ticker_info["ticker"] = ticker
-        ticker_info["data_type"] = data_type
-        return TickerMetadata(**ticker_info)
+        return TickerMetadata(**ticker_info, ticker=ticker, data_type=data_type)
 
     def get_sector_code_of(self, ticker: str) -> str:
         """Get the sector code for a given ticker.
@@ -69,10 +248,8 @@ class APIMetadataService:
         Raises:
             ValueError: If the ticker is not found or has no sector code.
         """
-        if self.metadata_cache is None:
-            raise ValueError("Metadata cache is missing, check the connection!")
         logger.info(f"SERVICE: Get sector code of a ticker")
-        ticker_info = self.metadata_cache.get(ticker.upper())
+        ticker_info = self.index.tickers.get(ticker.upper())
         if not ticker_info:
             raise ValueError(f"Ticker '{ticker}' not found.")
         sector_code = ticker_info.get("sector_code")
@@ -80,21 +257,63 @@ class APIMetadataService:
             raise ValueError(f"Missing sector for ticker {ticker}")
         return sector_code
 
+    def get_sector_name_of(self, ticker: str) -> str:
+        """Get the sector name for a given ticker.
+
+        Args:
+            ticker (str): The ticker symbol to retrieve the sector name for.
+
+        Returns:
+            str: The sector name for the ticker.
+
+        Raises:
+            ValueError: If the ticker is not found.
+        """
+        sector_name = self.index.sector_name_by_ticker.get(ticker.upper())
+        if sector_name is None:
+            raise ValueError(f"Ticker '{ticker}' not found.")
+        return sector_name
+
+    def get_tickers_of_sector(self, sector_code: str) -> Tuple[str, ...]:
+        """Get the active tickers of a sector.
+
+        Args:
+            sector_code (str): The sector code.
+
+        Returns:
+            Tuple[str, ...]: Upper-cased tickers of the sector, empty if the sector is unknown.
+        """
+        return self.index.tickers_by_sector.get(sector_code.upper(), ())
+
     def get_all_sectors(self) -> List[SectorMetadata]:
         """Get a list of all supported sectors.
 
         Returns:
             List[SectorMetadata]: A list of sector metadata objects.
         """
-        if self.rdbms_session is None:
-            raise ValueError("Connection is empty!!")
         logger.info("SERVICE: Preparing all sectors...")
-        sector_rows = get_all_sectors(
-            self.rdbms_session
-        )  # Assuming metadata_crud.py file exists
+        return list(self.index.sectors)
+
+    def get_data_versions(self, ticker: str) -> Dict[str, Any]:
+        """Get the freshness markers of a ticker's daily prices and relevant news.
 
-        # Convert raw results to a list of Pydantic objects
-        return [SectorMetadata(**row) for row in sector_rows]
+        Cheap enough to run per request, so derived results can be keyed on it.
+
+        Args:
+            ticker (str): The ticker symbol.
+
+        Returns:
+            Dict[str, Any]: `last_daily_bar`, `last_daily_update` and `last_news_time`
+                as datetimes, or None if there is no data.
+        """
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            row = get_ticker_data_versions(
+                session,
+                ticker.upper(),
+                dbcfg.DAILY_PRICES_TABLE_NAME,
+                dbcfg.RELEVANT_NEWS_TABLE_NAME,
+            )
+        return dict(row)
 
 
 class DataMetadataService:
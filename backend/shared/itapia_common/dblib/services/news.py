@@ -4,16 +4,27 @@ This module provides high-level interfaces for retrieving and managing news data
 handling conversion between raw database records and Pydantic models.
 """
 
-from datetime import datetime
-from typing import Literal, Optional
+import time
+from datetime import datetime, timezone
+from typing import Iterable, List, Literal, Optional, Tuple
 
 import itapia_common.dblib.db_config as dbcfg
+import numpy as np
+import pandas as pd
 from itapia_common.dblib.crud.general_update import bulk_insert
 from itapia_common.dblib.crud.news import (
+    get_news_by_scopes,
     get_relevant_news,
     get_universal_news,
+    get_universal_news_history,
+    get_universal_news_version_async,
     get_universal_news_with_date,
+    refresh_universal_news_digests,
+    register_universal_news_digests,
+    set_universal_news_version,
 )
+from itapia_common.dblib.pagination import decode_cursor, encode_cursor
+from itapia_common.dblib.session import rdbms_session_scope
 from itapia_common.logger import ITAPIALogger
 from itapia_common.schemas.entities.news import (
     RelevantNews,
@@ -21,29 +32,84 @@ from itapia_common.schemas.entities.news import (
     UniversalNews,
     UniversalNewsPoint,
 )
+from redis.asyncio import Redis as AsyncRedis
+from redis.client import Redis
 from sqlalchemy import Engine
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from .metadata import APIMetadataService
 
 logger = ITAPIALogger("News Service of DB")
 
+_MIN_PUBLISH_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def news_to_text(title: str, summary: str | None) -> str:
+    """Combine the title and summary of an article into one text for analysis.
+
+    Args:
+        title (str): Title of the article.
+        summary (str | None): Summary of the article, if any.
+
+    Returns:
+        str: The title, followed by the summary when present.
+    """
+    if summary is not None:
+        return title + "." + summary
+    return title
+
 
 class APINewsService:
     """Service class for API-level news operations."""
 
     def __init__(
-        self, rdbms_session: Optional[Session], metadata_service: APIMetadataService
+        self,
+        rdbms_session: Optional[Session],
+        metadata_service: APIMetadataService,
+        session_factory: Optional[sessionmaker] = None,
+        async_redis_client: Optional[AsyncRedis] = None,
     ):
         self.rdbms_session: Session = None
+        self.session_factory: sessionmaker = None
+        self.async_redis_client: AsyncRedis = None
         self.metadata_service = metadata_service
         if rdbms_session is not None:
             self.set_rdbms_session(rdbms_session)
+        if session_factory is not None:
+            self.set_session_factory(session_factory)
+        if async_redis_client is not None:
+            self.set_async_redis_client(async_redis_client)
 
     def set_rdbms_session(self, rdbms_session: Session):
         self.rdbms_session = rdbms_session
 
-    def get_relevant_news(self, ticker: str, skip: int, limit: int) -> RelevantNews:
+    def set_session_factory(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def set_async_redis_client(self, async_redis_client: AsyncRedis):
+        self.async_redis_client = async_redis_client
+
+    async def get_universal_news_version_async(self) -> int:
+        """Get the version of the universal news, bumped by every ingestion.
+
+        Universal news are shared by all tickers, so their version is published by
+        the writer instead of being looked up in the database on each read.
+
+        Returns:
+            int: The version, 0 if no ingestion published one yet.
+
+        Raises:
+            ValueError: If the async Redis client is not set.
+        """
+        if self.async_redis_client is None:
+            raise ValueError("Connection is empty!!")
+        return await get_universal_news_version_async(
+            self.async_redis_client, dbcfg.UNIVERSAL_NEWS_VERSION_KEY
+        )
+
+    def get_relevant_news(
+        self, ticker: str, skip: int, limit: int, cursor: str | None = None
+    ) -> RelevantNews:
         """Retrieve and package news data for a specific ticker.
 
         This method fetches relevant news articles for a ticker and converts them
@@ -53,24 +119,30 @@ class APINewsService:
             ticker (str): The ticker symbol to retrieve news for.
             skip (int): Number of records to skip for pagination.
             limit (int): Maximum number of records to return.
+            cursor (str | None, optional): `next_cursor` of the previous page. Reading
+                pages by cursor costs the same for every page, unlike `skip`. Defaults to None.
 
         Returns:
             RelevantNews: A packaged news response with metadata and data points.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
         """
-        if self.rdbms_session is None:
-            raise ValueError("Connection is empty!!")
         logger.info(f"SERVICE: Preparing news data for ticker {ticker}")
         metadata = self.metadata_service.get_validate_ticker_info(
             ticker, data_type="news"
         )
+        after_key = decode_cursor(cursor, 3) if cursor is not None else None
 
-        news_rows = get_relevant_news(
-            self.rdbms_session,
-            dbcfg.RELEVANT_NEWS_TABLE_NAME,
-            ticker,
-            skip=skip,
-            limit=limit,
-        )
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            news_rows = get_relevant_news(
+                session,
+                dbcfg.RELEVANT_NEWS_TABLE_NAME,
+                ticker,
+                skip=skip,
+                limit=limit,
+                after_key=after_key,
+            )
 
         news_points = [
             RelevantNewsPoint(
@@ -85,7 +157,16 @@ class APINewsService:
             for row in news_rows
         ]
 
-        return RelevantNews(metadata=metadata, datas=news_points)
+        next_cursor = None
+        if news_rows and len(news_rows) == limit:
+            last = news_rows[-1]
+            next_cursor = encode_cursor(
+                (last["publish_time"], last["collect_time"], last["news_uuid"])
+            )
+
+        return RelevantNews(
+            metadata=metadata, datas=news_points, next_cursor=next_cursor
+        )
 
     def get_universal_news(
         self,
@@ -93,6 +174,7 @@ class APINewsService:
         skip: int,
         limit: int,
         before_date: datetime | None = None,
+        cursor: str | None = None,
     ) -> UniversalNews:
         """Retrieve and package universal news data based on search terms.
 
@@ -104,32 +186,39 @@ class APINewsService:
             skip (int): Number of records to skip for pagination.
             limit (int): Maximum number of records to return.
             before_date (datetime | None, optional): Maximum date for filtering news articles.
+            cursor (str | None, optional): `next_cursor` of the previous page. Ignored
+                when `before_date` is given. Defaults to None.
 
         Returns:
-            UniversalNews: A packaged news response with data points.
+            UniversalNews: A packaged news response with data points. `next_cursor` is
+                only set when `before_date` is not given.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
         """
-        if self.rdbms_session is None:
-            raise ValueError("Connection is empty!!")
         logger.info(f"SERVICE: Preparing {limit} universal news ...")
+        after_key = decode_cursor(cursor, 5) if cursor is not None else None
 
-        if before_date is None:
-            news_rows = get_universal_news(
-                self.rdbms_session,
-                dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
-                search_terms=search_terms,
-                skip=skip,
-                limit=limit,
-            )
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            if before_date is None:
+                news_rows = get_universal_news(
+                    session,
+                    dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+                    search_terms=search_terms,
+                    skip=skip,
+                    limit=limit,
+                    after_key=after_key,
+                )
 
-        else:
-            news_rows = get_universal_news_with_date(
-                self.rdbms_session,
-                dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
-                search_terms=search_terms,
-                before_date=before_date,
-                skip=skip,
-                limit=limit,
-            )
+            else:
+                news_rows = get_universal_news_with_date(
+                    session,
+                    dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+                    search_terms=search_terms,
+                    before_date=before_date,
+                    skip=skip,
+                    limit=limit,
+                )
 
         news_points = [
             UniversalNewsPoint(
@@ -144,27 +233,249 @@ class APINewsService:
             for row in news_rows
         ]
 
-        return UniversalNews(datas=news_points)
+        next_cursor = None
+        if before_date is None and news_rows and len(news_rows) == limit:
+            last = news_rows[-1]
+            next_cursor = encode_cursor(
+                (
+                    last["rank"],
+                    last["news_prior"],
+                    last["publish_time"],
+                    last["collect_time"],
+                    last["news_uuid"],
+                )
+            )
+
+        return UniversalNews(datas=news_points, next_cursor=next_cursor)
+
+    def get_news_texts_by_scopes(
+        self,
+        ticker: str | None,
+        relevant_limit: int,
+        universal_scopes: List[Tuple[str, int]],
+        total_limit: int,
+        before_date: datetime | None = None,
+    ) -> List[str]:
+        """Retrieve a combined news feed from several scopes in a single round trip.
+
+        Relevant news of the ticker and every universal news search run as one SQL
+        statement. Universal news found by several searches are kept once, in the
+        first scope that returned them. The feed is ordered newest first.
+
+        Live feeds (no `before_date`) read universal news from the digests of the searches
+        registered with `DataNewsService.register_universal_news_digests`, the other
+        searches run as full-text searches. Nothing is written.
+
+        Args:
+            ticker (str | None): Ticker whose relevant news are included. None skips them.
+            relevant_limit (int): Maximum number of relevant news.
+            universal_scopes (List[Tuple[str, int]]): (search terms, limit) of each universal
+                news search, in priority order.
+            total_limit (int): Maximum number of texts returned.
+            before_date (datetime | None, optional): If given, only universal news published
+                up to this date are used. Defaults to None.
+
+        Returns:
+            List[str]: News texts, each made up of the title and summary of an article.
+        """
+        logger.info(
+            f"SERVICE: Preparing news feed of {len(universal_scopes)} universal scopes ..."
+        )
+
+        use_digests = (
+            before_date is None
+            and dbcfg.UNIVERSAL_NEWS_DIGESTS
+            and all(
+                limit <= dbcfg.UNIVERSAL_NEWS_DIGEST_DEPTH
+                for _, limit in universal_scopes
+            )
+        )
+
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            news_rows = get_news_by_scopes(
+                session,
+                dbcfg.RELEVANT_NEWS_TABLE_NAME,
+                dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+                ticker.upper() if ticker is not None else None,
+                relevant_limit,
+                universal_scopes,
+                before_date=before_date,
+                digest_table_name=(
+                    dbcfg.UNIVERSAL_NEWS_DIGEST_TABLE_NAME if use_digests else None
+                ),
+                scope_table_name=dbcfg.UNIVERSAL_NEWS_DIGEST_SCOPE_TABLE_NAME,
+            )
+
+        return _merge_news_feed(
+            (
+                (
+                    news_to_text(row["title"], row["summary"]),
+                    row["title_hash"],
+                    row["publish_time"],
+                )
+                for row in news_rows
+            ),
+            total_limit,
+        )
+
+    def get_history_news_window(
+        self,
+        universal_scopes: List[Tuple[str, int]],
+        total_limit: int,
+        before_date: datetime,
+    ) -> "HistoryNewsWindow":
+        """Load every universal news of several searches up to a date in a single round trip.
+
+        Serves backtests, which need the news feed at many dates: the returned window
+        answers each date in memory instead of running the searches again.
+
+        Args:
+            universal_scopes (List[Tuple[str, int]]): (search terms, limit) of each universal
+                news search, in priority order.
+            total_limit (int): Maximum number of texts of each feed.
+            before_date (datetime): Latest date the window will be asked for.
+
+        Returns:
+            HistoryNewsWindow: News window of the searches.
+        """
+        logger.info(
+            f"SERVICE: Loading history news of {len(universal_scopes)} universal scopes up to {before_date} ..."
+        )
+
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            news_rows = get_universal_news_history(
+                session,
+                dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+                [search_terms for search_terms, _ in universal_scopes],
+                before_date,
+            )
+        return HistoryNewsWindow(universal_scopes, total_limit, news_rows)
+
+
+class HistoryNewsWindow:
+    """Universal news of several searches, loaded once and sliced by publish time.
+
+    Gives the same feed as `APINewsService.get_news_texts_by_scopes` with a `before_date`
+    and no relevant news, for any date up to the one the window was loaded for.
+    """
+
+    def __init__(
+        self, universal_scopes: List[Tuple[str, int]], total_limit: int, news_rows
+    ):
+        """Index the loaded news of each search.
+
+        Args:
+            universal_scopes (List[Tuple[str, int]]): (search terms, limit) of each search.
+            total_limit (int): Maximum number of texts of each feed.
+            news_rows: Rows of `get_universal_news_history`, ordered by search then rank.
+        """
+        self.limits = [limit for _, limit in universal_scopes]
+        self.total_limit = total_limit
+        texts = [[] for _ in universal_scopes]
+        hashes = [[] for _ in universal_scopes]
+        publish_times = [[] for _ in universal_scopes]
+        for row in news_rows:
+            idx = row["scope_idx"]
+            texts[idx].append(news_to_text(row["title"], row["summary"]))
+            hashes[idx].append(row["title_hash"])
+            publish_times[idx].append(row["publish_time"])
+
+        self._texts = texts
+        self._hashes = hashes
+        self._publish_times = publish_times
+        # Rank order is kept, a date only masks out articles published after it
+        self._publish_ts = [
+            np.array([t.timestamp() for t in times], dtype=np.float64)
+            for times in publish_times
+        ]
+
+    def get_news_texts(self, before_date: datetime) -> List[str]:
+        """Build the news feed as it was at a date.
+
+        Args:
+            before_date (datetime): Only news published up to this date are used.
+                A naive date is taken as UTC, as the database query does.
+
+        Returns:
+            List[str]: News texts, each made up of the title and summary of an article.
+        """
+        if before_date.tzinfo is None:
+            before_date = before_date.replace(tzinfo=timezone.utc)
+        before_ts = before_date.timestamp()
+        entries = []
+        for idx, limit in enumerate(self.limits):
+            positions = np.flatnonzero(self._publish_ts[idx] <= before_ts)[:limit]
+            entries.extend(
+                (
+                    self._texts[idx][pos],
+                    self._hashes[idx][pos],
+                    self._publish_times[idx][pos],
+                )
+                for pos in positions
+            )
+        return _merge_news_feed(entries, self.total_limit)
+
+
+def _merge_news_feed(
+    entries: Iterable[Tuple[str, str | None, datetime | None]], total_limit: int
+) -> List[str]:
+    """Deduplicate and order news of several scopes into one feed.
+
+    Args:
+        entries (Iterable[Tuple[str, str | None, datetime | None]]): (text, title hash,
+            publish time) of each article, scope by scope in priority order. Articles
+            without a title hash are never deduplicated.
+        total_limit (int): Maximum number of texts returned.
+
+    Returns:
+        List[str]: Texts ordered newest first.
+    """
+    seen_hashes = set()
+    texts_with_time = []
+    for text, title_hash, publish_time in entries:
+        if title_hash is not None:
+            if title_hash in seen_hashes:
+                continue
+            seen_hashes.add(title_hash)
+        texts_with_time.append((text, publish_time or _MIN_PUBLISH_TIME))
+
+    # Stable sort keeps the scope order for articles published at the same time
+    texts_with_time.sort(key=lambda x: x[1], reverse=True)
+    return [text for text, _ in texts_with_time[:total_limit]]
 
 
 class DataNewsService:
     """Service class for data-level news operations."""
 
-    def __init__(self, engine: Engine):
+    def __init__(self, engine: Engine, redis_client: Redis = None):
+        """Initialize the data news service.
+
+        Args:
+            engine (Engine): Database engine for RDBMS operations.
+            redis_client (Redis, optional): Redis client used to publish the version
+                of the universal news. Defaults to None.
+        """
         self.engine = engine
+        self.redis_client = redis_client
 
     def add_news(
         self,
-        data: list[dict],
+        data: list[dict] | pd.DataFrame,
         type: Literal["relevant", "universal"],
         unique_cols: list[str],
+        method: Literal["insert", "copy"] = "insert",
     ):
         """Add news articles to the database.
 
+        Universal news are also merged into the digests of the registered searches,
+        then a new version of the universal news is published to Redis.
+
         Args:
-            data (list[dict]): List of news article data to insert.
+            data (list[dict] | pd.DataFrame): News article data to insert.
             type (Literal['relevant', 'universal']): Type of news articles.
             unique_cols (list[str]): List of columns that make up a unique constraint.
+            method (Literal['insert', 'copy'], optional): Write method passed to
+                `bulk_insert`. Defaults to 'insert'.
         """
         if type == "relevant":
             table_name = dbcfg.RELEVANT_NEWS_TABLE_NAME
@@ -177,4 +488,68 @@ class DataNewsService:
             unique_cols,
             chunk_size=150,
             on_conflict="nothing",
+            method=method,
         )
+
+        if type == "universal" and dbcfg.UNIVERSAL_NEWS_DIGESTS and len(data) > 0:
+            if isinstance(data, pd.DataFrame):
+                news_uuids = data["news_uuid"].tolist()
+            else:
+                news_uuids = [record["news_uuid"] for record in data]
+            self.refresh_universal_news_digests(news_uuids)
+
+        if type == "universal" and self.redis_client is not None and len(data) > 0:
+            # Published after the insert committed, so readers of the new version
+            # always find the news it stands for
+            set_universal_news_version(
+                self.redis_client,
+                dbcfg.UNIVERSAL_NEWS_VERSION_KEY,
+                time.time_ns() // 1_000,
+            )
+
+    def register_universal_news_digests(self, search_terms_lst: list[str]) -> list[str]:
+        """Register universal news searches as digests and build the new ones.
+
+        Run by writers (e.g. on service startup) for the searches live feeds use, reads
+        never register searches. Registration and `refresh_universal_news_digests`
+        are serialized, so news added meanwhile always reach the new digests.
+
+        Args:
+            search_terms_lst (list[str]): Search terms to register.
+
+        Returns:
+            list[str]: Search terms that were newly registered.
+        """
+        with self.engine.begin() as connection:
+            registered = register_universal_news_digests(
+                connection,
+                dbcfg.UNIVERSAL_NEWS_DIGEST_TABLE_NAME,
+                dbcfg.UNIVERSAL_NEWS_DIGEST_SCOPE_TABLE_NAME,
+                dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+                search_terms_lst,
+                dbcfg.UNIVERSAL_NEWS_DIGEST_DEPTH,
+            )
+        if registered:
+            logger.info(f"Built universal news digests of {registered}")
+        return registered
+
+    def refresh_universal_news_digests(self, news_uuids: list[str]) -> list[str]:
+        """Merge stored universal news into the digests of the registered searches.
+
+        Args:
+            news_uuids (list[str]): UUIDs of the universal news to merge.
+
+        Returns:
+            list[str]: Search terms whose digest changed.
+        """
+        with self.engine.begin() as connection:
+            touched = refresh_universal_news_digests(
+                connection,
+                dbcfg.UNIVERSAL_NEWS_DIGEST_TABLE_NAME,
+                dbcfg.UNIVERSAL_NEWS_DIGEST_SCOPE_TABLE_NAME,
+                dbcfg.UNIVERSAL_NEWS_TABLE_NAME,
+                news_uuids,
+                dbcfg.UNIVERSAL_NEWS_DIGEST_DEPTH,
+            )
+        logger.info(f"Refreshed {len(touched)} universal news digests")
+        return touched
@@ -1,27 +1,74 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 import itapia_common.dblib.db_config as dbcfg
+import numpy as np
 import pandas as pd
 from itapia_common.dblib.crud.general_update import bulk_insert
+from itapia_common.dblib.crud.partitions import ensure_yearly_partitions, get_years
 from itapia_common.dblib.crud.prices import (
     add_intraday_candle,
+    get_daily_ohlcv,
     get_daily_prices,
-    get_intraday_prices,
+    get_daily_prices_by_sector,
+    get_intraday_prices_after_async,
+    get_intraday_prices_async,
     get_last_history_date,
-    get_latest_intraday_price,
-    get_tickers_by_sector,
+    get_latest_intraday_price_async,
 )
+from itapia_common.dblib.pagination import decode_cursor, encode_cursor
+from itapia_common.dblib.session import rdbms_session_scope
 from itapia_common.logger import ITAPIALogger
+from itapia_common.schemas.entities.metadata import TickerMetadata
 from itapia_common.schemas.entities.prices import Price, PriceDataPoint
+from redis.asyncio import Redis as AsyncRedis
 from redis.client import Redis
 from sqlalchemy import Engine
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from .metadata import APIMetadataService
 
 logger = ITAPIALogger("Prices Service of DB")
 
+_EPOCH_UTC = pd.Timestamp(0, tz="UTC")
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def _to_ohlcv_frame(price_df: pd.DataFrame) -> pd.DataFrame:
+    """Index a raw price frame by a UTC DatetimeIndex built from `collect_date`.
+
+    Args:
+        price_df (pd.DataFrame): Raw frame returned by the CRUD layer.
+
+    Returns:
+        pd.DataFrame: Frame indexed by `datetime_utc`, without the `collect_date` column.
+    """
+    price_df.index = pd.DatetimeIndex(
+        pd.to_datetime(price_df["collect_date"], utc=True), name="datetime_utc"
+    )
+    return price_df.drop(columns=["collect_date"])
+
+
+def _intraday_rows_to_price(
+    ticker: str, metadata: TickerMetadata, price_rows: list[dict] | None
+) -> Price:
+    """Package intraday rows returned by the CRUD layer into a Price payload.
+
+    Rows without a last update time cannot be placed in time and are skipped.
+
+    Raises:
+        ValueError: If there are no rows.
+    """
+    if not price_rows or price_rows[0] is None:
+        raise ValueError(f"Intraday data not found for ticker {ticker}")
+
+    price_points = [
+        PriceDataPoint(timestamp=int(row["last_update_utc"].timestamp()), **row)
+        for row in price_rows
+        if row["last_update_utc"] is not None
+    ]
+    return Price(metadata=metadata, datas=price_points)
+
 
 class APIPricesService:
     def __init__(
@@ -29,42 +76,70 @@ class APIPricesService:
         rdbms_session: Optional[Session],
         redis_client: Optional[Redis],
         metadata_service: APIMetadataService,
+        session_factory: Optional[sessionmaker] = None,
+        async_redis_client: Optional[AsyncRedis] = None,
     ):
         self.rdbms_session: Session = None
+        self.session_factory: sessionmaker = None
         self.redis_client: Redis = None
+        self.async_redis_client: AsyncRedis = None
         self.metadata_service = metadata_service
 
         if rdbms_session:
             self.set_rdbms_session(rdbms_session)
 
+        if session_factory:
+            self.set_session_factory(session_factory)
+
         if redis_client:
             self.set_redis_client(redis_client)
 
+        if async_redis_client:
+            self.set_async_redis_client(async_redis_client)
+
     def set_rdbms_session(self, rdbms_session: Session):
         self.rdbms_session = rdbms_session
 
+    def set_session_factory(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
     def set_redis_client(self, redis_client: Redis):
         self.redis_client = redis_client
 
-    def get_daily_prices(self, ticker: str, skip: int, limit: int) -> Price:
+    def set_async_redis_client(self, async_redis_client: AsyncRedis):
+        self.async_redis_client = async_redis_client
+
+    def get_daily_prices(
+        self, ticker: str, skip: int, limit: int, cursor: str | None = None
+    ) -> Price:
         """Retrieve and package historical daily price data for a ticker.
 
         Args:
             ticker (str): Ticker symbol to retrieve prices for.
             skip (int): Number of records to skip (for pagination).
             limit (int): Maximum number of records to return (for pagination).
+            cursor (str | None, optional): `next_cursor` of the previous page. Reading
+                pages by cursor costs the same for every page, unlike `skip`. Defaults to None.
 
         Returns:
             Price: Price data object containing metadata and price points.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
         """
-        if self.rdbms_session is None:
-            raise ValueError("Connection is empty!!")
         logger.info(f"SERVICE: Preparing daily prices for ticker {ticker}")
         metadata = self.metadata_service.get_validate_ticker_info(ticker, "daily")
-
-        price_rows = get_daily_prices(
-            self.rdbms_session, dbcfg.DAILY_PRICES_TABLE_NAME, ticker, skip, limit
-        )
+        before_date = decode_cursor(cursor, 1)[0] if cursor is not None else None
+
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            price_rows = get_daily_prices(
+                session,
+                dbcfg.DAILY_PRICES_TABLE_NAME,
+                ticker,
+                skip,
+                limit,
+                before_date=before_date,
+            )
 
         # Convert data to Pydantic objects
         price_points = [
@@ -72,7 +147,77 @@ class APIPricesService:
             for row in price_rows
         ]
 
-        return Price(metadata=metadata, datas=price_points)
+        next_cursor = None
+        if price_rows and len(price_rows) == limit:
+            next_cursor = encode_cursor((price_rows[-1]["collect_date"],))
+
+        return Price(metadata=metadata, datas=price_points, next_cursor=next_cursor)
+
+    def get_daily_ohlcv(
+        self, ticker: str, skip: int = 0, limit: int = 2000
+    ) -> pd.DataFrame:
+        """Retrieve daily OHLCV data of a ticker as a DataFrame, skipping Pydantic models.
+
+        This is the fast path for analysis and backtesting. API responses should keep
+        using `get_daily_prices`.
+
+        Args:
+            ticker (str): Ticker symbol to retrieve prices for.
+            skip (int, optional): Number of latest records to skip. Defaults to 0.
+            limit (int, optional): Maximum number of records to return. Defaults to 2000.
+
+        Returns:
+            pd.DataFrame: OHLCV DataFrame with a UTC DatetimeIndex named `datetime_utc`,
+                sorted by time. Empty if no data is found.
+
+        Raises:
+            ValueError: If the ticker is not found in metadata.
+        """
+        logger.info(f"SERVICE: Preparing daily OHLCV for ticker {ticker}")
+        self.metadata_service.get_validate_ticker_info(ticker, "daily")
+
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            price_df = get_daily_ohlcv(
+                session, dbcfg.DAILY_PRICES_TABLE_NAME, ticker, skip, limit
+            )
+
+        if price_df.empty:
+            return pd.DataFrame()
+
+        return _to_ohlcv_frame(price_df)[_OHLCV_COLUMNS]
+
+    def get_daily_ohlcv_by_sector(
+        self, sector_code: str, skip: int = 0, limit: int = 2000
+    ) -> pd.DataFrame:
+        """Retrieve daily OHLCV data of all tickers in a sector as one columnar DataFrame.
+
+        The tickers of the sector come from the metadata index, then all of them are
+        fetched in a single windowed query (top-N rows per ticker), without building
+        per-row Pydantic objects.
+
+        Args:
+            sector_code (str): Sector code to retrieve prices for.
+            skip (int, optional): Number of latest records to skip per ticker. Defaults to 0.
+            limit (int, optional): Maximum number of records per ticker. Defaults to 2000.
+
+        Returns:
+            pd.DataFrame: OHLCV DataFrame with a UTC DatetimeIndex named `datetime_utc`
+                and a `ticker` column, sorted by ticker then time. Empty if no data is found.
+        """
+        logger.info(f"SERVICE: Preparing daily OHLCV for sector {sector_code}...")
+        tickers = self.metadata_service.get_tickers_of_sector(sector_code)
+        if not tickers:
+            return pd.DataFrame()
+
+        with rdbms_session_scope(self.rdbms_session, self.session_factory) as session:
+            price_df = get_daily_prices_by_sector(
+                session, dbcfg.DAILY_PRICES_TABLE_NAME, tickers, skip, limit
+            )
+
+        if price_df.empty:
+            return pd.DataFrame()
+
+        return _to_ohlcv_frame(price_df)[_OHLCV_COLUMNS + ["ticker"]]
 
     def get_daily_prices_by_sector(
         self, sector_code: str, skip: int, limit: int
@@ -87,42 +232,43 @@ class APIPricesService:
         Returns:
             List[Price]: List of price data objects for each ticker in the sector.
         """
-        if self.rdbms_session is None:
-            raise ValueError("Connection is empty!!")
-        logger.info(f"SERVICE: Preparing daily prices for sector {sector_code}...")
-
-        # 1. Get list of tickers in this sector
-        tickers_in_sector = get_tickers_by_sector(
-            self.rdbms_session, dbcfg.TICKER_METADATA_TABLE_NAME, sector_code.upper()
-        )
-
         all_payloads: List[Price] = []
 
-        if not tickers_in_sector:
-            # Could return empty list or raise error depending on requirements
+        # 1. Get prices of all tickers in this sector with a single query
+        sector_df = self.get_daily_ohlcv_by_sector(sector_code, skip, limit)
+        if sector_df.empty:
             # Returning empty list is usually more client-friendly
             return all_payloads
 
-        # 2. Iterate through each ticker and create payload for it
-        for ticker in tickers_in_sector:
+        sector_df = sector_df.assign(
+            timestamp=(sector_df.index - _EPOCH_UTC) // pd.Timedelta(seconds=1)
+        )
+        # Missing values must become None, not NaN, to pass PriceDataPoint validation
+        sector_df = sector_df.astype(object).where(sector_df.notna(), None)
+
+        # 2. Split the columnar result into one payload per ticker
+        for ticker, ticker_df in sector_df.groupby("ticker", sort=False):
             try:
-                # --- REUSE EXISTING LOGIC ---
-                # Call function to get data for a single ticker
-                single_ticker_payload = self.get_daily_prices(
-                    ticker=ticker, skip=skip, limit=limit
+                metadata = self.metadata_service.get_validate_ticker_info(
+                    ticker, "daily"
                 )
-                if single_ticker_payload.datas:  # Only add if there is price data
-                    all_payloads.append(single_ticker_payload)
-            except Exception as e:
+            except ValueError as e:
                 # Skip tickers with errors and log
                 logger.warn(
                     f"Warning: Could not fetch data for ticker {ticker}. Error: {e}"
                 )
                 continue
 
+            # Keep the newest-first order of the single-ticker endpoint
+            records = ticker_df.drop(columns=["ticker"]).iloc[::-1].to_dict("records")
+            price_points = [PriceDataPoint(**record) for record in records]
+            all_payloads.append(Price(metadata=metadata, datas=price_points))
+
         return all_payloads
 
-    def get_intraday_prices(self, ticker: str, latest_only: bool = False) -> Price:
+    async def get_intraday_prices_async(
+        self, ticker: str, latest_only: bool = False
+    ) -> Price:
         """Retrieve and package intraday price data from Redis for a ticker.
 
         Args:
@@ -133,35 +279,54 @@ class APIPricesService:
             Price: Price data object containing metadata and price points.
 
         Raises:
-            ValueError: If no intraday data is found for the ticker.
+            ValueError: If no intraday data is found for the ticker or the async
+                Redis client is not set.
         """
-        if self.rdbms_session is None:
-            raise ValueError("Connection is empty!!")
-        if self.redis_client is None:
+        if self.async_redis_client is None:
             raise ValueError("Connection is empty!!")
         logger.info(f"SERVICE: Preparing intraday prices for ticker {ticker}")
         metadata = self.metadata_service.get_validate_ticker_info(ticker, "intraday")
 
         if latest_only:
             price_rows = [
-                get_latest_intraday_price(
-                    self.redis_client, ticker.upper(), dbcfg.INTRADAY_STREAM_PREFIX
+                await get_latest_intraday_price_async(
+                    self.async_redis_client,
+                    ticker.upper(),
+                    dbcfg.INTRADAY_STREAM_PREFIX,
                 )
             ]
         else:
-            price_rows = get_intraday_prices(
-                self.redis_client, ticker.upper(), dbcfg.INTRADAY_STREAM_PREFIX
+            price_rows = await get_intraday_prices_async(
+                self.async_redis_client, ticker.upper(), dbcfg.INTRADAY_STREAM_PREFIX
             )
 
-        if not price_rows or price_rows[0] is None:
-            raise ValueError(f"Intraday data not found for ticker {ticker}")
+        return _intraday_rows_to_price(ticker, metadata, price_rows)
 
-        price_points = [
-            PriceDataPoint(timestamp=int(row["last_update_utc"].timestamp()), **row)
-            for row in price_rows
-        ]
+    async def get_intraday_updates_async(
+        self, last_ids: Dict[str, str]
+    ) -> Dict[str, Tuple[str, Dict[str, np.ndarray], bool]]:
+        """Retrieve intraday candles appended after the last seen stream ID of each ticker.
 
-        return Price(metadata=metadata, datas=price_points)
+        Lets long-lived consumers keep their own copy of the streams and only pull
+        new entries on each request.
+
+        Args:
+            last_ids (Dict[str, str]): Last seen stream ID per upper-cased ticker.
+                Use "0-0" to read a stream from the beginning.
+
+        Returns:
+            Dict[str, Tuple[str, Dict[str, np.ndarray], bool]]: For each ticker, the
+                newest stream ID, the decoded new candles and whether the last seen
+                entry is still in the stream.
+
+        Raises:
+            ValueError: If the async Redis client is not set.
+        """
+        if self.async_redis_client is None:
+            raise ValueError("Connection is empty!!")
+        return await get_intraday_prices_after_async(
+            self.async_redis_client, last_ids, dbcfg.INTRADAY_STREAM_PREFIX
+        )
 
 
 class DataPricesService:
@@ -175,13 +340,32 @@ class DataPricesService:
         self.engine = engine
         self.redis_client = redis_client
 
-    def add_daily_prices(self, data: list[dict] | pd.DataFrame, unique_cols: list[str]):
+    def add_daily_prices(
+        self,
+        data: list[dict] | pd.DataFrame,
+        unique_cols: list[str],
+        method: Literal["insert", "copy"] = "insert",
+    ):
         """Add daily price data to the database.
 
+        The yearly partitions of the written dates are created first.
+
         Args:
             data (list[dict] | pd.DataFrame): Price data to add.
             unique_cols (list[str]): List of column names that uniquely identify records.
+            method (Literal['insert', 'copy'], optional): Write method passed to
+                `bulk_insert`. Use 'copy' for large backfills. Defaults to 'insert'.
         """
+        if len(data) > 0:
+            collect_dates = (
+                data["collect_date"]
+                if isinstance(data, pd.DataFrame)
+                else [record["collect_date"] for record in data]
+            )
+            with self.engine.begin() as connection:
+                ensure_yearly_partitions(
+                    connection, dbcfg.DAILY_PRICES_TABLE_NAME, get_years(collect_dates)
+                )
         bulk_insert(
             self.engine,
             dbcfg.DAILY_PRICES_TABLE_NAME,
@@ -189,6 +373,7 @@ class DataPricesService:
             unique_cols,
             chunk_size=2000,
             on_conflict="update",
+            method=method,
         )
 
     def add_intraday_prices(self, candle_data: dict, ticker: str):
@@ -203,7 +388,8 @@ class DataPricesService:
             ticker,
             candle_data,
             dbcfg.INTRADAY_STREAM_PREFIX,
-            max_entries=300,
+            max_entries=dbcfg.INTRADAY_STREAM_MAX_ENTRIES,
+            packed=dbcfg.REDIS_PACKED_CANDLES,
         )
 
     def get_last_history_date(self, tickers: list[str], default_return_date: datetime):
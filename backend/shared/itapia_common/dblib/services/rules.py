@@ -4,28 +4,50 @@ This module provides a high-level interface for managing business rules,
 handling the conversion between Pydantic models and database representations.
 """
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
 from itapia_common.dblib.crud.rules import RuleCRUD
+from itapia_common.dblib.session import rdbms_session_scope
 from itapia_common.schemas.entities.rules import RuleEntity, RuleStatus, SemanticType
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 
 class RuleService:
     """Service class for managing business rules."""
 
-    def __init__(self, rdbms_session: Optional[Session]):
+    def __init__(
+        self,
+        rdbms_session: Optional[Session],
+        session_factory: Optional[sessionmaker] = None,
+    ):
         self.crud: RuleCRUD = None
+        self.session_factory: sessionmaker = None
         if rdbms_session is not None:
             self.set_rdbms_session(rdbms_session)
+        if session_factory is not None:
+            self.set_session_factory(session_factory)
 
     def set_rdbms_session(self, rdbms_session: Session) -> None:
         self.crud = RuleCRUD(rdbms_session)
 
+    def set_session_factory(self, session_factory: sessionmaker) -> None:
+        self.session_factory = session_factory
+
     def check_health(self):
-        if self.crud is None:
+        if self.crud is None and self.session_factory is None:
             raise ValueError("Connection is empty!")
 
+    @contextmanager
+    def _crud_scope(self) -> Iterator[RuleCRUD]:
+        """Yield a CRUD bound to a pooled session, or to the shared session as fallback."""
+        self.check_health()
+        if self.session_factory is not None:
+            with rdbms_session_scope(session_factory=self.session_factory) as session:
+                yield RuleCRUD(session)
+        else:
+            yield self.crud
+
     def save_rule(self, rule_entity: RuleEntity) -> str:
         """Take a Rule object, convert it to a dict, save it to the database
         through the CRUD layer, and return the saved Rule object.
@@ -36,12 +58,12 @@ class RuleService:
         Returns:
             str: The ID of the saved rule.
         """
-        self.check_health()
         # Convert the business object to raw data
         rule_dict = rule_entity.model_dump()
 
         # Call CRUD to perform the database operation
-        res_uuid = self.crud.create_or_update_rule(rule_entity.rule_id, rule_dict)
+        with self._crud_scope() as crud:
+            res_uuid = crud.create_or_update_rule(rule_entity.rule_id, rule_dict)
 
         # Return the original Rule object so it can continue to be used
         return res_uuid
@@ -56,9 +78,9 @@ class RuleService:
         Returns:
             RuleEntity | None: The rule entity if found, otherwise None.
         """
-        self.check_health()
         # Get raw data
-        rule_data = self.crud.get_rule_by_id(rule_id)
+        with self._crud_scope() as crud:
+            rule_data = crud.get_rule_by_id(rule_id)
 
         if rule_data:
             # "Assemble" the raw data into a business object
@@ -78,15 +100,15 @@ class RuleService:
         Returns:
             List[RuleEntity]: A list of rule entities.
         """
-        self.check_health()
         # Convert the business object (Enum) to raw data (str)
         purpose_name = purpose.name
         rule_status_name = rule_status.name
 
         # Get list of raw data
-        list_of_rule_data = self.crud.get_rules_by_purpose(
-            purpose_name, rule_status_name
-        )
+        with self._crud_scope() as crud:
+            list_of_rule_data = crud.get_rules_by_purpose(
+                purpose_name, rule_status_name
+            )
 
         # "Assemble" each dictionary into a Rule object
         return [RuleEntity(**row) for row in list_of_rule_data]
@@ -100,9 +122,9 @@ class RuleService:
         Returns:
             List[RuleEntity]: A list of all active rule entities.
         """
-        self.check_health()
         # Get list of raw data
-        list_of_rule_data = self.crud.get_all_rules(rule_status.name)
+        with self._crud_scope() as crud:
+            list_of_rule_data = crud.get_all_rules(rule_status.name)
 
         # "Assemble" each dictionary into a Rule object
         return [RuleEntity(**row) for row in list_of_rule_data]
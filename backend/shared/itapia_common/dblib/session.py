@@ -6,9 +6,11 @@ and connections for both PostgreSQL and Redis, using singleton patterns
 for efficient resource usage.
 """
 
-from typing import Generator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Generator, Iterator, Optional
 
 import redis
+import redis.asyncio
 import redis.exceptions
 from redis.client import Redis
 from sqlalchemy import Engine, create_engine
@@ -17,24 +19,52 @@ from sqlalchemy.orm import Session, sessionmaker
 from . import db_config as cfg
 
 _SINGLETON_RDBMS_ENGINE = None
+_SINGLETON_SESSION_FACTORY = None
 _SINGLETON_REDIS_CLIENT = None
+_SINGLETON_ASYNC_REDIS_CLIENT = None
 
 
 def get_singleton_rdbms_engine() -> Engine:
     """Get or create a singleton database engine instance.
 
     This function ensures only one database engine is created and reused
-    throughout the application lifecycle.
+    throughout the application lifecycle. The engine owns a sized connection pool
+    configured through the `POSTGRES_POOL_*` environment variables.
 
     Returns:
         Engine: A SQLAlchemy database engine instance.
     """
     global _SINGLETON_RDBMS_ENGINE
     if _SINGLETON_RDBMS_ENGINE is None:
-        _SINGLETON_RDBMS_ENGINE = create_engine(cfg.DATABASE_URL, pool_pre_ping=True)
+        _SINGLETON_RDBMS_ENGINE = create_engine(
+            cfg.DATABASE_URL,
+            pool_pre_ping=True,
+            pool_size=cfg.POSTGRES_POOL_SIZE,
+            max_overflow=cfg.POSTGRES_MAX_OVERFLOW,
+            pool_timeout=cfg.POSTGRES_POOL_TIMEOUT,
+            pool_recycle=cfg.POSTGRES_POOL_RECYCLE,
+        )
     return _SINGLETON_RDBMS_ENGINE
 
 
+def get_singleton_session_factory() -> sessionmaker:
+    """Get or create a singleton session factory bound to the singleton engine.
+
+    Each call of the returned factory opens a new, independent session that borrows
+    a connection from the engine pool, so it is safe to use one session per thread
+    or per unit of work.
+
+    Returns:
+        sessionmaker: A SQLAlchemy session factory.
+    """
+    global _SINGLETON_SESSION_FACTORY
+    if _SINGLETON_SESSION_FACTORY is None:
+        _SINGLETON_SESSION_FACTORY = sessionmaker(
+            autocommit=False, autoflush=False, bind=get_singleton_rdbms_engine()
+        )
+    return _SINGLETON_SESSION_FACTORY
+
+
 def get_singleton_redis_client() -> Redis:
     """Get or create a singleton Redis client instance.
 
@@ -59,6 +89,41 @@ def get_singleton_redis_client() -> Redis:
     return _SINGLETON_REDIS_CLIENT
 
 
+def get_singleton_async_redis_client() -> redis.asyncio.Redis:
+    """Get or create a singleton asyncio Redis client instance.
+
+    The client owns a connection pool bounded by `REDIS_MAX_CONNECTIONS`, so async
+    handlers can read Redis without blocking the event loop or borrowing executor
+    threads. Connections are opened lazily and are bound to the event loop that
+    first uses them.
+
+    Returns:
+        redis.asyncio.Redis: An asyncio Redis client instance.
+    """
+    global _SINGLETON_ASYNC_REDIS_CLIENT
+    if _SINGLETON_ASYNC_REDIS_CLIENT is None:
+        pool = redis.asyncio.ConnectionPool(
+            host=cfg.REDIS_HOST,
+            port=cfg.REDIS_PORT,
+            db=0,
+            decode_responses=True,
+            max_connections=cfg.REDIS_MAX_CONNECTIONS,
+        )
+        _SINGLETON_ASYNC_REDIS_CLIENT = redis.asyncio.Redis(connection_pool=pool)
+    return _SINGLETON_ASYNC_REDIS_CLIENT
+
+
+async def close_singleton_async_redis_client() -> None:
+    """Close the singleton asyncio Redis client and disconnect its pool.
+
+    Meant to be awaited on application shutdown, from the event loop that used it.
+    """
+    global _SINGLETON_ASYNC_REDIS_CLIENT
+    if _SINGLETON_ASYNC_REDIS_CLIENT is not None:
+        await _SINGLETON_ASYNC_REDIS_CLIENT.aclose(close_connection_pool=True)
+        _SINGLETON_ASYNC_REDIS_CLIENT = None
+
+
 def get_rdbms_session() -> Generator[Session, None, None]:
     """FastAPI dependency: Open a new database session for each request.
 
@@ -68,8 +133,7 @@ def get_rdbms_session() -> Generator[Session, None, None]:
     Yields:
         Session: A SQLAlchemy database session.
     """
-    engine = get_singleton_rdbms_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    SessionLocal = get_singleton_session_factory()
     rdbms_session = SessionLocal()
     try:
         yield rdbms_session
@@ -77,6 +141,36 @@ def get_rdbms_session() -> Generator[Session, None, None]:
         rdbms_session.close()
 
 
+@contextmanager
+def rdbms_session_scope(
+    rdbms_session: Optional[Session] = None,
+    session_factory: Optional[sessionmaker] = None,
+) -> Iterator[Session]:
+    """Provide a database session for a single unit of work.
+
+    If a session factory is given, a fresh session is borrowed from the pool and
+    closed (returning its connection) when the block exits. Otherwise the bound
+    session is yielded as-is and its lifecycle stays with the caller.
+
+    Args:
+        rdbms_session (Optional[Session]): A session owned by the caller.
+        session_factory (Optional[sessionmaker]): A factory used to open pooled sessions.
+
+    Yields:
+        Session: A SQLAlchemy database session.
+
+    Raises:
+        ValueError: If neither a session nor a session factory is provided.
+    """
+    if session_factory is not None:
+        with session_factory() as pooled_session:
+            yield pooled_session
+    elif rdbms_session is not None:
+        yield rdbms_session
+    else:
+        raise ValueError("Connection is empty!!")
+
+
 def get_redis_connection() -> Generator[Redis | None, None, None]:
     """FastAPI dependency: Provide an initialized Redis client.
 
@@ -87,3 +181,14 @@ def get_redis_connection() -> Generator[Redis | None, None, None]:
     """
     # Simply yield the already initialized singleton client
     yield get_singleton_redis_client()
+
+
+async def get_async_redis_connection() -> (
+    AsyncGenerator[redis.asyncio.Redis | None, None]
+):
+    """FastAPI dependency: Provide the asyncio Redis client.
+
+    Yields:
+        redis.asyncio.Redis | None: An asyncio Redis client instance.
+    """
+    yield get_singleton_async_redis_client()
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Set, Tuple
 
 from itapia_common.rules.exceptions import NotFoundVarPathError
+from itapia_common.rules.projection import ProjectedReport
 from itapia_common.schemas.entities.analysis import QuickCheckAnalysisReport
 from itapia_common.schemas.entities.rules import NodeType, SemanticType
 
@@ -222,6 +223,14 @@ class VarNode(_TreeNode):
         Raises:
             NotFoundVarPathError: If the path cannot be resolved
         """
+        if isinstance(report, ProjectedReport):
+            # Values were already extracted by the database, no traversal needed.
+            # A path that was not projected cannot be resolved, like a wrong path
+            # of a full report; a projected path without a value is just None.
+            if not report.has_path(self.path):
+                raise NotFoundVarPathError(self.path)
+            return report.get_value(self.path)
+
         try:
             keys = self.path.split(".")
             value = report
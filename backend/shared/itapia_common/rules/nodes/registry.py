@@ -168,3 +168,18 @@ def get_spec_ent(name: str) -> NodeSpecEntity:
         return_type=spec.return_type,
         args_type=spec.args_type,
     )
+
+
+def get_variable_paths() -> List[str]:
+    """Get the report paths read by all registered variable nodes.
+
+    Returns:
+        List[str]: Unique dot-separated report paths, in registration order
+    """
+    paths: Dict[str, None] = {}
+    for spec in _NODE_REGISTRY.values():
+        path = spec.params.get("path")
+        if spec.node_type == NodeType.VARIABLE and path is not None:
+            paths[path] = None
+
+    return list(paths)
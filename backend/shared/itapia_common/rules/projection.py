@@ -0,0 +1,117 @@
+"""
+Columnar projections of analysis reports for rule evaluation.
+
+Rules only read the leaf values addressed by variable node paths, so a backtest can
+keep just those values of each report instead of full QuickCheckAnalysisReport objects.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+from itapia_common.rules.exceptions import NotFoundVarPathError
+
+
+class ReportMatrix:
+    """Values of a fixed set of report paths for many reports, stored column by column.
+
+    Numerical paths are stored as float64 arrays with NaN for missing values, other
+    paths as object arrays with None for missing values.
+    """
+
+    def __init__(
+        self, generated_timestamps: np.ndarray, columns: Dict[str, np.ndarray]
+    ):
+        """Initialize the matrix.
+
+        Args:
+            generated_timestamps (np.ndarray): `generated_timestamp` of each report.
+            columns (Dict[str, np.ndarray]): Values of each path, one entry per report.
+        """
+        self.generated_timestamps = generated_timestamps
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.generated_timestamps)
+
+    def has_path(self, path: str) -> bool:
+        """Check whether a path was projected.
+
+        Args:
+            path (str): Dot-separated report path.
+
+        Returns:
+            bool: True if the matrix holds a column for the path.
+        """
+        return path in self.columns
+
+    def get_value(self, path: str, row: int) -> Any:
+        """Get the value of a path in a report.
+
+        Args:
+            path (str): Dot-separated report path.
+            row (int): Position of the report.
+
+        Returns:
+            Any: The value, or None if the report has no value at this path.
+
+        Raises:
+            NotFoundVarPathError: If the path was not projected.
+        """
+        column = self.columns.get(path)
+        if column is None:
+            raise NotFoundVarPathError(path)
+
+        value = column[row]
+        if column.dtype == np.float64:
+            return None if np.isnan(value) else float(value)
+        return value
+
+    def rows(self) -> List["ProjectedReport"]:
+        """Get a lightweight report view of each row.
+
+        Returns:
+            List[ProjectedReport]: One view per report, in matrix order.
+        """
+        return [ProjectedReport(self, row) for row in range(len(self))]
+
+
+class ProjectedReport:
+    """A single report of a ReportMatrix, accepted by `Rule.execute` in place of a full report."""
+
+    __slots__ = ("matrix", "row", "generated_timestamp")
+
+    def __init__(self, matrix: ReportMatrix, row: int):
+        """Initialize the view.
+
+        Args:
+            matrix (ReportMatrix): Matrix holding the values.
+            row (int): Position of the report in the matrix.
+        """
+        self.matrix = matrix
+        self.row = row
+        self.generated_timestamp = int(matrix.generated_timestamps[row])
+
+    def has_path(self, path: str) -> bool:
+        """Check whether a path was projected.
+
+        Args:
+            path (str): Dot-separated report path.
+
+        Returns:
+            bool: True if the report holds a value, possibly None, for the path.
+        """
+        return self.matrix.has_path(path)
+
+    def get_value(self, path: str) -> Any:
+        """Get the value of a path in this report.
+
+        Args:
+            path (str): Dot-separated report path.
+
+        Returns:
+            Any: The value, or None if the report has no value at this path.
+
+        Raises:
+            NotFoundVarPathError: If the path was not projected.
+        """
+        return self.matrix.get_value(path, self.row)
@@ -28,6 +28,9 @@ class RelevantNews(BaseModel):
 
     metadata: TickerMetadata = Field(..., description="Metadata of a ticker")
     datas: List[RelevantNewsPoint] = Field(..., description="News items")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page, None on the last page"
+    )
 
 
 class UniversalNewsPoint(RelevantNewsPoint):
@@ -44,3 +47,6 @@ class UniversalNews(BaseModel):
     """Universal news collection."""
 
     datas: List[UniversalNewsPoint] = Field(..., description="Universal news items")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page, None on the last page"
+    )
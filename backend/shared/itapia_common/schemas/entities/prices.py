@@ -29,3 +29,6 @@ class Price(BaseModel):
 
     metadata: TickerMetadata = Field(..., description="Metadata of a ticker")
     datas: List[PriceDataPoint] = Field(..., description="Daily data or intraday data")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page, None on the last page"
+    )
@@ -3,7 +3,7 @@ from setuptools import find_packages, setup
 setup(
     name="itapia_common",
     version="0.5.1",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     description="The common lib to connect db, get logger of ITAPIA, and define schemas between modules",
     install_requires=[
         "numpy==1.26.4",
@@ -11,7 +11,7 @@ setup(
         "sqlalchemy",
         "psycopg2-binary",
         "python-dotenv",
-        "redis",
+        "redis>=5.0.1",
         "pydantic",
         "fastapi",
     ],
@@ -0,0 +1 @@
+"""Tests for the itapia_common shared library."""
@@ -0,0 +1,9 @@
+"""pytest configuration for itapia_common tests."""
+
+import os
+
+# db_config reads the connection settings at import time; the tests never open a
+# real PostgreSQL connection, so placeholders are enough.
+os.environ.setdefault("POSTGRES_USER", "itapia_test")
+os.environ.setdefault("POSTGRES_PASSWORD", "itapia_test")
+os.environ.setdefault("POSTGRES_DB", "itapia_test")
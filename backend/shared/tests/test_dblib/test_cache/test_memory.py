@@ -0,0 +1,257 @@
+"""Tests for in-memory caches."""
+
+import asyncio
+
+import pytest
+from itapia_common.dblib.cache import memory
+from itapia_common.dblib.cache.memory import (
+    AsyncInMemoryCache,
+    CacheStats,
+    SimpleInMemoryCache,
+    SingletonInMemoryCache,
+)
+
+
+class _FakeClock:
+    """Stand-in for the `time` module with a manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _FakeClock:
+    """Clock driving the TTL of the in-memory caches."""
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(memory, "time", fake_clock)
+    return fake_clock
+
+
+class _Loader:
+    """Async value factory counting its calls and waiting on an event."""
+
+    def __init__(self, value="loaded", error: Exception | None = None):
+        self.value = value
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+async def _settle():
+    """Let every runnable task reach its next await."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Callers missing the same key wait for a single load."""
+    cache = AsyncInMemoryCache()
+    loader = _Loader()
+
+    tasks = [
+        asyncio.create_task(cache.get_or_set_with_lock("key", loader)) for _ in range(5)
+    ]
+    await _settle()
+    loader.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == ["loaded"] * 5
+    assert loader.calls == 1
+    assert cache.get("key") == "loaded"
+
+
+@pytest.mark.asyncio
+async def test_different_keys_load_in_parallel():
+    """Loads for different keys do not wait for each other."""
+    cache = AsyncInMemoryCache()
+    first, second = _Loader("first"), _Loader("second")
+
+    first_task = asyncio.create_task(cache.get_or_set_with_lock("a", first))
+    second_task = asyncio.create_task(cache.get_or_set_with_lock("b", second))
+    await _settle()
+    second.release.set()
+
+    assert await second_task == "second"
+    assert not first_task.done()
+    first.release.set()
+    assert await first_task == "first"
+
+
+@pytest.mark.asyncio
+async def test_loader_error_reaches_all_waiters_then_retries():
+    """A failed load raises in every waiter and the next call loads again."""
+    cache = AsyncInMemoryCache()
+    failing = _Loader(error=RuntimeError("database down"))
+
+    tasks = [
+        asyncio.create_task(cache.get_or_set_with_lock("key", failing))
+        for _ in range(3)
+    ]
+    await _settle()
+    failing.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert failing.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get("key") is None
+
+    retry = _Loader("recovered")
+    retry.release.set()
+    assert await cache.get_or_set_with_lock("key", retry) == "recovered"
+    assert retry.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_loader_is_taken_over_by_waiter():
+    """If the loading caller is cancelled, a waiter runs its own load instead."""
+    cache = AsyncInMemoryCache()
+    first = _Loader("first")
+    second = _Loader("second")
+    second.release.set()
+
+    loading_task = asyncio.create_task(cache.get_or_set_with_lock("key", first))
+    await _settle()
+    waiting_task = asyncio.create_task(cache.get_or_set_with_lock("key", second))
+    await _settle()
+    assert second.calls == 0
+
+    loading_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await loading_task
+
+    assert await waiting_task == "second"
+    assert second.calls == 1
+    assert cache.get("key") == "second"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_load():
+    """Cancelling a waiter leaves the shared load running for the others."""
+    cache = AsyncInMemoryCache()
+    loader = _Loader()
+
+    loading_task = asyncio.create_task(cache.get_or_set_with_lock("key", loader))
+    await _settle()
+    waiting_task = asyncio.create_task(cache.get_or_set_with_lock("key", loader))
+    await _settle()
+
+    waiting_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+
+    loader.release.set()
+    assert await loading_task == "loaded"
+    assert loader.calls == 1
+
+
+def test_lru_evicts_least_recently_used_first():
+    """Reading an entry protects it, the least recently used one is evicted."""
+    cache = SimpleInMemoryCache(max_entries=3)
+    for key in ["a", "b", "c"]:
+        cache.set(key, key.upper())
+
+    assert cache.get("a") == "A"
+    cache.set("d", "D")
+    cache.set("e", "E")
+
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert [cache.get(key) for key in ["a", "d", "e"]] == ["A", "D", "E"]
+    assert cache.stats().evictions == 2
+
+
+def test_byte_budget_keeps_newest_entry():
+    """The byte budget evicts old entries but never the entry just stored."""
+    cache = SimpleInMemoryCache(max_bytes=10, size_of=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "yyyy")
+    cache.set("c", "zzzz")
+
+    assert cache.get("a") is None
+    assert cache.stats().bytes == 8
+
+    cache.set("big", "w" * 50)
+
+    assert cache.get("big") == "w" * 50
+    assert cache.stats().entries == 1
+    assert cache.stats().bytes == 50
+
+
+def test_ttl_expiry_counters(clock):
+    """Expired entries are dropped on read and counted as expirations and misses."""
+    cache = SimpleInMemoryCache(ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    clock.now += 30
+    assert cache.get("a") == 1
+    clock.now += 31
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("missing") is None
+
+    assert cache.stats() == CacheStats(
+        hits=1, misses=3, evictions=0, expirations=2, entries=0, bytes=0
+    )
+
+
+def test_get_or_set_counts_one_miss_per_load():
+    """A load counts one miss, later reads count as hits."""
+    cache = SimpleInMemoryCache()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set_with_lock("key", factory) == "value"
+    assert cache.get_or_set_with_lock("key", factory) == "value"
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_cache_reloads_expired_entry(clock):
+    """An expired entry of the async cache is loaded again on the next call."""
+    cache = AsyncInMemoryCache(ttl_seconds=10)
+    loader = _Loader("first")
+    loader.release.set()
+
+    assert await cache.get_or_set_with_lock("key", loader) == "first"
+    clock.now += 11
+    loader.value = "second"
+    assert await cache.get_or_set_with_lock("key", loader) == "second"
+
+    assert loader.calls == 2
+    assert cache.stats().expirations == 1
+
+
+def test_singleton_cache_configure_trims_existing_entries():
+    """Configuring the shared cache applies the new bounds to stored entries."""
+    cache = SingletonInMemoryCache()
+    cache.clean_cache()
+    try:
+        for key in ["a", "b", "c"]:
+            cache.get_or_set(key, lambda key=key: key.upper())
+
+        cache.configure(max_entries=2)
+
+        assert cache.stats().entries == 2
+        assert cache.get_or_set("c", lambda: "reloaded") == "C"
+        assert cache.get_or_set("a", lambda: "reloaded") == "reloaded"
+    finally:
+        cache.configure()
+        cache.clean_cache()
@@ -0,0 +1,193 @@
+"""Tests for bulk write helpers."""
+
+import csv
+import io
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from itapia_common.dblib.crud import general_update
+from itapia_common.dblib.crud.general_update import _bulk_copy_upsert
+from sqlalchemy import Column, Float, MetaData, String, Table
+from sqlalchemy.dialects import postgresql
+
+
+class _FakeCursor:
+    """DBAPI cursor recording the CSV sent by each COPY."""
+
+    def __init__(self):
+        self.copies = []
+
+    def copy_expert(self, sql, buffer):
+        self.copies.append((sql, buffer.getvalue()))
+
+
+class _FakeConnection:
+    """Connection recording the SQL run by the COPY upsert."""
+
+    def __init__(self):
+        self.dialect = postgresql.dialect()
+        self.cursor = _FakeCursor()
+        self.connection = MagicMock()
+        self.connection.cursor.return_value = self.cursor
+        self.statements = []
+
+    def exec_driver_sql(self, sql):
+        self.statements.append(sql)
+
+
+@pytest.fixture
+def connection(monkeypatch) -> _FakeConnection:
+    """Fake connection behind the engine passed to `_bulk_copy_upsert`."""
+    table = Table(
+        "daily_prices",
+        MetaData(),
+        Column("ticker", String),
+        Column("collect_date", String),
+        Column("close", Float),
+        Column("note", String),
+    )
+    monkeypatch.setattr(general_update, "_get_table", lambda engine, name: table)
+    return _FakeConnection()
+
+
+@pytest.fixture
+def engine(connection):
+    """Engine whose transactions all use the fake connection."""
+
+    @contextmanager
+    def begin():
+        yield connection
+
+    fake_engine = MagicMock()
+    fake_engine.begin = begin
+    return fake_engine
+
+
+def _copied_rows(connection: _FakeConnection) -> list[list[str]]:
+    rows = []
+    for _, payload in connection.cursor.copies:
+        rows.extend(csv.reader(io.StringIO(payload)))
+    return rows
+
+
+def test_copy_encodes_missing_values_as_null_marker(engine, connection):
+    """None and NaN become the NULL marker, empty strings stay empty strings."""
+    data = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "MSFT", "NVDA"],
+            "collect_date": ["2024-01-02", "2024-01-02", "2024-01-02"],
+            "close": [1.5, np.nan, 2.0],
+            "note": [None, "", "split, 4:1"],
+        }
+    )
+
+    _bulk_copy_upsert(engine, "daily_prices", data, ["ticker", "collect_date"])
+
+    sql, payload = connection.cursor.copies[0]
+    assert "NULL '\\N'" in sql
+    lines = payload.splitlines()
+    assert lines[0] == "AAPL,2024-01-02,1.5,\\N"
+    assert lines[1] == "MSFT,2024-01-02,\\N,"
+    assert lines[2] == 'NVDA,2024-01-02,2.0,"split, 4:1"'
+
+
+def test_copy_sends_rows_in_chunks(engine, connection):
+    """Rows are streamed in COPY batches of `chunk_size` rows."""
+    data = pd.DataFrame(
+        {
+            "ticker": [f"T{i}" for i in range(5)],
+            "collect_date": ["2024-01-02"] * 5,
+            "close": [float(i) for i in range(5)],
+        }
+    )
+
+    _bulk_copy_upsert(
+        engine, "daily_prices", data, ["ticker", "collect_date"], chunk_size=2
+    )
+
+    assert len(connection.cursor.copies) == 3
+    assert [row[0] for row in _copied_rows(connection)] == [f"T{i}" for i in range(5)]
+
+
+def test_copy_update_keeps_last_row_of_each_key(engine, connection):
+    """Duplicate keys are merged before COPY and the last input row wins."""
+    data = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "MSFT", "AAPL"],
+            "collect_date": ["2024-01-02"] * 3,
+            "close": [1.0, 2.0, 3.0],
+        }
+    )
+
+    _bulk_copy_upsert(
+        engine,
+        "daily_prices",
+        data,
+        ["ticker", "collect_date"],
+        on_conflict="update",
+    )
+
+    assert _copied_rows(connection) == [
+        ["MSFT", "2024-01-02", "2.0"],
+        ["AAPL", "2024-01-02", "3.0"],
+    ]
+    upsert_sql = connection.statements[-1]
+    assert "DISTINCT" not in upsert_sql
+    assert "DO UPDATE SET close = EXCLUDED.close" in upsert_sql
+
+
+def test_copy_do_nothing_keeps_all_rows(engine, connection):
+    """Without updates, rows are sent as given and conflicts are ignored."""
+    data = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "AAPL"],
+            "collect_date": ["2024-01-02"] * 2,
+            "close": [1.0, 3.0],
+        }
+    )
+
+    _bulk_copy_upsert(engine, "daily_prices", data, ["ticker", "collect_date"])
+
+    assert len(_copied_rows(connection)) == 2
+    assert connection.statements[-1].endswith(
+        "ON CONFLICT (ticker, collect_date) DO NOTHING"
+    )
+
+
+def test_copy_rejects_unknown_columns(engine):
+    """Columns missing from the table are rejected before any write."""
+    data = pd.DataFrame({"ticker": ["AAPL"], "unknown": [1]})
+
+    with pytest.raises(ValueError):
+        _bulk_copy_upsert(engine, "daily_prices", data, ["ticker"])
+
+
+def test_copy_update_sets_updated_at(engine, connection, monkeypatch):
+    """Tables with an `updated_at` column get it set to now() on updated rows."""
+    table = Table(
+        "daily_prices",
+        MetaData(),
+        Column("ticker", String),
+        Column("collect_date", String),
+        Column("close", Float),
+        Column("updated_at", String),
+    )
+    monkeypatch.setattr(general_update, "_get_table", lambda engine, name: table)
+    data = pd.DataFrame(
+        {"ticker": ["AAPL"], "collect_date": ["2024-01-02"], "close": [1.0]}
+    )
+
+    _bulk_copy_upsert(
+        engine,
+        "daily_prices",
+        data,
+        ["ticker", "collect_date"],
+        on_conflict="update",
+    )
+
+    assert connection.statements[-1].endswith(
+        "DO UPDATE SET close = EXCLUDED.close, updated_at = now()"
+    )
@@ -0,0 +1,114 @@
+"""Tests for yearly range partitions."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+from itapia_common.dblib.crud import partitions
+from itapia_common.dblib.crud.partitions import (
+    ensure_yearly_partitions,
+    get_yearly_partition_name,
+    get_years,
+)
+
+
+class _FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class _FakeConnection:
+    """Connection answering catalog lookups and recording partition creations."""
+
+    def __init__(self, relkind: str | None, existing: set[str]):
+        self.relkind = relkind
+        self.existing = existing
+        self.created = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("SELECT relkind"):
+            return _FakeResult(self.relkind)
+        if sql.startswith("SELECT to_regclass"):
+            name = params["qualified_name"].removeprefix("public.")
+            return _FakeResult(name in self.existing)
+        self.created.append(sql)
+        return _FakeResult(None)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    """Each test starts without known partitions or partitioned tables."""
+    monkeypatch.setattr(partitions, "_KNOWN_PARTITIONS", set())
+    monkeypatch.setattr(partitions, "_PARTITIONED_TABLES", set())
+
+
+def test_partition_name():
+    assert get_yearly_partition_name("daily_prices", 2024) == "daily_prices_y2024"
+
+
+def test_years_are_utc_years_at_the_boundary():
+    """Dates are routed by their UTC year, as PostgreSQL routes timestamptz rows."""
+    values = [
+        # New Year's Eve in New York is already the next year in UTC
+        datetime(2024, 12, 31, 20, 0, tzinfo=timezone(timedelta(hours=-5))),
+        # New Year's morning in Hanoi is still the previous year in UTC
+        datetime(2026, 1, 1, 6, 0, tzinfo=timezone(timedelta(hours=7))),
+        # Naive datetimes are taken as UTC
+        datetime(2023, 12, 31, 23, 59, 59),
+    ]
+
+    assert get_years(values) == [2023, 2025]
+
+
+def test_years_accept_dates_timestamps_and_strings():
+    """Dates, pandas timestamps and ISO strings are deduplicated and sorted."""
+    values = [
+        "2024-01-01T00:00:00+00:00",
+        pd.Timestamp("2023-06-01", tz="UTC"),
+        date(2024, 12, 31),
+        None,
+    ]
+
+    assert get_years(values) == [2023, 2024]
+    assert get_years(pd.Series(values)) == [2023, 2024]
+    assert get_years([]) == []
+
+
+def test_partitions_cover_utc_years():
+    """Each partition spans one UTC year, lower bound included and upper excluded."""
+    connection = _FakeConnection(relkind="p", existing=set())
+
+    created = ensure_yearly_partitions(connection, "daily_prices", [2025, 2024, 2025])
+
+    assert created == ["daily_prices_y2024", "daily_prices_y2025"]
+    assert connection.created == [
+        "CREATE TABLE IF NOT EXISTS public.daily_prices_y2024 "
+        "PARTITION OF public.daily_prices "
+        "FOR VALUES FROM ('2024-01-01T00:00:00+00:00') TO ('2025-01-01T00:00:00+00:00')",
+        "CREATE TABLE IF NOT EXISTS public.daily_prices_y2025 "
+        "PARTITION OF public.daily_prices "
+        "FOR VALUES FROM ('2025-01-01T00:00:00+00:00') TO ('2026-01-01T00:00:00+00:00')",
+    ]
+
+
+def test_existing_partitions_are_skipped_and_remembered():
+    """Existing partitions are not created again, nor looked up a second time."""
+    connection = _FakeConnection(relkind="p", existing={"daily_prices_y2024"})
+
+    created = ensure_yearly_partitions(connection, "daily_prices", [2024, 2025])
+
+    assert created == ["daily_prices_y2025"]
+    assert "daily_prices_y2024" in partitions._KNOWN_PARTITIONS
+    assert "daily_prices_y2025" not in partitions._KNOWN_PARTITIONS
+
+
+def test_unpartitioned_table_is_left_alone():
+    """Tables that are not migrated yet get no partitions."""
+    connection = _FakeConnection(relkind="r", existing=set())
+
+    assert ensure_yearly_partitions(connection, "daily_prices", [2024]) == []
+    assert connection.created == []
@@ -0,0 +1,119 @@
+"""Tests for server-side prepared statements."""
+
+import pytest
+from itapia_common.dblib import db_config as dbcfg
+from itapia_common.dblib.crud.prepared import PreparedStatement, execute_prepared
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+
+
+def test_named_params_become_positional():
+    """Each name gets one position, reused wherever the name appears again."""
+    statement = PreparedStatement(
+        "SELECT * FROM t WHERE a = :ticker AND b > :since OR c = :ticker;"
+    )
+
+    assert statement.param_names == ["ticker", "since"]
+    assert statement.prepare_sql == (
+        f"PREPARE {statement.name} AS "
+        "SELECT * FROM t WHERE a = $1 AND b > $2 OR c = $1"
+    )
+    assert str(statement.execute_clause) == (
+        f"EXECUTE {statement.name}(:ticker, :since)"
+    )
+
+
+def test_casts_are_not_params():
+    """`::type` casts are kept, including a cast applied to a parameter."""
+    statement = PreparedStatement(
+        "SELECT :ticker::text, COALESCE(t.x, 'infinity'::timestamptz) FROM t"
+    )
+
+    assert statement.param_names == ["ticker"]
+    assert statement.prepare_sql.endswith(
+        "AS SELECT $1::text, COALESCE(t.x, 'infinity'::timestamptz) FROM t"
+    )
+
+
+def test_names_inside_literals_are_not_params():
+    """Names in string literals and quoted identifiers are left as they are."""
+    statement = PreparedStatement(
+        "SELECT 'at :noon', \"col:name\", 'it''s :x' FROM t WHERE a = :a"
+    )
+
+    assert statement.param_names == ["a"]
+    assert statement.prepare_sql.endswith(
+        "AS SELECT 'at :noon', \"col:name\", 'it''s :x' FROM t WHERE a = $1"
+    )
+
+
+def test_statement_without_params():
+    """A statement without parameters is executed without an argument list."""
+    statement = PreparedStatement("SELECT 1")
+
+    assert statement.param_names == []
+    assert str(statement.execute_clause) == f"EXECUTE {statement.name}"
+
+
+@pytest.fixture
+def engine():
+    """Pooled engine that records PREPARE/EXECUTE and runs `SELECT 1` instead."""
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+    engine.executed = []
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def record(conn, cursor, statement, parameters, context, executemany):
+        engine.executed.append(statement.split(" ")[0])
+        if statement.startswith(("PREPARE", "EXECUTE")):
+            return "SELECT 1", ()
+        return statement, parameters
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def prepared_statements_on(monkeypatch):
+    monkeypatch.setattr(dbcfg, "POSTGRES_PREPARED_STATEMENTS", True)
+
+
+def test_prepared_once_per_pooled_connection(engine):
+    """The statement stays prepared when the connection goes back to the pool."""
+    for _ in range(2):
+        with engine.connect() as connection:
+            execute_prepared(connection, "SELECT :a", {"a": 1})
+
+    assert engine.executed == ["PREPARE", "EXECUTE", "EXECUTE"]
+
+
+def test_prepared_again_after_invalidation(engine):
+    """An invalidated connection is replaced, and the new one prepares again."""
+    with engine.connect() as connection:
+        execute_prepared(connection, "SELECT :a", {"a": 1})
+        connection.invalidate()
+
+    with engine.connect() as connection:
+        execute_prepared(connection, "SELECT :a", {"a": 1})
+
+    assert engine.executed == ["PREPARE", "EXECUTE", "PREPARE", "EXECUTE"]
+
+
+def test_prepared_again_after_pool_dispose(engine):
+    """Replacing the whole pool also drops the prepared state."""
+    with engine.connect() as connection:
+        execute_prepared(connection, "SELECT :a", {"a": 1})
+    engine.dispose()
+    with engine.connect() as connection:
+        execute_prepared(connection, "SELECT :a", {"a": 1})
+
+    assert engine.executed == ["PREPARE", "EXECUTE", "PREPARE", "EXECUTE"]
+
+
+def test_plain_statement_when_disabled(engine, monkeypatch):
+    """With the setting off the query runs as plain text, without PREPARE."""
+    monkeypatch.setattr(dbcfg, "POSTGRES_PREPARED_STATEMENTS", False)
+    with engine.connect() as connection:
+        result = execute_prepared(connection, "SELECT :a", {"a": 7})
+        assert result.scalar() == 7
+
+    assert engine.executed == ["SELECT"]
@@ -0,0 +1,166 @@
+"""Tests for intraday price streams stored in Redis."""
+
+from datetime import datetime, timezone
+
+import fakeredis
+import fakeredis.aioredis
+import numpy as np
+import pytest
+from itapia_common.dblib.crud.prices import (
+    MISSING_TIMESTAMP_US,
+    PACKED_CANDLE_FIELD,
+    _decode_intraday_entries,
+    add_intraday_candle,
+    get_intraday_prices_async,
+    get_latest_intraday_price_async,
+)
+
+STREAM_PREFIX = "intraday_stream"
+
+
+def _candle(close: float, last_update: datetime) -> dict:
+    return {
+        "open": close - 1.0,
+        "high": close + 1.0,
+        "low": close - 2.0,
+        "close": close,
+        "volume": 1000,
+        "last_update_utc": last_update.isoformat(),
+    }
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(server):
+    """In-memory Redis client decoding responses like the production client."""
+    return fakeredis.FakeRedis(server=server, decode_responses=True)
+
+
+@pytest.fixture
+def async_redis_client(server):
+    """Asyncio client reading the same in-memory streams as `redis_client`."""
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("packed", [False, True])
+async def test_candle_round_trip_keeps_microseconds(
+    redis_client, async_redis_client, packed
+):
+    """Both stream formats give back the candle with its exact UTC update time."""
+    last_update = datetime(2024, 1, 2, 14, 30, 5, 123456, tzinfo=timezone.utc)
+    add_intraday_candle(
+        redis_client, "AAPL", _candle(150.0, last_update), STREAM_PREFIX, packed=packed
+    )
+
+    row = await get_latest_intraday_price_async(
+        async_redis_client, "AAPL", STREAM_PREFIX
+    )
+
+    assert row == {
+        "open": 149.0,
+        "high": 151.0,
+        "low": 148.0,
+        "close": 150.0,
+        "volume": 1000,
+        "last_update_utc": last_update,
+        "ticker": "AAPL",
+    }
+
+
+def test_packed_candle_is_a_single_field(redis_client):
+    """A packed candle is stored as one base64 field."""
+    last_update = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+    add_intraday_candle(
+        redis_client, "AAPL", _candle(150.0, last_update), STREAM_PREFIX, packed=True
+    )
+
+    ((_, fields),) = redis_client.xrange(f"{STREAM_PREFIX}:AAPL")
+
+    assert list(fields) == [PACKED_CANDLE_FIELD]
+    assert len(fields[PACKED_CANDLE_FIELD]) == 64
+
+
+@pytest.mark.asyncio
+async def test_mixed_stream_is_read_in_order(redis_client, async_redis_client):
+    """Legacy and packed entries of one stream are decoded in stream order."""
+    times = [
+        datetime(2024, 1, 2, 14, 30, minute_offset, tzinfo=timezone.utc)
+        for minute_offset in range(4)
+    ]
+    for i, last_update in enumerate(times):
+        add_intraday_candle(
+            redis_client,
+            "AAPL",
+            _candle(100.0 + i, last_update),
+            STREAM_PREFIX,
+            packed=i % 2 == 1,
+        )
+
+    rows = await get_intraday_prices_async(async_redis_client, "AAPL", STREAM_PREFIX)
+    arrays = _decode_intraday_entries(redis_client.xrange(f"{STREAM_PREFIX}:AAPL"))
+
+    assert [row["close"] for row in rows] == [100.0, 101.0, 102.0, 103.0]
+    assert [row["last_update_utc"] for row in rows] == times
+    np.testing.assert_array_equal(
+        arrays["timestamp_us"],
+        [int(t.timestamp()) * 1_000_000 for t in times],
+    )
+
+
+def test_legacy_entry_with_offset_is_converted_to_utc():
+    """A legacy entry written with a non-UTC offset is read as the same instant in UTC."""
+    entries = [
+        (
+            "1-0",
+            {
+                "open": "1",
+                "high": "2",
+                "low": "0.5",
+                "close": "1.5",
+                "volume": "10",
+                "last_update_utc": "2024-01-02T09:30:00.250000-05:00",
+            },
+        )
+    ]
+
+    arrays = _decode_intraday_entries(entries)
+
+    expected = datetime(2024, 1, 2, 14, 30, 0, 250000, tzinfo=timezone.utc)
+    assert arrays["timestamp_us"][0] == int(expected.timestamp() * 1_000_000)
+
+
+@pytest.mark.asyncio
+async def test_legacy_entry_with_missing_fields(redis_client, async_redis_client):
+    """Fields missing from a legacy entry are returned as None."""
+    redis_client.xadd(f"{STREAM_PREFIX}:AAPL", {"close": "150.5"})
+
+    row = await get_latest_intraday_price_async(
+        async_redis_client, "AAPL", STREAM_PREFIX
+    )
+    arrays = _decode_intraday_entries(redis_client.xrange(f"{STREAM_PREFIX}:AAPL"))
+
+    assert row["close"] == 150.5
+    assert row["open"] is None
+    assert row["volume"] is None
+    assert row["last_update_utc"] is None
+    assert np.isnan(arrays["open"][0])
+    assert arrays["timestamp_us"][0] == MISSING_TIMESTAMP_US
+
+
+@pytest.mark.asyncio
+async def test_missing_stream(async_redis_client):
+    """Missing streams read as no data."""
+    assert (
+        await get_intraday_prices_async(async_redis_client, "AAPL", STREAM_PREFIX) == []
+    )
+    assert (
+        await get_latest_intraday_price_async(
+            async_redis_client, "AAPL", STREAM_PREFIX
+        )
+        is None
+    )
@@ -0,0 +1,220 @@
+"""Tests for the news service."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from itapia_common.dblib.crud.news import get_relevant_news
+from itapia_common.dblib.services import news as news_service
+from itapia_common.dblib.services.news import (
+    APINewsService,
+    DataNewsService,
+    HistoryNewsWindow,
+)
+from itapia_common.schemas.entities.metadata import TickerMetadata
+
+BASE_TIME = datetime(2024, 1, 2, tzinfo=timezone.utc)
+# Stands in for PostgreSQL's 'infinity', so unknown publish times sort first
+INFINITY = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def _sort_key(publish_time, collect_time, news_uuid) -> tuple:
+    return (publish_time or INFINITY, collect_time, news_uuid)
+
+
+@pytest.fixture
+def news_rows() -> list[dict]:
+    """Relevant news where some rows have no publish time, sharing collect times."""
+    rows = []
+    for i in range(7):
+        publish_time = None if i % 3 == 0 else BASE_TIME + timedelta(hours=i)
+        rows.append(
+            {
+                "news_uuid": f"news-{i}",
+                "ticker": "AAPL",
+                "title": f"Title {i}",
+                "summary": None,
+                "provider": None,
+                "link": None,
+                "publish_time": publish_time,
+                "collect_time": BASE_TIME + timedelta(days=i % 2),
+            }
+        )
+    return rows
+
+
+@pytest.fixture
+def service(monkeypatch, news_rows) -> APINewsService:
+    """Service whose relevant news query runs in memory with the SQL ordering."""
+
+    def fake_get_relevant_news(
+        session, table_name, ticker, skip=0, limit=10, after_key=None
+    ):
+        rows = sorted(
+            news_rows,
+            key=lambda row: _sort_key(
+                row["publish_time"], row["collect_time"], row["news_uuid"]
+            ),
+            reverse=True,
+        )
+        if after_key is not None:
+            rows = [
+                row
+                for row in rows
+                if _sort_key(row["publish_time"], row["collect_time"], row["news_uuid"])
+                < _sort_key(*after_key)
+            ]
+        return rows[skip : skip + limit]
+
+    monkeypatch.setattr(news_service, "get_relevant_news", fake_get_relevant_news)
+    metadata_service = Mock()
+    metadata_service.get_validate_ticker_info.return_value = TickerMetadata(
+        ticker="AAPL",
+        exchange_code="NASDAQ",
+        currency="USD",
+        timezone="America/New_York",
+        sector_name="Technology",
+        data_type="news",
+    )
+    return APINewsService(rdbms_session=Mock(), metadata_service=metadata_service)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_relevant_news_cursor_pages_cover_all_rows(service, news_rows, limit):
+    """Following cursors visits every row once, through rows without a publish time."""
+    first_page = service.get_relevant_news("AAPL", skip=0, limit=len(news_rows))
+    expected = [point.news_uuid for point in first_page.datas]
+
+    seen = []
+    cursor = None
+    while True:
+        page = service.get_relevant_news("AAPL", skip=0, limit=limit, cursor=cursor)
+        seen.extend(point.news_uuid for point in page.datas)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == expected
+    # Unknown publish times come first, then by collect time
+    assert expected[:3] == ["news-3", "news-6", "news-0"]
+
+
+def test_relevant_news_cursor_keeps_unknown_publish_time(service):
+    """A page ending on a row without publish time carries None in its cursor."""
+    page = service.get_relevant_news("AAPL", skip=0, limit=2)
+
+    assert page.datas[-1].publish_ts is None
+    next_page = service.get_relevant_news(
+        "AAPL", skip=0, limit=2, cursor=page.next_cursor
+    )
+    assert [point.news_uuid for point in next_page.datas] == ["news-0", "news-5"]
+
+
+def test_relevant_news_keyset_maps_unknown_publish_time_to_infinity():
+    """The keyset filter compares a NULL cursor publish time as 'infinity'."""
+    session = Mock()
+    after_key = (None, BASE_TIME, "news-3")
+
+    get_relevant_news(session, "relevant_news", "AAPL", limit=2, after_key=after_key)
+
+    query, params = session.execute.call_args.args
+    assert (
+        "(COALESCE(publish_time, 'infinity'), collect_time, news_uuid) < "
+        "(COALESCE(CAST(:after_publish_time AS timestamptz), 'infinity'), "
+        ":after_collect_time, :after_news_uuid)"
+    ) in query.text
+    assert params["after_publish_time"] is None
+    assert params["after_collect_time"] == BASE_TIME
+    assert params["after_news_uuid"] == "news-3"
+
+
+def _history_row(scope_idx: int, title: str, publish_time: datetime, title_hash=None):
+    return {
+        "scope_idx": scope_idx,
+        "title": title,
+        "summary": None,
+        "publish_time": publish_time,
+        "title_hash": title_hash or title,
+    }
+
+
+@pytest.fixture
+def news_window() -> HistoryNewsWindow:
+    """Two searches of 2 articles each, rows in rank order, one article shared."""
+    rows = [
+        _history_row(0, "a-late", BASE_TIME + timedelta(days=2)),
+        _history_row(0, "a-early", BASE_TIME),
+        _history_row(0, "a-mid", BASE_TIME + timedelta(days=1)),
+        _history_row(1, "shared", BASE_TIME + timedelta(days=1), title_hash="a-mid"),
+        _history_row(1, "b-early", BASE_TIME + timedelta(hours=1)),
+    ]
+    return HistoryNewsWindow([("contextual", 2), ("macro", 2)], 10, rows)
+
+
+def test_news_window_includes_news_published_at_the_date(news_window):
+    """The slice is inclusive at the exact publish time and exclusive just before it."""
+    at_edge = news_window.get_news_texts(BASE_TIME + timedelta(days=2))
+    before_edge = news_window.get_news_texts(
+        BASE_TIME + timedelta(days=2) - timedelta(microseconds=1)
+    )
+
+    assert "a-late" in at_edge
+    assert "a-late" not in before_edge
+
+
+def test_news_window_compares_dates_in_utc(news_window):
+    """Dates in another timezone, or naive ones taken as UTC, slice at the same instant."""
+    edge = BASE_TIME + timedelta(hours=1)
+    new_york = timezone(timedelta(hours=-5))
+
+    expected = news_window.get_news_texts(edge)
+    assert news_window.get_news_texts(edge.astimezone(new_york)) == expected
+    assert news_window.get_news_texts(edge.replace(tzinfo=None)) == expected
+    assert expected == ["b-early", "a-early"]
+
+
+def test_news_window_limits_each_search_after_slicing(news_window):
+    """The top-N of a search at a date is its first N rows published by that date."""
+    texts = news_window.get_news_texts(BASE_TIME + timedelta(days=1))
+
+    # a-late is skipped, so a-mid takes its place; the shared article is deduplicated
+    assert texts == ["a-mid", "b-early", "a-early"]
+
+
+def test_news_window_before_all_news_is_empty(news_window):
+    """A date before every article gives an empty feed."""
+    assert news_window.get_news_texts(BASE_TIME - timedelta(seconds=1)) == []
+
+
+@pytest.mark.asyncio
+async def test_universal_news_ingestion_bumps_the_version(monkeypatch):
+    """Adding universal news publishes a new version, relevant news leave it alone."""
+    monkeypatch.setattr(news_service, "bulk_insert", Mock())
+    monkeypatch.setattr(news_service.dbcfg, "UNIVERSAL_NEWS_DIGESTS", False)
+    monkeypatch.setattr(
+        news_service, "time", Mock(time_ns=Mock(side_effect=[1_000, 2_000]))
+    )
+    server = fakeredis.FakeServer()
+    writer = DataNewsService(
+        Mock(), fakeredis.FakeRedis(server=server, decode_responses=True)
+    )
+    reader = APINewsService(
+        None,
+        Mock(),
+        async_redis_client=fakeredis.aioredis.FakeRedis(
+            server=server, decode_responses=True
+        ),
+    )
+    news = [{"news_uuid": "news-1"}]
+
+    assert await reader.get_universal_news_version_async() == 0
+
+    writer.add_news(news, "universal", ["news_uuid"])
+    assert await reader.get_universal_news_version_async() == 1
+    writer.add_news(news, "relevant", ["news_uuid"])
+    assert await reader.get_universal_news_version_async() == 1
+
+    writer.add_news(news, "universal", ["news_uuid"])
+    assert await reader.get_universal_news_version_async() == 2
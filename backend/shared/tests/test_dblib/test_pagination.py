@@ -0,0 +1,72 @@
+"""Tests for keyset pagination cursors."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from itapia_common.dblib.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        (datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc), 42, "uuid-1"),
+        (None, datetime(2024, 1, 2, 9, 30, tzinfo=timezone(timedelta(hours=-5))), "a"),
+        (0.5, 3, None, datetime(2024, 1, 2, 0, 0, 0, 123456), "id/with+chars"),
+    ],
+)
+def test_cursor_round_trip(key):
+    """Decoding a cursor gives back the exact sort key, datetimes included."""
+    cursor = encode_cursor(key)
+
+    assert decode_cursor(cursor, len(key)) == key
+
+
+def test_cursor_is_url_safe():
+    """Cursors only use URL-safe characters and carry no padding."""
+    cursor = encode_cursor(("?" * 7, ">" * 5))
+
+    assert "=" not in cursor
+    assert set(cursor) <= set(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    )
+
+
+def _raw_cursor(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor!",
+        "a",
+        _raw_cursor("not json"),
+        _raw_cursor("null"),
+        _raw_cursor("42"),
+        _raw_cursor('[{"other": 1}, 2]'),
+        _raw_cursor('[{"$dt": "not a date"}, 2]'),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    """Cursors that cannot be decoded raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 2)
+
+
+def test_cursor_of_another_key_size_is_rejected():
+    """A cursor holding a different number of values is rejected."""
+    cursor = encode_cursor((1, 2, 3))
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 2)
+
+
+def test_invalid_cursor_error_is_a_value_error():
+    """Callers catching ValueError keep handling bad cursors."""
+    assert issubclass(InvalidCursorError, ValueError)
@@ -0,0 +1,163 @@
+"""Tests for the prices service."""
+
+from datetime import date
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from itapia_common.dblib.services import prices as prices_service
+from itapia_common.dblib.services.prices import APIPricesService, _to_ohlcv_frame
+from itapia_common.schemas.entities.metadata import TickerMetadata
+
+
+def _metadata(ticker: str) -> TickerMetadata:
+    return TickerMetadata(
+        ticker=ticker,
+        exchange_code="NASDAQ",
+        currency="USD",
+        timezone="America/New_York",
+        sector_name="Technology",
+        data_type="daily",
+    )
+
+
+def test_to_ohlcv_frame_indexes_by_utc_date():
+    """Collect dates become a UTC DatetimeIndex and the column is dropped."""
+    raw = pd.DataFrame(
+        {
+            "collect_date": [date(2024, 1, 2), date(2024, 1, 3)],
+            "close": [11.0, 12.0],
+        }
+    )
+
+    frame = _to_ohlcv_frame(raw)
+
+    assert isinstance(frame.index, pd.DatetimeIndex)
+    assert frame.index.name == "datetime_utc"
+    assert str(frame.index.tz) == "UTC"
+    assert list(frame.index) == [
+        pd.Timestamp("2024-01-02", tz="UTC"),
+        pd.Timestamp("2024-01-03", tz="UTC"),
+    ]
+    assert list(frame.columns) == ["close"]
+    assert frame["close"].tolist() == [11.0, 12.0]
+
+
+def test_to_ohlcv_frame_converts_aware_timestamps_to_utc():
+    """Timezone-aware collect times are converted to UTC, not relabelled."""
+    raw = pd.DataFrame(
+        {
+            "collect_date": [pd.Timestamp("2024-01-02 09:30", tz="America/New_York")],
+            "close": [11.0],
+        }
+    )
+
+    frame = _to_ohlcv_frame(raw)
+
+    assert frame.index[0] == pd.Timestamp("2024-01-02 14:30", tz="UTC")
+
+
+@pytest.fixture
+def sector_rows() -> pd.DataFrame:
+    """Raw sector rows as returned by the CRUD layer, sorted by ticker then date."""
+    return pd.DataFrame(
+        {
+            "ticker": ["AAPL", "AAPL", "MSFT", "MSFT"],
+            "collect_date": [
+                date(2024, 1, 2),
+                date(2024, 1, 3),
+                date(2024, 1, 2),
+                date(2024, 1, 3),
+            ],
+            "open": [10.0, 11.0, 20.0, np.nan],
+            "high": [12.0, 13.0, 22.0, 23.0],
+            "low": [9.0, 10.0, 19.0, 20.0],
+            "close": [11.0, 12.0, 21.0, 22.0],
+            "volume": [100, 200, 300, 400],
+        }
+    )
+
+
+@pytest.fixture
+def service(monkeypatch, sector_rows) -> APIPricesService:
+    """Service reading the sector rows fixture instead of PostgreSQL."""
+    monkeypatch.setattr(
+        prices_service,
+        "get_daily_prices_by_sector",
+        lambda *args, **kwargs: sector_rows.copy(),
+    )
+    metadata_service = Mock()
+    metadata_service.get_tickers_of_sector.return_value = ("AAPL", "MSFT")
+    metadata_service.get_validate_ticker_info.side_effect = (
+        lambda ticker, data_type: _metadata(ticker)
+    )
+    return APIPricesService(
+        rdbms_session=Mock(), redis_client=None, metadata_service=metadata_service
+    )
+
+
+def test_sector_prices_split_per_ticker(service):
+    """The single sector query is split into one newest-first payload per ticker."""
+    payloads = service.get_daily_prices_by_sector("tech", skip=0, limit=2)
+
+    assert [payload.metadata.ticker for payload in payloads] == ["AAPL", "MSFT"]
+    aapl_points = payloads[0].datas
+    assert [point.timestamp for point in aapl_points] == [1704240000, 1704153600]
+    assert aapl_points[0].close == 12.0
+    assert aapl_points[0].volume == 200
+
+
+def test_sector_prices_missing_values_become_none(service):
+    """NaN prices are returned as None instead of failing validation."""
+    payloads = service.get_daily_prices_by_sector("tech", skip=0, limit=2)
+
+    msft_latest = payloads[1].datas[0]
+    assert msft_latest.open is None
+    assert msft_latest.high == 23.0
+
+
+def test_sector_prices_skip_invalid_tickers(service):
+    """Tickers rejected by the metadata service are left out of the result."""
+
+    def validate(ticker, data_type):
+        if ticker == "AAPL":
+            raise ValueError("unknown ticker")
+        return _metadata(ticker)
+
+    service.metadata_service.get_validate_ticker_info.side_effect = validate
+
+    payloads = service.get_daily_prices_by_sector("tech", skip=0, limit=2)
+
+    assert [payload.metadata.ticker for payload in payloads] == ["MSFT"]
+
+
+def test_sector_ohlcv_keeps_ticker_column(service):
+    """The sector OHLCV frame is columnar, with a ticker column and a UTC index."""
+    frame = service.get_daily_ohlcv_by_sector("tech", skip=0, limit=2)
+
+    assert list(frame.columns) == ["open", "high", "low", "close", "volume", "ticker"]
+    assert frame.index.name == "datetime_utc"
+    assert frame["ticker"].tolist() == ["AAPL", "AAPL", "MSFT", "MSFT"]
+
+
+def test_sector_ohlcv_reads_tickers_from_metadata_index(service, monkeypatch):
+    """The sector query reads the tickers the metadata index holds for the sector."""
+    query = Mock(return_value=pd.DataFrame())
+    monkeypatch.setattr(prices_service, "get_daily_prices_by_sector", query)
+
+    service.get_daily_ohlcv_by_sector("tech", skip=0, limit=2)
+
+    service.metadata_service.get_tickers_of_sector.assert_called_once_with("tech")
+    assert query.call_args.args[2] == ("AAPL", "MSFT")
+
+
+def test_unknown_sector_skips_the_query(service, monkeypatch):
+    """A sector without tickers in the metadata index returns no data without a query."""
+    query = Mock()
+    monkeypatch.setattr(prices_service, "get_daily_prices_by_sector", query)
+    service.metadata_service.get_tickers_of_sector.return_value = ()
+
+    assert service.get_daily_ohlcv_by_sector("unknown").empty
+    assert service.get_daily_prices_by_sector("unknown", skip=0, limit=2) == []
+    query.assert_not_called()
@@ -0,0 +1,54 @@
+"""Tests for database session helpers."""
+
+import pytest
+from itapia_common.dblib.session import rdbms_session_scope
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory bound to an in-memory SQLite engine."""
+    engine = create_engine("sqlite://")
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def test_session_scope_opens_and_closes_pooled_session(session_factory):
+    """A factory gives a fresh session per block, closed when the block exits."""
+    with rdbms_session_scope(session_factory=session_factory) as first:
+        assert first.execute(text("SELECT 1")).scalar() == 1
+        assert first.in_transaction()
+    with rdbms_session_scope(session_factory=session_factory) as second:
+        assert second is not first
+
+    assert not first.in_transaction()
+
+
+def test_session_scope_prefers_factory_over_bound_session(session_factory):
+    """The factory wins when both a session and a factory are given."""
+    bound = session_factory()
+    try:
+        with rdbms_session_scope(bound, session_factory) as session:
+            assert session is not bound
+    finally:
+        bound.close()
+
+
+def test_session_scope_keeps_caller_session_open(session_factory):
+    """A caller-owned session is yielded as-is and left open."""
+    bound = session_factory()
+    try:
+        with rdbms_session_scope(rdbms_session=bound) as session:
+            assert session is bound
+            session.execute(text("SELECT 1"))
+        assert bound.in_transaction()
+    finally:
+        bound.close()
+
+
+def test_session_scope_requires_a_connection():
+    """Without a session or a factory the scope refuses to start."""
+    with pytest.raises(ValueError):
+        with rdbms_session_scope():
+            pass
@@ -0,0 +1,97 @@
+"""Tests for projected reports read by rule variables."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from itapia_common.rules.exceptions import NotFoundVarPathError
+from itapia_common.rules.nodes import CategoricalVarNode, NumericalVarNode
+from itapia_common.rules.projection import ProjectedReport, ReportMatrix
+from itapia_common.schemas.entities.rules import SemanticType
+
+RSI_PATH = "technical_report.daily_report.key_indicators.rsi_14"
+TREND_PATH = "technical_report.daily_report.trend_report.midterm_report.ma_direction"
+
+
+@pytest.fixture
+def matrix() -> ReportMatrix:
+    """Three reports, the second one without any value."""
+    trend = np.empty(3, dtype=object)
+    trend[:] = ["uptrend", None, "downtrend"]
+    return ReportMatrix(
+        np.array([300, 200, 100], dtype=np.int64),
+        {RSI_PATH: np.array([70.0, np.nan, 30.0]), TREND_PATH: trend},
+    )
+
+
+def _rsi_node() -> NumericalVarNode:
+    return NumericalVarNode(
+        "VAR_RSI",
+        "RSI",
+        SemanticType.MOMENTUM,
+        RSI_PATH,
+        default_value=0.0,
+        source_range=(0, 100),
+        target_range=(-1, 1),
+    )
+
+
+def test_matrix_rows_are_report_views(matrix):
+    """Each row is a view carrying its generated timestamp."""
+    rows = matrix.rows()
+
+    assert len(matrix) == 3
+    assert [row.generated_timestamp for row in rows] == [300, 200, 100]
+    assert all(isinstance(row, ProjectedReport) for row in rows)
+
+
+def test_missing_values_are_none(matrix):
+    """NaN numbers and None objects both read as None, values as plain Python types."""
+    first, second, _ = matrix.rows()
+
+    assert first.get_value(RSI_PATH) == 70.0
+    assert type(first.get_value(RSI_PATH)) is float
+    assert first.get_value(TREND_PATH) == "uptrend"
+    assert second.get_value(RSI_PATH) is None
+    assert second.get_value(TREND_PATH) is None
+    assert second.has_path(RSI_PATH)
+
+
+def test_unprojected_path_raises(matrix):
+    """A path without a column is an error, not a missing value."""
+    report = matrix.rows()[0]
+
+    assert not report.has_path("technical_report.unknown")
+    with pytest.raises(NotFoundVarPathError):
+        report.get_value("technical_report.unknown")
+
+
+def test_var_node_reads_projected_values(matrix):
+    """Variables encode projected values and fall back to the default when missing."""
+    node = _rsi_node()
+    first, second, third = matrix.rows()
+
+    assert node.evaluate(first) == pytest.approx(0.4)
+    assert node.evaluate(second) == 0.0
+    assert node.evaluate(third) == pytest.approx(-0.4)
+
+    trend_node = CategoricalVarNode(
+        "VAR_TREND",
+        "Trend",
+        SemanticType.TREND,
+        TREND_PATH,
+        default_value=0.0,
+        mapping={"uptrend": 1.0, "downtrend": -1.0},
+    )
+    assert [trend_node.evaluate(row) for row in matrix.rows()] == [1.0, 0.0, -1.0]
+
+
+def test_var_node_raises_on_unprojected_path():
+    """A variable whose path was not projected raises, as with a wrong path of a full report."""
+    matrix = ReportMatrix(np.array([1], dtype=np.int64), {})
+    node = _rsi_node()
+
+    with pytest.raises(NotFoundVarPathError):
+        node.evaluate(matrix.rows()[0])
+    with pytest.raises(NotFoundVarPathError):
+        node.evaluate(SimpleNamespace(technical_report=SimpleNamespace()))